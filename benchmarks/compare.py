@@ -0,0 +1,145 @@
+""" Compare two sets of benchmark results and flag regressions.
+
+Usage::
+
+    python benchmarks/compare.py baseline.json current.json --threshold 10
+
+The files are the JSON results written by the benchmarks. Each result is
+matched with the result for the same parameters in the baseline and every
+metric is reported along with its relative change. The exit status is 1 if any
+metric regressed by more than the threshold (in percent).
+
+"""
+
+# Standard library imports.
+import argparse
+import json
+import sys
+
+
+#: For each benchmark, the parameters that identify a result and the metrics
+#: to compare. A metric is a (name, higher_is_better) tuple; dotted names are
+#: looked up in nested dicts.
+BENCHMARKS = {
+    'load': dict(
+        parameters = ('clients', 'rate'),
+        metrics    = (
+            ('throughput', True),
+            ('latency.p50', False),
+            ('latency.p99', False),
+            ('server_cpu', False),
+            ('server_max_rss', False),
+        ),
+    ),
+    'import': dict(
+        parameters = ('statement',),
+        metrics    = (
+            ('time', False),
+            ('modules', False),
+            ('max_rss', False),
+        ),
+    ),
+    'micro': dict(
+        parameters = ('name', 'server', 'size'),
+        metrics    = (('time', False),),
+    ),
+    'ws_compression': dict(
+        parameters = ('payload', 'wire', 'level', 'mem_level'),
+        metrics    = (('ratio', True), ('time', False)),
+    ),
+    'worker_messages': dict(
+        parameters = ('payload', 'wire', 'tabs', 'mode'),
+        metrics    = (('worker_time', False), ('main_time', False)),
+    ),
+}
+
+
+def compare(baseline, current, threshold):
+    """ Compare two sets of results.
+
+    Returns a list of (key, metric, old, new, change, regressed) tuples where
+    'change' is the relative change in percent (positive is better).
+
+    """
+
+    benchmark = BENCHMARKS[current['benchmark']]
+    parameters = benchmark['parameters']
+
+    def key(result):
+        return tuple(result.get(name) for name in parameters)
+
+    old_results = dict((key(result), result) for result in baseline['results'])
+
+    rows = []
+    for result in current['results']:
+        old_result = old_results.get(key(result))
+        if old_result is None:
+            continue
+
+        for metric, higher_is_better in benchmark['metrics']:
+            old, new = _lookup(old_result, metric), _lookup(result, metric)
+            if not old or new is None:
+                continue
+
+            change = 100.0 * (new - old) / old
+            if not higher_is_better:
+                change = -change
+
+            rows.append(
+                (key(result), metric, old, new, change, change < -threshold)
+            )
+
+    return rows
+
+
+def print_comparison(rows):
+    """ Print the rows returned by 'compare'. """
+
+    for key, metric, old, new, change, regressed in rows:
+        print('%-40s %-16s %12.4g %12.4g %+7.1f%%%s' % (
+            ', '.join(str(value) for value in key), metric, old, new, change,
+            '  REGRESSION' if regressed else ''
+        ))
+
+    return
+
+
+def _lookup(result, name):
+    """ Look up a (possibly dotted) metric name in a result. """
+
+    for part in name.split('.'):
+        if result is None:
+            return None
+
+        result = result.get(part)
+
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('baseline', help='the baseline results')
+    parser.add_argument('current', help='the results to compare')
+    parser.add_argument(
+        '--threshold', type=float, default=10.0,
+        help='the change (in percent) flagged as a regression (default: 10)'
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    with open(args.current) as f:
+        current = json.load(f)
+
+    if baseline['benchmark'] != current['benchmark']:
+        parser.error('cannot compare results of different benchmarks')
+
+    rows = compare(baseline, current, args.threshold)
+    print_comparison(rows)
+
+    return 1 if any(row[-1] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+""" Measure the cost of importing jigna.
+
+Each statement is run in a fresh interpreter a number of times and the best
+import time is reported, along with the number of modules loaded, the peak RSS
+of the interpreter and whether Qt and tornado were imported.
+
+Usage::
+
+    python benchmarks/import_time.py --output import.json
+    python benchmarks/import_time.py "from jigna.api import Template, WebApp"
+
+The results can be compared with 'compare.py'.
+
+"""
+
+# Standard library imports.
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+# Jigna library.
+import jigna
+
+#: The statements timed by default.
+STATEMENTS = [
+    'import jigna.api',
+    'from jigna.api import Template, WebApp',
+    'from jigna.api import Template, HTMLWidget',
+]
+
+#: The code run in the child interpreter to measure a statement.
+CHILD = """
+import json, resource, sys, time
+
+QT_MODULES = ('PyQt4', 'PyQt5', 'PySide')
+
+start = time.time()
+exec(sys.argv[1])
+elapsed = time.time() - start
+
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform != 'darwin':
+    max_rss *= 1024
+
+print(json.dumps(dict(
+    time    = elapsed,
+    modules = len(sys.modules),
+    max_rss = max_rss,
+    qt      = any(name.split('.')[0] in QT_MODULES for name in sys.modules),
+    tornado = 'tornado' in sys.modules,
+)))
+"""
+
+
+def measure(statement, repeat=5):
+    """ Measure a statement 'repeat' times and return the best result. """
+
+    results = []
+    for index in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', CHILD, statement]
+        )
+        results.append(json.loads(output.decode('utf-8')))
+
+    result = min(results, key=lambda result: result['time'])
+    result['statement'] = statement
+
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'statements', nargs='*', default=STATEMENTS,
+        help='the statements to time (default: the jigna.api imports)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='number of interpreters started per statement (default: 5)'
+    )
+    parser.add_argument('--output', help='file to write the JSON results to')
+    args = parser.parse_args(argv)
+
+    results = []
+    for statement in args.statements:
+        try:
+            result = measure(statement, args.repeat)
+
+        except subprocess.CalledProcessError:
+            print('%-45s failed' % statement)
+            continue
+
+        results.append(result)
+        print(
+            '%(statement)-45s %(time)8.3fs %(modules)5d modules '
+            'qt=%(qt)s tornado=%(tornado)s' % result
+        )
+
+    results = dict(
+        benchmark = 'import',
+        version   = jigna.__version__,
+        python    = platform.python_version(),
+        platform  = platform.platform(),
+        timestamp = time.time(),
+        results   = results,
+    )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
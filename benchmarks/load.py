@@ -0,0 +1,349 @@
+""" Load test a jigna web server with simulated websocket clients.
+
+For each combination of client count and event rate this starts a server
+(in a subprocess) serving a synthetic model, connects the given number of
+headless clients to it and has every client issue requests back to back for
+the given duration while the server updates a 'tick' trait at the given rate.
+
+It reports the request throughput, the latency of the 'tick' events fanned
+out to the clients (the time between the server setting the trait and a
+client receiving the event) and the CPU time and peak RSS of the server.
+
+Usage::
+
+    python benchmarks/load.py --clients 1,10,50 --rates 0,100 --duration 10 \
+        --output load.json
+
+The results are written as JSON so that runs of different versions can be
+compared (see 'compare.py').
+
+"""
+
+# Standard library imports.
+import argparse
+import json
+import os
+import platform
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+# 3rd party imports.
+from tornado import gen
+from tornado.ioloop import IOLoop, PeriodicCallback
+from tornado.web import Application
+
+# Jigna library.
+import jigna
+from jigna.client import Client
+from jigna.utils.web import get_free_port
+
+# Local imports.
+from models import create_model
+
+
+#### Server ###################################################################
+
+def serve(options):
+    """ Serve a synthetic model until terminated. """
+
+    from jigna.web_server import AsyncWebServer, WebServer
+
+    model = create_model(
+        width=options.width, length=options.length, depth=options.depth
+    )
+
+    klass = AsyncWebServer if options.async_server else WebServer
+    server = klass(context={'model': model}, html='', base_url='.')
+    Application(server.handlers).listen(options.port)
+
+    io_loop = IOLoop.current()
+    if options.rate > 0:
+        def tick():
+            model.tick = time.time()
+
+        PeriodicCallback(tick, 1000.0 / options.rate).start()
+
+    signal.signal(
+        signal.SIGTERM, lambda *args: io_loop.add_callback_from_signal(
+            io_loop.stop
+        )
+    )
+    io_loop.start()
+
+
+def start_server(options, rate):
+    """ Start a server in a subprocess and wait until it accepts connections.
+    """
+
+    port = get_free_port()
+    args = [
+        sys.executable, os.path.abspath(__file__), '--serve',
+        '--port', str(port), '--rate', str(rate),
+        '--width', str(options.width), '--length', str(options.length),
+        '--depth', str(options.depth),
+    ]
+    if options.async_server:
+        args.append('--async-server')
+
+    process = subprocess.Popen(args)
+
+    for attempt in range(100):
+        try:
+            socket.create_connection(('localhost', port), timeout=1).close()
+            break
+
+        except socket.error:
+            time.sleep(0.1)
+
+    else:
+        process.kill()
+        raise RuntimeError('Server did not start')
+
+    return process, port
+
+
+def stop_server(process):
+    """ Stop the server and return its resource usage. """
+
+    process.send_signal(signal.SIGTERM)
+    pid, status, usage = os.wait4(process.pid, 0)
+    process.returncode = status
+
+    # 'ru_maxrss' is in bytes on OS X and in kilobytes elsewhere.
+    max_rss = usage.ru_maxrss
+    if sys.platform != 'darwin':
+        max_rss *= 1024
+
+    return dict(
+        server_cpu     = usage.ru_utime + usage.ru_stime,
+        server_max_rss = max_rss,
+    )
+
+
+#### Clients ##################################################################
+
+class ClientDriver(object):
+    """ Drives a single client: issues requests and records event latency.
+    """
+
+    def __init__(self, url, options):
+        self.client = Client(url=url)
+        self.options = options
+        self.requests = 0
+        self.errors = 0
+        self.latencies = []
+
+        self.client.on_trait_change(self._on_object_changed, 'object_changed')
+
+    @gen.coroutine
+    def connect(self):
+        models = yield self.client.connect()
+        self.model = models['model']
+        self.items = yield self.client.get_attribute(self.model, 'items')
+        self.tree = yield self.client.get_attribute(self.model, 'tree')
+
+    @gen.coroutine
+    def run(self, deadline):
+        """ Issue requests back to back until the deadline. """
+
+        width = self.options.width
+        index = 0
+        while time.time() < deadline:
+            index += 1
+            try:
+                if index % 3 == 0 and len(self.items) > 0:
+                    yield self.client.get_item(
+                        self.items, index % len(self.items)
+                    )
+                    self.requests += 1
+
+                elif index % 3 == 1:
+                    self.requests += yield self._walk_tree()
+
+                else:
+                    yield self.client.get_attribute(
+                        self.model, 'attr_%d' % (index % width)
+                    )
+                    self.requests += 1
+
+            except Exception:
+                self.errors += 1
+
+    def close(self):
+        self.client.close()
+
+    @gen.coroutine
+    def _walk_tree(self):
+        """ Fetch the first child at each level of the tree of nodes.
+
+        Resolves to the number of requests made.
+
+        """
+
+        requests = 0
+        node = self.tree
+        while node is not None:
+            children = yield self.client.get_attribute(node, 'children')
+            requests += 1
+            if len(children) == 0:
+                break
+
+            node = yield self.client.get_item(children, 0)
+            requests += 1
+
+        raise gen.Return(requests)
+
+    def _on_object_changed(self, change):
+        proxy, name = change
+        if name == 'tick':
+            self.latencies.append(time.time() - proxy._cache['tick'])
+
+
+def percentile(values, p):
+    """ Return the p'th percentile of a list of values (None if empty). """
+
+    if not values:
+        return None
+
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p / 100.0 * (len(values) - 1))))
+
+    return values[index]
+
+
+@gen.coroutine
+def run_clients(port, count, options):
+    """ Run 'count' clients against the server for the configured duration.
+    """
+
+    url = 'ws://localhost:%d/_jigna_ws' % port
+    drivers = [ClientDriver(url, options) for index in range(count)]
+    yield [driver.connect() for driver in drivers]
+
+    start = time.time()
+    yield [driver.run(start + options.duration) for driver in drivers]
+    elapsed = time.time() - start
+
+    for driver in drivers:
+        driver.close()
+
+    requests = sum(driver.requests for driver in drivers)
+    latencies = sum((driver.latencies for driver in drivers), [])
+
+    raise gen.Return(dict(
+        requests   = requests,
+        errors     = sum(driver.errors for driver in drivers),
+        throughput = requests / elapsed,
+        events     = len(latencies),
+        latency    = dict(
+            (('p%d' % p), percentile(latencies, p)) for p in (50, 90, 99)
+        ),
+    ))
+
+
+#### Main #####################################################################
+
+def run_benchmarks(options):
+    """ Run the benchmark for each client count and event rate. """
+
+    results = []
+    for rate in options.rates:
+        for clients in options.clients:
+            process, port = start_server(options, rate)
+            try:
+                result = IOLoop.current().run_sync(
+                    lambda: run_clients(port, clients, options),
+                    timeout=options.duration + 60
+                )
+
+            finally:
+                usage = stop_server(process)
+
+            result.update(usage, clients=clients, rate=rate)
+            results.append(result)
+            print(
+                'clients=%(clients)4d rate=%(rate)5d '
+                'throughput=%(throughput)9.1f req/s '
+                'server_cpu=%(server_cpu)6.2fs' % result
+            )
+
+    return dict(
+        benchmark = 'load',
+        version   = jigna.__version__,
+        python    = platform.python_version(),
+        platform  = platform.platform(),
+        timestamp = time.time(),
+        options   = dict(
+            duration     = options.duration,
+            width        = options.width,
+            length       = options.length,
+            depth        = options.depth,
+            async_server = options.async_server,
+        ),
+        results   = results,
+    )
+
+
+def parse_args(argv=None):
+    def int_list(text):
+        return [int(value) for value in text.split(',')]
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--clients', type=int_list, default=[1, 10, 50],
+        help='comma separated list of client counts (default: 1,10,50)'
+    )
+    parser.add_argument(
+        '--rates', type=int_list, default=[0, 100],
+        help='comma separated list of event rates in Hz (default: 0,100)'
+    )
+    parser.add_argument(
+        '--duration', type=float, default=5.0,
+        help='duration of each run in seconds (default: 5)'
+    )
+    parser.add_argument(
+        '--width', type=int, default=20,
+        help='number of attributes of the model (default: 20)'
+    )
+    parser.add_argument(
+        '--length', type=int, default=1000,
+        help='length of the list of items (default: 1000)'
+    )
+    parser.add_argument(
+        '--depth', type=int, default=4,
+        help='depth of the tree of nested lists (default: 4)'
+    )
+    parser.add_argument(
+        '--async-server', action='store_true',
+        help='use the AsyncWebServer rather than the WebServer'
+    )
+    parser.add_argument('--output', help='file to write the JSON results to')
+
+    # Options used to start the server subprocess.
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--rate', type=int, default=0, help=argparse.SUPPRESS)
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    if options.serve:
+        serve(options)
+        return
+
+    results = run_benchmarks(options)
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    else:
+        print(json.dumps(results, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,346 @@
+""" Micro-benchmarks for the marshalling and dispatch hot paths of the server.
+
+Each benchmark times a single server operation (marshalling a value,
+describing an instance or a list, sending an object changed event, handling a
+JSON request etc) for a range of sizes (number of attributes, length of a
+list or depth of a tree), with both the 'WebServer' and the 'AsyncWebServer'.
+Neither Qt nor a browser is needed.
+
+Usage::
+
+    # Run all of the benchmarks (or those matching a pattern).
+    python benchmarks/micro.py
+    python benchmarks/micro.py -k marshal --output micro.json
+
+    # Save the current results as the baseline (before making a change).
+    python benchmarks/micro.py --save-baseline
+
+    # Compare against the saved baseline and flag regressions.
+    python benchmarks/micro.py --compare --threshold 20
+
+Timings depend on the machine, so no baseline is kept with the sources: the
+baseline is saved locally (in 'baselines/', which git ignores) and is only
+meaningful on the machine that saved it.
+
+"""
+
+from __future__ import print_function
+
+# Standard library imports.
+import argparse
+from collections import OrderedDict
+import json
+import os
+from os.path import abspath, dirname, isdir, isfile, join
+import platform
+import sys
+import time
+import timeit
+
+# Enthought library imports.
+from traits.api import TraitListEvent
+
+# Jigna library.
+import jigna
+from jigna.web_server import AsyncWebServer, WebServer, normalize_slice
+
+# Local imports.
+from compare import compare, print_comparison
+from models import create_model, create_tree
+
+#: The baseline saved on this machine (see '--save-baseline').
+BASELINE_FILE = join(abspath(dirname(__file__)), 'baselines', 'micro.json')
+
+#: The servers to benchmark, keyed by a short name.
+SERVERS = OrderedDict([('sync', WebServer), ('async', AsyncWebServer)])
+
+#: The sizes used for each kind of parameter.
+WIDTHS = (10, 100)
+LENGTHS = (10, 100, 1000)
+DEPTHS = (2, 8)
+
+
+#### Benchmarks ###############################################################
+
+#: All benchmarks as (name, sizes, server_names, function) tuples. Each
+#: function is called with a server and a size and returns a function to time.
+BENCHMARKS = []
+
+
+def benchmark(sizes, servers=tuple(SERVERS)):
+    """ Decorator registering a benchmark for each of the given sizes. """
+
+    def decorator(func):
+        BENCHMARKS.append((func.__name__, sizes, servers, func))
+        return func
+
+    return decorator
+
+
+def create_server(server_class, model=None):
+    """ Create a server with the given model in its context. """
+
+    context = {} if model is None else {'model': model}
+
+    return server_class(context=context, html='', base_url='.')
+
+
+def request(server, **kw):
+    """ Create a jsonized request for the model in the server's context. """
+
+    model = server.context['model']
+    kw.setdefault('id', str(id(model)))
+
+    return json.dumps(kw)
+
+
+@benchmark(sizes=(1,))
+def marshal_primitive(server, size):
+    return lambda: server._marshal(42)
+
+
+@benchmark(sizes=WIDTHS)
+def marshal_instance(server, width):
+    model = create_model(width=width, length=0, depth=0)
+    server._marshal(model)
+
+    return lambda: server._marshal(model)
+
+
+@benchmark(sizes=LENGTHS)
+def marshal_list(server, length):
+    items = create_model(length=length, depth=0).items
+    server._marshal(items)
+
+    return lambda: server._marshal(items)
+
+
+@benchmark(sizes=LENGTHS)
+def marshal_all(server, length):
+    values = list(range(length))
+
+    return lambda: server._marshal_all(values)
+
+
+@benchmark(sizes=WIDTHS)
+def get_instance_info(server, width):
+    model = create_model(width=width, length=0, depth=0)
+    server._get_instance_info(model)
+
+    return lambda: server._get_instance_info(model)
+
+
+@benchmark(sizes=WIDTHS)
+def get_instance_info_new_type(server, width):
+    model = create_model(width=width, length=0, depth=0)
+
+    def run():
+        server._visited_type_names.clear()
+        server._get_instance_info(model)
+
+    return run
+
+
+@benchmark(sizes=LENGTHS)
+def get_list_info(server, length):
+    items = create_model(length=length, depth=0).items
+    server._get_list_info(items)
+
+    return lambda: server._get_list_info(items)
+
+
+@benchmark(sizes=(1,))
+def send_object_changed_event(server, size):
+    model = create_model(length=0, depth=0)
+    server._marshal(model)
+
+    return lambda: server._send_object_changed_event(model, 'tick', 0.0, 1.0)
+
+
+@benchmark(sizes=LENGTHS)
+def send_list_items_event(server, length):
+    model = create_model(length=0, depth=0)
+    server._marshal(model)
+    event = TraitListEvent(
+        index=0, removed=[], added=create_model(length=length).items
+    )
+
+    return lambda: server._send_object_changed_event(
+        model, 'items_items', None, event
+    )
+
+
+@benchmark(sizes=LENGTHS, servers=('sync',))
+def normalize_extended_slice(server, length):
+    s = slice(None, None, -3)
+
+    return lambda: normalize_slice(s, length)
+
+
+@benchmark(sizes=WIDTHS)
+def handle_get_attribute(server, width):
+    server.context = {'model': create_model(width=width, length=0, depth=0)}
+    jsonized_request = request(
+        server, kind='get_instance_attribute', attribute_name='attr_0'
+    )
+
+    return lambda: server.handle_request(jsonized_request)
+
+
+@benchmark(sizes=LENGTHS)
+def handle_get_list(server, length):
+    server.context = {'model': create_model(length=length, depth=0)}
+    jsonized_request = request(
+        server, kind='get_instance_attribute', attribute_name='items'
+    )
+
+    return lambda: server.handle_request(jsonized_request)
+
+
+@benchmark(sizes=LENGTHS)
+def handle_get_item(server, length):
+    model = create_model(length=length, depth=0)
+    server.context = {'model': model}
+    server._marshal(model.items)
+    jsonized_request = request(
+        server, kind='get_item', id=str(id(model.items)), index=length // 2
+    )
+
+    return lambda: server.handle_request(jsonized_request)
+
+
+@benchmark(sizes=DEPTHS)
+def handle_walk_tree(server, depth):
+    """ Fetch the first child at each level of a tree of nested lists. """
+
+    tree = create_tree(depth)
+    server.context = {'model': tree}
+
+    requests = []
+    node = tree
+    while node.children:
+        server._marshal(node.children)
+        requests.append(request(
+            server, kind='get_instance_attribute', id=str(id(node)),
+            attribute_name='children'
+        ))
+        requests.append(request(
+            server, kind='get_item', id=str(id(node.children)), index=0
+        ))
+        node = node.children[0]
+
+    def run():
+        for jsonized_request in requests:
+            server.handle_request(jsonized_request)
+
+    return run
+
+
+#### Running ##################################################################
+
+def time_function(func, repeat=5, min_time=0.05):
+    """ Return the best time per call (in seconds) of a function. """
+
+    timer = timeit.Timer(func)
+
+    # Find a number of calls that takes at least 'min_time'.
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run_benchmarks(pattern=None, repeat=5, min_time=0.05):
+    """ Run all benchmarks whose name contains the pattern. """
+
+    results = []
+    for name, sizes, server_names, func in BENCHMARKS:
+        if pattern is not None and pattern not in name:
+            continue
+
+        for server_name in server_names:
+            for size in sizes:
+                server = create_server(SERVERS[server_name])
+                seconds = time_function(func(server, size), repeat, min_time)
+                server.shutdown()
+
+                result = dict(
+                    name=name, server=server_name, size=size, time=seconds
+                )
+                results.append(result)
+                print('%-28s %-6s %6d %12.2f us' % (
+                    name, server_name, size, seconds * 1e6
+                ))
+
+    return dict(
+        benchmark = 'micro',
+        version   = jigna.__version__,
+        python    = platform.python_version(),
+        platform  = platform.platform(),
+        timestamp = time.time(),
+        results   = results,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-k', dest='pattern', help='only run benchmarks containing PATTERN'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='number of times each timing is repeated (default: 5)'
+    )
+    parser.add_argument('--output', help='file to write the JSON results to')
+    parser.add_argument(
+        '--compare', nargs='?', const=BASELINE_FILE, metavar='BASELINE',
+        help='compare the results against a baseline (default: the one saved '
+             'with --save-baseline) and exit with status 1 on regressions'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=20.0,
+        help='the slow down (in percent) flagged as a regression '
+             '(default: 20)'
+    )
+    parser.add_argument(
+        '--save-baseline', action='store_true',
+        help='save the results as the baseline of this machine'
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare is not None and not isfile(args.compare):
+        parser.error(
+            'no baseline to compare with (%s): save one on this machine with '
+            '--save-baseline first' % args.compare
+        )
+
+    results = run_benchmarks(args.pattern, args.repeat)
+
+    if args.save_baseline and not isdir(dirname(BASELINE_FILE)):
+        os.makedirs(dirname(BASELINE_FILE))
+
+    for filename in (args.output, BASELINE_FILE if args.save_baseline else None):
+        if filename is not None:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        rows = compare(baseline, results, args.threshold)
+        print()
+        print_comparison(rows)
+
+        return 1 if any(row[-1] for row in rows) else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
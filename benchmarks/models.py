@@ -0,0 +1,69 @@
+""" Synthetic models used by the jigna benchmarks. """
+
+# Enthought library imports.
+from traits.api import Float, HasTraits, Instance, Int, List, Str
+
+
+class Item(HasTraits):
+    """ A list item. """
+
+    name = Str
+
+    value = Float
+
+    index = Int
+
+
+class Node(HasTraits):
+    """ A node in a tree of nested lists. """
+
+    name = Str
+
+    children = List(Instance('Node'))
+
+
+def create_wide_class(width):
+    """ Create a HasTraits class with 'width' Int attributes named attr_N.
+
+    The class also has a 'tick' trait (used to measure event latency), a list
+    of items and a tree of nodes.
+
+    """
+
+    class_dict = dict(
+        ('attr_%d' % index, Int(index)) for index in range(width)
+    )
+    class_dict['tick'] = Float
+    class_dict['items'] = List(Instance(Item))
+    class_dict['tree'] = Instance(Node)
+
+    return type('WideModel%d' % width, (HasTraits,), class_dict)
+
+
+def create_items(length):
+    """ Create a list of 'length' items. """
+
+    return [
+        Item(name='item %d' % index, value=index * 0.5, index=index)
+        for index in range(length)
+    ]
+
+
+def create_tree(depth, fan_out=2):
+    """ Create a tree of nodes of the given depth. """
+
+    node = Node(name='depth %d' % depth)
+    if depth > 0:
+        node.children = [create_tree(depth - 1, fan_out) for i in range(fan_out)]
+
+    return node
+
+
+def create_model(width=10, length=100, depth=3):
+    """ Create a model with the given number of attributes, items and the
+    given depth of nested lists.
+    """
+
+    klass = create_wide_class(width)
+
+    return klass(items=create_items(length), tree=create_tree(depth))
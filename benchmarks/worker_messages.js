@@ -0,0 +1,220 @@
+// Time handing the server's messages over from a jigna worker to a tab (see
+// 'worker_messages.py', which runs this with node).
+//
+//     node worker_messages.js <payloads.json> <jigna/js/src> <repeat>
+//
+// The payloads file holds the streams of messages to hand over, in the order
+// they were sent, for each wire encoding and the numbers of tabs to post them
+// to. The results are written to stdout as JSON.
+//
+// Messages posted between threads are copied with the structured clone
+// algorithm, whose serializer is 'v8.serialize' (the worker's side) and
+// deserializer 'v8.deserialize' (the tab's side). Three ways of posting a
+// batch are timed:
+//
+//  - 'clone': the worker parses (and decodes) the messages and posts the
+//    batch of objects;
+//
+//  - 'text': the worker posts the batch as JSON text, which the tab parses.
+//    The payloads are only parsed by the worker if it is shared by more than
+//    one tab (which needs them to route the messages);
+//
+//  - 'packed': the worker posts the batch packed by 'jigna.pack_batch' (what
+//    the workers do), ie. with the numeric columns of big lists in typed
+//    arrays, whose buffers are transferred to a single tab and copied to
+//    more than one, and the other payloads as JSON text that the tab parses.
+
+var fs = require('fs');
+var path = require('path');
+var v8 = require('v8');
+var vm = require('vm');
+
+// The sources of the workers (see 'jigna/js/build.js').
+var WORKER_FILES = ['worker/connection.js', 'app/wire.js'];
+
+function load_worker(src_dir) {
+    /* Return the 'jigna' namespace of the workers. */
+
+    var context = {self: {}, console: console, setTimeout: setTimeout};
+    vm.createContext(context);
+    for (var index=0; index < WORKER_FILES.length; index++) {
+        var filename = path.join(src_dir, WORKER_FILES[index]);
+        vm.runInContext(fs.readFileSync(filename, 'utf8'), context);
+    }
+
+    return context.jigna;
+}
+
+function now() {
+    return Number(process.hrtime.bigint()) / 1e6;
+}
+
+function create_connection(jigna, wire, preceding) {
+    /* Return a connection that has decoded the preceding messages (the
+    compact wire encoding refers back to them).
+    */
+
+    var connection = new jigna.WorkerConnection('', wire);
+    if (wire === 'compact') {
+        connection._decoder = new jigna.WireDecoder();
+    }
+    for (var index=0; index < preceding.length; index++) {
+        connection._decode(preceding[index]);
+    }
+
+    return connection;
+}
+
+function post_clone(jigna, connection, messages, tabs) {
+    /* Hand the messages over as objects; return the times taken. */
+
+    var start = now();
+    var batch = [];
+    for (var index=0; index < messages.length; index++) {
+        var message = connection._decode(messages[index]);
+        batch.push([message.request_id, message.get_payload()]);
+    }
+    var posted = [];
+    for (index=0; index < tabs; index++) {
+        posted.push(v8.serialize(batch));
+    }
+    var worker_time = now() - start;
+
+    start = now();
+    v8.deserialize(posted[0]);
+
+    return [worker_time, now() - start];
+}
+
+function encode_text(messages) {
+    /* Return a batch of messages as JSON text. */
+
+    var pairs = [];
+    for (var index=0; index < messages.length; index++) {
+        var message = messages[index];
+        pairs.push('[' + message.request_id + ',' + message.get_text() + ']');
+    }
+
+    return '[' + pairs.join(',') + ']';
+}
+
+function post_text(jigna, connection, messages, tabs) {
+    /* Hand the messages over as JSON text; return the times taken. */
+
+    var start = now();
+    var batch = [];
+    for (var index=0; index < messages.length; index++) {
+        var message = connection._decode(messages[index]);
+        if (tabs > 1) {
+            message.get_payload();
+        }
+        batch.push(message);
+    }
+    var posted = [];
+    for (index=0; index < tabs; index++) {
+        posted.push(v8.serialize(encode_text(batch)));
+    }
+    var worker_time = now() - start;
+
+    start = now();
+    JSON.parse(v8.deserialize(posted[0]));
+
+    return [worker_time, now() - start];
+}
+
+function post_packed(jigna, connection, messages, tabs) {
+    /* Hand the messages over packed; return the times taken. */
+
+    var start = now();
+    var batch = [];
+    for (var index=0; index < messages.length; index++) {
+        var message = connection._decode(messages[index]);
+        if (tabs > 1) {
+            message.get_payload();
+        }
+        batch.push(message);
+    }
+    var packed = jigna.pack_batch(batch);
+    var buffers = (tabs > 1) ? [] : packed.buffers;
+    var posted = [];
+    for (index=0; index < tabs; index++) {
+        posted.push(serialize(packed.messages, buffers));
+    }
+    var worker_time = now() - start;
+
+    start = now();
+    var pairs = deserialize(posted[0], buffers);
+    if (typeof pairs === 'string') {
+        pairs = JSON.parse(pairs);
+    }
+    for (index=0; index < pairs.length; index++) {
+        if (typeof pairs[index][1] === 'string') {
+            pairs[index][1] = JSON.parse(pairs[index][1]);
+        }
+    }
+
+    return [worker_time, now() - start];
+}
+
+function serialize(value, buffers) {
+    /* Serialize a value with its buffers transferred. */
+
+    var serializer = new v8.Serializer();
+    for (var index=0; index < buffers.length; index++) {
+        serializer.transferArrayBuffer(index, buffers[index]);
+    }
+    serializer.writeHeader();
+    serializer.writeValue(value);
+
+    return serializer.releaseBuffer();
+}
+
+function deserialize(data, buffers) {
+    /* Deserialize a value serialized with its buffers transferred. */
+
+    var deserializer = new v8.Deserializer(data);
+    for (var index=0; index < buffers.length; index++) {
+        deserializer.transferArrayBuffer(index, buffers[index]);
+    }
+    deserializer.readHeader();
+
+    return deserializer.readValue();
+}
+
+function run(jigna, streams, repeat) {
+    var modes = {clone: post_clone, text: post_text, packed: post_packed};
+    var results = [];
+
+    streams.forEach(function(stream) {
+        Object.keys(modes).forEach(function(mode) {
+            var best = [Infinity, Infinity];
+            for (var index=0; index < repeat; index++) {
+                var connection = create_connection(
+                    jigna, stream.wire, stream.preceding
+                );
+                var times = modes[mode](
+                    jigna, connection, stream.messages, stream.tabs
+                );
+                best = [Math.min(best[0], times[0]), Math.min(best[1], times[1])];
+            }
+
+            results.push({
+                payload     : stream.payload,
+                wire        : stream.wire,
+                tabs        : stream.tabs,
+                mode        : mode,
+                messages    : stream.messages.length,
+                worker_time : best[0] / 1000,
+                main_time   : best[1] / 1000
+            });
+        });
+    });
+
+    return results;
+}
+
+var streams = JSON.parse(fs.readFileSync(process.argv[2], 'utf8'));
+var jigna = load_worker(process.argv[3]);
+var repeat = parseInt(process.argv[4], 10);
+
+process.stdout.write(JSON.stringify(run(jigna, streams, repeat)));
@@ -0,0 +1,143 @@
+""" Measure the cost of handing the server's messages over from a worker.
+
+With the 'worker' option the websocket lives in a Web Worker (see
+'jigna/js/src/worker'), which posts the messages to the tab in batches. Real
+messages are generated as for 'ws_compression.py' and handed over by the
+worker script (run with node) as objects, which are copied with the structured
+clone algorithm, as JSON text that the tab parses, or packed as the workers do
+it (see 'jigna.pack_batch'). For each stream of messages this reports the time
+the worker and the tab (the main thread) spend per batch.
+
+Usage::
+
+    python benchmarks/worker_messages.py
+    python benchmarks/worker_messages.py --wire compact --tabs 1,4
+
+The results can be compared with 'compare.py'.
+
+"""
+
+from __future__ import print_function
+
+# Standard library imports.
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+# Jigna library.
+import jigna
+
+# Local imports.
+from ws_compression import create_payloads, encode_compact
+
+#: The node script that times the worker.
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      'worker_messages.js')
+
+#: The directory of the sources of the worker scripts.
+WORKER_SOURCES = os.path.join(os.path.dirname(jigna.__file__), 'js', 'src')
+
+
+def create_streams(wires, tabs):
+    """ Return the streams of messages to hand over. """
+
+    payloads = create_payloads()
+
+    streams = []
+    for wire in wires:
+        messages = payloads if wire == 'json' else encode_compact(payloads)
+
+        # The messages sent before each stream (the compact wire encoding
+        # refers back to them).
+        preceding = []
+        for name, stream in messages.items():
+            if name == 'session':
+                continue
+
+            for count in tabs:
+                streams.append(dict(
+                    payload   = name,
+                    wire      = wire,
+                    tabs      = count,
+                    messages  = stream,
+                    preceding = list(preceding),
+                ))
+            preceding.extend(stream)
+
+    return streams
+
+
+def run(wires, tabs, repeat):
+    streams = create_streams(wires, tabs)
+
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(streams, f)
+    try:
+        output = subprocess.check_output(
+            ['node', SCRIPT, f.name, WORKER_SOURCES, str(repeat)]
+        )
+    finally:
+        os.remove(f.name)
+
+    results = json.loads(output.decode('utf-8'))
+    for result in results:
+        print(
+            '%(payload)-22s %(wire)-7s tabs=%(tabs)-2d %(mode)-6s '
+            'worker %(worker_time)10.6fs main %(main_time)10.6fs' % result
+        )
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--wire', default='json,compact',
+        help='comma separated wire encodings (default: json,compact)'
+    )
+    parser.add_argument(
+        '--tabs', default='1,4',
+        help='comma separated numbers of tabs sharing the worker (default: 1,4)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=20,
+        help='number of times each stream is handed over (default: 20)'
+    )
+    parser.add_argument('--output', help='file to write the JSON results to')
+    args = parser.parse_args(argv)
+
+    try:
+        subprocess.check_output(['node', '--version'])
+    except OSError:
+        parser.error('node is needed to run the worker script')
+
+    results = run(
+        wires  = args.wire.split(','),
+        tabs   = [int(count) for count in args.tabs.split(',')],
+        repeat = args.repeat,
+    )
+
+    results = dict(
+        benchmark = 'worker_messages',
+        version   = jigna.__version__,
+        python    = platform.python_version(),
+        platform  = platform.platform(),
+        timestamp = time.time(),
+        options   = vars(args),
+        results   = results,
+    )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,242 @@
+""" Measure the trade-off of compressing the websocket messages.
+
+Real messages (events and responses) are generated by an 'AsyncWebServer'
+serving the synthetic model of 'models.py', and compressed the way tornado
+does for the 'permessage-deflate' extension (a raw deflate stream per
+connection, flushed after each message). For each compression level this
+reports the bandwidth saved (the compression ratio) and the CPU time spent
+compressing per message. With '--wire compact' the
+messages are sent in the compact wire encoding (see 'jigna.core.wire').
+
+Usage::
+
+    python benchmarks/ws_compression.py
+    python benchmarks/ws_compression.py --levels 1,6 --mem-level 5
+    python benchmarks/ws_compression.py --wire compact
+
+The results can be compared with 'compare.py'.
+
+"""
+
+from __future__ import print_function
+
+# Standard library imports.
+import argparse
+from collections import OrderedDict
+import json
+import platform
+import sys
+import time
+import zlib
+
+# Jigna library.
+import jigna
+from jigna.core.wire import CompactEncoder
+from jigna.web_server import AsyncWebServer
+
+# Local imports.
+from models import create_model
+
+try:
+    process_time = time.process_time
+except AttributeError:
+    # Python 2.
+    process_time = time.clock
+
+
+class MessageCollector(object):
+    """ A fake websocket that collects the events sent by the server. """
+
+    def __init__(self):
+        self.messages = []
+
+    def write_message(self, message, binary=False):
+        self.messages.append(message)
+
+
+def response(server, **kw):
+    """ Return the websocket message carrying the response to a request. """
+
+    return json.dumps([0, server.handle_request(json.dumps(kw))])
+
+
+def encode_compact(payloads):
+    """ Re-encode the messages in the compact wire encoding (as sent, in
+    order, over a single connection).
+    """
+    encoder = CompactEncoder()
+    compact = OrderedDict()
+    for name, messages in payloads.items():
+        if name == 'session':
+            continue
+
+        compact[name] = []
+        for message in messages:
+            request_id, payload = json.loads(message)
+            payload = json.loads(payload)
+            if request_id == -1:
+                message = encoder.encode_event(payload)
+            else:
+                message = encoder.encode_response(request_id, payload)
+            compact[name].append(json.dumps(message))
+
+    compact['session'] = [
+        message for messages in list(compact.values()) for message in messages
+    ]
+
+    return compact
+
+
+def create_payloads():
+    """ Return the sets of messages to compress, keyed by name. """
+
+    payloads = OrderedDict()
+
+    model = create_model(width=20, length=1000, depth=2)
+    server = AsyncWebServer(context={'model': model}, html='', base_url='.')
+    collector = MessageCollector()
+    server._bridge.add_socket(collector)
+    model_id = str(id(model))
+
+    # Small events, eg. a ticking value.
+    server._marshal(model)
+    server._marshal(model.items)
+    collector.messages = []
+    for value in range(100):
+        model.tick = float(value)
+    payloads['tick_events'] = collector.messages
+    collector.messages = []
+
+    # Adding items to a list.
+    for length in (10, 100):
+        model.items.extend(create_model(length=length, depth=0).items)
+        payloads['list_items_event_%d' % length] = collector.messages
+        collector.messages = []
+
+    # Fetching instances (the first one also describes the type).
+    payloads['get_instances'] = [
+        response(server, kind='get_item', id=str(id(model.items)), index=i)
+        for i in range(20)
+    ]
+
+    # Fetching lists.
+    for length in (10, 100, 1000):
+        items = create_model(length=length, depth=0).items
+        model.items = items
+        payloads['get_list_%d' % length] = [response(
+            server, kind='get_instance_attribute', id=model_id,
+            attribute_name='items'
+        )]
+
+    # Everything, in the order it was sent.
+    payloads['session'] = [
+        message for messages in list(payloads.values()) for message in messages
+    ]
+
+    return payloads
+
+
+def compress(messages, level, mem_level):
+    """ Compress a stream of messages as sent over a single connection.
+
+    Return the (compressed size, CPU time per message).
+    """
+    data = [message.encode('utf-8') for message in messages]
+    if level == 0:
+        return sum(len(message) for message in data), 0.0
+
+    start = process_time()
+    compressor = zlib.compressobj(
+        level, zlib.DEFLATED, -zlib.MAX_WBITS, mem_level
+    )
+    size = 0
+    for message in data:
+        compressed = compressor.compress(message)
+        compressed += compressor.flush(zlib.Z_SYNC_FLUSH)
+        # Like tornado, drop the trailing 0x00 0x00 0xff 0xff.
+        size += len(compressed) - 4
+
+    return size, (process_time() - start) / len(data)
+
+
+def run(levels, mem_level, repeat, wire='json'):
+    payloads = create_payloads()
+    if wire == 'compact':
+        payloads = encode_compact(payloads)
+
+    results = []
+    for name, messages in payloads.items():
+        raw_size = sum(len(message.encode('utf-8')) for message in messages)
+        for level in levels:
+            runs = [
+                compress(messages, level, mem_level) for index in range(repeat)
+            ]
+            size = runs[0][0]
+            result = dict(
+                payload    = name,
+                wire       = wire,
+                level      = level,
+                mem_level  = mem_level,
+                messages   = len(messages),
+                bytes      = raw_size,
+                compressed = size,
+                ratio      = float(raw_size) / size,
+                time       = min(elapsed for _, elapsed in runs),
+            )
+            results.append(result)
+            print(
+                '%(payload)-22s level=%(level)d '
+                '%(bytes)9d -> %(compressed)8d bytes (%(ratio)5.1fx) '
+                '%(time)10.6fs/message' % result
+            )
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--levels', default='0,1,6,9',
+        help='comma separated compression levels (default: 0,1,6,9)'
+    )
+    parser.add_argument(
+        '--mem-level', type=int, default=8,
+        help='zlib memory level (default: 8)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='number of times each stream is compressed (default: 5)'
+    )
+    parser.add_argument(
+        '--wire', choices=['json', 'compact'], default='json',
+        help='the encoding of the messages (default: json)'
+    )
+    parser.add_argument('--output', help='file to write the JSON results to')
+    args = parser.parse_args(argv)
+
+    results = run(
+        levels    = [int(level) for level in args.levels.split(',')],
+        mem_level = args.mem_level,
+        repeat    = args.repeat,
+        wire      = args.wire,
+    )
+
+    results = dict(
+        benchmark = 'ws_compression',
+        version   = jigna.__version__,
+        python    = platform.python_version(),
+        platform  = platform.platform(),
+        timestamp = time.time(),
+        options   = vars(args),
+        results   = results,
+    )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
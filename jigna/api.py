@@ -1,11 +1,68 @@
+""" The public API of jigna.
+
+The Qt ('HTMLWidget') and tornado ('WebApp') backends are only imported when
+they are first used, so eg. a web server that does::
+
+    from jigna.api import Template, WebApp
+
+never imports Qt, and a desktop application never imports tornado.
+
+"""
+
+# Standard library imports.
+import importlib
+import sys
+from types import ModuleType
+
 from .template import Template
 from .vue_template import VueTemplate
 from .core.concurrent import Future
-from .html_widget import HTMLWidget
-
-# Wrapping the WebApp import so that you can use jigna even if you don't have
-# tornado install
-try:
-    from .web_app import WebApp
-except ImportError:
-    pass
+
+#: The names that are imported on first use and the modules they live in.
+LAZY_IMPORTS = {
+    'HTMLWidget' : 'jigna.html_widget',
+    'WebApp'     : 'jigna.web_app',
+}
+
+
+class _LazyModule(ModuleType):
+    """ A module that imports the backends on first use. """
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(LAZY_IMPORTS))
+
+    def __getattr__(self, name):
+        module_name = LAZY_IMPORTS.get(name)
+        if module_name is None:
+            raise AttributeError(
+                'module %r has no attribute %r' % (self.__name__, name)
+            )
+
+        value = getattr(importlib.import_module(module_name), name)
+
+        # Cache the value so that we are only called once per name.
+        setattr(self, name, value)
+
+        return value
+
+
+def _make_lazy(module):
+    """ Make a module import the names in 'LAZY_IMPORTS' on first use. """
+
+    try:
+        # Python 3.5+ allows us to change the class of the module in place.
+        module.__class__ = _LazyModule
+
+    except TypeError:
+        lazy_module = _LazyModule(module.__name__, module.__doc__)
+        lazy_module.__dict__.update(module.__dict__)
+
+        # Keep a reference to the original module as Python 2 clears the
+        # globals of a module when it is garbage collected.
+        lazy_module._original_module = module
+        sys.modules[module.__name__] = lazy_module
+
+    return
+
+
+_make_lazy(sys.modules[__name__])
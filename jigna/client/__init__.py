@@ -0,0 +1,5 @@
+""" A headless Python client for jigna web servers. """
+
+from .client import Client, RequestError
+from .connection import Connection, ConnectionClosed
+from .proxy import DictProxy, InstanceProxy, ListProxy, Proxy
@@ -0,0 +1,472 @@
+#
+# Jigna product code
+#
+# (C) Copyright 2013-2016 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+
+""" A headless Python client for jigna web servers.
+
+The client speaks the same websocket protocol as the JS client and builds
+Python proxies that mirror the models served by the server. It is built on
+tornado coroutines, so it can be used from tornado or asyncio code and many
+clients can share a single event loop::
+
+    @gen.coroutine
+    def main():
+        client = Client(url='ws://localhost:8000/_jigna_ws')
+        models = yield client.connect()
+
+        person = models['person']
+        name = yield client.get_attribute(person, 'name')
+        yield client.set_instance_attribute(person, 'name', name.upper())
+        result = yield person.greet('Hello')
+
+"""
+
+# Standard library imports.
+import logging
+
+# 3rd party imports.
+from tornado import gen
+from tornado.concurrent import Future
+
+# Enthought library imports.
+from traits.api import (
+    Any, Dict, Enum, Event, HasTraits, Instance, Str, Undefined
+)
+
+# Local imports.
+from .connection import Connection
+from .proxy import DictProxy, InstanceProxy, ListProxy, Proxy, TypeInfo
+
+# Logger.
+logger = logging.getLogger(__name__)
+
+
+class RequestError(Exception):
+    """ Raised when the server failed to handle a request.
+
+    The message is the traceback of the exception raised on the server.
+
+    """
+
+
+class Client(HasTraits):
+    """ A client for a jigna web server. """
+
+    #### 'Client' protocol ####################################################
+
+    #: The websocket url of the server, eg. 'ws://localhost:8000/_jigna_ws'.
+    url = Str
+
+    #: The encoding of the messages sent by the server, either 'json' or
+    #: 'compact' (see 'jigna.core.wire').
+    wire = Enum('json', 'compact')
+
+    #: The connection to the server.
+    connection = Instance(Connection)
+    def _connection_default(self):
+        return Connection(self.url, on_event=self.handle_event, wire=self.wire)
+
+    #: The models in the server's context, keyed by name.
+    models = Dict
+
+    #: Fired with a (proxy, attribute_name) tuple whenever a proxied object
+    #: changes on the server.
+    object_changed = Event
+
+    @gen.coroutine
+    def connect(self):
+        """ Connect to the server and fetch the context.
+
+        Resolves to the 'models' dict.
+
+        """
+
+        yield self.connection.connect()
+        yield self.update_context()
+
+        raise gen.Return(self.models)
+
+    def close(self):
+        """ Close the connection to the server. """
+
+        self.connection.close()
+
+        return
+
+    def handle_event(self, event):
+        """ Handle an event from the server. """
+
+        obj, name = event['obj'], event['name']
+
+        if obj == 'jigna':
+            if name == 'context_updated':
+                self._add_models(event['data'])
+
+            elif name == 'new_type':
+                self._get_type_info(event['data'])
+
+        elif obj in self._thread_futures:
+            future = self._thread_futures.pop(obj)
+            if name == 'done':
+                future.set_result(event['data'])
+
+            else:
+                future.set_exception(RequestError(event['data']))
+
+        elif obj in self._id_to_proxy_map:
+            self._on_object_changed(event)
+
+        return
+
+    @gen.coroutine
+    def send_request(self, request):
+        """ Send a request to the server.
+
+        Resolves to the (marshalled) result of the request.
+
+        """
+
+        response = yield self.connection.send_request(request)
+        if response.get('exception'):
+            raise RequestError(response['exception'])
+
+        raise gen.Return(response.get('result'))
+
+    # Convenience methods for each kind of request ###########################
+
+    @gen.coroutine
+    def call_instance_method(self, proxy, method_name, *args):
+        """ Call a method on the proxied instance. """
+
+        request = dict(
+            kind        = 'call_instance_method',
+            id          = proxy._id,
+            method_name = method_name,
+            args        = self._marshal_all(args)
+        )
+        response = yield self.send_request(request)
+
+        raise gen.Return(self._unmarshal(response))
+
+    @gen.coroutine
+    def call_instance_method_thread(self, proxy, method_name, *args):
+        """ Call a method on the proxied instance in a thread on the server.
+
+        Resolves to the (marshalled) result when the method completes.
+
+        """
+
+        request = dict(
+            kind        = 'call_instance_method_thread',
+            id          = proxy._id,
+            method_name = method_name,
+            args        = self._marshal_all(args)
+        )
+        response = yield self.send_request(request)
+
+        future = Future()
+        self._thread_futures[str(self._unmarshal(response))] = future
+        result = yield future
+
+        raise gen.Return(result)
+
+    @gen.coroutine
+    def get_attribute(self, proxy, attribute_name):
+        """ Fetch the value of an attribute of an instance proxy. """
+
+        request = dict(
+            kind           = 'get_instance_attribute',
+            id             = proxy._id,
+            attribute_name = attribute_name
+        )
+        response = yield self.send_request(request)
+
+        value = self._unmarshal(response)
+        proxy._cache[attribute_name] = value
+
+        raise gen.Return(value)
+
+    @gen.coroutine
+    def get_item(self, proxy, index):
+        """ Fetch an item of a list or dict proxy. """
+
+        request = dict(kind='get_item', id=proxy._id, index=index)
+        response = yield self.send_request(request)
+
+        value = self._unmarshal(response)
+        proxy._cache[index] = value
+
+        raise gen.Return(value)
+
+    @gen.coroutine
+    def set_instance_attribute(self, proxy, attribute_name, value):
+        """ Set the value of an attribute of an instance proxy. """
+
+        request = dict(
+            kind           = 'set_instance_attribute',
+            id             = proxy._id,
+            attribute_name = attribute_name,
+            value          = self._marshal(value)
+        )
+        proxy._cache[attribute_name] = value
+
+        yield self.send_request(request)
+
+    @gen.coroutine
+    def set_item(self, proxy, index, value):
+        """ Set an item of a list or dict proxy. """
+
+        request = dict(
+            kind  = 'set_item',
+            id    = proxy._id,
+            index = index,
+            value = self._marshal(value)
+        )
+        proxy._cache[index] = value
+
+        yield self.send_request(request)
+
+    @gen.coroutine
+    def update_context(self):
+        """ Ask the server for the context.
+
+        Resolves when the 'models' have been updated.
+
+        """
+
+        context_updated = self._context_updated = Future()
+        yield self.send_request(dict(kind='update_context'))
+        yield context_updated
+
+    #### Private protocol #####################################################
+
+    #: All proxies that have been created, keyed by the id of the server-side
+    #: object.
+    _id_to_proxy_map = Any
+    def __id_to_proxy_map_default(self):
+        return {}
+
+    #: Futures for the methods running in threads on the server keyed by the
+    #: id of the server-side future.
+    _thread_futures = Any
+    def __thread_futures_default(self):
+        return {}
+
+    #: The description of each type keyed by the type name.
+    _type_infos = Any
+    def __type_infos_default(self):
+        return {}
+
+    #: Resolved when the next 'context_updated' event is received.
+    _context_updated = Any
+
+    def _add_models(self, context):
+        """ Add the models in a 'context_updated' event. """
+
+        for model_name, marshalled in context.items():
+            self.models[model_name] = self._unmarshal(marshalled)
+
+        if self._context_updated is not None:
+            self._context_updated.set_result(self.models)
+            self._context_updated = None
+
+        return
+
+    def _create_proxy(self, type, id, info):
+        """ Create a proxy for a server-side object. """
+
+        if type == 'instance':
+            proxy = InstanceProxy(id, self, self._get_type_info(info))
+
+        elif type == 'list':
+            proxy = ListProxy(id, self, self._get_list_items(info))
+
+        elif type == 'dict':
+            proxy = DictProxy(id, self, self._get_dict_items(info))
+
+        else:
+            raise ValueError('cannot create proxy for: %s' % type)
+
+        self._id_to_proxy_map[id] = proxy
+
+        return proxy
+
+    def _get_dict_items(self, info):
+        """ Return the items of a dict from the dict info. """
+
+        keys = info['keys']
+        if 'values' in info:
+            values = self._get_list_items(info['values'])
+
+        else:
+            values = [Undefined] * len(keys)
+
+        return dict(zip(keys, values))
+
+    def _get_column_items(self, columns):
+        """ Return the items of a list sent in columns. """
+
+        info = dict(type_name=columns['type_name'])
+        values = columns['values']
+
+        items = []
+        for index, obj_id in enumerate(columns['ids']):
+            proxy = self._unmarshal(dict(type='instance', value=obj_id, info=info))
+            for name, column in values.items():
+                proxy._cache[name] = column[index]
+
+            items.append(proxy)
+
+        return items
+
+    def _get_list_items(self, info):
+        """ Return the items of a list from the list info.
+
+        The sync server only sends the length of the list, in which case the
+        items are 'Undefined' until they are fetched.
+
+        """
+
+        if 'columns' in info:
+            items = self._get_column_items(info['columns'])
+
+        elif 'data' in info:
+            items = [self._unmarshal(data) for data in info['data']]
+
+        else:
+            items = [Undefined] * info['length']
+
+        return items
+
+    def _get_type_info(self, info):
+        """ Return the (shared) description of the type in an instance info.
+        """
+
+        type_info = self._type_infos.get(info['type_name'])
+        if type_info is None:
+            type_info = TypeInfo(info['type_name'])
+            self._type_infos[info['type_name']] = type_info
+
+        if 'attribute_names' in info:
+            type_info.update(info)
+
+        return type_info
+
+    def _marshal(self, obj):
+        """ Marshal a value. """
+
+        if isinstance(obj, Proxy):
+            return dict(type=obj._type, value=obj._id)
+
+        return dict(type='primitive', value=obj)
+
+    def _marshal_all(self, objs):
+        """ Marshal all of the values in an iterable. """
+
+        return [self._marshal(obj) for obj in objs]
+
+    def _on_object_changed(self, event):
+        """ Update a proxy from an object changed event. """
+
+        proxy = self._id_to_proxy_map[event['obj']]
+        name = event['name']
+        data = event['data']
+
+        if event.get('items_event'):
+            collection_id = str(data['value'])
+            collection = self._id_to_proxy_map.get(collection_id)
+            if collection is None:
+                # Traits creates a new list/dict when one is assigned, but
+                # does not fire a change event if the new value is equal to
+                # the old one, so the proxy may still be for the old one.
+                collection = proxy._cache.get(name)
+                if isinstance(collection, (ListProxy, DictProxy)):
+                    self._id_to_proxy_map[collection_id] = collection
+
+            info = data['info']
+            if 'added' not in info:
+                # The sync server sends the info of the whole collection.
+                if collection is None:
+                    collection = self._create_proxy(
+                        data['type'], collection_id, info
+                    )
+
+                elif isinstance(collection, ListProxy):
+                    collection._cache[:] = self._get_list_items(info)
+
+                else:
+                    collection._cache.clear()
+                    collection._cache.update(self._get_dict_items(info))
+
+                proxy._cache[name] = collection
+
+            elif collection is None:
+                # We have never seen the collection, so the changes cannot be
+                # applied; it will be fetched again when it is asked for.
+                proxy._cache.pop(name, None)
+
+            elif isinstance(collection, ListProxy):
+                self._update_list_proxy(collection, info)
+
+            else:
+                self._update_dict_proxy(collection, info)
+
+        else:
+            proxy._cache[name] = self._unmarshal(data)
+
+        self.object_changed = (proxy, name)
+
+        return
+
+    def _unmarshal(self, obj):
+        """ Unmarshal a value. """
+
+        if obj is None:
+            return None
+
+        if obj['type'] == 'primitive':
+            return obj['value']
+
+        proxy = self._id_to_proxy_map.get(str(obj['value']))
+        if proxy is None:
+            proxy = self._create_proxy(
+                obj['type'], str(obj['value']), obj['info']
+            )
+
+        return proxy
+
+    def _update_dict_proxy(self, proxy, info):
+        """ Apply a dict items event (from the async server) to a proxy. """
+
+        cache = proxy._cache
+        cache.update(self._get_dict_items(info['added']))
+        for key in info['removed']:
+            cache.pop(key, None)
+
+        return
+
+    def _update_list_proxy(self, proxy, info):
+        """ Apply a list items event (from the async server) to a proxy. """
+
+        cache = proxy._cache
+        added = self._get_list_items(info['added'])
+
+        if 'index' in info:
+            index = info['index']
+            cache[index:index + info['removed']] = added
+
+        elif info['removed'] > len(added):
+            # An extended slice deleting items.
+            del cache[info['start']:info['stop']:info['step']]
+
+        else:
+            # An extended slice replacing items.
+            for i, value in enumerate(added):
+                cache[info['start'] + i * info['step']] = value
+
+        return
+
+#### EOF ######################################################################
@@ -0,0 +1,161 @@
+#
+# Jigna product code
+#
+# (C) Copyright 2013-2016 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+
+""" A websocket connection speaking the jigna '/_jigna_ws' protocol. """
+
+# Standard library imports.
+from itertools import count
+import json
+import logging
+
+# 3rd party imports.
+from tornado import gen
+from tornado.concurrent import Future
+from tornado.ioloop import IOLoop
+from tornado.websocket import websocket_connect
+
+# Jigna library.
+from jigna.core.wire import CompactDecoder
+
+# Logger.
+logger = logging.getLogger(__name__)
+
+#: The request id used by the server for events.
+EVENT_ID = -1
+
+
+class ConnectionClosed(Exception):
+    """ Raised for requests pending when the connection is closed. """
+
+
+class Connection(object):
+    """ A websocket connection to a jigna web server.
+
+    Every message on the socket is a JSON array '[request_id, payload]' where
+    the payload is itself a JSON string. Responses carry the id of the request
+    they are a response to, events are sent with the id -1. With the compact
+    wire encoding the messages from the server are encoded as described in
+    'jigna.core.wire' instead.
+
+    """
+
+    def __init__(self, url, on_event=None, compression=True, wire='json'):
+        """ Constructor.
+
+        url: str:
+            The websocket url, eg. 'ws://localhost:8000/_jigna_ws'.
+
+        on_event: callable:
+            Called with each (decoded) event sent by the server.
+
+        compression: bool:
+            Whether to ask the server to compress its messages (with the
+            'permessage-deflate' extension).
+
+        wire: str:
+            The encoding of the messages sent by the server, either 'json' or
+            'compact' (see 'jigna.core.wire').
+
+        """
+
+        self.url = url
+        self.on_event = on_event
+        self.compression = compression
+        self.wire = wire
+
+        self._decoder = CompactDecoder() if wire == 'compact' else None
+
+        self._pending = {}
+        self._request_ids = count()
+        self._socket = None
+
+    @gen.coroutine
+    def connect(self):
+        """ Open the connection. """
+
+        url = self.url
+        if self.wire != 'json':
+            url += ('&' if '?' in url else '?') + 'wire=' + self.wire
+
+        self._socket = yield websocket_connect(
+            url, compression_options={} if self.compression else None
+        )
+        IOLoop.current().spawn_callback(self._read_messages)
+
+    def close(self):
+        """ Close the connection. """
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+        return
+
+    def send_request(self, request):
+        """ Send a request.
+
+        Return a Future that resolves to the (decoded) response.
+
+        """
+
+        if self._socket is None:
+            raise ConnectionClosed(self.url)
+
+        request_id = next(self._request_ids)
+        future = Future()
+        self._pending[request_id] = future
+
+        self._socket.write_message(
+            json.dumps([request_id, json.dumps(request)])
+        )
+
+        return future
+
+    #### Private protocol #####################################################
+
+    @gen.coroutine
+    def _read_messages(self):
+        """ Read and dispatch messages until the connection is closed. """
+
+        socket = self._socket
+        while True:
+            message = yield socket.read_message()
+            if message is None:
+                break
+
+            try:
+                self._handle_message(message)
+
+            except Exception:
+                logger.exception('Error handling message %r', message)
+
+        self._socket = None
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(ConnectionClosed(self.url))
+
+    def _handle_message(self, message):
+        """ Handle a single message from the server. """
+
+        if self._decoder is None:
+            request_id, payload = json.loads(message)
+            payload = json.loads(payload)
+
+        else:
+            request_id, payload = self._decoder.decode(json.loads(message))
+
+        if request_id == EVENT_ID:
+            if self.on_event is not None:
+                self.on_event(payload)
+
+        else:
+            future = self._pending.pop(request_id)
+            future.set_result(payload)
+
+        return
+
+#### EOF ######################################################################
@@ -0,0 +1,176 @@
+#
+# Jigna product code
+#
+# (C) Copyright 2013-2016 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+
+""" Python-side proxies for the objects served by a jigna server.
+
+These mirror the JS proxies: the value of an attribute (or item) is whatever
+was last received from the server, or 'Undefined' if it has not been fetched
+yet. Use the client to fetch values explicitly.
+
+"""
+
+# Standard library imports.
+from functools import partial
+
+# Enthought library imports.
+from traits.api import Undefined
+
+
+class TypeInfo(object):
+    """ The description of a server-side type.
+
+    The same instance is shared by all proxies for objects of the type. It
+    may be created before the server has sent the full description (with the
+    async server the description arrives in a separate 'new_type' event), in
+    which case it is updated in place when the description arrives.
+
+    """
+
+    def __init__(self, type_name):
+        self.type_name = type_name
+        self.attribute_names = []
+        self.event_names = []
+        self.method_names = []
+
+        # Marshalled default values of the attributes (async server only).
+        self.attribute_values = []
+
+    def update(self, info):
+        """ Update the description from the info sent by the server. """
+
+        self.attribute_names = info.get('attribute_names', [])
+        self.event_names = info.get('event_names', [])
+        self.method_names = info.get('method_names', [])
+        self.attribute_values = info.get('attribute_values', [])
+
+        return
+
+
+class Proxy(object):
+    """ Base class for all proxies. """
+
+    def __init__(self, type, id, client):
+        # We use the '_attribute' pattern to reduce the risk of name clashes
+        # with the actual attributes and methods on the object that we are a
+        # proxy for.
+        object.__setattr__(self, '_type', type)
+        object.__setattr__(self, '_id', id)
+        object.__setattr__(self, '_client', client)
+
+
+class InstanceProxy(Proxy):
+    """ A proxy for an instance.
+
+    Attribute values are read from the cache, setting an attribute sends the
+    new value to the server and calling a method returns a Future for the
+    result of the call.
+
+    """
+
+    def __init__(self, id, client, type_info):
+        super(InstanceProxy, self).__init__('instance', id, client)
+
+        object.__setattr__(self, '_type_info', type_info)
+        object.__setattr__(self, '_cache', {})
+
+    def __dir__(self):
+        info = self._type_info
+        return sorted(
+            info.attribute_names + info.event_names + info.method_names
+        )
+
+    def __getattr__(self, name):
+        info = self._type_info
+
+        if name in info.attribute_names:
+            value = self._cache.get(name, Undefined)
+            if value is Undefined and info.attribute_values:
+                index = info.attribute_names.index(name)
+                value = self._client._unmarshal(info.attribute_values[index])
+
+            return value
+
+        if name in info.method_names:
+            return partial(self._client.call_instance_method, self, name)
+
+        raise AttributeError(name)
+
+    def __repr__(self):
+        return '<InstanceProxy for a %s (%s)>' % (
+            self._type_info.type_name, self._id
+        )
+
+    def __setattr__(self, name, value):
+        info = self._type_info
+
+        if name in info.attribute_names or name in info.event_names:
+            self._client.set_instance_attribute(self, name, value)
+
+        else:
+            raise AttributeError(name)
+
+
+class ListProxy(Proxy):
+    """ A proxy for a list. """
+
+    def __init__(self, id, client, items):
+        super(ListProxy, self).__init__('list', id, client)
+
+        object.__setattr__(self, '_cache', items)
+
+    def __getitem__(self, index):
+        return self._cache[index]
+
+    def __iter__(self):
+        return iter(self._cache)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __repr__(self):
+        return '<ListProxy of length %d (%s)>' % (len(self), self._id)
+
+    def __setitem__(self, index, value):
+        self._client.set_item(self, index, value)
+
+
+class DictProxy(Proxy):
+    """ A proxy for a dict. """
+
+    def __init__(self, id, client, items):
+        super(DictProxy, self).__init__('dict', id, client)
+
+        object.__setattr__(self, '_cache', items)
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __getitem__(self, key):
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(self._cache)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __repr__(self):
+        return '<DictProxy with %d keys (%s)>' % (len(self), self._id)
+
+    def __setitem__(self, key, value):
+        self._client.set_item(self, key, value)
+
+    def items(self):
+        return list(self._cache.items())
+
+    def keys(self):
+        return list(self._cache.keys())
+
+    def values(self):
+        return list(self._cache.values())
+
+#### EOF ######################################################################
@@ -0,0 +1,415 @@
+#
+# Jigna product code
+#
+# (C) Copyright 2013-2016 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+
+""" Replay a recorded traffic log against a jigna web server.
+
+The log is recorded with 'jigna.core.traffic.TrafficRecorder'. Every client
+socket in the log is replayed over a websocket connection of its own (the
+synchronous GET requests share one), either with the recorded timing (scaled
+by 'speed') or as fast as possible (a speed of 0). The requests of each socket
+are sent in order, each one after the response to the previous one.
+
+The server must serve the same models as the recorded one. Object ids differ
+from server to server, so the replayer maps the ids in the recorded responses
+and events to the ids in the responses and events it receives, and translates
+the ids in the requests it sends. Each response is compared with the recorded
+one and any differences are reported.
+
+Usage::
+
+    python -m jigna.client.replay session.jsonl.gz ws://localhost:8000/_jigna_ws
+
+"""
+
+# Standard library imports.
+import argparse
+from collections import OrderedDict, defaultdict, deque
+import json
+import logging
+import sys
+import time
+
+# 3rd party imports.
+from tornado import gen
+from tornado.ioloop import IOLoop
+
+# Enthought library imports.
+from traits.api import Any, Dict, Float, HasTraits, Instance, Int, List, Str
+
+# Jigna library.
+from jigna.core.stats import Histogram
+from jigna.core.traffic import read_traffic
+
+# Local imports.
+from .connection import Connection
+
+# Logger.
+logger = logging.getLogger(__name__)
+
+# A monotonic clock where one is available.
+clock = getattr(time, 'monotonic', time.time)
+
+#: The types of the marshalled values that are proxies for server objects.
+PROXY_TYPES = ('instance', 'list', 'dict')
+
+
+class Replayer(HasTraits):
+    """ Replay a traffic log against a server. """
+
+    #### 'Replayer' protocol ##################################################
+
+    #: The websocket url of the server, eg. 'ws://localhost:8000/_jigna_ws'.
+    url = Str
+
+    #: The records of the traffic log (see 'jigna.core.traffic'). Any
+    #: iterable will do (they are only iterated over once), eg. the records
+    #: returned by 'read_traffic'.
+    records = Any
+
+    #: The replay speed relative to the recording (0 to replay as fast as
+    #: possible).
+    speed = Float(1.0)
+
+    #: The number of requests sent so far.
+    requests = Int
+
+    #: The time (in seconds) taken by the replay.
+    duration = Float
+
+    #: The differences between the recorded and the replayed responses.
+    #:
+    #: Each is a dict with the keys 'socket', 'request', 'path', 'recorded'
+    #: and 'replayed'.
+    mismatches = List
+
+    #: The maximum number of mismatches to keep.
+    max_mismatches = Int(1000)
+
+    #: The distribution of the response times (in seconds).
+    histogram = Instance(Histogram, ())
+
+    #: The distribution of the response times keyed by request kind.
+    histograms = Dict
+
+    @gen.coroutine
+    def replay(self):
+        """ Replay the log.
+
+        Resolves to the report (see 'report').
+
+        """
+
+        # Group the requests by socket and pair them with their responses.
+        sockets = OrderedDict()
+        pending = defaultdict(deque)
+        self._responses = {}
+        for record in self.records:
+            if self._first_time is None:
+                self._first_time = record.time
+
+            if record.direction == 'request':
+                sockets.setdefault(record.socket, []).append(record)
+                pending[record.socket].append(record)
+
+            elif record.direction == 'response':
+                request = pending[record.socket].popleft()
+                self._responses[request] = record
+
+            elif record.direction == 'event':
+                event = json.loads(record.payload)
+                self._recorded_events[event['name']].append(event)
+
+        connections = []
+        for index, socket in enumerate(sockets):
+            # Events are broadcast to all sockets, so we only need to map the
+            # ids in the events received by one of them.
+            on_event = self._on_event if index == 0 else None
+            connection = Connection(self.url, on_event=on_event)
+            yield connection.connect()
+            connections.append(connection)
+
+        self._start_time = clock()
+        try:
+            yield [
+                self._replay_socket(connection, socket, socket_records)
+                for connection, (socket, socket_records)
+                in zip(connections, sockets.items())
+            ]
+
+        finally:
+            self.duration = clock() - self._start_time
+            for connection in connections:
+                connection.close()
+
+        raise gen.Return(self.report())
+
+    def report(self):
+        """ Return a report of the replay as a JSON serializable dict. """
+
+        return dict(
+            requests   = self.requests,
+            duration   = self.duration,
+            throughput = self.requests / self.duration if self.duration else 0,
+            mismatches = len(self.mismatches),
+            latency    = self.histogram.as_dict(),
+            kinds      = dict(
+                (kind, histogram.as_dict())
+                for kind, histogram in self.histograms.items()
+            ),
+        )
+
+    #### Private protocol #####################################################
+
+    #: Maps the ids of the recorded server objects to those of the replayed.
+    _id_map = Any
+    def __id_map_default(self):
+        return {}
+
+    #: The recorded events that have not been matched with a replayed one yet
+    #: keyed by event name.
+    _recorded_events = Any
+    def __recorded_events_default(self):
+        return defaultdict(deque)
+
+    #: The recorded response for each request record.
+    _responses = Any
+
+    #: The time of the first record.
+    _first_time = Any
+
+    #: The clock time at which the replay started.
+    _start_time = Any
+
+    def _compare(self, recorded, replayed, path, mismatches):
+        """ Compare a recorded and a replayed value and learn their ids. """
+
+        if isinstance(recorded, dict) and isinstance(replayed, dict):
+            if recorded.get('type') in PROXY_TYPES and 'value' in recorded:
+                self._compare_marshalled(recorded, replayed, path, mismatches)
+
+            else:
+                for key in set(recorded) | set(replayed):
+                    self._compare(
+                        recorded.get(key), replayed.get(key),
+                        path + (key,), mismatches
+                    )
+
+        elif isinstance(recorded, list) and isinstance(replayed, list):
+            if len(recorded) != len(replayed):
+                mismatches.append((path, recorded, replayed))
+
+            else:
+                for index, (a, b) in enumerate(zip(recorded, replayed)):
+                    self._compare(a, b, path + (index,), mismatches)
+
+        elif recorded != replayed:
+            mismatches.append((path, recorded, replayed))
+
+        return
+
+    def _compare_marshalled(self, recorded, replayed, path, mismatches):
+        """ Compare a recorded and a replayed marshalled proxy value. """
+
+        if recorded['type'] != replayed.get('type'):
+            mismatches.append((path, recorded, replayed))
+            return
+
+        # Python reuses the ids of garbage collected objects, so a recorded id
+        # always maps to the id most recently seen in its place.
+        self._id_map[str(recorded['value'])] = str(replayed['value'])
+
+        # Only compare the parts of the info that do not depend on which types
+        # the server has already described to the client.
+        old_info = recorded.get('info') or {}
+        new_info = replayed.get('info') or {}
+        for key in ('type_name', 'length', 'keys', 'data', 'values'):
+            if key in old_info or key in new_info:
+                self._compare(
+                    old_info.get(key), new_info.get(key),
+                    path + ('info', key), mismatches
+                )
+
+        # The items of lists sent in columns are only given by their ids.
+        old_columns = old_info.get('columns') or {}
+        new_columns = new_info.get('columns') or {}
+        old_ids = old_columns.get('ids', [])
+        new_ids = new_columns.get('ids', [])
+        if len(old_ids) != len(new_ids):
+            mismatches.append((path + ('info', 'columns'), old_ids, new_ids))
+
+        for old_id, new_id in zip(old_ids, new_ids):
+            self._id_map[str(old_id)] = str(new_id)
+
+        for key in ('type_name', 'values'):
+            if key in old_columns or key in new_columns:
+                self._compare(
+                    old_columns.get(key), new_columns.get(key),
+                    path + ('info', 'columns', key), mismatches
+                )
+
+        return
+
+    def _on_event(self, event):
+        """ Learn the ids in a replayed event from the matching recorded one.
+        """
+
+        obj = event['obj']
+        queue = self._recorded_events[event['name']]
+        for index, recorded in enumerate(queue):
+            if obj == 'jigna' or self._id_map.get(recorded['obj']) == obj:
+                del queue[index]
+                self._compare(recorded.get('data'), event.get('data'), (), [])
+                break
+
+        return
+
+    @gen.coroutine
+    def _replay_socket(self, connection, socket, records):
+        """ Replay the requests of a single socket. """
+
+        for record in records:
+            if self.speed > 0:
+                due = (
+                    self._start_time +
+                    (record.time - self._first_time) / self.speed
+                )
+                delay = due - clock()
+                if delay > 0:
+                    yield gen.sleep(delay)
+
+            request = self._translate_request(json.loads(record.payload))
+
+            start = clock()
+            response = yield connection.send_request(request)
+            elapsed = clock() - start
+
+            self.requests += 1
+            self.histogram.add(elapsed)
+            histogram = self.histograms.get(request['kind'])
+            if histogram is None:
+                histogram = self.histograms[request['kind']] = Histogram()
+
+            histogram.add(elapsed)
+
+            recorded = self._responses.get(record)
+            if recorded is not None:
+                self._check_response(
+                    socket, request, json.loads(recorded.payload), response
+                )
+
+        return
+
+    def _check_response(self, socket, request, recorded, replayed):
+        """ Compare a recorded response with the replayed one. """
+
+        mismatches = []
+
+        # Tracebacks contain file names and line numbers, so we only check
+        # that the request either failed or succeeded in both cases.
+        if bool(recorded.get('exception')) != bool(replayed.get('exception')):
+            mismatches.append(
+                (('exception',), recorded['exception'], replayed['exception'])
+            )
+
+        if request['kind'] == 'call_instance_method_thread':
+            # The result is the id of the future for the method's result.
+            old_result = recorded.get('result') or {}
+            new_result = replayed.get('result') or {}
+            if 'value' in old_result and 'value' in new_result:
+                self._id_map[str(old_result['value'])] = str(
+                    new_result['value']
+                )
+
+        else:
+            self._compare(
+                recorded.get('result'), replayed.get('result'), ('result',),
+                mismatches
+            )
+
+        for path, old, new in mismatches:
+            if len(self.mismatches) < self.max_mismatches:
+                self.mismatches.append(dict(
+                    socket=socket, request=request, path=list(path),
+                    recorded=old, replayed=new
+                ))
+
+        return
+
+    def _translate(self, marshalled):
+        """ Translate the id in a marshalled value. """
+
+        if isinstance(marshalled, dict) and marshalled.get('type') in PROXY_TYPES:
+            marshalled = dict(marshalled)
+            old_id = str(marshalled['value'])
+            marshalled['value'] = self._id_map.get(old_id, old_id)
+
+        return marshalled
+
+    def _translate_request(self, request):
+        """ Translate the ids in a recorded request. """
+
+        if 'id' in request:
+            request['id'] = self._id_map.get(request['id'], request['id'])
+
+        if 'args' in request:
+            request['args'] = [self._translate(arg) for arg in request['args']]
+
+        if 'value' in request:
+            request['value'] = self._translate(request['value'])
+
+        return request
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Replay a recorded traffic log against a jigna server.'
+    )
+    parser.add_argument('log', help='the traffic log')
+    parser.add_argument(
+        'url', help="the server's websocket url, eg. ws://localhost:8000/_jigna_ws"
+    )
+    parser.add_argument(
+        '--speed', type=float, default=1.0,
+        help='the replay speed relative to the recording, 0 to replay as '
+             'fast as possible (default: 1)'
+    )
+    parser.add_argument('--output', help='file to write the JSON report to')
+    parser.add_argument(
+        '--show-mismatches', type=int, default=10, metavar='N',
+        help='print the first N mismatched responses (default: 10)'
+    )
+    args = parser.parse_args(argv)
+
+    header, records = read_traffic(args.log)
+    replayer = Replayer(url=args.url, records=records, speed=args.speed)
+    report = IOLoop.current().run_sync(replayer.replay)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(
+                dict(report, mismatched=replayer.mismatches), f, indent=2
+            )
+
+    print(
+        '%(requests)d requests in %(duration).2fs (%(throughput).1f/s), '
+        '%(mismatches)d mismatches' % report
+    )
+    if replayer.requests > 0:
+        print('latency: p50 %.2fms, p99 %.2fms' % (
+            report['latency']['p50'] * 1e3, report['latency']['p99'] * 1e3
+        ))
+
+    for mismatch in replayer.mismatches[:args.show_mismatches]:
+        print(json.dumps(mismatch))
+
+    return 1 if replayer.mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+#### EOF ######################################################################
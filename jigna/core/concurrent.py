@@ -26,6 +26,11 @@ def set_trait_later(obj, trait, value):
     gui.set_trait_later(obj, trait, value)
 
 
+def invoke_later(callable, *args, **kw):
+    from ..utils import gui
+    gui.invoke_later(callable, *args, **kw)
+
+
 ################################################################################
 # `Signal` class.
 ################################################################################
@@ -235,35 +240,17 @@ class Deferred(HasTraits):
         """ Complete the deferred with success and specified result.
             and set the progress to 1.0
         """
-        if self.dispatch == 'ui':
-            promise = self.promise
-            set_trait_later(promise, '_result', value)
-            set_trait_later(promise, '_progress', 1.0)
-            set_trait_later(promise, '_status', 'done')
-        else:
-            with self.promise._lock:
-                self.promise._result = value
-                self.promise._progress = 1.0
-                self.promise._status = 'done'
+        self._update_promise(
+            ('_result', value), ('_progress', 1.0), ('_status', 'done')
+        )
 
     def error(self, value):
         """ Complete the deferred with failure and specified result. """
-        if self.dispatch == 'ui':
-            promise = self.promise
-            set_trait_later(promise, '_error', value)
-            set_trait_later(promise, '_status', 'error')
-        else:
-            with self.promise._lock:
-                self.promise._error = value
-                self.promise._status = 'error'
+        self._update_promise(('_error', value), ('_status', 'error'))
 
     def progress(self, value):
         """ Set the progress of the operation (0 <= value <= 1). """
-        if self.dispatch == 'ui':
-            set_trait_later(self.promise, '_progress', value)
-        else:
-            with self.promise._lock:
-                self.promise._progress = value
+        self._update_promise(('_progress', value))
 
     # Traits ##################################################################
 
@@ -275,6 +262,25 @@ class Deferred(HasTraits):
     def _promise_default(self):
         return Promise(dispatch=self.dispatch)
 
+    # Private interface #######################################################
+
+    def _update_promise(self, *name_values):
+        """ Set the given (name, value) pairs on the promise in order.
+
+        With the "ui" dispatch they are all set by a single call in the GUI
+        thread, so listeners never see a partially updated promise.
+        """
+        if self.dispatch == 'ui':
+            invoke_later(self._set_promise_traits, name_values)
+        else:
+            self._set_promise_traits(name_values)
+
+    def _set_promise_traits(self, name_values):
+        promise = self.promise
+        with promise._lock:
+            for name, value in name_values:
+                setattr(promise, name, value)
+
 
 ################################################################################
 # `Future` class.
@@ -15,9 +15,10 @@ from jigna.qt import QtCore
 # Logger.
 logger = logging.getLogger(__name__)
 
-def create_js_object_wrapper(callbacks=[], parent=None):
+def create_js_object_wrapper(callbacks=[], parent=None, signals=[]):
     """ Create a JS object wrapper containing the given callbacks as its
-    methods.
+    methods and the given signals (each taking a single 'QVariant' argument)
+    which JS can connect to.
 
     Note: Set the parent (setParent()) of the returned QObject to make sure
     it is destroyed when the parent is destroyed, or manually destroy the
@@ -42,6 +43,9 @@ def create_js_object_wrapper(callbacks=[], parent=None):
         else:
             logger.error('Callback %r is not translatable to JavaScript', name)
 
+    for name in signals:
+        class_dict[name] = QtCore.Signal('QVariant')
+
     # Create the container class.
     container_class = type(
         'CustomPythonContainer', (_PythonContainer, QtCore.QObject,), class_dict
@@ -70,8 +74,78 @@ def wrap_func(func, name=None):
     wrapped.name = slot_key
     return wrapped
 
+def from_qvariant(obj):
+    """ Convert a value received from JS via a 'QVariant' slot argument.
+
+    JS numbers are doubles, so integral floats are converted to ints (as a
+    JSON round trip would do), byte arrays to bytes and null variants to None.
+    """
+    if isinstance(obj, dict):
+        return dict((key, from_qvariant(value)) for key, value in obj.items())
+
+    if isinstance(obj, list):
+        return [from_qvariant(value) for value in obj]
+
+    if isinstance(obj, float):
+        return int(obj) if obj.is_integer() else obj
+
+    if isinstance(obj, QtCore.QByteArray):
+        return bytes(obj)
+
+    if isinstance(obj, getattr(QtCore, 'QPyNullVariant', ())):
+        return None
+
+    return obj
+
+def to_qvariant(obj):
+    """ Convert a value to one that Qt passes to JS as structured data.
+
+    Dicts and lists become JS objects and arrays. Bytes are passed as a
+    QByteArray (a Uint8ClampedArray in JS) and numpy arrays as a dict with the
+    keys '__ndarray__', 'dtype', 'shape' and 'data' (the raw bytes), so large
+    binary data is never converted to text. Values of any other type are
+    replaced by the repr of their type (as done when JSON encoding them).
+    """
+    if obj is None or isinstance(obj, _PRIMITIVE_TYPES):
+        return obj
+
+    if isinstance(obj, dict):
+        return dict(
+            (key if isinstance(key, _TEXT_TYPES) else str(key), to_qvariant(value))
+            for key, value in obj.items()
+        )
+
+    if isinstance(obj, (list, tuple)):
+        return [to_qvariant(value) for value in obj]
+
+    if isinstance(obj, (bytes, bytearray)):
+        return QtCore.QByteArray(bytes(obj))
+
+    if hasattr(obj, '__array_interface__') and hasattr(obj, 'tobytes'):
+        # Numpy scalars are passed as Python scalars.
+        if obj.shape == ():
+            return to_qvariant(obj.item())
+
+        return dict(
+            __ndarray__ = True,
+            dtype       = obj.dtype.str,
+            shape       = list(obj.shape),
+            data        = QtCore.QByteArray(obj.tobytes()),
+        )
+
+    return repr(type(obj))
+
 #### Private protocol #########################################################
 
+try:
+    # On Python 2 'str' is also 'bytes' but is mostly used for text.
+    _TEXT_TYPES = (str, unicode)
+    _PRIMITIVE_TYPES = (bool, int, long, float, str, unicode)
+except NameError:
+    # Python 3.
+    _TEXT_TYPES = (str,)
+    _PRIMITIVE_TYPES = (bool, int, float, str)
+
 class _PythonContainer(QtCore.QObject):
     """ Container class for python object to be exposed to js. """
     def __init__(self, parent=None, slot_map=None):
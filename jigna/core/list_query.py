@@ -0,0 +1,676 @@
+#
+# Jigna product code
+#
+# (C) Copyright 2013-2016 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+
+""" Sorted, filtered windows onto list attributes.
+
+A table over a large list does not need every item of the list on the client,
+only the ones that are on screen. A 'ListQuery' keeps the items of a list
+attribute that match some filters, in the order given by some sort keys, and
+exposes a window (an offset and a limit) onto them. The view is maintained
+incrementally as the list (and the sorted or filtered attributes of its items)
+change, and 'window_changed' is fired whenever the items in the window (or the
+total number of matching items) change.
+
+The sort keys and the filters are declarative (so that they can come from a
+web client), e.g.::
+
+    query = ListQuery(
+        obj     = addressbook,
+        trait_name = 'people',
+        sort    = ['-age', 'name'],
+        filters = [['age', '>=', 18], ['name', 'icontains', 'fred']],
+        offset  = 0,
+        limit   = 20
+    )
+    query.open()
+    ...
+    query.window()
+
+Sort keys are attribute names, prefixed with '-' for descending order. Filters
+are '[attribute name, operator, value]' triples that must all hold, where the
+operator is one of 'OPERATORS' and the value is a primitive (or a list of
+primitives for 'in' and 'not in'). Only public attributes of the items can be
+used and nothing is evaluated, so a query is safe to take from a client.
+
+"""
+
+# Standard library imports.
+from bisect import bisect_left, bisect_right
+import operator
+import re
+
+# Enthought library imports.
+from traits.api import Any, Event, HasTraits, Int, List, Property, Str
+
+
+def _contains(value, other):
+    return other in value
+
+
+def _icontains(value, other):
+    return other.lower() in value.lower()
+
+
+def _in(value, other):
+    return value in other
+
+
+def _not_in(value, other):
+    return value not in other
+
+
+def _startswith(value, other):
+    return value.startswith(other)
+
+
+#: The operators that can be used in filters.
+OPERATORS = {
+    '=='         : operator.eq,
+    '!='         : operator.ne,
+    '<'          : operator.lt,
+    '<='         : operator.le,
+    '>'          : operator.gt,
+    '>='         : operator.ge,
+    'in'         : _in,
+    'not in'     : _not_in,
+    'contains'   : _contains,
+    'icontains'  : _icontains,
+    'startswith' : _startswith
+}
+
+#: The types of the values that can be used in filters.
+PRIMITIVE_TYPES = (bool, int, float, str, type(None))
+try:
+    PRIMITIVE_TYPES += (long, unicode)
+except NameError:
+    pass
+
+#: The attribute names that can be used in sort keys and filters.
+ATTRIBUTE_NAME = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
+
+
+def get_value(item, name):
+    """ Get the value of an attribute of an item (or a key of a dict item). """
+
+    if isinstance(item, dict):
+        return item.get(name)
+
+    return getattr(item, name, None)
+
+
+class ListQuery(HasTraits):
+    """ A sorted, filtered window onto a list attribute of an object. """
+
+    #### 'ListQuery' protocol #################################################
+
+    #: The object with the list.
+    obj = Any
+
+    #: The name of the list attribute.
+    trait_name = Str
+
+    #: The sort keys (attribute names, prefixed with '-' for descending
+    #: order). Items with equal keys are in the order they were added in.
+    sort = List(Str)
+
+    #: The filters ('[attribute name, operator, value]' triples).
+    filters = List
+
+    #: The index of the first item in the window.
+    offset = Int(0)
+
+    #: The maximum number of items in the window.
+    limit = Int(50)
+
+    #: The trait change dispatch mechanism to use for the list and its items.
+    dispatch = Str('same')
+
+    #: The number of items that match the filters.
+    total = Property(Int)
+    def _get_total(self):
+        return len(self._items)
+
+    #: Fired when the items in the window, or the total, change (but not when
+    #: the window is changed with 'update').
+    window_changed = Event
+
+    def open(self):
+        """ Start maintaining the view (and listening to the list). """
+
+        self._check(self.sort, self.filters)
+
+        self.obj.on_trait_change(
+            self._on_list_changed, self.trait_name, dispatch=self.dispatch
+        )
+        self.obj.on_trait_change(
+            self._on_list_items_changed, self.trait_name + '_items',
+            dispatch=self.dispatch
+        )
+        self._reset()
+
+        return
+
+    def close(self):
+        """ Stop maintaining the view. """
+
+        self.obj.on_trait_change(
+            self._on_list_changed, self.trait_name, remove=True
+        )
+        self.obj.on_trait_change(
+            self._on_list_items_changed, self.trait_name + '_items',
+            remove=True
+        )
+        self._unhook_all()
+        self._items = []
+        self._keys = []
+        self._labels = []
+        self._item_labels = {}
+
+        return
+
+    def update(self, sort=None, filters=None, offset=None, limit=None):
+        """ Change the sort keys, the filters and/or the window. """
+
+        self._check(
+            self.sort if sort is None else sort,
+            self.filters if filters is None else filters
+        )
+
+        if offset is not None:
+            self.offset = offset
+
+        if limit is not None:
+            self.limit = limit
+
+        if sort is not None or filters is not None:
+            # Stop listening to the attributes that were sorted or filtered.
+            self._unhook_all()
+
+            if sort is not None:
+                self.sort = sort
+
+            if filters is not None:
+                self.filters = filters
+
+            self._reset()
+
+        else:
+            self._last_window = self._describe_window()
+
+        return
+
+    def window(self):
+        """ Return the items in the window. """
+
+        offset = max(self.offset, 0)
+
+        return self._items[offset:offset + max(self.limit, 0)]
+
+    #### Private protocol #####################################################
+
+    #: The items that match the filters (sorted, if there are any sort keys).
+    #: This and '_keys' are plain lists as they may be large.
+    _items = Any
+    def __items_default(self):
+        return []
+
+    #: The sort keys of the items (if there are any sort keys), or else their
+    #: labels (see '_labels').
+    _keys = Any
+    def __keys_default(self):
+        return []
+
+    #: Without sort keys, a label for each position in the list. The labels
+    #: increase with the positions, so the view is in the order of the list
+    #: when it is sorted by label, and an item can be inserted into (or
+    #: removed from) the view by bisecting the labels. Items added to the
+    #: list get labels between those of their neighbours.
+    _labels = Any
+    def __labels_default(self):
+        return []
+
+    #: The labels of the positions of each (distinct) item in the list (if
+    #: there are no sort keys).
+    #:
+    #: { int id : set(float label) }
+    _item_labels = Any
+    def __item_labels_default(self):
+        return {}
+
+    #: The sort key of each (distinct) item in the list.
+    #:
+    #: { int id : _SortKey key }
+    _item_keys = Any
+    def __item_keys_default(self):
+        return {}
+
+    #: The number of times that each (distinct) item is in the list.
+    #:
+    #: { int id : int count }
+    _counts = Any
+    def __counts_default(self):
+        return {}
+
+    #: The items whose attributes we are listening to.
+    #:
+    #: { int id : HasTraits item }
+    _hooked = Any
+    def __hooked_default(self):
+        return {}
+
+    #: The order in which the items were added (for items with equal keys).
+    _sequence = Int(0)
+
+    #: The description of the window when the listeners were last told.
+    _last_window = Any
+
+    def _check(self, sort, filters):
+        """ Raise a ValueError unless the sort keys and filters are valid. """
+
+        for key in sort:
+            if not ATTRIBUTE_NAME.match(key.lstrip('-')):
+                raise ValueError('Invalid sort key: %r' % (key,))
+
+        for predicate in filters:
+            if len(predicate) != 3:
+                raise ValueError('Invalid filter: %r' % (predicate,))
+
+            name, op, value = predicate
+            if not ATTRIBUTE_NAME.match(name):
+                raise ValueError('Invalid filter attribute: %r' % (name,))
+
+            if op not in OPERATORS:
+                raise ValueError('Invalid filter operator: %r' % (op,))
+
+            values = value if op in ('in', 'not in') else [value]
+            if not isinstance(values, list) or not all(
+                isinstance(value, PRIMITIVE_TYPES) for value in values
+            ):
+                raise ValueError('Invalid filter value: %r' % (value,))
+
+        return
+
+    def _describe_window(self):
+        return self.total, [id(item) for item in self.window()]
+
+    def _hook(self, item):
+        """ Listen to the sorted and filtered attributes of an item. """
+
+        names = self._watched_names()
+        if isinstance(item, HasTraits) and len(names) > 0:
+            item.on_trait_change(
+                self._on_item_changed, names, dispatch=self.dispatch
+            )
+            self._hooked[id(item)] = item
+
+        return
+
+    def _unhook_all(self):
+        for item in self._hooked.values():
+            item.on_trait_change(
+                self._on_item_changed, self._watched_names(), remove=True
+            )
+        self._hooked = {}
+
+        return
+
+    def _watched_names(self):
+        names = set(key.lstrip('-') for key in self.sort)
+        names.update(predicate[0] for predicate in self.filters)
+
+        return sorted(names)
+
+    def _matches(self, item):
+        """ Does an item match all of the filters? """
+
+        for name, op, value in self.filters:
+            try:
+                if not OPERATORS[op](get_value(item, name), value):
+                    return False
+
+            # e.g. Comparing None and a number or 'contains' on a number.
+            except (TypeError, AttributeError):
+                return False
+
+        return True
+
+    def _sort_key(self, item):
+        """ Return the sort key of an item (based on its current values). """
+
+        key = self._item_keys.get(id(item))
+        sequence = key.sequence if key is not None else self._next_sequence()
+
+        return _SortKey(
+            [get_value(item, name.lstrip('-')) for name in self.sort],
+            [name.startswith('-') for name in self.sort],
+            sequence
+        )
+
+    def _next_sequence(self):
+        self._sequence += 1
+
+        return self._sequence
+
+    def _reset(self):
+        """ Build the view from scratch. """
+
+        self._unhook_all()
+        self._item_keys = {}
+        self._counts = {}
+
+        source = getattr(self.obj, self.trait_name)
+        for item in source:
+            self._add_item(item, insert=False)
+
+        self._relabel()
+        self._rebuild()
+        self._last_window = self._describe_window()
+
+        return
+
+    def _rebuild(self):
+        """ Filter (and sort) all of the items in the list. """
+
+        source = getattr(self.obj, self.trait_name)
+        if len(self.sort) > 0:
+            items = [item for item in source if self._matches(item)]
+            keyed = sorted(
+                ((self._item_keys[id(item)], item) for item in items),
+                key=lambda pair: pair[0]
+            )
+            self._keys = [key for key, item in keyed]
+            self._items = [item for key, item in keyed]
+
+        else:
+            labelled = [
+                (label, item) for label, item in zip(self._labels, source)
+                if self._matches(item)
+            ]
+            self._keys = [label for label, item in labelled]
+            self._items = [item for label, item in labelled]
+
+        return
+
+    def _relabel(self):
+        """ Label the positions in the list (if there are no sort keys). """
+
+        self._labels = []
+        self._item_labels = {}
+        if len(self.sort) == 0:
+            source = getattr(self.obj, self.trait_name)
+            self._labels = [float(index) for index in range(len(source))]
+            for label, item in zip(self._labels, source):
+                self._item_labels.setdefault(id(item), set()).add(label)
+
+        return
+
+    def _new_labels(self, low, high, count):
+        """ Return labels for 'count' positions between two labels (either
+        of which may be None at the ends of the list).
+
+        Return None if the labels cannot be told apart from each other.
+
+        """
+
+        if low is None and high is None:
+            return [float(index) for index in range(count)]
+
+        elif low is None:
+            return [high - count + index for index in range(count)]
+
+        elif high is None:
+            return [low + 1 + index for index in range(count)]
+
+        step = (high - low) / (count + 1)
+        labels = [low + step * (index + 1) for index in range(count)]
+        if any(a >= b for a, b in zip([low] + labels, labels + [high])):
+            return None
+
+        return labels
+
+    def _replace_positions(self, index, removed, added):
+        """ Update the view (in the order of the list) when items have been
+        replaced at an index of the list.
+        """
+
+        labels = self._labels
+        stop = index + len(removed)
+        for label, item in zip(labels[index:stop], removed):
+            self._remove_at(label)
+            self._item_labels[id(item)].discard(label)
+            self._remove_item(item, remove=False)
+
+        new_labels = self._new_labels(
+            labels[index - 1] if index > 0 else None,
+            labels[stop] if stop < len(labels) else None,
+            len(added)
+        )
+        for item in added:
+            self._add_item(item, insert=False)
+
+        # Run out of labels between the neighbours, so label the list again.
+        if new_labels is None:
+            self._relabel()
+            self._rebuild()
+            return
+
+        labels[index:stop] = new_labels
+        for label, item in zip(new_labels, added):
+            self._item_labels.setdefault(id(item), set()).add(label)
+            self._insert_at(label, item)
+
+        return
+
+    def _add_item(self, item, insert=True):
+        """ Add an item that has been added to the list. """
+
+        count = self._counts.get(id(item), 0)
+        self._counts[id(item)] = count + 1
+        if count == 0:
+            self._item_keys[id(item)] = self._sort_key(item)
+            self._hook(item)
+
+        if insert:
+            self._insert(item)
+
+        return
+
+    def _remove_item(self, item, remove=True):
+        """ Remove an item that has been removed from the list. """
+
+        if remove:
+            self._remove(item)
+
+        count = self._counts.pop(id(item)) - 1
+        if count > 0:
+            self._counts[id(item)] = count
+
+        else:
+            del self._item_keys[id(item)]
+            self._item_labels.pop(id(item), None)
+            if self._hooked.pop(id(item), None) is not None:
+                item.on_trait_change(
+                    self._on_item_changed, self._watched_names(), remove=True
+                )
+
+        return
+
+    def _insert(self, item):
+        """ Insert an item into the sorted view (if it matches). """
+
+        if self._matches(item):
+            key = self._item_keys[id(item)]
+            index = bisect_right(self._keys, key)
+            self._keys.insert(index, key)
+            self._items.insert(index, item)
+
+        return
+
+    def _remove(self, item):
+        """ Remove an item from the sorted view (if it is there). """
+
+        key = self._item_keys[id(item)]
+        index = bisect_left(self._keys, key)
+        while index < len(self._items) and not key < self._keys[index]:
+            if self._items[index] is item:
+                del self._keys[index]
+                del self._items[index]
+                break
+
+            index += 1
+
+        return
+
+    def _insert_at(self, label, item):
+        """ Insert an item at a labelled position into the view (if it
+        matches).
+        """
+
+        if self._matches(item):
+            index = bisect_left(self._keys, label)
+            self._keys.insert(index, label)
+            self._items.insert(index, item)
+
+        return
+
+    def _remove_at(self, label):
+        """ Remove the item at a labelled position from the view (if it is
+        there).
+        """
+
+        index = bisect_left(self._keys, label)
+        if index < len(self._keys) and self._keys[index] == label:
+            del self._keys[index]
+            del self._items[index]
+
+        return
+
+    def _window_changed(self):
+        """ Tell the listeners if the window has changed. """
+
+        window = self._describe_window()
+        if window != self._last_window:
+            self._last_window = window
+            self.window_changed = True
+
+        return
+
+    #### Trait change handlers ################################################
+
+    def _on_list_changed(self):
+        self._reset()
+        self.window_changed = True
+
+        return
+
+    def _on_list_items_changed(self, event):
+        added, removed = event.added, event.removed
+
+        # Without sort keys the view is in the order of the list. Extended
+        # slices (which are rare) change scattered positions, so the view is
+        # built again...
+        if len(self.sort) == 0 and isinstance(event.index, slice):
+            self._on_list_changed()
+            return
+
+        # Extended slices report the items as a list of lists.
+        if isinstance(event.index, slice):
+            added = added[0] if len(added) > 0 else []
+            removed = removed[0] if len(removed) > 0 else []
+
+        # ... otherwise only the positions that changed are updated.
+        if len(self.sort) == 0:
+            self._replace_positions(event.index, removed, added)
+
+        else:
+            for item in removed:
+                self._remove_item(item)
+
+            for item in added:
+                self._add_item(item)
+
+        self._window_changed()
+
+        return
+
+    def _on_item_changed(self, item, name, old, new):
+        if len(self.sort) == 0:
+            # The item may have been removed while the notification was
+            # being dispatched.
+            for label in self._item_labels.get(id(item), ()):
+                self._remove_at(label)
+                self._insert_at(label, item)
+
+        else:
+            # The item may have been removed while the notification was
+            # being dispatched.
+            count = self._counts.get(id(item), 0)
+            for index in range(count):
+                self._remove(item)
+
+            self._item_keys[id(item)] = self._sort_key(item)
+            for index in range(count):
+                self._insert(item)
+
+        self._window_changed()
+
+        return
+
+
+class _SortKey(object):
+    """ The sort key of an item. """
+
+    __slots__ = ('values', 'descending', 'sequence')
+
+    def __init__(self, values, descending, sequence):
+        self.values = values
+        self.descending = descending
+        self.sequence = sequence
+
+    def __lt__(self, other):
+        for value, other_value, descending in zip(
+            self.values, other.values, self.descending
+        ):
+            if _equal(value, other_value):
+                continue
+
+            less = _less(value, other_value)
+
+            return not less if descending else less
+
+        return self.sequence < other.sequence
+
+
+def _equal(value, other):
+    try:
+        return bool(value == other)
+
+    except Exception:
+        return False
+
+
+def _less(value, other):
+    """ Is one (unequal) value less than another?
+
+    None is less than anything else, and values that cannot be compared are
+    ordered by the names of their types.
+
+    """
+
+    if value is None:
+        return True
+
+    if other is None:
+        return False
+
+    try:
+        return bool(value < other)
+
+    except TypeError:
+        return type(value).__name__ < type(other).__name__
+
+#### EOF ######################################################################
@@ -11,14 +11,19 @@ try:
 except ImportError:
     from builtins import str as unicode
 
+from collections import deque
 import logging
 import sys
 import threading
+import time
 from io import StringIO
 
 # System library imports.
 from jigna.qt import QtCore, QtNetwork, qt_api, QT_API_PYQT5
 
+# Local imports.
+from jigna.core.stats import Histogram
+
 # Logger.
 logger = logging.getLogger(__name__)
 
@@ -27,14 +32,28 @@ class ProxyAccessManager(QtNetwork.QNetworkAccessManager):
     """ A QNetworkAccessManager subclass which proxies requests for a set of
     hosts and schemes.
     """
-    def __init__(self, root_paths={}, hosts={}):
+    def __init__(self, root_paths={}, hosts={}, max_workers=None):
         """ root_paths: Mapping of root paths to WSGI callables.
             hosts: Mapping of hosts to WSGI callables.
+            max_workers: The maximum number of threads serving requests
+            (defaults to the number of CPU cores, and at least 4).
         """
         super(ProxyAccessManager, self).__init__()
         self.root_paths = root_paths
         self.hosts = hosts
 
+        # The (bounded) pool of threads the WSGI requests are served from.
+        # Requests are queued when all of the threads are busy.
+        self.thread_pool = QtCore.QThreadPool(self)
+        if max_workers is None:
+            max_workers = max(4, QtCore.QThread.idealThreadCount())
+        self.thread_pool.setMaxThreadCount(max_workers)
+
+        # The time requests spend waiting for a thread and being served (in
+        # seconds).
+        self.queue_time = Histogram()
+        self.service_time = Histogram()
+
     def get_url_handler(self, url):
         """ Returns the WSGI callable to be used for specified url.
         """
@@ -47,6 +66,16 @@ class ProxyAccessManager(QtNetwork.QNetworkAccessManager):
 
         return handler
 
+    def stats(self):
+        """ Return the queue and service time statistics of the requests.
+        """
+        return dict(
+            max_workers  = self.thread_pool.maxThreadCount(),
+            active       = self.thread_pool.activeThreadCount(),
+            queue_time   = self.queue_time.as_dict(),
+            service_time = self.service_time.as_dict(),
+        )
+
     def inject(self, webview):
         """ Replace the old QNetworkAccessManager instance with this instance.
         """
@@ -94,21 +123,27 @@ class ProxyReply(QtNetwork.QNetworkReply):
         self.req_data = data
         self.handler = handler
 
-        self.buffer = b''
-        self._buflock = threading.Lock()
+        self.buffer = ReplyBuffer()
         self.aborted = False
 
+        # Wake up the worker if the reply goes away without being read.
+        buffer = self.buffer
+        self.destroyed.connect(lambda *args: buffer.close())
+
         self.open(self.ReadOnly)
 
-        self._worker = ProxyReplyWorker(self)
-        self._worker.start()
+        self._worker = ProxyReplyWorker(self, parent)
 
-        # Handle synchronous requests (webkit sync ajax requests)
+        # Handle synchronous requests (webkit sync ajax requests) inline, as
+        # the GUI thread would only be waiting for a pool thread anyway.
         # req.Attribute.QSynchronousHttpNetworkReply may not be defined for
         # pyside compiled with qt 4.7 but still works with qt 4.8
         # QSynchronousHttpNetworkReply = DownloadBufferAttribute + 1 = 16
         if req.attribute(req.Attribute(16)):
-            self._worker.wait()
+            self._worker.streaming = False
+            self._worker.run()
+        else:
+            parent.thread_pool.start(self._worker)
 
     ###########################################################################
     # QNetworkReply interface
@@ -119,43 +154,213 @@ class ProxyReply(QtNetwork.QNetworkReply):
             self.aborted = True
             self.setError(self.OperationCanceledError,
                           'Request Aborted')
+            # Wake up the worker if it is waiting for us to read.
+            self.buffer.close()
 
     def bytesAvailable(self):
         return super(ProxyReply, self).bytesAvailable() + len(self.buffer)
 
+    def close(self):
+        # Unread data is discarded (and the worker stops writing it).
+        self.buffer.close()
+        super(ProxyReply, self).close()
+
     def isSequential(self):
         return True
 
     def readData(self, maxSize):
-        with self._buflock:
-            data, self.buffer = self.buffer[:maxSize], self.buffer[maxSize:]
-        return data
+        return self.buffer.read(maxSize)
+
+
+class ReplyBuffer(object):
+    """ A thread safe FIFO byte buffer for a reply.
+
+    The data is kept as a queue of the chunks that were written, so writing is
+    O(1) and reading 'k' bytes is O(k) (the buffer is never copied as a whole).
+
+    A writer can wait for the reader to drain the buffer below a low
+    watermark, which bounds the memory used when streaming large responses.
+    """
+
+    #: The size (in bytes) above which a streaming writer waits for the reader.
+    high_watermark = 4 * 1024 * 1024
+
+    #: The size (in bytes) below which a waiting writer is woken up.
+    low_watermark = 1024 * 1024
+
+    def __init__(self):
+        self._chunks = deque()
+        self._size = 0
+
+        # The offset of the first unread byte in the first chunk.
+        self._offset = 0
+
+        # Set when the reader has gone away.
+        self._closed = False
+
+        self._condition = threading.Condition()
+
+    def __len__(self):
+        return self._size
+
+    def close(self):
+        """ Discard the buffered data and wake up any waiting writer. """
+
+        with self._condition:
+            self._closed = True
+            self._chunks.clear()
+            self._size = self._offset = 0
+            self._condition.notify_all()
+
+    def is_closed(self):
+        """ Has the reader gone away? """
+
+        return self._closed
+
+    def is_full(self):
+        """ Is the buffer above its high watermark? """
+
+        return self._size >= self.high_watermark
+
+    def read(self, max_size):
+        """ Read (and remove) up to 'max_size' bytes from the buffer. """
+
+        pieces = []
+        with self._condition:
+            remaining = min(max_size, self._size)
+            self._size -= remaining
+
+            while remaining > 0:
+                chunk = self._chunks[0]
+                end = self._offset + remaining
+                if end < len(chunk):
+                    pieces.append(memoryview(chunk)[self._offset:end])
+                    self._offset = end
+                    break
+
+                if self._offset:
+                    pieces.append(memoryview(chunk)[self._offset:])
+                else:
+                    pieces.append(chunk)
+                remaining -= len(chunk) - self._offset
+                self._chunks.popleft()
+                self._offset = 0
+
+            if self._size < self.low_watermark:
+                self._condition.notify_all()
+
+        return b''.join(pieces)
+
+    def wait_for_reader(self, timeout=None):
+        """ Block until the buffer has been drained below its low watermark
+        (or closed), or until the timeout (in seconds) has passed.
+
+        Return False if it timed out.
+        """
+        if timeout is not None:
+            deadline = time.time() + timeout
+
+        with self._condition:
+            while self._size >= self.low_watermark and not self._closed:
+                if timeout is None:
+                    self._condition.wait()
+
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+
+        return True
 
+    def write(self, data):
+        """ Append some bytes to the buffer. """
 
-class ProxyReplyWorker(QtCore.QThread):
-    """ Worker thread to fetch urls for QNetworkProxy. """
+        if not data:
+            return
 
-    # Signals to forward to ProxyReply
+        with self._condition:
+            if not self._closed:
+                self._chunks.append(data)
+                self._size += len(data)
+
+
+class _ReplySignals(QtCore.QObject):
+    """ The signals a worker forwards to its reply.
+
+    A QRunnable is not a QObject, so it cannot have signals of its own.
+    """
     metaDataChanged = QtCore.Signal()
     readyRead = QtCore.Signal()
     finished = QtCore.Signal()
 
+
+class ProxyReplyWorker(QtCore.QRunnable):
+    """ Job (run in the access manager's thread pool) that fetches a url from
+    a WSGI app for a ProxyReply. """
+
     OPERATIONS = {QtNetwork.QNetworkAccessManager.GetOperation: 'GET',
                   QtNetwork.QNetworkAccessManager.PostOperation: 'POST',}
 
-    def __init__(self, reply, parent=None):
-        super(ProxyReplyWorker, self).__init__(parent)
+    #: How long (in seconds) a streaming worker waits for the reply to be read
+    #: before it gives up on the response (so that a reply that is never read
+    #: does not hold a thread of the pool forever).
+    read_timeout = 60
+
+    def __init__(self, reply, manager):
+        super(ProxyReplyWorker, self).__init__()
         self.reply = reply
-        self.metaDataChanged.connect(self.reply.metaDataChanged)
-        self.readyRead.connect(self.reply.readyRead)
-        self.finished.connect(self.reply.finished)
+        self.manager = manager
+        self.created = time.time()
+
+        # Should the response be consumed only as the reply is read? This is
+        # turned off when the worker runs in the GUI thread (which is also the
+        # reader).
+        self.streaming = True
+
+        # The signals are always queued so that they are delivered after the
+        # reply has been returned to WebKit, even when the worker is run
+        # inline (for synchronous requests).
+        self.signals = _ReplySignals()
+        for name in ('metaDataChanged', 'readyRead', 'finished'):
+            getattr(self.signals, name).connect(
+                getattr(reply, name), QtCore.Qt.QueuedConnection
+            )
+
+        # We keep a reference to the worker on the reply.
+        self.setAutoDelete(False)
+
+    # Convenience aliases for the signals.
+    @property
+    def metaDataChanged(self):
+        return self.signals.metaDataChanged
+
+    @property
+    def readyRead(self):
+        return self.signals.readyRead
+
+    @property
+    def finished(self):
+        return self.signals.finished
 
     ###########################################################################
-    # QThread interface.
+    # QRunnable interface.
     ###########################################################################
 
     def run(self):
         """ handles the request by acting as a WSGI forwarding server. """
+        start = time.time()
+        self.manager.queue_time.add(start - self.created)
+        try:
+            self._serve()
+        finally:
+            self.manager.service_time.add(time.time() - start)
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _serve(self):
         reply = self.reply
         url = reply.url()
         req = reply.request()
@@ -177,7 +382,7 @@ class ProxyReplyWorker(QtCore.QThread):
             'wsgi.url_scheme': url.scheme(),
             'wsgi.input': StringIO(unicode(reply.req_data)),
             'wsgi.errors': sys.stderr,
-            'wsgi.multithread': False,
+            'wsgi.multithread': True,
             'wsgi.multiprocess': True,
             'wsgi.run_once': False,
         }
@@ -189,25 +394,12 @@ class ProxyReplyWorker(QtCore.QThread):
             env[env_name] = head_val.data()
 
         try:
-            local_buf = []
-            local_buf_len = 0
-            for read in reply.handler(env, self._start_response):
-                if reply.aborted:
-                    return
-                if not isinstance(read, bytes):
-                    read = str(read).encode('utf8')
-                local_buf.append(read)
-                local_buf_len += len(read)
-                if local_buf_len >= 8192:
-                    # Do not write to buffer on every read, app is slowed down
-                    # due to lock contention
-                    with reply._buflock:
-                        reply.buffer += b''.join(local_buf)
-                    local_buf = []
-                    local_buf_len = 0
-                    self.readyRead.emit()
-            with reply._buflock:
-                reply.buffer += b''.join(local_buf)
+            response = reply.handler(env, self._start_response)
+            try:
+                self._write_response(response)
+            finally:
+                if hasattr(response, 'close'):
+                    response.close()
 
         except Exception as e:
             if reply.aborted:
@@ -219,15 +411,46 @@ class ProxyReplyWorker(QtCore.QThread):
                 QtNetwork.QNetworkRequest.HttpReasonPhraseAttribute,
                 'Internal Error'
             )
-            with reply._buflock:
-                reply.buffer += b'WSGI Proxy "Server" Error.\n' + str(e)
+            reply.buffer.write(
+                b'WSGI Proxy "Server" Error.\n' + str(e).encode('utf8')
+            )
         finally:
             self.readyRead.emit()
             self.finished.emit()
 
-    ###########################################################################
-    # Private interface.
-    ###########################################################################
+    def _write_response(self, response):
+        """ Write a WSGI response iterable to the reply's buffer. """
+
+        reply = self.reply
+        buffer = reply.buffer
+        unsignalled = 0
+        for read in response:
+            if reply.aborted or buffer.is_closed():
+                return
+            if not isinstance(read, bytes):
+                read = str(read).encode('utf8')
+            buffer.write(read)
+            unsignalled += len(read)
+
+            # Do not signal on every read, WebKit is slowed down by small
+            # reads.
+            if unsignalled >= 8192:
+                self.readyRead.emit()
+                unsignalled = 0
+
+            # Only consume more of the response as WebKit reads it, so that
+            # large responses are never held in memory as a whole.
+            if self.streaming and buffer.is_full():
+                if unsignalled:
+                    self.readyRead.emit()
+                    unsignalled = 0
+                if not buffer.wait_for_reader(self.read_timeout):
+                    logger.warning(
+                        'Reply for %s not read for %ss, discarding it',
+                        reply.url().toString(), self.read_timeout
+                    )
+                    buffer.close()
+                    return
 
     def _start_response(self, status, response_headers):
         """ WSGI start_response callable. """
@@ -0,0 +1,319 @@
+#
+# Jigna product code
+#
+# (C) Copyright 2013-2016 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+
+""" Per model method profiling of the requests handled by a jigna server.
+
+Usage::
+
+    profiler = CallProfiler()
+    server.profiler = profiler
+
+    # Run cProfile on the next 50 calls to 'Person.save'.
+    profiler.sample('myapp.model.Person', 'save', calls=50)
+
+    ...
+
+    for row in profiler.report():
+        print(row['kind'], row['type_name'], row['name'], row['wall']['p99'])
+
+    profiler.dump_stats('jigna.pstats')
+    profiler.dump_collapsed('jigna.collapsed')
+
+"""
+
+# Standard library imports.
+import cProfile
+import pstats
+import threading
+import time
+
+# Enthought library imports.
+from traits.api import Any, HasTraits
+
+# Local imports.
+from jigna.core.stats import Histogram
+
+# A monotonic clock where one is available.
+clock = getattr(time, 'monotonic', time.time)
+
+# The CPU time of the current thread where it is available (Python >= 3.7),
+# of the process otherwise.
+if hasattr(time, 'thread_time'):
+    cpu_clock = time.thread_time
+elif hasattr(time, 'process_time'):
+    cpu_clock = time.process_time
+else:
+    cpu_clock = time.clock
+
+#: Bucket boundaries (in bytes) for the payload size histograms.
+SIZE_BOUNDS = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+
+class CallStats(object):
+    """ The statistics gathered for a single kind of call. """
+
+    def __init__(self):
+        self.errors = 0
+        self.wall = Histogram()
+        self.cpu = Histogram()
+        self.request_size = Histogram(bounds=SIZE_BOUNDS)
+        self.response_size = Histogram(bounds=SIZE_BOUNDS)
+
+    def as_dict(self):
+        """ Return a JSON serializable summary of the statistics. """
+
+        return dict(
+            count         = self.wall.count,
+            errors        = self.errors,
+            wall          = self.wall.as_dict(),
+            cpu           = self.cpu.as_dict(),
+            request_size  = self.request_size.as_dict(),
+            response_size = self.response_size.as_dict(),
+        )
+
+
+class CallProfiler(HasTraits):
+    """ Gather call statistics per (kind, type_name, name).
+
+    'kind' is the kind of request (eg. 'call_instance_method' or
+    'get_instance_attribute'), 'type_name' the type of the object the request
+    is for and 'name' the method or attribute name. Methods run in a thread
+    via 'call_instance_method_thread' are recorded with the kind 'thread'.
+
+    """
+
+    #### 'CallProfiler' protocol ##############################################
+
+    def call(self, key, func, *args):
+        """ Call func(*args) and record the call against the given key. """
+
+        stats = self._get_stats(key)
+        profile = self._get_profile(key)
+
+        wall, cpu = clock(), cpu_clock()
+        try:
+            if profile is None:
+                return func(*args)
+
+            else:
+                return profile.runcall(func, *args)
+
+        except:
+            stats.errors += 1
+            raise
+
+        finally:
+            stats.wall.add(clock() - wall)
+            stats.cpu.add(cpu_clock() - cpu)
+            if profile is not None:
+                self._add_profile(profile)
+
+    def wrap(self, key, func):
+        """ Return a callable that calls func and records it against key. """
+
+        def wrapped(*args):
+            return self.call(key, func, *args)
+
+        return wrapped
+
+    def record_sizes(self, key, request_size, response_size):
+        """ Record the payload sizes (in bytes) of a request. """
+
+        stats = self._get_stats(key)
+        stats.request_size.add(request_size)
+        stats.response_size.add(response_size)
+
+        return
+
+    def sample(self, type_name, name, calls=100):
+        """ Run cProfile on the next 'calls' calls to the given method.
+
+        The samples are accumulated and can be saved using 'dump_stats' or
+        'dump_collapsed'.
+
+        """
+
+        with self._lock:
+            self._samples[(type_name, name)] = calls
+
+        return
+
+    def report(self):
+        """ Return the statistics as a list of dicts, most expensive first.
+
+        Each dict has the keys 'kind', 'type_name' and 'name' in addition to
+        the ones returned by 'CallStats.as_dict'.
+
+        """
+
+        rows = []
+        for key, stats in list(self._stats.items()):
+            row = stats.as_dict()
+            row['kind'], row['type_name'], row['name'] = key
+            rows.append(row)
+
+        rows.sort(key=lambda row: row['wall']['total'], reverse=True)
+
+        return rows
+
+    def reset(self):
+        """ Forget all statistics and samples gathered so far. """
+
+        with self._lock:
+            self._stats = {}
+            self._samples = {}
+            self._pstats = None
+
+        return
+
+    def dump_stats(self, filename):
+        """ Save the cProfile samples in the pstats format. """
+
+        self._get_pstats().dump_stats(filename)
+
+        return
+
+    def dump_collapsed(self, filename):
+        """ Save the cProfile samples in the collapsed stack format.
+
+        The file can be fed to flamegraph.pl, speedscope etc. The weights are
+        in microseconds. The call stacks are reconstructed from the caller
+        information recorded by cProfile, so the time of functions that are
+        called from several places is shared between the stacks in proportion
+        to the time spent in each caller.
+
+        """
+
+        with open(filename, 'w') as f:
+            for stack, weight in sorted(self.collapsed_stacks().items()):
+                f.write('%s %d\n' % (stack, weight))
+
+        return
+
+    def collapsed_stacks(self):
+        """ Return the cProfile samples as a {collapsed_stack : weight} dict.
+        """
+
+        entries = self._get_pstats().stats
+
+        callees = {}
+        for func, (cc, nc, tt, ct, callers) in entries.items():
+            for caller, edge in callers.items():
+                callees.setdefault(caller, []).append((func, edge[2], edge[3]))
+
+        stacks = {}
+
+        def walk(func, path, self_time, cumulative_time):
+            weight = int(self_time * 1e6)
+            if weight > 0:
+                stack = ';'.join(_frame_label(f) for f in path)
+                stacks[stack] = stacks.get(stack, 0) + weight
+
+            total = entries[func][3]
+            if total <= 0:
+                return
+
+            factor = cumulative_time / total
+            for callee, edge_self, edge_cumulative in callees.get(func, []):
+                if callee not in path:
+                    walk(
+                        callee, path + [callee], edge_self * factor,
+                        edge_cumulative * factor
+                    )
+
+        for func, (cc, nc, tt, ct, callers) in entries.items():
+            if not any(caller in entries for caller in callers):
+                walk(func, [func], tt, ct)
+
+        return stacks
+
+    #### Private protocol #####################################################
+
+    #: Guards the creation of statistics and the samples.
+    _lock = Any
+    def __lock_default(self):
+        return threading.Lock()
+
+    #: The statistics for each key.
+    _stats = Any
+    def __stats_default(self):
+        return {}
+
+    #: The number of calls still to sample, keyed by (type_name, name).
+    _samples = Any
+    def __samples_default(self):
+        return {}
+
+    #: The accumulated cProfile samples (a 'pstats.Stats' instance).
+    _pstats = Any
+
+    def _add_profile(self, profile):
+        """ Add the samples of a profile to the accumulated samples. """
+
+        profile.create_stats()
+        with self._lock:
+            if self._pstats is None:
+                self._pstats = pstats.Stats(profile)
+
+            else:
+                self._pstats.add(profile)
+
+        return
+
+    def _get_profile(self, key):
+        """ Return a new profile if the call should be sampled, else None. """
+
+        if not self._samples:
+            return None
+
+        kind, type_name, name = key
+        with self._lock:
+            remaining = self._samples.get((type_name, name), 0)
+            if remaining <= 0:
+                return None
+
+            if remaining == 1:
+                del self._samples[(type_name, name)]
+
+            else:
+                self._samples[(type_name, name)] = remaining - 1
+
+        return cProfile.Profile()
+
+    def _get_pstats(self):
+        """ Return the accumulated samples. """
+
+        if self._pstats is None:
+            raise ValueError('No samples have been recorded')
+
+        return self._pstats
+
+    def _get_stats(self, key):
+        """ Return the statistics for the given key, creating them if needed.
+        """
+
+        stats = self._stats.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(key, CallStats())
+
+        return stats
+
+
+def _frame_label(func):
+    """ Return a label for a function in a collapsed stack. """
+
+    filename, line, name = func
+    if filename == '~':
+        label = name
+
+    else:
+        label = '%s (%s:%d)' % (name, filename, line)
+
+    return label.replace(';', ',')
+
+#### EOF ######################################################################
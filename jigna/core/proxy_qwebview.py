@@ -31,7 +31,7 @@ class ProxyQWebView(QtWebKitWidgets.QWebView):
 
     def __init__(
         self, parent=None, python_namespace=None, callbacks=[],
-        debug=True, hosts={}
+        debug=True, hosts={}, signals=[]
     ):
         super(ProxyQWebView, self).__init__(parent)
 
@@ -39,7 +39,9 @@ class ProxyQWebView(QtWebKitWidgets.QWebView):
         self.setPage(self._page)
 
         # Connect JS with python.
-        self.expose_python_namespace(python_namespace, callbacks)
+        self.js_wrapper = self.expose_python_namespace(
+            python_namespace, callbacks, signals
+        )
 
         # Install custom access manager to delegate requests to custom WSGI
         # hosts.
@@ -73,11 +75,12 @@ class ProxyQWebView(QtWebKitWidgets.QWebView):
 
         return result
 
-    def expose_python_namespace(self, python_namespace, callbacks):
+    def expose_python_namespace(self, python_namespace, callbacks, signals=[]):
         """ Exposes the given python namespace to Javascript.
 
         Javascript can access the given list of callbacks as if they were
-        methods on the object described by the python namespace.
+        methods on the object described by the python namespace, and connect
+        to the given signals. Return the object exposed.
 
         python_namespace: str:
             Namespace to expose to the JS world. This creates an object of the
@@ -87,6 +90,10 @@ class ProxyQWebView(QtWebKitWidgets.QWebView):
             This list of callbacks is what is exposed to the JS world via the
             given python namespace.
 
+        signals: [signal_name]:
+            The names of signals (taking a single 'QVariant' argument) that
+            the JS world can connect to.
+
         Usage:
         ------
 
@@ -101,11 +108,15 @@ class ProxyQWebView(QtWebKitWidgets.QWebView):
 
         """
         frame = self._page.mainFrame()
-        js_wrapper = create_js_object_wrapper(callbacks=callbacks,parent=frame)
+        js_wrapper = create_js_object_wrapper(
+            callbacks=callbacks, parent=frame, signals=signals
+        )
         frame.javaScriptWindowObjectCleared.connect(
             lambda: self._on_js_window_cleared(python_namespace, js_wrapper)
         )
 
+        return js_wrapper
+
     def _on_js_window_cleared(self, namespace, js_wrapper):
         frame = self._page.mainFrame()
         frame.addToJavaScriptWindowObject(namespace, js_wrapper)
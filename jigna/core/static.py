@@ -0,0 +1,357 @@
+""" Serving of static files (shared by the WSGI and tornado servers).
+
+Small files are kept in an LRU cache which is validated against the
+modification time of the file on every request, so a changed file is never
+served stale. Large files are not cached, they are read in chunks from a
+memory map instead.
+
+Responses carry 'ETag' and 'Last-Modified' headers so that clients can make
+conditional requests (which are answered with '304 Not Modified'), and single
+byte ranges are supported ('206 Partial Content').
+
+"""
+
+# Standard library imports.
+from collections import OrderedDict, namedtuple
+from email.utils import formatdate, mktime_tz, parsedate_tz
+import json
+import mimetypes
+import mmap
+import os
+from os.path import abspath, dirname, join
+import re
+import threading
+
+#: The directory containing the built JS bundles.
+JS_DIST_DIR = join(dirname(dirname(abspath(__file__))), 'js', 'dist')
+
+#: Matches the names of content hashed files (eg. 'jigna-core.0123456789.js'),
+#: which never change and so can be cached by clients forever.
+HASHED_FILE = re.compile(r'\.[0-9a-f]{10}(\.min)?\.[a-z]+$')
+
+mimeLock = threading.Lock()
+mimeInitialized = False
+
+
+def guess_type(path):
+    """ Thread-safe wrapper around the @#%^$$# non-thread safe mimetypes module. NEVER
+    call mimetypes directly.
+
+    """
+
+    global mimeLock
+    global mimeInitialized
+
+    if not mimeInitialized:
+        with mimeLock:
+            if not mimeInitialized:
+                mimetypes.init()
+
+                # On Windows, the mime type for 'ttf' (True Type Fonts) isn't
+                # recognized correctly. We, therefore, add the correct mime
+                # type here.
+                mimetypes.add_type('application/font-sfnt', '.ttf')
+
+                mimeInitialized = True
+
+    guessed = mimetypes.guess_type(path)
+
+    return (guessed[0] or "", guessed[1] or "")
+
+
+#: The information about a file needed to serve it. 'data' is the content of
+#: the file if it is cached, and None otherwise.
+StaticFile = namedtuple(
+    'StaticFile',
+    ['path', 'size', 'mtime', 'etag', 'last_modified', 'content_type', 'data']
+)
+
+#: How to respond to a request for a static file. 'start' and 'stop' are the
+#: byte range of the file to send as the body (if any).
+StaticResponse = namedtuple(
+    'StaticResponse', ['status', 'reason', 'headers', 'start', 'stop']
+)
+
+
+class StaticFiles(object):
+    """ A (thread safe) cache of static files. """
+
+    #: The 'Cache-Control' header sent with every file. Clients must
+    #: revalidate their copy (which is cheap thanks to conditional requests)
+    #: as the files may change while the server is running.
+    cache_control = 'no-cache'
+
+    #: The 'Cache-Control' header sent with content hashed files.
+    hashed_cache_control = 'public, max-age=31536000, immutable'
+
+    #: The size of the chunks large files are read in.
+    chunk_size = 256 * 1024
+
+    def __init__(self, max_size=32 * 1024 * 1024, max_file_size=256 * 1024):
+        """ Constructor.
+
+        max_size: The maximum total size (in bytes) of the cached files.
+        max_file_size: Files larger than this are never cached (and are
+        streamed instead). They are read inline, so this also bounds the
+        time spent blocking on a read.
+
+        """
+        self.max_size = max_size
+        self.max_file_size = max_file_size
+
+        self._files = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """ Return the StaticFile for a path (None if it is not a file). """
+
+        try:
+            stat = os.stat(path)
+
+        except OSError:
+            return None
+
+        mtime = stat.st_mtime
+        size = stat.st_size
+
+        with self._lock:
+            static_file = self._files.get(path)
+            if static_file is not None:
+                if static_file.mtime == mtime and static_file.size == size:
+                    # Mark as the most recently used.
+                    del self._files[path]
+                    self._files[path] = static_file
+
+                    return static_file
+
+                self._remove(path)
+
+        if not os.path.isfile(path):
+            return None
+
+        data = None
+        if size <= self.max_file_size:
+            with open(path, 'rb') as f:
+                data = f.read()
+
+            # In case the file changed since it was stat'ed.
+            size = len(data)
+
+        static_file = StaticFile(
+            path          = path,
+            size          = size,
+            mtime         = mtime,
+            etag          = '"%x-%x"' % (int(mtime * 1e6), size),
+            last_modified = formatdate(mtime, usegmt=True),
+            content_type  = '; '.join(filter(None, guess_type(path))),
+            data          = data,
+        )
+
+        if data is not None:
+            with self._lock:
+                self._remove(path)
+                self._files[path] = static_file
+                self._size += size
+                while self._size > self.max_size:
+                    self._remove(next(iter(self._files)))
+
+        return static_file
+
+    def clear(self):
+        """ Empty the cache. """
+
+        with self._lock:
+            self._files.clear()
+            self._size = 0
+
+    def prepare(self, static_file, get_header):
+        """ Return the StaticResponse to a request for a file.
+
+        'get_header' is called with the name of a request header and returns
+        its value (or None).
+        """
+        if HASHED_FILE.search(static_file.path):
+            cache_control = self.hashed_cache_control
+        else:
+            cache_control = self.cache_control
+
+        headers = [
+            ('Content-Type', static_file.content_type),
+            ('ETag', static_file.etag),
+            ('Last-Modified', static_file.last_modified),
+            ('Cache-Control', cache_control),
+            ('Accept-Ranges', 'bytes'),
+        ]
+
+        if is_not_modified(static_file, get_header):
+            return StaticResponse(304, 'Not Modified', headers, 0, 0)
+
+        size = static_file.size
+        byte_range = parse_range(get_header('Range'), size)
+        if byte_range is None:
+            start, stop = 0, size
+            status, reason = 200, 'OK'
+
+        elif byte_range == UNSATISFIABLE:
+            headers.append(('Content-Range', 'bytes */%d' % size))
+            return StaticResponse(
+                416, 'Requested Range Not Satisfiable', headers, 0, 0
+            )
+
+        else:
+            start, stop = byte_range
+            status, reason = 206, 'Partial Content'
+            headers.append(
+                ('Content-Range', 'bytes %d-%d/%d' % (start, stop - 1, size))
+            )
+
+        headers.append(('Content-Length', str(stop - start)))
+
+        return StaticResponse(status, reason, headers, start, stop)
+
+    def iter_content(self, static_file, start, stop):
+        """ Generate the bytes in [start, stop) of a file in chunks. """
+
+        if static_file.data is not None:
+            if start < stop:
+                yield static_file.data[start:stop]
+            return
+
+        for chunk in read_range(static_file.path, start, stop, self.chunk_size):
+            yield chunk
+
+    #### Private protocol #####################################################
+
+    def _remove(self, path):
+        """ Remove a file from the cache (if it is there). """
+
+        static_file = self._files.pop(path, None)
+        if static_file is not None:
+            self._size -= static_file.size
+
+
+#: The value returned by 'parse_range' when a range cannot be satisfied.
+UNSATISFIABLE = 'unsatisfiable'
+
+
+def parse_range(value, size):
+    """ Parse the value of a 'Range' header for a file of 'size' bytes.
+
+    Return the (start, stop) of the range, None if the whole file should be
+    sent (there is no range, or it is not a single byte range) and
+    'UNSATISFIABLE' if the range lies outside of the file.
+    """
+    if not value or not value.startswith('bytes='):
+        return None
+
+    spec = value[len('bytes='):].strip()
+    if ',' in spec or '-' not in spec:
+        return None
+
+    first, last = [part.strip() for part in spec.split('-', 1)]
+    try:
+        if not first:
+            # A suffix range, ie. the last 'last' bytes.
+            length = int(last)
+            if length == 0:
+                return UNSATISFIABLE
+            start, stop = max(size - length, 0), size
+
+        else:
+            start = int(first)
+            stop = min(int(last) + 1, size) if last else size
+            if stop <= start and start < size:
+                return None
+
+    except ValueError:
+        return None
+
+    if start >= size:
+        return UNSATISFIABLE
+
+    return start, stop
+
+
+def is_not_modified(static_file, get_header):
+    """ Does a conditional request match our copy of the file? """
+
+    if_none_match = get_header('If-None-Match')
+    if if_none_match:
+        etags = [etag.strip() for etag in if_none_match.split(',')]
+        # Weak comparison, as allowed for GET requests.
+        etags = [etag[2:] if etag.startswith('W/') else etag for etag in etags]
+        return '*' in etags or static_file.etag in etags
+
+    if_modified_since = get_header('If-Modified-Since')
+    if if_modified_since:
+        parsed = parsedate_tz(if_modified_since)
+        if parsed is not None:
+            return int(static_file.mtime) <= mktime_tz(parsed)
+
+    return False
+
+
+def read_range(path, start, stop, chunk_size):
+    """ Generate the bytes in [start, stop) of a file in chunks, read via a
+    memory map.
+    """
+    if start >= stop:
+        return
+
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # The file may have shrunk since it was stat'ed.
+            stop = min(stop, len(mapped))
+            for offset in range(start, stop, chunk_size):
+                yield mapped[offset:min(offset + chunk_size, stop)]
+
+        finally:
+            mapped.close()
+
+
+def bundle_files(bundle):
+    """ Return the names of the files (in the JS dist directory) that make up
+    a JS bundle (eg. 'jigna.js'), in the order they must be loaded in.
+
+    The build splits each bundle into content hashed vendor and jigna files
+    (listed in 'manifest.json'). If there is no manifest the single file
+    bundle is used.
+    """
+    global _manifest
+
+    if _manifest is None:
+        try:
+            with open(join(JS_DIST_DIR, 'manifest.json')) as f:
+                _manifest = json.load(f)
+
+        except (IOError, ValueError):
+            _manifest = {}
+
+    return _manifest.get(bundle, [bundle])
+
+
+def script_tags(bundle, prefix='/jigna/'):
+    """ Return the HTML script tags that load a JS bundle. """
+
+    return '\n'.join(
+        '<script type="text/javascript" src="%s%s"></script>' % (prefix, name)
+        for name in bundle_files(bundle)
+    )
+
+
+def worker_url(worker, prefix='/jigna/'):
+    """ Return the URL of the script of a jigna worker ('jigna-worker.js' or
+    'jigna-shared-worker.js').
+    """
+    return prefix + bundle_files(worker)[0]
+
+
+#: The contents of the JS bundle manifest (loaded on first use).
+_manifest = None
+
+#: The cache shared by all of the servers.
+static_files = StaticFiles()
+
+#### EOF ######################################################################
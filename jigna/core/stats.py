@@ -0,0 +1,90 @@
+#
+# Jigna product code
+#
+# (C) Copyright 2013-2016 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+
+""" Light-weight statistics helpers used by the jigna instrumentation. """
+
+# Standard library imports.
+from bisect import bisect_left
+import threading
+
+
+class Histogram(object):
+    """ A thread-safe histogram with fixed bucket boundaries.
+
+    The default boundaries are suited to durations measured in seconds and
+    range from a millisecond to five seconds; anything larger lands in the
+    overflow bucket.
+
+    """
+
+    #: Upper bounds of the default buckets (in seconds).
+    DEFAULT_BOUNDS = (
+        0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0
+    )
+
+    def __init__(self, bounds=None):
+        self.bounds = tuple(bounds or self.DEFAULT_BOUNDS)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def add(self, value):
+        """ Add a value to the histogram. """
+
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value
+            if value > self.maximum:
+                self.maximum = value
+
+    def percentile(self, p):
+        """ Return an upper bound for the given percentile (0 <= p <= 100).
+
+        The value returned is the upper bound of the bucket that contains the
+        percentile (or the largest value seen when it is in the overflow
+        bucket), None if the histogram is empty.
+
+        """
+
+        if self.count == 0:
+            return None
+
+        rank = self.count * p / 100.0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count > 0:
+                break
+
+        if index < len(self.bounds):
+            return min(self.bounds[index], self.maximum)
+
+        return self.maximum
+
+    def reset(self):
+        """ Forget all values added so far. """
+
+        with self._lock:
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.count = 0
+            self.total = 0.0
+            self.maximum = 0.0
+
+    def as_dict(self):
+        """ Return a JSON serializable summary of the histogram. """
+
+        return dict(
+            bounds  = list(self.bounds),
+            counts  = list(self.counts),
+            count   = self.count,
+            total   = self.total,
+            mean    = self.total / self.count if self.count else 0.0,
+            maximum = self.maximum,
+            p50     = self.percentile(50),
+            p99     = self.percentile(99),
+        )
@@ -0,0 +1,197 @@
+#
+# Jigna product code
+#
+# (C) Copyright 2013-2016 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+
+""" Record the traffic between web clients and a jigna web server.
+
+The recorder writes every request and response received and sent by the
+server's sockets, and every event broadcast to them, to a log file that can be
+replayed against another server with 'jigna.client.replay'.
+
+Usage::
+
+    recorder = TrafficRecorder(filename='session.jsonl.gz')
+    recorder.start()
+    server.recorder = recorder
+    ...
+    recorder.stop()
+
+The log is a (optionally gzipped) file of JSON lines. The first line is a
+header dict, every other line is a record::
+
+    [time, direction, socket, request_id, payload]
+
+where 'time' is the number of seconds since the recording started,
+'direction' is one of 'open', 'close', 'request', 'response' or 'event',
+'socket' identifies the client socket (or is 'get' for the synchronous GET
+requests and None for events, which are broadcast to all sockets) and
+'payload' is the jsonized request, response or event as sent on the wire.
+
+"""
+
+# Standard library imports.
+from collections import namedtuple
+import gzip
+import io
+import json
+import threading
+import time
+
+# Enthought library imports.
+from traits.api import Any, Bool, HasTraits, Int, Str
+
+# A monotonic clock where one is available.
+clock = getattr(time, 'monotonic', time.time)
+
+#: The version of the log format.
+FORMAT_VERSION = 1
+
+
+#: A single record of a traffic log.
+TrafficRecord = namedtuple(
+    'TrafficRecord', ['time', 'direction', 'socket', 'request_id', 'payload']
+)
+
+
+class TrafficRecorder(HasTraits):
+    """ Record the traffic of a web server to a log file. """
+
+    #### 'TrafficRecorder' protocol ###########################################
+
+    #: The name of the log file.
+    filename = Str
+
+    #: Whether the log file is gzipped (by default, if the filename ends with
+    #: '.gz').
+    compress = Bool
+    def _compress_default(self):
+        return self.filename.endswith('.gz')
+
+    #: The number of records written so far.
+    count = Int
+
+    #: Is the recorder recording?
+    recording = Bool(False)
+
+    def start(self):
+        """ Start recording (truncating the log file). """
+
+        if self.recording:
+            return
+
+        if self.compress:
+            self._file = gzip.open(self.filename, 'wb')
+
+        else:
+            self._file = open(self.filename, 'wb')
+
+        self._start_time = clock()
+        self.count = 0
+        self._write(dict(version=FORMAT_VERSION, start=time.time()))
+        self.recording = True
+
+        return
+
+    def stop(self):
+        """ Stop recording and close the log file. """
+
+        if not self.recording:
+            return
+
+        with self._lock:
+            self.recording = False
+            self._file.close()
+            self._file = None
+
+        return
+
+    def record(self, direction, socket, request_id=None, payload=None):
+        """ Record a message.
+
+        This is thread safe and does nothing if the recorder is not
+        recording.
+
+        """
+
+        if not self.recording:
+            return
+
+        with self._lock:
+            # We may have been stopped while waiting for the lock.
+            if self._file is None:
+                return
+
+            self._write([
+                round(clock() - self._start_time, 6), direction, socket,
+                request_id, payload
+            ])
+            self.count += 1
+
+        return
+
+    #### Private protocol #####################################################
+
+    #: The open log file.
+    _file = Any
+
+    #: Serializes the writes to the log file.
+    _lock = Any
+    def __lock_default(self):
+        return threading.Lock()
+
+    #: The (monotonic) time at which the recording started.
+    _start_time = Any
+
+    def _write(self, obj):
+        """ Write a single line to the log file. """
+
+        line = json.dumps(obj, separators=(',', ':')) + '\n'
+        self._file.write(line.encode('utf-8'))
+
+        return
+
+
+def read_traffic(filename):
+    """ Read a traffic log.
+
+    Return a tuple (header, records) where 'records' is an iterator over the
+    TrafficRecord instances. The records are read from the file one line at a
+    time as they are iterated over, so logs need not fit in memory.
+
+    """
+
+    if filename.endswith('.gz'):
+        f = io.TextIOWrapper(gzip.open(filename, 'rb'), encoding='utf-8')
+
+    else:
+        f = io.open(filename, encoding='utf-8')
+
+    try:
+        header = json.loads(f.readline())
+        if header.get('version') != FORMAT_VERSION:
+            raise ValueError(
+                'unsupported traffic log version: %s' % header.get('version')
+            )
+
+    except Exception:
+        f.close()
+        raise
+
+    return header, _read_records(f)
+
+
+def _read_records(f):
+    """ Yield the records in the rest of a traffic log and close it. """
+
+    with f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield TrafficRecord(*json.loads(line))
+
+    return
+
+#### EOF ######################################################################
@@ -0,0 +1,161 @@
+""" Ahead-of-time type manifests.
+
+The first time a server marshals an instance of a type it introspects the
+type and sends its description (its attribute, event and method names) to the
+client in a 'new_type' event, and the client builds a proxy constructor from
+it. This happens for every type on every connection.
+
+A type manifest describes a declared set of types once, ahead of time. It is
+written as a small JS module (named after the hash of its contents, so that it
+can be cached by browsers forever) which registers the type descriptions with
+jigna before it is initialized. The client then builds the proxy constructors
+when it starts and tells the server the hash of its manifest, and a server
+with the same manifest does not introspect those types nor send them.
+
+Usage::
+
+    python -m jigna.core.type_manifest mymodule:Person mymodule:Address -o dist
+
+which writes 'jigna-types.<hash>.js' (the JS module) and 'jigna-types.json'
+(for the server, see 'TypeManifest.load') to the 'dist' directory.
+
+Note that the types must be constructible without arguments and that only the
+attributes that all of their instances have can be described.
+
+"""
+
+# Standard library imports.
+import argparse
+import hashlib
+from importlib import import_module
+import json
+from os.path import join
+import sys
+
+# Enthought library imports.
+from traits.api import HasTraits, List, Property, Str, cached_property
+
+# Jigna library.
+from jigna.server import Server
+
+
+class TypeManifest(HasTraits):
+    """ The descriptions of a set of types. """
+
+    #### 'TypeManifest' protocol ##############################################
+
+    #: The description of each type (as sent in a 'new_type' event), sorted by
+    #: type name.
+    types = List
+
+    #: The hash of the descriptions (a hex string of 10 characters).
+    hash = Property(Str, depends_on='types[]')
+
+    #: The name of the JS module.
+    filename = Property(Str, depends_on='hash')
+
+    #: The names of the types.
+    type_names = Property(List(Str), depends_on='types[]')
+
+    @classmethod
+    def from_classes(cls, classes):
+        """ Create the manifest of some classes. """
+
+        # Use the server's introspection so that the descriptions are exactly
+        # the ones it would send.
+        server = Server()
+
+        types = [server._get_instance_info(klass()) for klass in classes]
+
+        return cls(types=sorted(types, key=lambda info: info['type_name']))
+
+    @classmethod
+    def load(cls, path):
+        """ Load a manifest saved with 'save'. """
+
+        with open(path) as f:
+            return cls(types=json.load(f)['types'])
+
+    def save(self, path):
+        """ Save the manifest (as JSON). """
+
+        with open(path, 'w') as f:
+            json.dump(dict(hash=self.hash, types=self.types), f, indent=2)
+
+        return
+
+    def script_tag(self, prefix='/jigna/'):
+        """ Return the HTML script tag that loads the JS module. """
+
+        return '<script type="text/javascript" src="%s%s"></script>' % (
+            prefix, self.filename
+        )
+
+    def to_js(self):
+        """ Return the JS module that registers the types with jigna. """
+
+        return '// Generated by jigna.core.type_manifest, do not edit.\n' \
+            'jigna.register_types(%s, %s);\n' % (
+                json.dumps(self.hash), self._dumps()
+            )
+
+    #### Private protocol #####################################################
+
+    def _dumps(self):
+        """ Return the canonical JSON of the types. """
+
+        return json.dumps(self.types, sort_keys=True, separators=(',', ':'))
+
+    def _get_filename(self):
+        return 'jigna-types.%s.js' % self.hash
+
+    @cached_property
+    def _get_hash(self):
+        return hashlib.sha256(self._dumps().encode('utf-8')).hexdigest()[:10]
+
+    @cached_property
+    def _get_type_names(self):
+        return [info['type_name'] for info in self.types]
+
+
+def import_class(name):
+    """ Import a class given as 'module:name' or 'module.name'. """
+
+    if ':' in name:
+        module_name, class_name = name.split(':', 1)
+    else:
+        module_name, class_name = name.rsplit('.', 1)
+
+    return getattr(import_module(module_name), class_name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Generate the type manifest of some classes.'
+    )
+    parser.add_argument(
+        'classes', nargs='+', help='the classes, eg. mymodule:Person'
+    )
+    parser.add_argument(
+        '-o', '--output-dir', default='.',
+        help='the directory to write the manifest to (default: .)'
+    )
+    args = parser.parse_args(argv)
+
+    manifest = TypeManifest.from_classes(
+        [import_class(name) for name in args.classes]
+    )
+
+    with open(join(args.output_dir, manifest.filename), 'w') as f:
+        f.write(manifest.to_js())
+
+    manifest.save(join(args.output_dir, 'jigna-types.json'))
+    print(manifest.filename)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+#### EOF ######################################################################
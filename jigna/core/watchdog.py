@@ -0,0 +1,218 @@
+#
+# Jigna product code
+#
+# (C) Copyright 2013-2016 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+
+""" A watchdog that measures the scheduling lag of a tornado IOLoop.
+
+All requests from web clients (and, with the default 'same' dispatch, all
+trait change notifications) are handled on the IOLoop thread, so a single slow
+model method freezes every client. The watchdog runs in a thread of its own,
+regularly schedules a callback on the loop and measures how long it takes for
+the callback to run. When that takes longer than a threshold the Python stack
+of the loop thread is captured along with the request being handled.
+
+Usage::
+
+    watchdog = LoopWatchdog(threshold=0.1)
+    server.watchdog = watchdog
+    watchdog.start()
+
+"""
+
+# Standard library imports.
+from collections import deque
+from contextlib import contextmanager
+import logging
+import sys
+import threading
+import time
+import traceback
+
+# Enthought library imports.
+from traits.api import Any, Event, Float, HasTraits, Instance, Int, Property
+
+# Local imports.
+from jigna.core.stats import Histogram
+
+# Logger.
+logger = logging.getLogger(__name__)
+
+# A monotonic clock where one is available.
+clock = getattr(time, 'monotonic', time.time)
+
+
+class LoopWatchdog(HasTraits):
+    """ Watch a tornado IOLoop for scheduling lag. """
+
+    #### 'LoopWatchdog' protocol ##############################################
+
+    #: The IOLoop to watch (defaults to the current IOLoop).
+    io_loop = Any
+    def _io_loop_default(self):
+        from tornado.ioloop import IOLoop
+        return IOLoop.current()
+
+    #: How often the loop is probed (in seconds).
+    interval = Float(0.05)
+
+    #: The lag (in seconds) above which the loop is considered blocked and
+    #: the stack of the loop thread is captured.
+    threshold = Float(0.1)
+
+    #: The number of stall reports to keep.
+    max_reports = Int(100)
+
+    #: The distribution of the measured lag (in seconds).
+    histogram = Instance(Histogram, ())
+
+    #: The stalls detected so far (most recent last).
+    #:
+    #: Each report is a dict with the keys 'time', 'lag', 'stack', 'kind',
+    #: 'type_name' and 'name'. 'lag' is updated with the full duration of the
+    #: stall once the loop becomes responsive again.
+    reports = Property
+    def _get_reports(self):
+        return list(self._reports)
+
+    #: Fired (on the watchdog thread) with the report of each stall.
+    stalled = Event
+
+    def start(self):
+        """ Start watching the loop. """
+
+        if self._thread is not None:
+            return
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name='jigna-loop-watchdog'
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+        return
+
+    def stop(self):
+        """ Stop watching the loop. """
+
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        return
+
+    @contextmanager
+    def activity(self, kind, type_name=None, name=None):
+        """ A context manager that records what the current thread is doing.
+
+        The activity is included in any stall report captured while the
+        context manager is active on the loop thread.
+
+        """
+
+        ident = threading.current_thread().ident
+        previous = self._activities.get(ident)
+        self._activities[ident] = dict(
+            kind=kind, type_name=type_name, name=name
+        )
+        try:
+            yield
+
+        finally:
+            if previous is None:
+                self._activities.pop(ident, None)
+            else:
+                self._activities[ident] = previous
+
+    def snapshot(self):
+        """ Return a JSON serializable summary of the measurements. """
+
+        return dict(
+            histogram = self.histogram.as_dict(),
+            stalls    = len(self._reports),
+        )
+
+    #### Private protocol #####################################################
+
+    #: The thread doing the watching.
+    _thread = Any
+
+    #: Set to stop the watching thread.
+    _stop_event = Any
+
+    #: The ident of the thread running the IOLoop.
+    _loop_ident = Any
+
+    #: The activity of each thread, keyed by the thread ident.
+    _activities = Any
+    def __activities_default(self):
+        return {}
+
+    #: The recent stall reports.
+    _reports = Any
+    def __reports_default(self):
+        return deque(maxlen=self.max_reports)
+
+    def _run(self):
+        """ Probe the loop until stopped. """
+
+        while not self._stop_event.is_set():
+            beat = threading.Event()
+            self.io_loop.add_callback(self._on_beat, beat, clock())
+
+            if not beat.wait(self.threshold):
+                report = self._report_stall()
+                while not beat.wait(self.interval):
+                    if self._stop_event.is_set():
+                        return
+
+                report['lag'] = beat.lag
+
+            self._stop_event.wait(self.interval)
+
+        return
+
+    def _on_beat(self, beat, sent):
+        """ Called on the loop thread when a probe gets to run. """
+
+        beat.lag = clock() - sent
+        self._loop_ident = threading.current_thread().ident
+        self.histogram.add(beat.lag)
+        beat.set()
+
+        return
+
+    def _report_stall(self):
+        """ Capture the stack and activity of the blocked loop thread. """
+
+        ident = self._loop_ident
+        frame = sys._current_frames().get(ident) if ident else None
+        stack = ''.join(traceback.format_stack(frame)) if frame else ''
+        activity = self._activities.get(ident) or {}
+
+        report = dict(
+            time      = time.time(),
+            lag       = self.threshold,
+            stack     = stack,
+            kind      = activity.get('kind'),
+            type_name = activity.get('type_name'),
+            name      = activity.get('name'),
+        )
+        self._reports.append(report)
+
+        logger.warning(
+            'IOLoop blocked for more than %.3fs (%s %s.%s):\n%s',
+            self.threshold, report['kind'], report['type_name'],
+            report['name'], stack
+        )
+        self.stalled = report
+
+        return report
+
+#### EOF ######################################################################
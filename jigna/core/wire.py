@@ -0,0 +1,486 @@
+""" A compact wire encoding for the messages sent to websocket clients.
+
+The default ('json') encoding sends each response and event as a JSON text
+(itself embedded in a JSON array with the request id), in which every
+marshalled value is a dict with the keys 'type', 'value' and 'info', every
+event repeats the keys 'obj', 'name', 'data' and 'items_event', and type
+names, attribute names and object ids are sent in full every time.
+
+The compact encoding (used by clients that connect with '?wire=compact')
+instead sends:
+
+- positional arrays rather than dicts (see the codes below).
+
+- every object id, type name, attribute/event/method name and event name as
+  an integer code. The codes are per connection: the first message that uses
+  a string defines its code by listing the string at the end of the message,
+  later messages only send the code.
+
+- the payload inline, rather than as a JSON text within the message.
+
+A message is '[request_id, payload]' or '[request_id, payload, strings]' where
+'strings' are the strings defined by the message (they are given the next
+codes, in order, before the payload is decoded).
+
+So that the table of codes does not grow forever (every object ever sent has
+an id in it), the encoder starts a new table once it has 'max_strings'
+strings: the first message after that is '[request_id, payload, strings,
+true]', and the decoder drops all of the codes defined so far before it
+defines the message's strings (which then start from code 0).
+
+The requests sent by clients are unchanged, so a client only needs to decode
+(see 'CompactDecoder' and 'jigna.WireDecoder' in JS).
+
+"""
+
+# Standard library.
+import json
+
+#### Value codes ##############################################################
+
+#: A primitive: [PRIMITIVE, value]
+PRIMITIVE = 0
+
+#: An instance: [INSTANCE, id, type_name] or
+#: [INSTANCE, id, [type_name, attribute_names, event_names, method_names]]
+#: (with a fifth item, the marshalled attribute values, if they are sent).
+INSTANCE = 1
+
+#: A list: [LIST, id, [length]], [LIST, id, [length, marshalled_items]] or
+#: (for a list whose items are sent in columns)
+#: [LIST, id, [length, null, [type_name, ids, [[name, values], ...]]]]
+LIST = 2
+
+#: A dict: [DICT, id, [keys]] or [DICT, id, [keys, values_list_info]]
+DICT = 3
+
+#: Items added to/removed from a list:
+#: [LIST_SPLICE, id, [index, removed, added_list_info]] or
+#: [LIST_SPLICE, id, [start, stop, step, removed, added_list_info]]
+LIST_SPLICE = 4
+
+#: Items added to/removed from a dict:
+#: [DICT_UPDATE, id, [removed_keys, added_dict_info]]
+DICT_UPDATE = 5
+
+#: Anything else, sent as is: [RAW, value]
+RAW = 6
+
+#### Event codes ##############################################################
+
+# An event is [obj, name, code, data] where 'obj' and 'name' are string codes
+# and the code says how 'data' is encoded. Events of any other shape are sent
+# as is (as a dict).
+
+#: The data is sent as is (eg. the result of a threaded call).
+EVENT_RAW = 0
+
+#: The data is a marshalled value.
+EVENT_VALUE = 1
+
+#: The data is a marshalled value and the event is an 'items' event.
+EVENT_ITEMS = 2
+
+#: The data is a dict of marshalled values ('context_updated').
+EVENT_CONTEXT = 3
+
+#: The data is the full info of a type ('new_type').
+EVENT_TYPE = 4
+
+#### Internal #################################################################
+
+_MARSHALLED_KEYS = frozenset(['type', 'value', 'info'])
+_EVENT_KEYS = frozenset(['obj', 'name', 'data', 'items_event'])
+_FUTURE_EVENT_KEYS = frozenset(['obj', 'name', 'data'])
+
+_TYPE_INFO_KEYS = frozenset(
+    ['type_name', 'attribute_names', 'event_names', 'method_names']
+)
+_VALUES_KEY = frozenset(['attribute_values'])
+_NAME_LISTS = ('attribute_names', 'event_names', 'method_names')
+
+
+class CompactEncoder(object):
+    """ Encodes the responses and events sent over a single connection. """
+
+    #: The number of strings after which a new table of codes is started.
+    max_strings = 100000
+
+    def __init__(self):
+        # The code of each string defined so far.
+        self._codes = {}
+
+        # The strings defined since the last message was encoded.
+        self._new_strings = []
+
+        # Has a new table of codes been started by the message being encoded?
+        self._reset = False
+
+    def encode_event(self, event, request_id=-1):
+        """ Encode an event into a message. """
+
+        self._start_message()
+        return self._message(request_id, self._encode_event(event))
+
+    def encode_response(self, request_id, response):
+        """ Encode a response (a dict with the keys 'exception' and 'result')
+        into a message.
+        """
+        self._start_message()
+        payload = [self._encode_any(response['result'])]
+        if response['exception'] is not None:
+            payload.append(response['exception'])
+
+        return self._message(request_id, payload)
+
+    #### Private protocol #####################################################
+
+    def _encode_any(self, value):
+        """ Encode a value that may or may not be a marshalled value. """
+
+        if value is None:
+            return None
+
+        if _is_marshalled(value):
+            return self._encode_value(value)
+
+        return [RAW, value]
+
+    def _encode_event(self, event):
+        keys = frozenset(event)
+        if keys != _EVENT_KEYS and keys != _FUTURE_EVENT_KEYS:
+            return event
+
+        obj, name, data = event['obj'], event['name'], event['data']
+        if 'items_event' in event:
+            if not _is_marshalled(data):
+                return event
+
+            code = EVENT_ITEMS if event['items_event'] else EVENT_VALUE
+            data = self._encode_value(data)
+
+        elif obj == 'jigna' and name == 'context_updated':
+            code = EVENT_CONTEXT
+            data = dict(
+                (key, self._encode_value(value)) for key, value in data.items()
+            )
+
+        elif obj == 'jigna' and name == 'new_type':
+            try:
+                data = self._encode_type_info(data)
+
+            except _CannotEncode:
+                return event
+
+            code = EVENT_TYPE
+
+        else:
+            # Eg. the events fired when a future is done.
+            code = EVENT_RAW
+
+        return [self._intern(obj), self._intern(name), code, data]
+
+    def _encode_list_info(self, info):
+        if set(info) == set(['length']):
+            return [info['length']]
+
+        if set(info) == set(['length', 'data']):
+            return [info['length'], [self._encode_value(v) for v in info['data']]]
+
+        if set(info) == set(['length', 'columns']):
+            return [info['length'], None, self._encode_columns(info['columns'])]
+
+        raise _CannotEncode
+
+    def _encode_columns(self, columns):
+        return [
+            self._intern(columns['type_name']),
+            [self._intern(obj_id) for obj_id in columns['ids']],
+            [
+                [self._intern(name), values]
+                for name, values in sorted(columns['values'].items())
+            ]
+        ]
+
+    def _encode_dict_info(self, info):
+        if set(info) == set(['keys']):
+            return [info['keys']]
+
+        if set(info) == set(['keys', 'values']):
+            return [info['keys'], self._encode_list_info(info['values'])]
+
+        raise _CannotEncode
+
+    def _encode_type_info(self, info):
+        keys = set(info)
+        if keys == set(['type_name']):
+            return self._intern(info['type_name'])
+
+        if not _TYPE_INFO_KEYS <= keys <= _TYPE_INFO_KEYS | _VALUES_KEY:
+            raise _CannotEncode
+
+        encoded = [self._intern(info['type_name'])]
+        for key in _NAME_LISTS:
+            encoded.append([self._intern(name) for name in info[key]])
+
+        if 'attribute_values' in info:
+            encoded.append(
+                [self._encode_value(value) for value in info['attribute_values']]
+            )
+
+        return encoded
+
+    def _encode_value(self, marshalled):
+        """ Encode a marshalled value. """
+
+        kind, value, info = (
+            marshalled['type'], marshalled['value'], marshalled['info']
+        )
+        try:
+            if kind == 'primitive':
+                if info is not None:
+                    raise _CannotEncode
+                return [PRIMITIVE, value]
+
+            if kind == 'instance':
+                return [INSTANCE, self._intern(value), self._encode_type_info(info)]
+
+            if kind == 'list':
+                if 'length' in info:
+                    return [LIST, self._intern(value), self._encode_list_info(info)]
+
+                return [LIST_SPLICE, self._intern(value), self._encode_splice(info)]
+
+            if kind == 'dict':
+                if 'keys' in info:
+                    return [DICT, self._intern(value), self._encode_dict_info(info)]
+
+                if set(info) != set(['removed', 'added']):
+                    raise _CannotEncode
+
+                return [
+                    DICT_UPDATE, self._intern(value),
+                    [info['removed'], self._encode_dict_info(info['added'])]
+                ]
+
+        except (_CannotEncode, AttributeError, KeyError, TypeError):
+            pass
+
+        return [RAW, marshalled]
+
+    def _encode_splice(self, info):
+        added = self._encode_list_info(info['added'])
+        if set(info) == set(['index', 'removed', 'added']):
+            return [info['index'], info['removed'], added]
+
+        if set(info) == set(['start', 'stop', 'step', 'removed', 'added']):
+            return [
+                info['start'], info['stop'], info['step'], info['removed'],
+                added
+            ]
+
+        raise _CannotEncode
+
+    def _intern(self, string):
+        """ Return the code of a string (an object id may be an int). """
+
+        string = str(string)
+        code = self._codes.get(string)
+        if code is None:
+            code = self._codes[string] = len(self._codes)
+            self._new_strings.append(string)
+
+        return code
+
+    def _message(self, request_id, payload):
+        message = [request_id, payload]
+        if self._new_strings or self._reset:
+            message.append(self._new_strings)
+            self._new_strings = []
+
+        if self._reset:
+            message.append(True)
+            self._reset = False
+
+        return message
+
+    def _start_message(self):
+        """ Start a new table of codes if the current one is full. """
+
+        if len(self._codes) >= self.max_strings:
+            self._codes = {}
+            self._reset = True
+
+
+class CompactDecoder(object):
+    """ Decodes the messages received over a single connection.
+
+    The decoded responses and events are exactly as sent by the server in the
+    default encoding (except that all object ids are strings).
+
+    """
+
+    def __init__(self):
+        self._strings = []
+
+    def decode(self, message):
+        """ Decode a message.
+
+        Return a tuple (request_id, payload) where the payload is the decoded
+        event (if the request id is -1) or response.
+        """
+        if len(message) > 3 and message[3]:
+            self._strings = []
+
+        if len(message) > 2:
+            self._strings.extend(message[2])
+
+        request_id, payload = message[0], message[1]
+        if request_id == -1:
+            return request_id, self._decode_event(payload)
+
+        if not isinstance(payload, list):
+            # The server failed to handle the request and sent a plain reply.
+            return request_id, json.loads(payload)
+
+        response = dict(
+            exception = payload[1] if len(payload) > 1 else None,
+            result    = self._decode_any(payload[0]),
+        )
+
+        return request_id, response
+
+    #### Private protocol #####################################################
+
+    def _decode_any(self, value):
+        if value is None:
+            return None
+
+        if value[0] == RAW:
+            return value[1]
+
+        return self._decode_value(value)
+
+    def _decode_event(self, event):
+        if isinstance(event, dict):
+            return event
+
+        strings = self._strings
+        obj, name, code, data = event
+        decoded = dict(obj=strings[obj], name=strings[name])
+        if code == EVENT_RAW:
+            decoded['data'] = data
+
+        elif code == EVENT_CONTEXT:
+            decoded['data'] = dict(
+                (key, self._decode_value(value)) for key, value in data.items()
+            )
+
+        elif code == EVENT_TYPE:
+            decoded['data'] = self._decode_type_info(data)
+
+        else:
+            decoded['data'] = self._decode_value(data)
+            decoded['items_event'] = code == EVENT_ITEMS
+
+        return decoded
+
+    def _decode_dict_info(self, info):
+        decoded = dict(keys=info[0])
+        if len(info) > 1:
+            decoded['values'] = self._decode_list_info(info[1])
+
+        return decoded
+
+    def _decode_columns(self, columns):
+        strings = self._strings
+
+        return dict(
+            type_name = strings[columns[0]],
+            ids       = [strings[code] for code in columns[1]],
+            values    = dict(
+                (strings[code], values) for code, values in columns[2]
+            )
+        )
+
+    def _decode_list_info(self, info):
+        decoded = dict(length=info[0])
+        if len(info) > 2:
+            decoded['columns'] = self._decode_columns(info[2])
+
+        elif len(info) > 1:
+            decoded['data'] = [self._decode_value(value) for value in info[1]]
+
+        return decoded
+
+    def _decode_type_info(self, info):
+        strings = self._strings
+        if not isinstance(info, list):
+            return dict(type_name=strings[info])
+
+        decoded = dict(type_name=strings[info[0]])
+        for key, codes in zip(_NAME_LISTS, info[1:4]):
+            decoded[key] = [strings[code] for code in codes]
+
+        if len(info) > 4:
+            decoded['attribute_values'] = [
+                self._decode_value(value) for value in info[4]
+            ]
+
+        return decoded
+
+    def _decode_value(self, value):
+        code = value[0]
+        if code == RAW:
+            return value[1]
+
+        if code == PRIMITIVE:
+            return dict(type='primitive', value=value[1], info=None)
+
+        obj_id, info = self._strings[value[1]], value[2]
+        if code == INSTANCE:
+            return dict(
+                type='instance', value=obj_id, info=self._decode_type_info(info)
+            )
+
+        if code == LIST:
+            return dict(
+                type='list', value=obj_id, info=self._decode_list_info(info)
+            )
+
+        if code == DICT:
+            return dict(
+                type='dict', value=obj_id, info=self._decode_dict_info(info)
+            )
+
+        if code == LIST_SPLICE:
+            if len(info) == 3:
+                decoded = dict(index=info[0], removed=info[1])
+            else:
+                decoded = dict(
+                    start=info[0], stop=info[1], step=info[2], removed=info[3]
+                )
+            decoded['added'] = self._decode_list_info(info[-1])
+
+            return dict(type='list', value=obj_id, info=decoded)
+
+        if code == DICT_UPDATE:
+            return dict(
+                type='dict', value=obj_id, info=dict(
+                    removed=info[0], added=self._decode_dict_info(info[1])
+                )
+            )
+
+        raise ValueError('Unknown value code %r' % code)
+
+
+class _CannotEncode(Exception):
+    """ Raised when a value does not have the expected shape. """
+
+
+def _is_marshalled(value):
+    """ Is a value a marshalled value (a dict with type, value and info)? """
+
+    return isinstance(value, dict) and frozenset(value) == _MARSHALLED_KEYS
+
+#### EOF ######################################################################
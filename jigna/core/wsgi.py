@@ -1,44 +1,16 @@
 # Standard library imports
-import threading
-import mimetypes
 import logging
-from os.path import exists, join, sep
+from os.path import join, sep
 
 # Enthought library imports
 from traits.api import HasTraits, Str, Dict, Directory, on_trait_change
 
-mimeLock = threading.Lock()
-mimeInitialized = False
+# Local imports
+from jigna.core.static import guess_type, static_files
 
 logger = logging.getLogger(__name__)
 
 
-def guess_type(path):
-    """ Thread-safe wrapper around the @#%^$$# non-thread safe mimetypes module. NEVER
-    call mimetypes directly.
-
-    """
-
-    global mimeLock
-    global mimeInitialized
-
-    if not mimeInitialized:
-        with mimeLock:
-            if not mimeInitialized:
-                mimetypes.init()
-
-                # On Windows, the mime type for 'ttf' (True Type Fonts) isn't
-                # recognized correctly. We, therefore, add the correct mime
-                # type here.
-                mimetypes.add_type('application/font-sfnt', '.ttf')
-
-                mimeInitialized = True
-
-    guessed = mimetypes.guess_type(path)
-
-    return (guessed[0] or "", guessed[1] or "")
-
-
 class FileLoader(HasTraits):
 
     #: Root directory where it looks
@@ -48,6 +20,10 @@ class FileLoader(HasTraits):
     #: paths
     overrides = Dict
 
+    #: A mapping of path prefixes (eg. 'jigna') to the directories the files
+    #: below them are served from (before looking in the root directory).
+    mounts = Dict
+
     #### WSGI protocol ########################################################
 
     def __call__(self, env, start_response):
@@ -64,15 +40,26 @@ class FileLoader(HasTraits):
 
         # Continue, if the path wasn't handled by canned responses for special
         # paths
-        path = join(self.root, path)
-        if not exists(path):
+        static_file = None
+        prefix, _, rest = path.partition(sep)
+        if rest and prefix in self.mounts:
+            static_file = static_files.get(join(self.mounts[prefix], rest))
+
+        if static_file is None:
+            static_file = static_files.get(join(self.root, path))
+
+        if static_file is None:
             start_response('404 File not found', [])
-            return [""]
+            return [b""]
 
-        else:
-            start_response(
-                '200 OK', [('Content-Type', '; '.join(guess_type(path)))]
-            )
-            with open(path, 'rb') as f:
-                response = f.read()
-            return [response]
+        def get_header(name):
+            return env.get('HTTP_' + name.upper().replace('-', '_'))
+
+        response = static_files.prepare(static_file, get_header)
+        start_response(
+            '%d %s' % (response.status, response.reason), response.headers
+        )
+
+        return static_files.iter_content(
+            static_file, response.start, response.stop
+        )
@@ -25,9 +25,14 @@ class HTMLWidget(QtWidgets.QWidget):
 
     def __init__(
         self, parent=None, window_flags=QtCore.Qt.Widget, context=None,
-        template=None, debug=False
+        template=None, debug=False, bridge_mode='json'
     ):
-        """ Constructor. """
+        """ Constructor.
+
+        'bridge_mode' is the 'QtServer.bridge_mode' to use: 'json' or
+        'native'.
+
+        """
 
         super(HTMLWidget, self).__init__(parent, window_flags)
 
@@ -35,6 +40,7 @@ class HTMLWidget(QtWidgets.QWidget):
         self._context  = context
         self._template = template
         self._debug    = debug
+        self._bridge_mode = bridge_mode
         self._server   = self._create_server()
 
         # fixme: This has to be a public attribute for testing *only*.
@@ -68,7 +74,8 @@ class HTMLWidget(QtWidgets.QWidget):
             base_url = join(os.getcwd(), self._template.base_url),
             html     = self._template.html,
             context  = self._context,
-            debug    = self._debug
+            debug    = self._debug,
+            bridge_mode = self._bridge_mode
         )
 
         return server
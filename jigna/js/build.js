@@ -1,6 +1,21 @@
+var crypto = require('crypto');
 var fs = require('fs');
 var util = require('util');
 var path = require('path');
+var zlib = require('zlib');
+
+// terser is optional: without it jigna's own code is left unminified (the
+// vendor libraries are bundled from their minified copies in 'external/').
+var terser = null;
+try {
+    terser = require('terser');
+} catch (e) {
+    console.warn('terser is not installed, the jigna code will not be minified.');
+}
+
+// Matches the names of the content hashed bundles (and their compressed
+// siblings) so that stale ones can be removed.
+var HASHED_FILE = /\.[0-9a-f]{10}(\.min)?\.js(\.gz|\.br)?$/;
 
 function concatenate(options) {
     var base_url = options.base_url || "";
@@ -33,35 +48,92 @@ function concatenate(options) {
     }
 
     // Write the generated script
-    fs.writeFileSync(dest, concat_str);
+    if (dest) {
+        fs.writeFileSync(dest, concat_str);
+    }
+
+    return concat_str;
+}
+
+function minify(code) {
+    if (terser === null) {
+        return Promise.resolve(code);
+    }
+
+    return Promise.resolve(terser.minify(code)).then(function(result) {
+        if (result.error) {
+            throw result.error;
+        }
+        return result.code;
+    });
+}
+
+function bundle(options) {
+    // Write a minified, content hashed bundle (and its gzip and brotli
+    // compressed siblings) to 'dist/'. Return a promise for its file name.
+    return minify(concatenate(options)).then(function(code) {
+        var hash = crypto.createHash('sha256').update(code).digest('hex');
+        var name = util.format(
+            '%s.%s%s.js', options.name, hash.slice(0, 10),
+            terser === null ? '' : '.min'
+        );
+        var dest = path.join('dist', name);
+        var data = Buffer.from(code);
+
+        fs.writeFileSync(dest, data);
+        fs.writeFileSync(dest + '.gz', zlib.gzipSync(data, {level: 9}));
+        fs.writeFileSync(dest + '.br', zlib.brotliCompressSync(data, {
+            params: {
+                [zlib.constants.BROTLI_PARAM_MODE]: zlib.constants.BROTLI_MODE_TEXT,
+                [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+                [zlib.constants.BROTLI_PARAM_SIZE_HINT]: data.length
+            }
+        }));
+
+        return name;
+    });
 }
 
+// The jigna core (shared by the angular and vue flavours).
+var CORE_FILES = [
+    // Internal dependencies
+    'app/event_target.js',
+
+    // Namespace definition
+    'app/jigna.js',
+    'app/scheduler.js',
+
+    // App files
+    'app/client.js',
+    'app/async_client.js',
+    'app/proxy_factory.js',
+    'app/async_proxy_factory.js',
+    'app/proxy.js',
+    'app/list_proxy.js',
+    'app/memory_manager.js',
+    'app/list_query.js',
+    'app/qt_bridge.js',
+    'app/wire.js',
+    'app/web_bridge.js',
+    'app/worker_bridge.js',
+];
+
+// The single file bundles (and the workers) are still built unhashed, as that
+// is how HTML files (see 'examples/') and the Qt server (see 'qt_server.py')
+// load them, and how templates load them if there is no manifest.
+
 // jigna.js: this includes angular.js.
 concatenate({
     base_url: 'src/',
     src: [
         // External dependencies
         'external/jquery.min.js',
-        'external/angular.js',
-
-        // Internal dependencies
-        'app/event_target.js',
-
-        // Namespace definition
-        'app/jigna.js',
-
-        // App files
-        'app/client.js',
-        'app/async_client.js',
-        'app/proxy_factory.js',
-        'app/async_proxy_factory.js',
-        'app/proxy.js',
-        'app/subarray.js',
-        'app/list_proxy.js',
-        'app/qt_bridge.js',
-        'app/web_bridge.js',
+        'external/angular.min.js',
+
+        // Jigna
+    ].concat(CORE_FILES, [
         'app/jigna-angular.js',
-    ],
+    ]),
     dest: 'dist/jigna.js',
     wrap: true,
     exports: [
@@ -77,26 +149,12 @@ concatenate({
     src: [
         // External dependencies
         'external/jquery.min.js',
-        'external/vue.js',
-
-        // Internal dependencies
-        'app/event_target.js',
-
-        // Namespace definition
-        'app/jigna.js',
-
-        // App files
-        'app/client.js',
-        'app/async_client.js',
-        'app/proxy_factory.js',
-        'app/async_proxy_factory.js',
-        'app/proxy.js',
-        'app/subarray.js',
-        'app/list_proxy.js',
-        'app/qt_bridge.js',
-        'app/web_bridge.js',
+        'external/vue.min.js',
+
+        // Jigna
+    ].concat(CORE_FILES, [
         'app/jigna-vue.js',
-    ],
+    ]),
     dest: 'dist/jigna-vue.js',
     wrap: true,
     exports: [
@@ -105,3 +163,93 @@ concatenate({
         'jigna'
     ]
 });
+
+// The workers used by the WorkerBridge and the SharedWorkerBridge.
+var WORKER_FILES = [
+    'worker/connection.js',
+    'app/wire.js',
+];
+
+// jigna-worker.js: the dedicated worker.
+var DEDICATED_WORKER = {
+    base_url: 'src/',
+    src: WORKER_FILES.concat(['worker/dedicated.js']),
+    dest: 'dist/jigna-worker.js',
+    wrap: true,
+    exports: []
+};
+concatenate(DEDICATED_WORKER);
+
+// jigna-shared-worker.js: the shared worker.
+var SHARED_WORKER = {
+    base_url: 'src/',
+    src: WORKER_FILES.concat(['worker/shared.js']),
+    dest: 'dist/jigna-shared-worker.js',
+    wrap: true,
+    exports: []
+};
+concatenate(SHARED_WORKER);
+
+// The split bundles: the vendor libraries change rarely, so they are kept
+// apart from the jigna core so that browsers can keep them cached. The
+// manifest maps the single file bundles (and workers) above to the split
+// bundles (in the order they must be loaded in).
+fs.readdirSync('dist').forEach(function(name) {
+    if (HASHED_FILE.test(name)) {
+        fs.unlinkSync(path.join('dist', name));
+    }
+});
+
+Promise.all([
+    bundle({
+        name: 'vendor-angular',
+        base_url: 'src/',
+        src: ['external/jquery.min.js', 'external/angular.min.js'],
+        wrap: true,
+        exports: ['$', 'angular']
+    }),
+    bundle({
+        name: 'vendor-vue',
+        base_url: 'src/',
+        src: ['external/jquery.min.js', 'external/vue.min.js'],
+        wrap: true,
+        exports: ['$', 'Vue']
+    }),
+    bundle({
+        name: 'jigna-core',
+        base_url: 'src/',
+        src: CORE_FILES,
+        wrap: true,
+        exports: ['jigna']
+    }),
+    bundle({
+        name: 'jigna-angular',
+        base_url: 'src/',
+        src: ['app/jigna-angular.js'],
+        wrap: true,
+        exports: []
+    }),
+    bundle({
+        name: 'jigna-vue',
+        base_url: 'src/',
+        src: ['app/jigna-vue.js'],
+        wrap: true,
+        exports: []
+    }),
+    bundle(Object.assign({name: 'jigna-worker'}, DEDICATED_WORKER, {dest: null})),
+    bundle(Object.assign({name: 'jigna-shared-worker'}, SHARED_WORKER, {dest: null}))
+]).then(function(names) {
+    var manifest = {
+        'jigna.js': [names[0], names[2], names[3]],
+        'jigna-vue.js': [names[1], names[2], names[4]],
+        'jigna-worker.js': [names[5]],
+        'jigna-shared-worker.js': [names[6]]
+    };
+    fs.writeFileSync(
+        path.join('dist', 'manifest.json'),
+        JSON.stringify(manifest, null, 2) + '\n'
+    );
+}).catch(function(error) {
+    console.error(error);
+    process.exit(1);
+});
@@ -0,0 +1,2795 @@
+(function (){
+
+///// EventTarget /////////////////////////////////////////////////////////////
+// Copyright (c) 2010 Nicholas C. Zakas. All rights reserved.
+// MIT License
+///////////////////////////////////////////////////////////////////////////////
+
+var EventTarget = function(){
+    this._listeners = {};
+};
+
+EventTarget.prototype = {
+
+    constructor: EventTarget,
+
+    add_listener: function(obj, event_name, listener, thisArg){
+        var id = this._to_id(obj);
+
+        if (this._listeners[id] === undefined){
+            this._listeners[id] = {};
+        }
+
+        if (this._listeners[id][event_name] === undefined) {
+            this._listeners[id][event_name] = [];
+        }
+
+        this._listeners[id][event_name].push({thisArg: thisArg, listener: listener});
+    },
+
+    fire_event: function(obj, event){
+        var id = this._to_id(obj);
+
+        if (typeof event == "string"){
+            event = { name: event };
+        }
+        if (!event.target){
+            event.target = obj;
+        }
+
+        if (!event.name){  //falsy
+            throw new Error("Event object missing 'name' property.");
+        }
+
+        if (this._listeners[id] === undefined) {
+            return;
+        }
+
+        if (this._listeners[id][event.name] instanceof Array){
+            var listeners = this._listeners[id][event.name];
+            for (var i=0, len=listeners.length; i < len; i++){
+                listener = listeners[i].listener;
+                thisArg = listeners[i].thisArg;
+                listener.call(thisArg, event);
+            }
+        }
+    },
+
+    remove_listener: function(obj, event_name, listener){
+        var id = this._to_id(obj);
+
+        if (this._listeners[id][event_name] instanceof Array){
+            var listeners = this._listeners[id][event_name];
+            for (var i=0, len=listeners.length; i < len; i++){
+                if (listeners[i] === listener){
+                    listeners.splice(i, 1);
+                    break;
+                }
+            }
+        }
+    },
+
+    //// Private protocol /////////////////////////////////////////////////////
+
+    _to_id: function(obj){
+        if (obj.__id__ !== undefined) {
+            return obj.__id__;
+        }
+        else {
+            return obj;
+        }
+    }
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// Jigna
+///////////////////////////////////////////////////////////////////////////////
+
+// Namespace for all Jigna-related objects.
+var jigna = new EventTarget();
+
+jigna.initialize = function(options) {
+    options = options || {};
+    this.ready  = $.Deferred();
+    this.debug  = options.debug;
+    this.async  = options.async;
+    this.wire   = options.wire;
+    this.worker = options.worker;
+    this.worker_url = options.worker_url;
+    this.memory_budget = options.memory_budget;
+    if (options.max_frequency !== undefined) {
+        this.scheduler.max_frequency = options.max_frequency;
+    }
+    this.client = options.async ? new jigna.AsyncClient() : new jigna.Client();
+    this.client.initialize();
+    return this.ready;
+};
+
+jigna.models = {};
+
+// The type manifest registered by a generated types module (see
+// 'jigna/core/type_manifest.py'), if any.
+jigna.type_manifest = null;
+
+jigna.register_types = function(hash, types) {
+    /* Register the descriptions of the types in a type manifest.
+
+    This must be called before jigna is initialized. The proxy constructors
+    for the types are created when the client starts, and the server does not
+    send the types again if it has the same manifest.
+    */
+    this.type_manifest = {hash: hash, types: types};
+};
+
+jigna.add_listener('jigna', 'model_added', function(event){
+    var models = event.data;
+    for (var model_name in models) {
+        jigna.models[model_name] = models[model_name];
+    }
+
+    jigna.fire_event('jigna', 'object_changed');
+});
+
+jigna.threaded = function(obj, method_name, args) {
+    args = Array.prototype.slice.call(arguments, 2);
+    return this.client.call_instance_method_thread(obj.__id__, method_name, args);
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// Scheduler
+///////////////////////////////////////////////////////////////////////////////
+
+// The scheduler batches the 'object_changed' events fired by the client (one
+// for every change to a proxy and every value fetched from the server) and
+// fires a single 'objects_changed' event per animation frame, with the
+// (distinct) proxies that changed. The Angular and Vue apps listen to that
+// event so that a burst of changes costs one digest/re-render.
+//
+// Browsers do not run animation frames for hidden documents (background tabs,
+// minimized windows), so the scheduler uses a timer instead while the document
+// is hidden.
+
+jigna.Scheduler = function() {
+    // The maximum number of 'objects_changed' events fired per second (at
+    // most one per animation frame). If it is zero (or less) the event is
+    // fired synchronously for every change.
+    this.max_frequency = 60;
+
+    // Private protocol.
+    this._changed = false;
+    this._objects = [];
+    this._object_ids = {};
+    this._pending = false;
+    this._last_flush = 0;
+
+    // Incremented to cancel the scheduled flush.
+    this._generation = 0;
+};
+
+jigna.Scheduler.prototype.mark_changed = function(proxy) {
+    /* Mark a proxy as changed (or just that something changed if the proxy
+    is undefined).
+    */
+
+    if (proxy !== undefined && proxy !== null) {
+        var id = proxy.__id__;
+        if (id === undefined || this._object_ids[id] !== true) {
+            if (id !== undefined) {
+                this._object_ids[id] = true;
+            }
+            this._objects.push(proxy);
+        }
+    }
+    this._changed = true;
+
+    if (this.max_frequency > 0) {
+        this._schedule();
+    }
+    else {
+        this.flush();
+    }
+};
+
+jigna.Scheduler.prototype.flush = function() {
+    /* Fire the 'objects_changed' event now (if anything changed). */
+
+    if (!this._changed) {
+        return;
+    }
+
+    var objects = this._objects;
+    this._changed = false;
+    this._objects = [];
+    this._object_ids = {};
+    this._last_flush = Date.now();
+
+    jigna.fire_event('jigna', {name: 'objects_changed', objects: objects});
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.Scheduler.prototype._schedule = function() {
+    /* Schedule a flush on the next animation frame (no sooner than the
+    maximum frequency allows).
+    */
+
+    if (this._pending) {
+        return;
+    }
+    this._pending = true;
+
+    var scheduler = this;
+    var generation = this._generation;
+    var flush = function() {
+        if (scheduler._generation !== generation) {
+            return;
+        }
+        scheduler._pending = false;
+        scheduler.flush();
+    };
+    var request_frame = function() {
+        if (scheduler._has_animation_frames()) {
+            window.requestAnimationFrame(flush);
+        }
+        else {
+            setTimeout(flush, 16);
+        }
+    };
+
+    var delay = 1000 / this.max_frequency - (Date.now() - this._last_flush);
+    if (delay > 0) {
+        setTimeout(request_frame, delay);
+    }
+    else {
+        request_frame();
+    }
+};
+
+jigna.Scheduler.prototype._has_animation_frames = function() {
+    /* Return true if animation frames run (the document is visible). */
+
+    if (typeof window === 'undefined' || !window.requestAnimationFrame) {
+        return false;
+    }
+
+    return typeof document === 'undefined' || !document.hidden;
+};
+
+jigna.Scheduler.prototype._on_visibility_changed = function() {
+    /* Flush now if the document is hidden while a frame is awaited (it would
+    not run until the document is shown again).
+    */
+
+    if (this._pending && !this._has_animation_frames()) {
+        this._generation += 1;
+        this._pending = false;
+        this.flush();
+    }
+};
+
+// The scheduler used by jigna.
+jigna.scheduler = new jigna.Scheduler();
+
+jigna.add_listener('jigna', 'object_changed', function(event) {
+    jigna.scheduler.mark_changed(event.object);
+});
+
+if (typeof document !== 'undefined' && document.addEventListener) {
+    document.addEventListener('visibilitychange', function() {
+        jigna.scheduler._on_visibility_changed();
+    });
+}
+
+jigna.flush = function() {
+    /* Propagate any pending changes to the UI now. */
+    this.scheduler.flush();
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// Client
+///////////////////////////////////////////////////////////////////////////////
+
+jigna.Client = function() {};
+
+jigna.Client.prototype.initialize = function() {
+    // jigna.Client protocol.
+    this.bridge           = this._get_bridge();
+
+    // Private protocol.
+    this._id_to_proxy_map = {};
+    this._proxy_factory   = this._create_proxy_factory();
+    this._memory_manager  = new jigna.MemoryManager(this);
+
+    // The list queries that have started (see 'jigna.ListQuery'), by id.
+    this._queries         = {};
+
+    jigna.stats = this._memory_manager.stats;
+
+    // Add all of the models being edited
+    jigna.add_listener(
+        'jigna',
+        'context_updated',
+        function(event){this._add_models(event.data);},
+        this
+    );
+
+    // Wait for the bridge to be ready, and when it is ready, update the
+    // context so that initial models are added to jigna scope
+    var client = this;
+    this.bridge.ready.done(function(){
+        client.update_context();
+    });
+};
+
+jigna.Client.prototype.handle_event = function(jsonized_event) {
+    /* Handle an event from the server. */
+    this._dispatch_event(JSON.parse(jsonized_event));
+};
+
+jigna.Client.prototype.handle_events = function(events) {
+    /* Handle a batch of (already parsed) events from the server. */
+    for (var index=0; index < events.length; index++) {
+        this._dispatch_event(events[index]);
+    }
+};
+
+jigna.Client.prototype.on_object_changed = function(event){
+    if (jigna.debug) {
+        this.print_JS_message('------------on_object_changed--------------');
+        this.print_JS_message('object id  : ' + event.obj);
+        this.print_JS_message('attribute  : ' + event.name);
+        this.print_JS_message('items event: ' + event.items_event);
+        this.print_JS_message('new type   : ' + event.data.type);
+        this.print_JS_message('new value  : ' + event.data.value);
+        this.print_JS_message('new info   : ' + event.data.info);
+        this.print_JS_message('-------------------------------------------');
+    }
+
+    var proxy = this._id_to_proxy_map[event.obj];
+
+    // If the *contents* of a list/dict have changed then we need to update
+    // the associated proxy to reflect the change.
+    if (event.items_event) {
+        var collection_proxy = this._id_to_proxy_map[event.data.value];
+        // The collection proxy can be undefined if on the Python side you
+        // have re-initialized a list/dict with the same value that it
+        // previously had, e.g.
+        //
+        // class Person(HasTraits):
+        //     friends = List([1, 2, 3])
+        //
+        // fred = Person()
+        // fred.friends = [1, 2, 3] # No trait changed event!!
+        //
+        // This is because even though traits does copy on assignment for
+        // lists/dicts (and hence the new list will have a new Id), it fires
+        // the trait change events only if it considers the old and new values
+        // to be different (ie. if does not compare the identity of the lists).
+        //
+        // For us(!), it means that we won't have seen the new list before we
+        // get an items changed event on it.
+        if (collection_proxy === undefined) {
+            proxy.__cache__[event.name] = this._create_proxy(
+                event.data.type, event.data.value, event.data.info
+            );
+
+        } else {
+            this._proxy_factory.update_proxy(
+                collection_proxy, event.data.type, event.data.info
+            );
+        }
+
+    } else {
+        proxy.__cache__[event.name] = this._unmarshal(event.data);
+    }
+
+    // Angular listens to this event and forces a digest cycle which is how it
+    // detects changes in its watchers.
+    jigna.fire_event('jigna', {name: 'object_changed', object: proxy});
+};
+
+jigna.Client.prototype.send_request = function(request) {
+    /* Send a request to the server and wait for (and return) the response. */
+
+    // Bridges in native mode pass the request and response as objects.
+    if (this.bridge.native) {
+        return this.bridge.send_request_native(request).result;
+    }
+
+    var jsonized_request  = JSON.stringify(request);
+    var jsonized_response = this.bridge.send_request(jsonized_request);
+
+    return JSON.parse(jsonized_response).result;
+};
+
+// Convenience methods for each kind of request //////////////////////////////
+
+jigna.Client.prototype.call_instance_method = function(id, method_name, args) {
+    /* Call an instance method */
+
+    var request = {
+        kind        : 'call_instance_method',
+        id          : id,
+        method_name : method_name,
+        args        : this._marshal_all(args)
+    };
+
+    var response = this.send_request(request);
+    var result = this._unmarshal(response);
+
+    return result;
+};
+
+jigna.Client.prototype.call_instance_method_thread = function(id, method_name, args) {
+    /* Call an instance method in a thread. Useful if the method takes long to
+    execute and you don't want to block the UI during that time.*/
+
+    var request = {
+        kind        : 'call_instance_method_thread',
+        id          : id,
+        method_name : method_name,
+        args        : this._marshal_all(args),
+    };
+
+    // the response of a threaded request is a marshalled version of a python
+    // future object. We attach 'done' and 'error' handlers on that object to
+    // resolve/reject our own deferred.
+    var response = this.send_request(request);
+    var future_obj = this._unmarshal(response);
+
+    var deferred = new $.Deferred();
+
+    jigna.add_listener(future_obj, 'done', function(event){
+        deferred.resolve(event.data);
+    });
+
+    jigna.add_listener(future_obj, 'error', function(event){
+        deferred.reject(event.data);
+    });
+
+    return deferred.promise();
+};
+
+jigna.Client.prototype.close_query = function(query_id) {
+    /* Tell the server to stop a list query. */
+
+    var request = {
+        kind  : 'close_query',
+        query : query_id
+    };
+
+    // We do not need to wait for the response.
+    if (this.bridge.native) {
+        this.bridge.send_request_native(request);
+    }
+    else {
+        this.bridge.send_request_async(JSON.stringify(request));
+    }
+};
+
+jigna.Client.prototype.get_attribute = function(proxy, attribute) {
+    /* Get the specified attribute of the proxy from the server. */
+
+    var request = this._create_request(proxy, attribute);
+
+    var response = this.send_request(request);
+    var result = this._unmarshal(response);
+
+    return result;
+};
+
+jigna.Client.prototype.print_JS_message = function(message) {
+    var request = {
+        kind: 'print_JS_message',
+        value: message
+    };
+
+    this.send_request(request);
+};
+
+jigna.Client.prototype.release = function(ids) {
+    /* Tell the server that we no longer have proxies for some objects. */
+
+    var request = {
+        kind : 'release',
+        ids  : ids
+    };
+
+    // We do not need to wait for the response.
+    if (this.bridge.native) {
+        this.bridge.send_request_native(request);
+    }
+    else {
+        this.bridge.send_request_async(JSON.stringify(request));
+    }
+};
+
+jigna.Client.prototype.set_instance_attribute = function(id, attribute_name, value) {
+    var request = {
+        kind           : 'set_instance_attribute',
+        id             : id,
+        attribute_name : attribute_name,
+        value          : this._marshal(value)
+    };
+
+    this.send_request(request);
+};
+
+jigna.Client.prototype.set_item = function(id, index, value) {
+    var request = {
+        kind  : 'set_item',
+        id    : id,
+        index : index,
+        value : this._marshal(value)
+    };
+
+    this.send_request(request);
+};
+
+jigna.Client.prototype.update_context = function() {
+    var request  = {kind : 'update_context'};
+
+    // Tell the server which types we already know about.
+    if (jigna.type_manifest !== null) {
+        request.type_manifest = jigna.type_manifest.hash;
+    }
+
+    this.send_request(request);
+};
+
+// Private protocol //////////////////////////////////////////////////////////
+
+jigna.Client.prototype._dispatch_event = function(event) {
+    /* Dispatch an event from the server.
+
+    Changes to the attributes (and events) of an instance are routed straight
+    to 'on_object_changed' via the dispatch table of the proxy's type. Any
+    listeners added with 'jigna.add_listener' are then called as usual.
+    */
+
+    var proxy = this._id_to_proxy_map[event.obj];
+    if (proxy !== undefined) {
+        var dispatch = proxy.__dispatch__;
+        if (dispatch !== undefined && dispatch[event.name] === true) {
+            this.on_object_changed(event);
+        }
+    }
+
+    jigna.fire_event(event.obj, event);
+};
+
+jigna.Client.prototype._add_model = function(model_name, id, info) {
+    // Create a proxy for the object identified by the Id...
+    var proxy = this._create_proxy('instance', id, info);
+
+    // fire the event to let the UI toolkit know that a new model was added
+    var data = {};
+    data[model_name] = proxy;
+
+    jigna.fire_event('jigna', {
+        name: 'model_added',
+        data: data,
+    });
+
+    return proxy;
+};
+
+jigna.Client.prototype._add_models = function(context) {
+    var client = this;
+    var models = {};
+    $.each(context, function(model_name, model) {
+        if (jigna.models[model_name] === undefined) {
+            proxy = client._add_model(model_name, model.value, model.info);
+            models[model_name] = proxy;
+        }
+    });
+
+    // Resolve the jigna.ready deferred, at this point the initial set of
+    // models are set.  For example vue.js can now use these data models to
+    // create the initial Vue instance.
+    jigna.ready.resolve();
+
+    return models;
+};
+
+jigna.Client.prototype._create_proxy_factory = function() {
+    return new jigna.ProxyFactory(this);
+};
+
+jigna.Client.prototype._create_proxy = function(type, obj, info) {
+    if (type === 'primitive') {
+        return obj;
+    }
+    else {
+        // The proxy may have been evicted while the UI still refers to it.
+        var proxy = this._memory_manager.revive(obj);
+        if (proxy !== undefined && proxy.__type__ === type) {
+            this._proxy_factory.reset_proxy(proxy, type, info);
+        }
+        else {
+            proxy = this._proxy_factory.create_proxy(type, obj, info);
+        }
+
+        this._id_to_proxy_map[obj] = proxy;
+        this._memory_manager.add(proxy);
+        return proxy;
+    }
+};
+
+jigna.Client.prototype._create_request = function(proxy, attribute) {
+    /* Create the request object for getting the given attribute of the proxy. */
+
+    // The proxy may have been evicted while the UI still refers to it.
+    this._memory_manager.use(proxy);
+
+    var request;
+    if (proxy.__type__ === 'instance') {
+        request = {
+            kind           : 'get_instance_attribute',
+            id             : proxy.__id__,
+            attribute_name : attribute
+        };
+    }
+    else if ((proxy.__type__ === 'list') || (proxy.__type__ === 'dict')) {
+        request = {
+            kind  : 'get_item',
+            id    : proxy.__id__,
+            index : attribute
+        };
+    }
+    return request;
+};
+
+jigna.Client.prototype._get_bridge = function() {
+    var bridge, qt_bridge;
+
+    // Are we using the intra-process Qt Bridge...
+    qt_bridge = window['qt_bridge'];
+    if (qt_bridge !== undefined) {
+        bridge = new jigna.QtBridge(this, qt_bridge);
+    // ... or the inter-process web bridge (with its websocket in a worker
+    // shared by all tabs, in a worker or in the page)?
+    } else if (jigna.worker === 'shared' && typeof SharedWorker !== 'undefined') {
+        bridge = new jigna.SharedWorkerBridge(this);
+    } else if (jigna.worker && typeof Worker !== 'undefined') {
+        bridge = new jigna.WorkerBridge(this);
+    } else {
+        bridge = new jigna.WebBridge(this);
+    }
+
+    return bridge;
+};
+
+jigna.Client.prototype._marshal = function(obj) {
+    var type, value;
+
+    if (obj instanceof jigna.Proxy) {
+        type  = obj.__type__;
+        value = obj.__id__;
+
+    } else {
+        type  = 'primitive';
+        value = obj;
+    }
+
+    return {'type' : type, 'value' : value};
+};
+
+jigna.Client.prototype._marshal_all = function(objs) {
+    var index;
+
+    for (index in objs) {
+        objs[index] = this._marshal(objs[index]);
+    }
+
+    // For convenience, as we modify the array in-place.
+    return objs;
+};
+
+jigna.Client.prototype._unmarshal_items = function(info) {
+    /* Unmarshal the items in a list info (see 'Server._get_items_info'). */
+
+    var items = new Array(info.length);
+    for (var index=0; index < info.length; index++) {
+        items[index] = this._unmarshal(info.data[index]);
+    }
+
+    return items;
+};
+
+jigna.Client.prototype._unmarshal = function(obj) {
+
+    // Native bridges pass Python's None as undefined.
+    if (obj === null || obj === undefined) {
+        return null;
+    }
+
+    if (obj.type === 'primitive') {
+        if (obj.value && obj.value.__ndarray__) {
+            return jigna.QtBridge.decode_array(obj.value);
+        }
+        return obj.value;
+
+    } else {
+        value = this._id_to_proxy_map[obj.value];
+        if (value === undefined) {
+            return this._create_proxy(obj.type, obj.value, obj.info);
+        }
+        else {
+            this._memory_manager.touch(value);
+            return value;
+        }
+    }
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// AsyncClient
+///////////////////////////////////////////////////////////////////////////////
+
+// Inherit AsyncClient from Client
+// Source: MDN docs (https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Object/create)
+jigna.AsyncClient = function() {};
+jigna.AsyncClient.prototype = Object.create(jigna.Client.prototype);
+jigna.AsyncClient.prototype.constructor = jigna.AsyncClient;
+
+jigna.AsyncClient.prototype.send_request = function(request) {
+    /* Send a request to the server and wait for (and return) the response. */
+
+    var deferred = new $.Deferred();
+
+    // Bridges in native mode pass the request and response as objects.
+    if (this.bridge.native) {
+        deferred.resolve(this.bridge.send_request_native(request).result);
+        return deferred.promise();
+    }
+
+    var jsonized_request  = JSON.stringify(request);
+
+    this.bridge.send_request_async(jsonized_request).done(function(response){
+        // Responses in the compact wire encoding are decoded by the bridge.
+        if (typeof response === 'string') {
+            response = JSON.parse(response);
+        }
+        deferred.resolve(response.result);
+    });
+
+    return deferred.promise();
+};
+
+jigna.AsyncClient.prototype.call_instance_method = function(id, method_name, args) {
+    /* Calls an instance method. Do not use this to call any long running
+    methods.
+
+    Note: Since this is an async client, it won't block the UI even if you
+    call a long running method here but the UI updates (progress bars etc)
+    won't be available until the server completes running that method.
+    */
+    var request = {
+        kind        : 'call_instance_method',
+        id          : id,
+        method_name : method_name,
+        args        : this._marshal_all(args)
+    };
+    var client = this;
+
+    var deferred = new $.Deferred();
+    this.send_request(request).done(function(response){
+        deferred.resolve(client._unmarshal(response));
+    });
+
+    return deferred.promise();
+};
+
+jigna.AsyncClient.prototype.call_instance_method_thread = function(id, method_name, args) {
+    /* Calls an instance method in a thread on the server. Use this to call
+    any long running method on the server otherwise you won't get any UI
+    updates on the client.
+    */
+    var request = {
+        kind        : 'call_instance_method_thread',
+        id          : id,
+        method_name : method_name,
+        args        : this._marshal_all(args),
+    };
+    var client = this;
+
+    // Note that this deferred is resolved when the method called in a thread
+    // finishes, not when the request to call the method finishes.
+    // This is done to make this similar to the sync client so that the users
+    // can attach their handlers when the method is done.
+    var deferred = new $.Deferred();
+
+    this.send_request(request).done(function(response){
+
+        var future_obj = client._unmarshal(response);
+        // the response of a threaded request is a marshalled version of a python
+        // future object. We attach 'done' and 'error' handlers on that object to
+        // resolve/reject our own deferred.
+
+        jigna.add_listener(future_obj, 'done', function(event){
+            deferred.resolve(event.data);
+        });
+
+        jigna.add_listener(future_obj, 'error', function(event){
+            deferred.reject(event.data);
+        });
+
+    });
+
+    return deferred.promise();
+};
+
+jigna.AsyncClient.prototype.get_attribute = function(proxy, attribute) {
+    /* Get the specified attribute of the proxy from the server. */
+    var client = this;
+
+    // start a new request only if a request for getting that attribute isn't
+    // already sent
+    if (proxy.__state__[attribute] != 'busy') {
+        proxy.__state__[attribute] = 'busy';
+
+        var request = this._create_request(proxy, attribute);
+        this.send_request(request).done(function(response){
+            // update the proxy cache
+            proxy.__cache__[attribute] = client._unmarshal(response);
+
+            // fire the object changed event to trigger fresh fetches from
+            // the cache
+            jigna.fire_event('jigna', {name: 'object_changed', object: proxy});
+
+            // set the state as free again so that further fetches ask the
+            // server again
+            proxy.__state__[attribute] = undefined;
+
+        });
+    }
+
+    return proxy.__cache__[attribute];
+};
+
+jigna.AsyncClient.prototype.on_object_changed = function(event){
+    if (jigna.debug) {
+        this.print_JS_message('------------on_object_changed--------------');
+        this.print_JS_message('object id  : ' + event.obj);
+        this.print_JS_message('attribute  : ' + event.name);
+        this.print_JS_message('items event: ' + event.items_event);
+        this.print_JS_message('new type   : ' + event.data.type);
+        this.print_JS_message('new value  : ' + event.data.value);
+        this.print_JS_message('new info   : ' + event.data.info);
+        this.print_JS_message('-------------------------------------------');
+    }
+
+    var proxy = this._id_to_proxy_map[event.obj];
+
+    // If the *contents* of a list/dict have changed then we need to update
+    // the associated proxy to reflect the change.
+    if (event.items_event) {
+        var collection_proxy = this._id_to_proxy_map[event.data.value];
+        // The collection proxy can be undefined if on the Python side you
+        // have re-initialized a list/dict with the same value that it
+        // previously had, e.g.
+        //
+        // class Person(HasTraits):
+        //     friends = List([1, 2, 3])
+        //
+        // fred = Person()
+        // fred.friends = [1, 2, 3] # No trait changed event!!
+        //
+        // This is because even though traits does copy on assignment for
+        // lists/dicts (and hence the new list will have a new Id), it fires
+        // the trait change events only if it considers the old and new values
+        // to be different (ie. if does not compare the identity of the lists).
+        //
+        // For us(!), it means that we won't have seen the new list before we
+        // get an items changed event on it.
+        if (collection_proxy === undefined) {
+            // In the async case, we do not create a new proxy instead we
+            // update the id_to_proxy map and update the proxy with the
+            // dict/list event info.
+            collection_proxy = proxy.__cache__[event.name];
+            if (collection_proxy !== undefined &&
+                collection_proxy.__id__ !== undefined) {
+                this._id_to_proxy_map[event.data.value] = collection_proxy;
+            }
+            // Otherwise the list/dict has not been fetched yet (or its proxy
+            // was evicted, see 'MemoryManager'), so it is fetched when used.
+            else {
+                collection_proxy = undefined;
+                proxy.__cache__[event.name] = undefined;
+            }
+        }
+        if (collection_proxy !== undefined) {
+            this._proxy_factory.update_proxy(
+                collection_proxy, event.data.type, event.data.info
+            );
+        }
+
+    } else {
+        proxy.__cache__[event.name] = this._unmarshal(event.data);
+    }
+
+    // Angular listens to this event and forces a digest cycle which is how it
+    // detects changes in its watchers.
+    jigna.fire_event('jigna', {name: 'object_changed', object: proxy});
+};
+
+// Private protocol //////////////////////////////////////////////////////////
+
+jigna.AsyncClient.prototype._dispatch_event = function(event) {
+    /* Dispatch an event from the server. */
+
+    // The items of lists sent in columns only get proxies when they are used,
+    // so create the proxy first if it is for one of them (otherwise the
+    // change would be lost).
+    if (this._id_to_proxy_map[event.obj] === undefined) {
+        this._proxy_factory.unmarshal_row(event.obj);
+    }
+
+    jigna.Client.prototype._dispatch_event.call(this, event);
+};
+
+jigna.AsyncClient.prototype._unmarshal_items = function(info) {
+    /* Unmarshal the items in a list info (which may be in columns). */
+
+    var factory = this._proxy_factory;
+    var items = factory._saved_items(info);
+    for (var index=0; index < items.length; index++) {
+        var item = items[index];
+        if (item instanceof jigna._SavedRow) {
+            items[index] = factory.unmarshal_row(item.data.value);
+        } else if (item instanceof jigna._SavedData) {
+            items[index] = this._unmarshal(item.data);
+        }
+    }
+
+    return items;
+};
+
+jigna.AsyncClient.prototype._create_proxy_factory = function() {
+    return new jigna.AsyncProxyFactory(this);
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// ProxyFactory
+///////////////////////////////////////////////////////////////////////////////
+
+jigna.ProxyFactory = function(client) {
+    // Private protocol.
+    this._client = client;
+
+    // We create a constructor for each Python class and then create the
+    // actual proxies from those.
+    this._type_to_constructor_map = {};
+
+    // Create a new instance constructor when a "new_type" event is fired.
+    jigna.add_listener(
+        'jigna',
+        'new_type',
+        function(event){this._create_instance_constructor(event.data);},
+        this
+    );
+
+    // Create the constructors for the types in the type manifest up front.
+    if (jigna.type_manifest !== null) {
+        var types = jigna.type_manifest.types;
+        for (var index=0; index < types.length; index++) {
+            this._create_instance_constructor(types[index]);
+        }
+    }
+};
+
+jigna.ProxyFactory.prototype.create_proxy = function(type, id, info) {
+    /* Create a proxy for the given type, id and value. */
+
+    var factory_method = this['_create_' + type + '_proxy'];
+    if (factory_method === undefined) {
+        throw 'cannot create proxy for: ' + type;
+    }
+
+    return factory_method.apply(this, [id, info]);
+};
+
+jigna.ProxyFactory.prototype.clear_cache = function(proxy) {
+    /* Drop all of the cached values of a proxy. */
+
+    proxy.__cache__ = Array.isArray(proxy.__cache__) ? [] : {};
+};
+
+jigna.ProxyFactory.prototype.reset_proxy = function(proxy, type, info) {
+    /* Reset a proxy whose cached values were dropped (see 'MemoryManager')
+    from the info that its object has been received with again.
+    */
+
+    if (type === 'list') {
+        this.clear_cache(proxy);
+        this._populate_list_proxy(proxy, info);
+    }
+    else if (type === 'dict') {
+        this.clear_cache(proxy);
+        this._delete_dict_keys(proxy);
+        this._populate_dict_proxy(proxy, info);
+    }
+
+    return proxy;
+};
+
+jigna.ProxyFactory.prototype.update_proxy = function(proxy, type, info) {
+    /* Update the given proxy.
+     *
+     * This is only used for list and dict proxies when their items have
+     * changed.
+     */
+
+    var factory_method = this['_update_' + type + '_proxy'];
+    if (factory_method === undefined) {
+        throw 'cannot update proxy for: ' + type;
+    }
+
+    return factory_method.apply(this, [proxy, info]);
+};
+
+// Private protocol ////////////////////////////////////////////////////////////
+
+// Instance proxy creation /////////////////////////////////////////////////////
+
+jigna.ProxyFactory.prototype._add_instance_method = function(proxy, method_name){
+    proxy[method_name] = function() {
+        // In here, 'this' refers to the proxy!
+        var args = Array.prototype.slice.call(arguments);
+
+        return this.__client__.call_instance_method(
+            this.__id__, method_name, args
+        );
+    };
+};
+
+jigna.ProxyFactory.prototype._add_instance_attribute = function(proxy, attribute_name){
+    var descriptor, get, set;
+
+    get = function() {
+        // In here, 'this' refers to the proxy!
+        var value = this.__cache__[attribute_name];
+        if (value === undefined) {
+            value = this.__client__.get_attribute(this, attribute_name);
+            this.__cache__[attribute_name] = value;
+        }
+
+        return value;
+    };
+
+    set = function(value) {
+        // In here, 'this' refers to the proxy!
+        //
+        // If the proxy is for a 'HasTraits' instance then we don't need
+        // to set the cached value here as the value will get updated when
+        // we get the corresponding trait event. However, setting the value
+        // here means that we can create jigna UIs for non-traits objects - it
+        // just means we won't react to external changes to the model(s).
+        this.__cache__[attribute_name] = value;
+        this.__client__.set_instance_attribute(
+            this.__id__, attribute_name, value
+        );
+    };
+
+    descriptor = {enumerable:true, get:get, set:set, configurable:true};
+    Object.defineProperty(proxy, attribute_name, descriptor);
+};
+
+jigna.ProxyFactory.prototype._add_instance_event = function(proxy, event_name){
+    var descriptor, set;
+
+    set = function(value) {
+        this.__cache__[event_name] = value;
+        this.__client__.set_instance_attribute(
+            this.__id__, event_name, value
+        );
+    };
+
+    descriptor = {enumerable:false, set:set, configurable: true};
+    Object.defineProperty(proxy, event_name, descriptor);
+};
+
+jigna.ProxyFactory.prototype._create_instance_constructor = function(info) {
+    var constructor = this._type_to_constructor_map[info.type_name];
+    if (constructor !== undefined) {
+        return constructor;
+    }
+
+    // Note that the constructor does not listen for changes to the object
+    // that the proxy is a proxy for, the client dispatches them to the proxy
+    // using the '__dispatch__' table of its type (see below).
+    constructor = function(type, id, client) {
+        jigna.Proxy.call(this, type, id, client);
+    };
+
+    // This is the standard way to set up protoype inheritance in JS.
+    //
+    // The line below says "when the function 'constructor' is called via the
+    // 'new' operator, then set the prototype of the created object to the
+    // given object".
+    constructor.prototype = Object.create(jigna.Proxy.prototype);
+    constructor.prototype.constructor = constructor;
+
+    for (index in info.attribute_names) {
+        this._add_instance_attribute(
+            constructor.prototype, info.attribute_names[index]
+        );
+    }
+
+    for (index in info.event_names) {
+        this._add_instance_event(
+            constructor.prototype, info.event_names[index]
+        );
+    }
+
+    for (index in info.method_names) {
+        this._add_instance_method(
+            constructor.prototype, info.method_names[index]
+        );
+    }
+
+    // The names of the attributes and events whose changes are dispatched to
+    // 'Client.on_object_changed' (shared by all of the proxies of the type).
+    var dispatch = Object.create(null);
+    for (index in info.attribute_names) {
+        dispatch[info.attribute_names[index]] = true;
+    }
+    for (index in info.event_names) {
+        dispatch[info.event_names[index]] = true;
+    }
+    Object.defineProperty(
+        constructor.prototype, '__dispatch__', {value : dispatch}
+    );
+
+    // The info is only sent to us once per type, and so we store it in the
+    // prototype so that we can use it in the constructor to get the names
+    // of any atttributes and events.
+    Object.defineProperty(
+        constructor.prototype, '__info__', {value : info}
+    );
+
+    // This property is not actually used by jigna itself. It is only there to
+    // make it easy to see what the type of the server-side object is when
+    // debugging the JS code in the web inspector.
+    Object.defineProperty(
+        constructor.prototype, '__type_name__', {value : info.type_name}
+    );
+
+    this._type_to_constructor_map[info.type_name] = constructor;
+
+    return constructor;
+}
+
+jigna.ProxyFactory.prototype._create_instance_proxy = function(id, info) {
+    var constructor, proxy;
+
+    // We create a constructor for each Python class and then create the
+    // actual proxies as from those.
+    constructor = this._type_to_constructor_map[info.type_name];
+    if (constructor === undefined) {
+        constructor = this._create_instance_constructor(info);
+    }
+
+    return new constructor('instance', id, this._client);
+};
+
+// Dict proxy creation /////////////////////////////////////////////////////////
+
+jigna.ProxyFactory.prototype._create_dict_proxy = function(id, info) {
+    var proxy = new jigna.Proxy('dict', id, this._client);
+    this._populate_dict_proxy(proxy, info);
+
+    return proxy;
+};
+
+jigna.ProxyFactory.prototype._delete_dict_keys = function(proxy) {
+    /* Delete all keys of a previously used dict proxy. */
+    var index, keys;
+
+    keys = Object.keys(proxy);
+    for (index in keys) {
+        delete proxy[keys[index]];
+    }
+};
+
+jigna.ProxyFactory.prototype._populate_dict_proxy = function(proxy, info) {
+    var index;
+
+    for (index in info.keys) {
+        this._add_item_attribute(proxy, info.keys[index]);
+    }
+};
+
+jigna.ProxyFactory.prototype._update_dict_proxy = function(proxy, info) {
+    proxy.__cache__ = {}
+    this._delete_dict_keys(proxy);
+    this._populate_dict_proxy(proxy, info);
+};
+
+// List proxy creation /////////////////////////////////////////////////////////
+
+jigna.ProxyFactory.prototype._create_list_proxy = function(id, info) {
+    var proxy = new jigna.ListProxy('list', id, this._client);
+    this._populate_list_proxy(proxy, info);
+
+    return proxy;
+};
+
+jigna.ProxyFactory.prototype._populate_list_proxy = function(proxy, info) {
+    /* Populate the items in a list proxy. */
+
+    jigna.ListProxy.resize(proxy, info.length);
+
+    return proxy;
+};
+
+jigna.ProxyFactory.prototype._update_list_proxy = function(proxy, info) {
+    /* Update the given proxy.
+     *
+     * This gets rid of any cached items (items we have already requested from
+     * the server-side) and sets the (possibly) new length.
+     */
+    proxy.__cache__ = [];
+    this._populate_list_proxy(proxy, info);
+};
+
+// Common for list and dict proxies ////////////////////////////////////////////
+
+jigna.ProxyFactory.prototype._add_item_attribute = function(proxy, index){
+    var descriptor, get, set;
+    var factory = this;
+
+    get = function() {
+        // In here, 'this' refers to the proxy!
+        return factory._get_item(this, index);
+    };
+
+    set = function(value) {
+        // In here, 'this' refers to the proxy!
+        factory._set_item(this, index, value);
+    };
+
+    descriptor = {enumerable:true, get:get, set:set, configurable:true};
+    Object.defineProperty(proxy, index, descriptor);
+};
+
+jigna.ProxyFactory.prototype._get_item = function(proxy, index){
+    /* Get the value of an item of a list/dict proxy. */
+
+    var value = proxy.__cache__[index];
+    if (value === undefined) {
+        value = proxy.__client__.get_attribute(proxy, index);
+        proxy.__cache__[index] = value;
+    }
+
+    return value;
+};
+
+jigna.ProxyFactory.prototype._set_item = function(proxy, index, value){
+    /* Set the value of an item of a list/dict proxy. */
+
+    proxy.__cache__[index] = value;
+    proxy.__client__.set_item(proxy.__id__, index, value);
+};
+
+
+/////////////////////////////////////////////////////////////////////////////
+// AsyncProxyFactory
+/////////////////////////////////////////////////////////////////////////////
+
+jigna._SavedData = function(data) {
+    // Used internally to save marshaled data to unmarshal later.
+    this.data = data;
+};
+
+jigna._SavedRow = function(columns, index) {
+    // Used internally to save an item of a list sent in columns (see
+    // 'AsyncWebServer._get_columns') to unmarshal later.
+    jigna._SavedData.call(this, {
+        type  : 'instance',
+        value : columns.ids[index],
+        info  : {type_name: columns.type_name}
+    });
+    this.columns = columns;
+    this.index = index;
+};
+
+jigna._SavedRow.prototype = Object.create(jigna._SavedData.prototype);
+jigna._SavedRow.prototype.constructor = jigna._SavedRow;
+
+jigna.AsyncProxyFactory = function(client) {
+    jigna.ProxyFactory.call(this, client);
+
+    // The (most recent) saved row of each object sent in columns that does
+    // not have a proxy yet. A row is dropped from here when it is dropped
+    // from the cache of its list (see '_drop_rows'), as it holds on to all of
+    // the columns.
+    this._id_to_row_map = {};
+};
+
+jigna.AsyncProxyFactory.prototype = Object.create(
+    jigna.ProxyFactory.prototype
+);
+
+jigna.AsyncProxyFactory.prototype.constructor = jigna.AsyncProxyFactory
+
+jigna.AsyncProxyFactory.prototype.clear_cache = function(proxy) {
+    /* Drop all of the cached values of a proxy. */
+
+    this._drop_rows(proxy.__cache__);
+    jigna.ProxyFactory.prototype.clear_cache.call(this, proxy);
+};
+
+jigna.AsyncProxyFactory.prototype.unmarshal_row = function(id) {
+    /* Create the proxy for an object that was sent in columns (if it does not
+    have one already) and return it.
+    */
+
+    var client = this._client;
+    var proxy = client._id_to_proxy_map[id];
+    var row = this._id_to_row_map[id];
+    if (row === undefined) {
+        return proxy;
+    }
+
+    delete this._id_to_row_map[id];
+    if (proxy === undefined) {
+        proxy = client._unmarshal(row.data);
+        this._set_row_values(proxy, row.columns, row.index);
+    }
+
+    return proxy;
+};
+
+jigna.AsyncProxyFactory.prototype._add_instance_attribute = function(proxy, attribute_name){
+    var descriptor, get, set;
+
+    get = function() {
+        // In here, 'this' refers to the proxy!
+        var value = this.__cache__[attribute_name];
+        if (value === undefined) {
+            value = this.__client__.get_attribute(this, attribute_name);
+            if (value === undefined) {
+                var info = this.__info__;
+                if (info && (info.attribute_values !== undefined)) {
+                    var index = info.attribute_names.indexOf(attribute_name);
+                    value = this.__client__._unmarshal(
+                        info.attribute_values[index]
+                    );
+                }
+            } else {
+                this.__cache__[attribute_name] = value;
+            }
+        }
+
+        return value;
+    };
+
+    set = function(value) {
+        // In here, 'this' refers to the proxy!
+        //
+        // If the proxy is for a 'HasTraits' instance then we don't need
+        // to set the cached value here as the value will get updated when
+        // we get the corresponding trait event. However, setting the value
+        // here means that we can create jigna UIs for non-traits objects - it
+        // just means we won't react to external changes to the model(s).
+        this.__cache__[attribute_name] = value;
+        this.__client__.set_instance_attribute(
+            this.__id__, attribute_name, value
+        );
+    };
+
+    descriptor = {enumerable:true, get:get, set:set, configurable:true};
+    Object.defineProperty(proxy, attribute_name, descriptor);
+};
+
+jigna.AsyncProxyFactory.prototype._populate_dict_proxy = function(proxy, info) {
+    var index, key;
+    var values = this._saved_items(info.values);
+
+    for (index=0; index < info.keys.length; index++) {
+        key = info.keys[index];
+        this._add_item_attribute(proxy, key);
+        this._drop_row(proxy.__cache__[key]);
+        proxy.__cache__[key] = values[index];
+    }
+};
+
+jigna.AsyncProxyFactory.prototype._update_dict_proxy = function(proxy, info) {
+    var removed = info.removed;
+    var cache = proxy.__cache__;
+    var key;
+
+    // Add the keys in the added.
+    this._populate_dict_proxy(proxy, info.added);
+
+    for (var index=0; index < removed.length; index++) {
+        key = removed[index];
+        this._drop_row(cache[key]);
+        delete cache[key];
+        delete proxy[key];
+    }
+};
+
+jigna.AsyncProxyFactory.prototype._populate_list_proxy = function(proxy, info) {
+    /* Populate the items in a list proxy. */
+
+    var items = this._saved_items(info);
+    var cache = proxy.__cache__;
+    for (var index=0; index < info.length; index++) {
+        cache[index] = items[index];
+    }
+    jigna.ListProxy.resize(proxy, info.length);
+
+    return proxy;
+};
+
+jigna.AsyncProxyFactory.prototype._update_list_proxy = function(proxy, info) {
+    /* Update the given proxy. */
+
+    var index;
+    var cache = proxy.__cache__;
+    if (info.index === undefined) {
+        // This is an extended slice.  Note that one cannot increase the size
+        // of the list with an extended slice.  So one is either deleting
+        // elements or changing them.
+        var added = info.added;
+        if (info.removed - added.length > 0) {
+            var to_remove = [];
+            for (index=info.start; index<info.stop; index+=info.step) {
+                to_remove.push(index);
+            }
+            // Delete the cached entries in sequence from the back.
+            for (index=to_remove.length; index > 0; index--) {
+                this._drop_rows(cache.splice(to_remove[index-1], 1));
+            }
+        } else {
+            // When nothing is removed, just update the cache entries.
+            var items = this._saved_items(added);
+            for (var i=0; i < added.length; i++) {
+                index = info.start + i*info.step;
+                this._drop_row(cache[index]);
+                cache[index] = items[i];
+            }
+        }
+    } else {
+        // This is not an extended slice.
+        var splice_args = [info.index, info.removed].concat(
+            this._saved_items(info.added)
+        );
+        this._drop_rows(cache.splice.apply(cache, splice_args));
+    }
+
+    jigna.ListProxy.resize(proxy, cache.length);
+};
+
+
+// Common for list and dict proxies ////////////////////////////////////////////
+
+jigna.AsyncProxyFactory.prototype._get_item = function(proxy, index){
+    /* Get the value of an item of a list/dict proxy. */
+
+    var value = proxy.__cache__[index];
+    if (value === undefined) {
+        value = proxy.__client__.get_attribute(proxy, index);
+        proxy.__cache__[index] = value;
+    } else if (value instanceof jigna._SavedRow) {
+        value = this.unmarshal_row(value.data.value);
+        proxy.__cache__[index] = value;
+    } else if (value instanceof jigna._SavedData) {
+        value = proxy.__client__._unmarshal(value.data);
+        proxy.__cache__[index] = value;
+    }
+
+    return value;
+};
+
+jigna.AsyncProxyFactory.prototype._drop_row = function(value) {
+    /* Forget a saved row that is no longer in the cache of a list/dict. */
+
+    if (value instanceof jigna._SavedRow) {
+        var id = value.data.value;
+        if (this._id_to_row_map[id] === value) {
+            delete this._id_to_row_map[id];
+        }
+    }
+};
+
+jigna.AsyncProxyFactory.prototype._drop_rows = function(values) {
+    /* Forget the saved rows in an array (or object) of cached values. */
+
+    for (var key in values) {
+        this._drop_row(values[key]);
+    }
+};
+
+jigna.AsyncProxyFactory.prototype._saved_items = function(info) {
+    /* Return the items in a list info, saved to be unmarshalled later. */
+
+    var items = new Array(info.length);
+    var index;
+
+    if (info.columns === undefined) {
+        for (index=0; index < info.length; index++) {
+            items[index] = new jigna._SavedData(info.data[index]);
+        }
+
+        return items;
+    }
+
+    // The values in the columns are the most recent ones, so the proxies
+    // that already exist are updated now, while the others are only created
+    // when they are used (see 'unmarshal_row').
+    var columns = info.columns;
+    var id_to_proxy_map = this._client._id_to_proxy_map;
+    for (index=0; index < info.length; index++) {
+        var id = columns.ids[index];
+        var proxy = id_to_proxy_map[id];
+        if (proxy === undefined) {
+            items[index] = this._id_to_row_map[id] = new jigna._SavedRow(
+                columns, index
+            );
+        }
+        else {
+            this._set_row_values(proxy, columns, index);
+            items[index] = proxy;
+        }
+    }
+
+    return items;
+};
+
+jigna.AsyncProxyFactory.prototype._set_row_values = function(proxy, columns, index) {
+    /* Set the cached values of a proxy from a row of columns. */
+
+    var values = columns.values;
+    for (var name in values) {
+        proxy.__cache__[name] = values[name][index];
+    }
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// Proxy
+///////////////////////////////////////////////////////////////////////////////
+
+jigna.Proxy = function(type, id, client) {
+    // We use the '__attribute__' pattern to reduce the risk of name clashes
+    // with the actuall attribute and methods on the object that we are a
+    // proxy for.
+    Object.defineProperty(this, '__type__',   {value : type});
+    Object.defineProperty(this, '__id__',     {value : id});
+    Object.defineProperty(this, '__client__', {value : client});
+    Object.defineProperty(this, '__cache__',  {value : {}, writable: true});
+
+    // The state for each attribute can be 'busy' or undefined, if 'busy' it
+    // implies that the server is waiting to receive the value.
+    Object.defineProperty(this, '__state__',  {value : {}});
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// ListProxy
+///////////////////////////////////////////////////////////////////////////////
+
+// A ListProxy is a real Javascript `Array` (so that `Array.isArray`, the
+// array methods, `ng-repeat` and `v-for` all work) whose length is the length
+// of the list on the server. Its items are fetched/unmarshalled on demand by
+// the proxy factory (see `ProxyFactory._get_item`).
+//
+// Where ES6 proxies are available the array is wrapped in one that intercepts
+// reading/writing the items, so resizing a list is O(1) and no property is
+// defined per item. Otherwise an accessor property is defined for each item
+// (the length is still the native one, so reading it is O(1)).
+
+jigna.ListProxy = function(type, id, client) {
+
+    var arr = [];
+
+    // fixme: repetition of property definition
+    Object.defineProperty(arr, '__type__',   {value : type});
+    Object.defineProperty(arr, '__id__',     {value : id});
+    Object.defineProperty(arr, '__client__', {value : client});
+    Object.defineProperty(arr, '__cache__',  {value : [], writable: true});
+
+    // The state for each attribute can be 'busy' or undefined, if 'busy' it
+    // implies that the server is waiting to receive the value.
+    Object.defineProperty(arr, '__state__',  {value : {}});
+
+    if (jigna.ListProxy.native) {
+        var proxy = new Proxy(arr, jigna.ListProxy._handler);
+        Object.defineProperty(arr, '__proxy__', {value : proxy});
+        return proxy;
+    }
+
+    return arr;
+};
+
+// Are ES6 proxies available?
+jigna.ListProxy.native = (typeof Proxy === 'function');
+
+jigna.ListProxy.resize = function(proxy, length) {
+    /* Set the length of a list proxy. */
+
+    if (!jigna.ListProxy.native) {
+        var factory = proxy.__client__._proxy_factory;
+        for (var index=proxy.length; index < length; index++) {
+            factory._add_item_attribute(proxy, index);
+        }
+    }
+
+    // This deletes any items past the new length.
+    proxy.length = length;
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.ListProxy._index = function(key) {
+    /* Return the array index named by a property key (-1 if it is not one). */
+
+    if (typeof key !== 'string') {
+        return -1;
+    }
+
+    var code = key.charCodeAt(0);
+    if (!(code >= 48 && code <= 57)) {
+        return -1;
+    }
+
+    var index = +key;
+    if ((index >>> 0) !== index || String(index) !== key) {
+        return -1;
+    }
+
+    return index;
+};
+
+jigna.ListProxy._handler = {
+    // The items (ie. the indices less than the length) are handled by the
+    // proxy factory, everything else is left to the array.
+
+    get: function(target, key, receiver) {
+        var index = jigna.ListProxy._index(key);
+        if (index !== -1 && index < target.length) {
+            return target.__client__._proxy_factory._get_item(receiver, index);
+        }
+
+        return target[key];
+    },
+
+    set: function(target, key, value, receiver) {
+        var index = jigna.ListProxy._index(key);
+        if (index !== -1 && index < target.length) {
+            target.__client__._proxy_factory._set_item(receiver, index, value);
+        }
+        else {
+            target[key] = value;
+        }
+
+        return true;
+    },
+
+    has: function(target, key) {
+        var index = jigna.ListProxy._index(key);
+        if (index !== -1 && index < target.length) {
+            return true;
+        }
+
+        return key in target;
+    },
+
+    getOwnPropertyDescriptor: function(target, key) {
+        // The items are described as accessors (as they are when there are no
+        // ES6 proxies) so that describing an item does not fetch it.
+        var index = jigna.ListProxy._index(key);
+        if (index !== -1 && index < target.length) {
+            var proxy = target.__proxy__;
+            var factory = target.__client__._proxy_factory;
+            return {
+                get          : function() {
+                    return factory._get_item(proxy, index);
+                },
+                set          : function(value) {
+                    factory._set_item(proxy, index, value);
+                },
+                enumerable   : true,
+                configurable : true
+            };
+        }
+
+        return Object.getOwnPropertyDescriptor(target, key);
+    },
+
+    ownKeys: function(target) {
+        var keys = [];
+        for (var index=0; index < target.length; index++) {
+            keys.push(String(index));
+        }
+
+        var own = Reflect.ownKeys(target);
+        for (index=0; index < own.length; index++) {
+            if (jigna.ListProxy._index(own[index]) === -1) {
+                keys.push(own[index]);
+            }
+        }
+
+        return keys;
+    }
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// MemoryManager
+///////////////////////////////////////////////////////////////////////////////
+
+// The client keeps a proxy for every object that it has seen (and each proxy
+// caches every value fetched from the server). The memory manager keeps the
+// number of proxies within a budget: when there are more, the least recently
+// used proxies that cannot be reached from 'jigna.models' (or an object that
+// has listeners, or the window of a list query) are evicted. An evicted
+// proxy's cached values are dropped and the server is told to release the
+// object (see 'Server.release').
+//
+// The UI may still refer to an evicted proxy (eg. from a local variable or a
+// component's props), so it is only forgotten once it is garbage collected:
+// until then it is revived when it is used again (its values are fetched
+// again, and the server holds the object again) or when the same object is
+// received again (so that its identity is kept). The UI is told about the
+// evicted proxies, so the ones that it still shows are fetched again at once.
+//
+// The statistics are available as 'jigna.stats'.
+
+jigna.MemoryManager = function(client) {
+    // The maximum number of proxies (zero for no limit, see the
+    // 'memory_budget' option of 'jigna.initialize').
+    this.budget = jigna.memory_budget || 0;
+
+    // After a collection there are at most this fraction of the budget
+    // proxies (so that we do not collect every time a proxy is created).
+    this.low_water_mark = 0.75;
+
+    // Statistics.
+    this.stats = {
+        // The number of proxies.
+        proxies        : 0,
+
+        // The number of cached values (as of the last collection).
+        cached_values  : 0,
+
+        // The number of items of lists sent in columns that have no proxy
+        // yet (as of the last collection, see 'AsyncProxyFactory').
+        saved_rows     : 0,
+
+        // The number of collections and of the proxies evicted by them.
+        collections    : 0,
+        evicted        : 0,
+
+        // How long the last collection took (in milliseconds).
+        last_collection_time : 0
+    };
+
+    // Private protocol.
+    this._client = client;
+
+    // The proxies (by id), their number and when each was last used (the
+    // value of a counter incremented every time a proxy is used). Plain
+    // objects are used rather than Maps, which older browsers (eg. QtWebKit)
+    // do not have.
+    this._proxies = {};
+    this._size = 0;
+    this._last_used = {};
+    this._clock = 0;
+
+    // Weak references to the evicted proxies (by id), or the proxies
+    // themselves where there are no weak references (see '_evict').
+    this._evicted = {};
+
+    this._pending = false;
+};
+
+jigna.MemoryManager.prototype.add = function(proxy) {
+    /* Add a proxy that has just been created. */
+
+    this.stats.proxies += 1;
+    if (this.budget > 0) {
+        var id = proxy.__id__;
+        if (this._proxies[id] === undefined) {
+            this._size += 1;
+        }
+        this._proxies[id] = proxy;
+        this._last_used[id] = this._clock++;
+        if (this._size > this.budget) {
+            this._schedule();
+        }
+    }
+};
+
+jigna.MemoryManager.prototype.touch = function(proxy) {
+    /* Mark a proxy as (the most recently) used. */
+
+    if (this.budget > 0 && this._proxies[proxy.__id__] !== undefined) {
+        this._last_used[proxy.__id__] = this._clock++;
+    }
+};
+
+jigna.MemoryManager.prototype.revive = function(id) {
+    /* Return the evicted proxy for an object that is received again (or
+    undefined if there is none, or it has been garbage collected). The client
+    then adds it again (see 'Client._create_proxy').
+    */
+
+    var ref = this._evicted[id];
+    if (ref === undefined) {
+        return undefined;
+    }
+
+    delete this._evicted[id];
+
+    return (typeof WeakRef === 'function') ? ref.deref() : ref;
+};
+
+jigna.MemoryManager.prototype.use = function(proxy) {
+    /* Mark a proxy whose values are being fetched as used (reviving it if it
+    was evicted).
+    */
+
+    var id = proxy.__id__;
+    if (this._client._id_to_proxy_map[id] === undefined) {
+        delete this._evicted[id];
+        this._client._id_to_proxy_map[id] = proxy;
+        this.add(proxy);
+    }
+    else {
+        this.touch(proxy);
+    }
+};
+
+jigna.MemoryManager.prototype.collect = function() {
+    /* Evict the least recently used unreachable proxies (if there are more
+    proxies than the budget allows).
+    */
+
+    this._pending = false;
+    if (this.budget <= 0 || this._size <= this.budget) {
+        return;
+    }
+
+    var start = Date.now();
+    var reachable = this._find_reachable();
+    this._prune();
+
+    // Evict the unreachable proxies, least recently used first.
+    var last_used = this._last_used;
+    var unreachable = [];
+    for (var id in this._proxies) {
+        if (reachable[id] !== true) {
+            unreachable.push(id);
+        }
+    }
+    unreachable.sort(function(a, b) { return last_used[a] - last_used[b]; });
+
+    var target = Math.floor(this.budget * this.low_water_mark);
+    var evicted = {};
+    var ids = [];
+    var survivors = [];
+    for (var index=0; index < unreachable.length; index++) {
+        id = unreachable[index];
+        if (this._size - ids.length > target) {
+            evicted[id] = true;
+            ids.push(id);
+        }
+        else {
+            survivors.push(this._proxies[id]);
+        }
+    }
+
+    var evicted_proxies = [];
+    for (index=0; index < ids.length; index++) {
+        evicted_proxies.push(this._proxies[ids[index]]);
+        this._evict(evicted_proxies[index]);
+    }
+
+    // Unreachable proxies that were not evicted may still refer to evicted
+    // ones, so those values must be fetched again too.
+    for (index=0; index < survivors.length; index++) {
+        this._forget(survivors[index], evicted);
+    }
+
+    if (ids.length > 0) {
+        this._client.release(ids);
+    }
+
+    // Any of the evicted proxies that the UI still shows are fetched again.
+    for (index=0; index < evicted_proxies.length; index++) {
+        jigna.fire_event(
+            'jigna', {name: 'object_changed', object: evicted_proxies[index]}
+        );
+    }
+
+    this.stats.proxies -= ids.length;
+    this.stats.collections += 1;
+    this.stats.evicted += ids.length;
+    this.stats.last_collection_time = Date.now() - start;
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.MemoryManager.prototype._evict = function(proxy) {
+    /* Evict a proxy. */
+
+    var id = proxy.__id__;
+    delete this._proxies[id];
+    delete this._last_used[id];
+    this._size -= 1;
+    delete this._client._id_to_proxy_map[id];
+    this._client._proxy_factory.clear_cache(proxy);
+
+    // Without weak references the evicted proxies are kept (but their cached
+    // values are not).
+    this._evicted[id] = (
+        (typeof WeakRef === 'function') ? new WeakRef(proxy) : proxy
+    );
+};
+
+jigna.MemoryManager.prototype._find_reachable = function() {
+    /* Return the ids of the proxies that can be reached from the models (or
+    from the objects that have listeners and the windows of list queries).
+    */
+
+    var id_to_proxy_map = this._client._id_to_proxy_map;
+    var reachable = {};
+    var queue = [];
+    var cached_values = 0;
+
+    var visit = function(id) {
+        if (reachable[id] !== true) {
+            reachable[id] = true;
+            var proxy = id_to_proxy_map[id];
+            if (proxy !== undefined) {
+                queue.push(proxy);
+            }
+        }
+    };
+
+    for (var name in jigna.models) {
+        visit(jigna.models[name].__id__);
+    }
+    for (var id in jigna._listeners) {
+        visit(id);
+    }
+    var queries = this._client._queries;
+    for (id in queries) {
+        var items = queries[id].items;
+        for (var index=0; index < items.length; index++) {
+            if (items[index] !== null && items[index].__id__ !== undefined) {
+                visit(items[index].__id__);
+            }
+        }
+    }
+
+    while (queue.length > 0) {
+        var cache = queue.pop().__cache__;
+        for (var key in cache) {
+            var value = cache[key];
+            cached_values += 1;
+            if (value === null || typeof value !== 'object') {
+                continue;
+            }
+
+            // A proxy...
+            if (value.__id__ !== undefined) {
+                visit(value.__id__);
+            }
+            // ... or a value that has not been unmarshalled yet.
+            else if (value instanceof jigna._SavedData) {
+                if (value.data.type !== 'primitive') {
+                    visit(value.data.value);
+                }
+            }
+        }
+    }
+
+    this.stats.cached_values = cached_values;
+
+    var rows = this._client._proxy_factory._id_to_row_map;
+    this.stats.saved_rows = (rows === undefined) ? 0 : Object.keys(rows).length;
+
+    return reachable;
+};
+
+jigna.MemoryManager.prototype._forget = function(proxy, evicted) {
+    /* Drop the cached values of a proxy that are evicted proxies. */
+
+    var cache = proxy.__cache__;
+    for (var key in cache) {
+        var value = cache[key];
+        if (value !== null && typeof value === 'object' &&
+            evicted[value.__id__] === true) {
+            cache[key] = undefined;
+        }
+    }
+};
+
+jigna.MemoryManager.prototype._prune = function() {
+    /* Forget the evicted proxies that have been garbage collected. */
+
+    if (typeof WeakRef !== 'function') {
+        return;
+    }
+
+    for (var id in this._evicted) {
+        if (this._evicted[id].deref() === undefined) {
+            delete this._evicted[id];
+        }
+    }
+};
+
+jigna.MemoryManager.prototype._schedule = function() {
+    /* Collect once the current changes have been handled (so that the new
+    proxies are already cached by the proxies they were fetched from).
+    */
+
+    if (this._pending) {
+        return;
+    }
+    this._pending = true;
+
+    var manager = this;
+    setTimeout(function() { manager.collect(); }, 0);
+};
+
+// The statistics of the client's memory manager (see 'Client.initialize').
+jigna.stats = null;
+
+
+///////////////////////////////////////////////////////////////////////////////
+// ListQuery
+///////////////////////////////////////////////////////////////////////////////
+
+// A sorted, filtered window onto a list attribute of a proxy, maintained by
+// the server (see 'jigna/core/list_query.py'), so that a table over a large
+// list only has the items that are on screen, e.g.
+//
+//     var query = jigna.query(addressbook, 'people', {
+//         sort    : ['-age', 'name'],
+//         filters : [['age', '>=', 18]],
+//         limit   : 20
+//     });
+//
+//     <tr ng-repeat="person in query.items">...</tr>
+//
+//     query.update({offset: 20});
+//
+// 'items' and 'total' are kept up to date as the list changes on the server.
+
+jigna.ListQuery = function(client, proxy, attribute_name, options) {
+    options = options || {};
+
+    // The sort keys (attribute names, prefixed with '-' for descending
+    // order) and the filters ([attribute name, operator, value] triples).
+    this.sort    = options.sort || [];
+    this.filters = options.filters || [];
+
+    // The window.
+    this.offset  = options.offset || 0;
+    this.limit   = options.limit === undefined ? 50 : options.limit;
+
+    // The items in the window and the total number of items that match the
+    // filters.
+    this.items   = [];
+    this.total   = 0;
+
+    // The id of the query on the server (once it has started).
+    this.id      = null;
+
+    // A promise that is resolved with the query once it has started.
+    var deferred = new $.Deferred();
+    this.ready   = deferred.promise();
+
+    // Private protocol.
+    this._client = client;
+    this._closed = false;
+
+    var request = {
+        kind           : 'query_list',
+        id             : proxy.__id__,
+        attribute_name : attribute_name,
+        sort           : this.sort,
+        filters        : this.filters,
+        offset         : this.offset,
+        limit          : this.limit
+    };
+
+    var query = this;
+    $.when(client.send_request(request)).done(function(window) {
+        query.id = window.query;
+        client._queries[query.id] = query;
+        jigna.add_listener(query.id, 'window', query._on_window, query);
+
+        query._set_window(window);
+
+        // The query may have been closed before it started.
+        if (query._closed) {
+            query.close();
+        }
+
+        deferred.resolve(query);
+    });
+};
+
+jigna.ListQuery.prototype.update = function(options) {
+    /* Change the sort keys, filters and/or window ('sort', 'filters',
+    'offset' and 'limit' in the options). Return a promise that is resolved
+    with the query once the new window has arrived.
+    */
+
+    var query = this;
+
+    return this.ready.then(function() {
+        var request = {kind: 'update_query', query: query.id};
+        var names = ['sort', 'filters', 'offset', 'limit'];
+        for (var index=0; index < names.length; index++) {
+            var name = names[index];
+            if (options[name] !== undefined) {
+                query[name] = request[name] = options[name];
+            }
+        }
+
+        return $.when(query._client.send_request(request)).then(
+            function(window) {
+                query._set_window(window);
+                return query;
+            }
+        );
+    });
+};
+
+jigna.ListQuery.prototype.close = function() {
+    /* Stop the query (its items are no longer kept up to date). */
+
+    this._closed = true;
+    if (this.id === null) {
+        return;
+    }
+
+    delete this._client._queries[this.id];
+    delete jigna._listeners[this.id];
+    this._client.close_query(this.id);
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.ListQuery.prototype._on_window = function(event) {
+    this._set_window(event.data);
+};
+
+jigna.ListQuery.prototype._set_window = function(window) {
+    this.offset = window.offset;
+    this.total  = window.total;
+    this.items  = this._client._unmarshal_items(window.items);
+
+    jigna.fire_event('jigna', {name: 'object_changed', object: this});
+};
+
+jigna.query = function(proxy, attribute_name, options) {
+    /* Start a query on a list attribute of a proxy (see 'jigna.ListQuery'). */
+
+    return new jigna.ListQuery(this.client, proxy, attribute_name, options);
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// QtBridge (intra-process)
+///////////////////////////////////////////////////////////////////////////////
+
+jigna.QtBridge = function(client, qt_bridge) {
+    this.ready = new $.Deferred();
+
+    // In native mode (see QtServer.bridge_mode), requests, responses and
+    // events are passed as objects rather than as JSON text.
+    this.native = (qt_bridge.handle_request_native !== undefined);
+
+    // Private protocol
+    this._client    = client;
+    this._qt_bridge = qt_bridge;
+
+    if (this.native) {
+        var bridge = this;
+        qt_bridge.events_sent.connect(function(events) {
+            bridge.handle_events(events);
+        });
+    }
+
+    this.ready.resolve();
+};
+
+// The typed array for each numpy dtype (as given by 'dtype.str').
+jigna.QtBridge.ARRAY_TYPES = {
+    '|b1': Uint8Array,   '|i1': Int8Array,    '|u1': Uint8Array,
+    '<i2': Int16Array,   '<u2': Uint16Array,  '<i4': Int32Array,
+    '<u4': Uint32Array,  '<f4': Float32Array, '<f8': Float64Array
+};
+
+jigna.QtBridge.decode_array = function(value) {
+    /* Decode a numpy array sent by a native bridge.
+
+    The array is returned as a typed array (sharing the data sent) with an
+    extra 'shape' attribute. Arrays with a dtype that has no typed array
+    equivalent are returned as sent (with the raw bytes in 'data').
+    */
+
+    var array_type = jigna.QtBridge.ARRAY_TYPES[value.dtype];
+    if (array_type === undefined) {
+        return value;
+    }
+
+    var data  = value.data;
+    var array = new array_type(
+        data.buffer, data.byteOffset, data.byteLength / array_type.BYTES_PER_ELEMENT
+    );
+    array.shape = value.shape;
+
+    return array;
+};
+
+jigna.QtBridge.prototype.handle_event = function(jsonized_event) {
+    /* Handle an event from the server. */
+    this._client.handle_event(jsonized_event);
+};
+
+jigna.QtBridge.prototype.handle_events = function(events) {
+    /* Handle a batch of (already parsed) events from the server. */
+    this._client.handle_events(events);
+};
+
+jigna.QtBridge.prototype.send_request = function(jsonized_request) {
+    /* Send a request to the server and wait for the reply. */
+
+    result = this._qt_bridge.handle_request(jsonized_request);
+
+    return result;
+};
+
+jigna.QtBridge.prototype.send_request_native = function(request) {
+    /* Send a request (an object) to the server and return the response (an
+    object). Only available in native mode. */
+
+    return this._qt_bridge.handle_request_native(request);
+};
+
+jigna.QtBridge.prototype.send_request_async = function(jsonized_request) {
+    /* A dummy async version of the send_request method. Since QtBridge is
+    single process, this method indeed waits for the reply but presents
+    a deferred API so that the AsyncClient can use it. Mainly for testing
+    purposes only. */
+
+    var deferred = new $.Deferred();
+
+    deferred.resolve(this._qt_bridge.handle_request(jsonized_request));
+
+    return deferred.promise();
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// WireDecoder
+///////////////////////////////////////////////////////////////////////////////
+
+// Decodes the messages sent by the server in the compact wire encoding (see
+// 'jigna/core/wire.py' for the format). The decoded events and responses are
+// exactly as sent in the default (JSON) encoding.
+
+jigna.WireDecoder = function() {
+    // The strings defined so far (indexed by their code).
+    this._strings = [];
+};
+
+// Value codes.
+jigna.WireDecoder.PRIMITIVE   = 0;
+jigna.WireDecoder.INSTANCE    = 1;
+jigna.WireDecoder.LIST        = 2;
+jigna.WireDecoder.DICT        = 3;
+jigna.WireDecoder.LIST_SPLICE = 4;
+jigna.WireDecoder.DICT_UPDATE = 5;
+jigna.WireDecoder.RAW         = 6;
+
+// Event codes.
+jigna.WireDecoder.EVENT_RAW     = 0;
+jigna.WireDecoder.EVENT_VALUE   = 1;
+jigna.WireDecoder.EVENT_ITEMS   = 2;
+jigna.WireDecoder.EVENT_CONTEXT = 3;
+jigna.WireDecoder.EVENT_TYPE    = 4;
+
+jigna.WireDecoder.prototype.decode = function(message) {
+    /* Decode a (parsed) message.
+
+    Return an array [request_id, payload] where the payload is the decoded
+    event (if the request id is -1) or response.
+    */
+
+    // The server has started a new table of codes.
+    if (message.length > 3 && message[3]) {
+        this._strings = [];
+    }
+
+    if (message.length > 2) {
+        Array.prototype.push.apply(this._strings, message[2]);
+    }
+
+    var request_id = message[0];
+    var payload = message[1];
+    if (request_id === -1) {
+        return [request_id, this._decode_event(payload)];
+    }
+
+    // The server failed to handle the request and sent a plain reply.
+    if (!Array.isArray(payload)) {
+        return [request_id, JSON.parse(payload)];
+    }
+
+    return [request_id, {
+        exception : payload.length > 1 ? payload[1] : null,
+        result    : this._decode_any(payload[0])
+    }];
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WireDecoder.prototype._decode_any = function(value) {
+    if (value === null) {
+        return null;
+    }
+
+    if (value[0] === jigna.WireDecoder.RAW) {
+        return value[1];
+    }
+
+    return this._decode_value(value);
+};
+
+jigna.WireDecoder.prototype._decode_event = function(event) {
+    if (!Array.isArray(event)) {
+        return event;
+    }
+
+    var codes = jigna.WireDecoder;
+    var code = event[2];
+    var data = event[3];
+    var decoded = {obj: this._strings[event[0]], name: this._strings[event[1]]};
+    if (code === codes.EVENT_RAW) {
+        decoded.data = data;
+    }
+    else if (code === codes.EVENT_CONTEXT) {
+        decoded.data = {};
+        for (var key in data) {
+            decoded.data[key] = this._decode_value(data[key]);
+        }
+    }
+    else if (code === codes.EVENT_TYPE) {
+        decoded.data = this._decode_type_info(data);
+    }
+    else {
+        decoded.data = this._decode_value(data);
+        decoded.items_event = code === codes.EVENT_ITEMS;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_dict_info = function(info) {
+    var decoded = {keys: info[0]};
+    if (info.length > 1) {
+        decoded.values = this._decode_list_info(info[1]);
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_columns = function(columns) {
+    var strings = this._strings;
+
+    var ids = new Array(columns[1].length);
+    for (var index=0; index < ids.length; index++) {
+        ids[index] = strings[columns[1][index]];
+    }
+
+    var values = {};
+    for (index=0; index < columns[2].length; index++) {
+        values[strings[columns[2][index][0]]] = columns[2][index][1];
+    }
+
+    return {type_name: strings[columns[0]], ids: ids, values: values};
+};
+
+jigna.WireDecoder.prototype._decode_list_info = function(info) {
+    var decoded = {length: info[0]};
+    if (info.length > 2) {
+        decoded.columns = this._decode_columns(info[2]);
+    }
+    else if (info.length > 1) {
+        var items = info[1];
+        var data = new Array(items.length);
+        for (var index=0; index < items.length; index++) {
+            data[index] = this._decode_value(items[index]);
+        }
+        decoded.data = data;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_names = function(codes) {
+    var names = new Array(codes.length);
+    for (var index=0; index < codes.length; index++) {
+        names[index] = this._strings[codes[index]];
+    }
+
+    return names;
+};
+
+jigna.WireDecoder.prototype._decode_type_info = function(info) {
+    if (!Array.isArray(info)) {
+        return {type_name: this._strings[info]};
+    }
+
+    var decoded = {
+        type_name       : this._strings[info[0]],
+        attribute_names : this._decode_names(info[1]),
+        event_names     : this._decode_names(info[2]),
+        method_names    : this._decode_names(info[3])
+    };
+    if (info.length > 4) {
+        decoded.attribute_values = this._decode_list_info([0, info[4]]).data;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_value = function(value) {
+    var codes = jigna.WireDecoder;
+    var code = value[0];
+    if (code === codes.RAW) {
+        return value[1];
+    }
+
+    if (code === codes.PRIMITIVE) {
+        return {type: 'primitive', value: value[1], info: null};
+    }
+
+    var id = this._strings[value[1]];
+    var info = value[2];
+    if (code === codes.INSTANCE) {
+        return {type: 'instance', value: id, info: this._decode_type_info(info)};
+    }
+    else if (code === codes.LIST) {
+        return {type: 'list', value: id, info: this._decode_list_info(info)};
+    }
+    else if (code === codes.DICT) {
+        return {type: 'dict', value: id, info: this._decode_dict_info(info)};
+    }
+    else if (code === codes.LIST_SPLICE) {
+        var splice;
+        if (info.length === 3) {
+            splice = {index: info[0], removed: info[1]};
+        }
+        else {
+            splice = {
+                start: info[0], stop: info[1], step: info[2], removed: info[3]
+            };
+        }
+        splice.added = this._decode_list_info(info[info.length - 1]);
+
+        return {type: 'list', value: id, info: splice};
+    }
+    else if (code === codes.DICT_UPDATE) {
+        return {type: 'dict', value: id, info: {
+            removed : info[0],
+            added   : this._decode_dict_info(info[1])
+        }};
+    }
+
+    throw new Error('Unknown value code ' + code);
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// WebBridge
+///////////////////////////////////////////////////////////////////////////////
+
+jigna.WebBridge = function(client) {
+    this._client = client;
+
+    // The jigna_server attribute can be set by a client to point to a
+    // different Jigna server.
+    var jigna_server = window['jigna_server'];
+    if (jigna_server === undefined) {
+        jigna_server = window.location.host;
+    }
+    this._server_url = 'http://' + jigna_server;
+
+    var url = 'ws://' + jigna_server + '/_jigna_ws';
+
+    // With the compact wire encoding the server's messages must be decoded
+    // (see wire.js).
+    this._decoder = null;
+    if (jigna.wire === 'compact') {
+        url += '?wire=compact';
+        this._decoder = new jigna.WireDecoder();
+    }
+
+    this._deferred_requests = {};
+    this._request_ids = [];
+    for (var index=0; index < 1024; index++) {
+        this._request_ids.push(index);
+    }
+
+    // The id that identifies the websocket in the synchronous GET requests
+    // (see '_connect').
+    this._connection_id = null;
+
+    this.ready = new $.Deferred();
+    this._connect(url);
+};
+
+jigna.WebBridge.prototype.handle_event = function(jsonized_event) {
+    /* Handle an event from the server. */
+    var response = JSON.parse(jsonized_event);
+    if (this._decoder !== null) {
+        // The payload is already decoded (it is not a JSON string).
+        response = this._decoder.decode(response);
+        if (response[0] === -1) {
+            this._client.handle_events([response[1]]);
+            return;
+        }
+    }
+
+    var request_id = response[0];
+    var jsonized_response = response[1];
+    if (request_id === -1) {
+        this._client.handle_event(jsonized_response);
+    }
+    else {
+        var deferred = this._pop_deferred_request(request_id);
+        deferred.resolve(jsonized_response);
+    }
+};
+
+jigna.WebBridge.prototype.send_request = function(jsonized_request) {
+    /* Send a request to the server and wait for the reply. */
+
+    var jsonized_response;
+
+    // The server notes which client holds the objects in the response.
+    var data = {'data': jsonized_request};
+    if (this._connection_id !== null) {
+        data['connection'] = this._connection_id;
+    }
+
+    $.ajax(
+        {
+            url     : '/_jigna',
+            type    : 'GET',
+            data    : data,
+            success : function(result) {jsonized_response = result;},
+            error   : function(status, error) {
+                          console.warning("Error: " + error);
+                      },
+            async   : false
+        }
+    );
+
+    return jsonized_response;
+};
+
+jigna.WebBridge.prototype.send_request_async = function(jsonized_request) {
+    /* Send a request to the server and do not wait and return a Promise
+       which is resolved upon completion of the request.
+    */
+
+    var deferred = new $.Deferred();
+    var request_id = this._push_deferred_request(deferred);
+    var bridge = this;
+    this.ready.done(function() {
+        bridge._send(JSON.stringify([request_id, jsonized_request]));
+    });
+    return deferred.promise();
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WebBridge.prototype._connect = function(url) {
+    /* Open the websocket to the server. */
+
+    // Tell the server which websocket the synchronous GET requests come from.
+    this._connection_id = (
+        Math.random().toString(36).slice(2) + Date.now().toString(36)
+    );
+    url += (url.indexOf('?') === -1 ? '?' : '&');
+    url += 'connection=' + this._connection_id;
+
+    var bridge = this;
+    this._web_socket = new WebSocket(url);
+    this._web_socket.onopen = function() {
+        bridge.ready.resolve();
+    };
+    this._web_socket.onmessage = function(event) {
+        bridge.handle_event(event.data);
+    };
+};
+
+jigna.WebBridge.prototype._send = function(message) {
+    /* Send a message to the server. */
+    this._web_socket.send(message);
+};
+
+jigna.WebBridge.prototype._pop_deferred_request = function(request_id) {
+    var deferred = this._deferred_requests[request_id];
+    delete this._deferred_requests[request_id];
+    this._request_ids.push(request_id);
+    return deferred;
+};
+
+jigna.WebBridge.prototype._push_deferred_request = function(deferred) {
+    var id = this._request_ids.pop();
+    if (id === undefined) {
+        console.error("In _push_deferred_request, request_id is undefined.");
+    }
+    this._deferred_requests[id] = deferred;
+    return id;
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// WorkerBridge
+///////////////////////////////////////////////////////////////////////////////
+
+// A WebBridge whose websocket lives in a Web Worker (see
+// 'worker/dedicated.js'). The worker receives (and, with the compact wire
+// encoding, decodes) the server's messages and posts them in batches, with
+// each payload either as JSON text or with the columns of big lists in typed
+// arrays (see 'jigna.pack_batch' in 'worker/connection.js'). Used when jigna
+// is initialized with the 'worker' option.
+
+jigna.WorkerBridge = function(client) {
+    jigna.WebBridge.call(this, client);
+};
+
+jigna.WorkerBridge.prototype = Object.create(jigna.WebBridge.prototype);
+jigna.WorkerBridge.prototype.constructor = jigna.WorkerBridge;
+
+// The URL of the worker script (unless it is given by the 'worker' option).
+jigna.WorkerBridge.url = '/jigna/jigna-worker.js';
+
+jigna.WorkerBridge.prototype.handle_batch = function(messages) {
+    /* Handle a batch of (decoded) messages from the worker. */
+
+    var events = [];
+    for (var index=0; index < messages.length; index++) {
+        var request_id = messages[index][0];
+        var payload = messages[index][1];
+        if (typeof payload === 'string') {
+            payload = JSON.parse(payload);
+        }
+        if (request_id === -1) {
+            events.push(payload);
+        }
+        else {
+            // Handle the events that arrived before the response first.
+            if (events.length > 0) {
+                this._client.handle_events(events);
+                events = [];
+            }
+            this._pop_deferred_request(request_id).resolve(payload);
+        }
+    }
+
+    if (events.length > 0) {
+        this._client.handle_events(events);
+    }
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WorkerBridge.prototype._connect = function(url) {
+    /* Start the worker and have it open the websocket to the server. */
+
+    // The messages are decoded by the worker.
+    this._decoder = null;
+
+    var bridge = this;
+    this._port = this._create_port(url);
+    this._port.onmessage = function(event) {
+        var message = event.data;
+        if (message.type === 'batch') {
+            var messages = message.messages;
+            if (typeof messages === 'string') {
+                messages = JSON.parse(messages);
+            }
+            bridge.handle_batch(messages);
+        }
+        else if (message.type === 'open') {
+            bridge.ready.resolve();
+        }
+    };
+    this._port.postMessage({type: 'connect', url: url, wire: jigna.wire});
+};
+
+jigna.WorkerBridge.prototype._create_port = function(url) {
+    /* Create the worker and return the port to post messages to it. */
+
+    // The 'worker' option is true, 'shared' (if shared workers are not
+    // supported) or the URL of the worker script. Templates give the URL of
+    // the (content hashed) worker script in the 'worker_url' option, which is
+    // that of the shared worker script if the option is 'shared'.
+    var worker_url = jigna.worker;
+    if (worker_url === true) {
+        worker_url = jigna.worker_url || jigna.WorkerBridge.url;
+    }
+    else if (worker_url === 'shared') {
+        worker_url = jigna.WorkerBridge.url;
+    }
+
+    return new Worker(worker_url);
+};
+
+jigna.WorkerBridge.prototype._send = function(message) {
+    /* Send a message to the server (via the worker). */
+    this._port.postMessage({type: 'send', message: message});
+};
+
+///////////////////////////////////////////////////////////////////////////////
+// SharedWorkerBridge
+///////////////////////////////////////////////////////////////////////////////
+
+// A WorkerBridge whose worker is shared by all of the tabs that connect to the
+// same server (see 'worker/shared.js'), so that there is one websocket (and
+// every event is sent and decoded once) no matter how many tabs are open.
+// Used when jigna is initialized with the 'worker' option set to 'shared'.
+
+jigna.SharedWorkerBridge = function(client) {
+    jigna.WorkerBridge.call(this, client);
+};
+
+jigna.SharedWorkerBridge.prototype = Object.create(jigna.WorkerBridge.prototype);
+jigna.SharedWorkerBridge.prototype.constructor = jigna.SharedWorkerBridge;
+
+// The URL of the shared worker script.
+jigna.SharedWorkerBridge.url = '/jigna/jigna-shared-worker.js';
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.SharedWorkerBridge.prototype._create_port = function(url) {
+    /* Connect to the shared worker and return the port to it. */
+
+    var worker = new SharedWorker(
+        jigna.worker_url || jigna.SharedWorkerBridge.url, 'jigna'
+    );
+    var port = worker.port;
+
+    // Shared workers cannot tell when a tab goes away.
+    window.addEventListener('pagehide', function() {
+        port.postMessage({type: 'disconnect'});
+    });
+
+    // The tab also goes away when it is put in the back/forward cache. When
+    // it is shown again it has missed the events sent meanwhile (and the
+    // objects it held may have been released), so it is reloaded to connect
+    // again.
+    window.addEventListener('pageshow', function(event) {
+        if (event.persisted) {
+            window.location.reload();
+        }
+    });
+
+    return port;
+};
+
+
+window.jigna = jigna;
+
+})();
@@ -0,0 +1,1031 @@
+(function (){
+
+///////////////////////////////////////////////////////////////////////////////
+// WorkerConnection
+///////////////////////////////////////////////////////////////////////////////
+
+// The websocket to the server used by the jigna workers (see 'dedicated.js'
+// and 'shared.js'). The messages received in a burst are handed over as a
+// single batch of `WorkerMessage`s, which are packed for the tabs by
+// 'jigna.pack_batch'.
+//
+// Whatever is posted to a tab is copied (with the structured clone
+// algorithm), and copying objects costs the tab about as much as parsing
+// their JSON. So the worker does what the tab would otherwise do with the
+// bulk of the data: the numbers in the columns of big lists (see
+// 'AsyncWebServer._get_columns') are put in typed arrays whose buffers are
+// transferred rather than copied (the tab indexes them like arrays). Other
+// payloads are posted as JSON text, which is cheaper for the tab to parse
+// than to copy as objects (see 'benchmarks/worker_messages.py').
+
+// Namespace for the jigna objects in the worker.
+var jigna = {};
+
+jigna.WorkerConnection = function(url, wire) {
+    this.url = url;
+    this.wire = wire;
+
+    // Called when the websocket is open, with each batch of (decoded)
+    // messages and when the websocket is closed.
+    this.onopen = null;
+    this.onbatch = null;
+    this.onclose = null;
+
+    // Private protocol.
+    this._socket = null;
+    this._decoder = null;
+    this._outbox = [];
+    this._batch = [];
+};
+
+jigna.WorkerConnection.prototype.connect = function() {
+    /* Open the websocket to the server. */
+
+    var connection = this;
+
+    if (this.wire === 'compact') {
+        this._decoder = new jigna.WireDecoder();
+    }
+
+    this._socket = new WebSocket(this.url);
+    this._socket.onopen = function() {
+        var outbox = connection._outbox;
+        connection._outbox = [];
+        for (var index=0; index < outbox.length; index++) {
+            connection._socket.send(outbox[index]);
+        }
+        connection.onopen();
+    };
+    this._socket.onmessage = function(event) {
+        connection._receive(event.data);
+    };
+    this._socket.onclose = function() {
+        connection.onclose();
+    };
+};
+
+jigna.WorkerConnection.prototype.close = function() {
+    this._socket.close();
+};
+
+jigna.WorkerConnection.prototype.is_open = function() {
+    return this._socket !== null && this._socket.readyState === 1;
+};
+
+jigna.WorkerConnection.prototype.send = function(message) {
+    /* Send a (jsonized) message to the server once the websocket is open. */
+
+    if (this.is_open()) {
+        this._socket.send(message);
+    }
+    else {
+        this._outbox.push(message);
+    }
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WorkerConnection.prototype._decode = function(data) {
+    /* Return the WorkerMessage for a message from the server. */
+
+    var message = JSON.parse(data);
+    if (this._decoder !== null) {
+        // The payload is already decoded (it is not a JSON string).
+        message = this._decoder.decode(message);
+        return new jigna.WorkerMessage(message[0], message[1], undefined);
+    }
+
+    return new jigna.WorkerMessage(message[0], undefined, message[1]);
+};
+
+jigna.WorkerConnection.prototype._flush = function() {
+    var batch = this._batch;
+    this._batch = [];
+    this.onbatch(batch);
+};
+
+jigna.WorkerConnection.prototype._receive = function(data) {
+    /* Decode a message from the server and add it to the batch. */
+
+    var message = this._decode(data);
+
+    if (this._batch.length === 0) {
+        // Hand the batch over once the messages that have already arrived
+        // have been decoded.
+        var connection = this;
+        setTimeout(function() { connection._flush(); }, 0);
+    }
+    this._batch.push(message);
+};
+
+///////////////////////////////////////////////////////////////////////////////
+// WorkerMessage
+///////////////////////////////////////////////////////////////////////////////
+
+// An event (request_id -1) or response from the server, with its payload
+// parsed and/or as JSON text (each is only computed when it is needed).
+
+jigna.WorkerMessage = function(request_id, payload, text) {
+    this.request_id = request_id;
+
+    // The buffers of the typed arrays in the packed payload (see 'pack').
+    this.buffers = undefined;
+
+    // Private protocol.
+    this._payload = payload;
+    this._text = text;
+    this._packed = undefined;
+};
+
+jigna.WorkerMessage.prototype.get_payload = function() {
+    /* Return the (parsed) payload. */
+
+    if (this._payload === undefined) {
+        this._payload = JSON.parse(this._text);
+    }
+
+    return this._payload;
+};
+
+jigna.WorkerMessage.prototype.get_text = function() {
+    /* Return the payload as JSON text. */
+
+    if (this._text === undefined) {
+        this._text = JSON.stringify(this._payload);
+    }
+
+    return this._text;
+};
+
+jigna.WorkerMessage.prototype.pack = function() {
+    /* Return the payload as it is posted to the tabs.
+
+    That is the payload with its numeric columns in typed arrays (whose
+    buffers are then in 'buffers') if it has any, or its JSON text.
+    */
+
+    if (this._packed !== undefined) {
+        return this._packed;
+    }
+
+    // Payloads that are too short to have a column worth packing are not
+    // parsed.
+    var text = this._text;
+    if (text !== undefined && text.length < 2 * jigna.MIN_PACKED_COLUMN) {
+        this._packed = text;
+        return text;
+    }
+
+    var payload = this.get_payload();
+    this.buffers = jigna.pack_columns(payload, []);
+    this._packed = (this.buffers.length > 0) ? payload : this.get_text();
+
+    return this._packed;
+};
+
+// The minimum length of the numeric columns that are put in typed arrays.
+jigna.MIN_PACKED_COLUMN = 64;
+
+jigna.pack_batch = function(messages, request_ids) {
+    /* Pack a batch of messages for a tab.
+
+    Return an object with the `[request_id, payload]` pairs ('messages'),
+    where each payload is packed (see 'WorkerMessage.pack'), and the buffers
+    of their typed arrays ('buffers'). If none of the payloads has typed
+    arrays, the pairs are given as JSON text (one string is cheaper to post
+    and parse than many). The request ids are those of the messages unless
+    they are given.
+    */
+
+    var pairs = [];
+    var buffers = [];
+    for (var index=0; index < messages.length; index++) {
+        var message = messages[index];
+        var request_id = message.request_id;
+        if (request_ids !== undefined) {
+            request_id = request_ids[index];
+        }
+
+        pairs.push([request_id, message.pack()]);
+        if (message.buffers !== undefined) {
+            buffers.push.apply(buffers, message.buffers);
+        }
+    }
+
+    if (buffers.length === 0) {
+        for (index=0; index < pairs.length; index++) {
+            pairs[index] = '[' + pairs[index][0] + ',' + pairs[index][1] + ']';
+        }
+        pairs = '[' + pairs.join(',') + ']';
+    }
+
+    return {messages: pairs, buffers: buffers};
+};
+
+jigna.pack_columns = function(value, buffers) {
+    /* Put the numeric columns of the lists in a (marshalled) value in typed
+    arrays, and return their buffers.
+    */
+
+    if (value === null || typeof value !== 'object') {
+        return buffers;
+    }
+
+    var key;
+    if (value.type_name !== undefined && Array.isArray(value.ids)) {
+        var values = value.values;
+        for (key in values) {
+            var column = jigna._pack_column(values[key]);
+            if (column !== null) {
+                values[key] = column;
+                buffers.push(column.buffer);
+            }
+        }
+
+        return buffers;
+    }
+
+    for (key in value) {
+        jigna.pack_columns(value[key], buffers);
+    }
+
+    return buffers;
+};
+
+jigna._pack_column = function(column) {
+    /* Return a column as a typed array (null if it is not worth it or it has
+    values that are not numbers).
+    */
+
+    if (!Array.isArray(column) || column.length < jigna.MIN_PACKED_COLUMN) {
+        return null;
+    }
+
+    for (var index=0; index < column.length; index++) {
+        if (typeof column[index] !== 'number') {
+            return null;
+        }
+    }
+
+    return new Float64Array(column);
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// WireDecoder
+///////////////////////////////////////////////////////////////////////////////
+
+// Decodes the messages sent by the server in the compact wire encoding (see
+// 'jigna/core/wire.py' for the format). The decoded events and responses are
+// exactly as sent in the default (JSON) encoding.
+
+jigna.WireDecoder = function() {
+    // The strings defined so far (indexed by their code).
+    this._strings = [];
+};
+
+// Value codes.
+jigna.WireDecoder.PRIMITIVE   = 0;
+jigna.WireDecoder.INSTANCE    = 1;
+jigna.WireDecoder.LIST        = 2;
+jigna.WireDecoder.DICT        = 3;
+jigna.WireDecoder.LIST_SPLICE = 4;
+jigna.WireDecoder.DICT_UPDATE = 5;
+jigna.WireDecoder.RAW         = 6;
+
+// Event codes.
+jigna.WireDecoder.EVENT_RAW     = 0;
+jigna.WireDecoder.EVENT_VALUE   = 1;
+jigna.WireDecoder.EVENT_ITEMS   = 2;
+jigna.WireDecoder.EVENT_CONTEXT = 3;
+jigna.WireDecoder.EVENT_TYPE    = 4;
+
+jigna.WireDecoder.prototype.decode = function(message) {
+    /* Decode a (parsed) message.
+
+    Return an array [request_id, payload] where the payload is the decoded
+    event (if the request id is -1) or response.
+    */
+
+    // The server has started a new table of codes.
+    if (message.length > 3 && message[3]) {
+        this._strings = [];
+    }
+
+    if (message.length > 2) {
+        Array.prototype.push.apply(this._strings, message[2]);
+    }
+
+    var request_id = message[0];
+    var payload = message[1];
+    if (request_id === -1) {
+        return [request_id, this._decode_event(payload)];
+    }
+
+    // The server failed to handle the request and sent a plain reply.
+    if (!Array.isArray(payload)) {
+        return [request_id, JSON.parse(payload)];
+    }
+
+    return [request_id, {
+        exception : payload.length > 1 ? payload[1] : null,
+        result    : this._decode_any(payload[0])
+    }];
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WireDecoder.prototype._decode_any = function(value) {
+    if (value === null) {
+        return null;
+    }
+
+    if (value[0] === jigna.WireDecoder.RAW) {
+        return value[1];
+    }
+
+    return this._decode_value(value);
+};
+
+jigna.WireDecoder.prototype._decode_event = function(event) {
+    if (!Array.isArray(event)) {
+        return event;
+    }
+
+    var codes = jigna.WireDecoder;
+    var code = event[2];
+    var data = event[3];
+    var decoded = {obj: this._strings[event[0]], name: this._strings[event[1]]};
+    if (code === codes.EVENT_RAW) {
+        decoded.data = data;
+    }
+    else if (code === codes.EVENT_CONTEXT) {
+        decoded.data = {};
+        for (var key in data) {
+            decoded.data[key] = this._decode_value(data[key]);
+        }
+    }
+    else if (code === codes.EVENT_TYPE) {
+        decoded.data = this._decode_type_info(data);
+    }
+    else {
+        decoded.data = this._decode_value(data);
+        decoded.items_event = code === codes.EVENT_ITEMS;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_dict_info = function(info) {
+    var decoded = {keys: info[0]};
+    if (info.length > 1) {
+        decoded.values = this._decode_list_info(info[1]);
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_columns = function(columns) {
+    var strings = this._strings;
+
+    var ids = new Array(columns[1].length);
+    for (var index=0; index < ids.length; index++) {
+        ids[index] = strings[columns[1][index]];
+    }
+
+    var values = {};
+    for (index=0; index < columns[2].length; index++) {
+        values[strings[columns[2][index][0]]] = columns[2][index][1];
+    }
+
+    return {type_name: strings[columns[0]], ids: ids, values: values};
+};
+
+jigna.WireDecoder.prototype._decode_list_info = function(info) {
+    var decoded = {length: info[0]};
+    if (info.length > 2) {
+        decoded.columns = this._decode_columns(info[2]);
+    }
+    else if (info.length > 1) {
+        var items = info[1];
+        var data = new Array(items.length);
+        for (var index=0; index < items.length; index++) {
+            data[index] = this._decode_value(items[index]);
+        }
+        decoded.data = data;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_names = function(codes) {
+    var names = new Array(codes.length);
+    for (var index=0; index < codes.length; index++) {
+        names[index] = this._strings[codes[index]];
+    }
+
+    return names;
+};
+
+jigna.WireDecoder.prototype._decode_type_info = function(info) {
+    if (!Array.isArray(info)) {
+        return {type_name: this._strings[info]};
+    }
+
+    var decoded = {
+        type_name       : this._strings[info[0]],
+        attribute_names : this._decode_names(info[1]),
+        event_names     : this._decode_names(info[2]),
+        method_names    : this._decode_names(info[3])
+    };
+    if (info.length > 4) {
+        decoded.attribute_values = this._decode_list_info([0, info[4]]).data;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_value = function(value) {
+    var codes = jigna.WireDecoder;
+    var code = value[0];
+    if (code === codes.RAW) {
+        return value[1];
+    }
+
+    if (code === codes.PRIMITIVE) {
+        return {type: 'primitive', value: value[1], info: null};
+    }
+
+    var id = this._strings[value[1]];
+    var info = value[2];
+    if (code === codes.INSTANCE) {
+        return {type: 'instance', value: id, info: this._decode_type_info(info)};
+    }
+    else if (code === codes.LIST) {
+        return {type: 'list', value: id, info: this._decode_list_info(info)};
+    }
+    else if (code === codes.DICT) {
+        return {type: 'dict', value: id, info: this._decode_dict_info(info)};
+    }
+    else if (code === codes.LIST_SPLICE) {
+        var splice;
+        if (info.length === 3) {
+            splice = {index: info[0], removed: info[1]};
+        }
+        else {
+            splice = {
+                start: info[0], stop: info[1], step: info[2], removed: info[3]
+            };
+        }
+        splice.added = this._decode_list_info(info[info.length - 1]);
+
+        return {type: 'list', value: id, info: splice};
+    }
+    else if (code === codes.DICT_UPDATE) {
+        return {type: 'dict', value: id, info: {
+            removed : info[0],
+            added   : this._decode_dict_info(info[1])
+        }};
+    }
+
+    throw new Error('Unknown value code ' + code);
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// Shared worker
+///////////////////////////////////////////////////////////////////////////////
+
+// The worker used by the SharedWorkerBridge (see 'app/worker_bridge.js'). All
+// of the tabs (of an origin) that connect to the same server share one
+// websocket: their requests are multiplexed over it, and every event is
+// received (and decoded) once and then posted to all of the tabs.
+//
+// The worker also keeps the state that the tabs can share:
+//
+//  - the types sent by the server, which are replayed to tabs that connect
+//    later (the server sends the description of a type only once);
+//
+//  - the responses to requests for the attributes/items of objects, so that
+//    tabs asking for the same value (eg. when a dashboard is opened in a new
+//    tab) are answered without asking the server. A cached value is dropped
+//    whenever the server sends an event for its object or a tab sets one of
+//    its attributes/items, and all of them are dropped when a tab calls a
+//    method (objects that do not notify of their changes, eg. plain Python
+//    objects, can only be changed by that);
+//
+//  - which tabs hold which objects. To the server the worker is a single
+//    connection, so the tabs' 'release' requests (see 'Server.release') are
+//    only passed on for the objects that no tab holds anymore.
+//
+// The messages from/to the tabs are the same as for the dedicated worker
+// (see 'dedicated.js'), and tabs also send {type: 'disconnect'} when they are
+// closed.
+
+jigna.SharedConnection = function(url, wire) {
+    this.connection = new jigna.WorkerConnection(url, wire);
+
+    // The ports to the connected tabs.
+    this.ports = [];
+
+    // Called when the websocket is closed (or the last tab is removed).
+    this.onclose = null;
+
+    // Private protocol.
+
+    // The pending requests (by request id) with the ports and the ids that
+    // the tabs are waiting for their responses with, and (for requests whose
+    // response can be cached) their cache key.
+    this._requests = {};
+    this._next_request_id = 0;
+
+    // The new_type events (WorkerMessages, by type name).
+    this._types = {};
+
+    // The cached responses (WorkerMessages, by object id and cache key), their
+    // number, and the ids of the pending requests by object id and cache key.
+    this._cache = {};
+    this._cache_size = 0;
+    this._in_flight = {};
+
+    // The number of times the cached responses of each object (and all of
+    // them) were dropped (so that responses to requests sent before that are
+    // not cached).
+    this._generations = {};
+    this._epoch = 0;
+
+    // The ids of the futures of the methods called in threads (see
+    // 'Server.call_instance_method_thread') that have not finished yet.
+    this._futures = new Set();
+
+    // The tabs (ports) that hold each object (by id) that has been sent to
+    // them. Objects that are not in here are held by all of the tabs (those
+    // sent in events share the set of all the tabs).
+    this._holders = new Map();
+    this._all_ports = new Set();
+
+    // The ids of the objects that no tab holds, to be released (once there
+    // are no requests in flight whose responses might contain them).
+    this._releasing = new Set();
+
+    var shared = this;
+    this.connection.onopen = function() {
+        shared._post_all({type: 'open'});
+    };
+    this.connection.onbatch = function(messages) {
+        shared._handle_batch(messages);
+    };
+    this.connection.onclose = function() {
+        shared._post_all({type: 'close'});
+        shared.onclose();
+    };
+    this.connection.connect();
+};
+
+// The maximum number of cached responses (the cache is emptied if there are
+// more).
+jigna.SharedConnection.MAX_CACHE_SIZE = 10000;
+
+jigna.SharedConnection.prototype.add_port = function(port) {
+    /* Add a tab. */
+
+    this.ports.push(port);
+    this._all_ports = new Set(this.ports);
+
+    // Tell the tab about the types that were sent before it connected.
+    var events = [];
+    for (var type_name in this._types) {
+        events.push(this._types[type_name]);
+    }
+    if (events.length > 0) {
+        port.postMessage(
+            {type: 'batch', messages: jigna.pack_batch(events).messages}
+        );
+    }
+
+    if (this.connection.is_open()) {
+        port.postMessage({type: 'open'});
+    }
+};
+
+jigna.SharedConnection.prototype.remove_port = function(port) {
+    /* Remove a tab (the websocket is closed when the last tab is removed). */
+
+    var index = this.ports.indexOf(port);
+    if (index === -1) {
+        return;
+    }
+    this.ports.splice(index, 1);
+
+    // Nobody is waiting for the responses to the tab's requests anymore.
+    for (var request_id in this._requests) {
+        var waiters = this._requests[request_id].waiters;
+        for (index=waiters.length-1; index >= 0; index--) {
+            if (waiters[index].port === port) {
+                waiters.splice(index, 1);
+            }
+        }
+    }
+
+    if (this.ports.length === 0) {
+        this.connection.close();
+        this.onclose();
+        return;
+    }
+
+    // The tab no longer holds any objects.
+    this._all_ports = new Set(this.ports);
+    var shared = this;
+    this._holders.forEach(function(holders, id) {
+        if (holders.has(port)) {
+            shared._release(id, holders, port);
+        }
+    });
+    this._flush_releases();
+};
+
+jigna.SharedConnection.prototype.send = function(port, message) {
+    /* Send a (jsonized) message from a tab to the server. */
+
+    var data = JSON.parse(message);
+    var waiter = {port: port, request_id: data[0]};
+    var request = JSON.parse(data[1]);
+
+    // The objects are only released once no tab holds them.
+    if (request.kind === 'release') {
+        for (var index=0; index < request.ids.length; index++) {
+            var id = request.ids[index];
+            var holders = this._holders.get(id) || this._all_ports;
+            this._release(id, holders, port);
+        }
+        this._flush_releases();
+
+        var response = new jigna.WorkerMessage(
+            waiter.request_id, {exception: null, result: null}, undefined
+        );
+        port.postMessage(
+            {type: 'batch', messages: jigna.pack_batch([response]).messages}
+        );
+        return;
+    }
+
+    // Setting an attribute/item changes the object, and calling a method may
+    // change any object.
+    if (request.kind === 'set_instance_attribute' || request.kind === 'set_item') {
+        this._invalidate(request.id);
+    }
+    else if (request.kind.indexOf('call_instance_method') === 0) {
+        this._invalidate_all();
+    }
+
+    var key = this._cache_key(request);
+    if (key !== null) {
+        var cached = this._cache[request.id];
+        if (cached !== undefined && cached[key] !== undefined) {
+            this._hold(port, cached[key].get_payload());
+            var batch = jigna.pack_batch([cached[key]], [waiter.request_id]);
+            port.postMessage({type: 'batch', messages: batch.messages});
+            return;
+        }
+
+        var in_flight = this._in_flight[request.id + ' ' + key];
+        if (in_flight !== undefined) {
+            this._requests[in_flight].waiters.push(waiter);
+            return;
+        }
+    }
+
+    var request_id = this._next_request_id++;
+    this._requests[request_id] = {
+        waiters    : [waiter],
+        kind       : request.kind,
+        id         : request.id,
+        key        : key,
+        generation : this._generations[request.id],
+        epoch      : this._epoch
+    };
+    if (key !== null) {
+        this._in_flight[request.id + ' ' + key] = request_id;
+    }
+
+    this.connection.send(JSON.stringify([request_id, data[1]]));
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.SharedConnection.prototype._cache_key = function(request) {
+    /* Return the cache key of a request (null if its response cannot be
+    cached).
+    */
+
+    if (request.kind === 'get_instance_attribute') {
+        return 'attribute ' + request.attribute_name;
+    }
+    else if (request.kind === 'get_item') {
+        return 'item ' + JSON.stringify(request.index);
+    }
+
+    return null;
+};
+
+jigna.SharedConnection.prototype._handle_batch = function(messages) {
+    /* Route a batch of messages (WorkerMessages) from the server to the
+    tabs.
+    */
+
+    // The messages for each tab and the request ids they are sent with.
+    var batches = [];
+    for (var index=0; index < this.ports.length; index++) {
+        batches.push({messages: [], request_ids: []});
+    }
+
+    for (index=0; index < messages.length; index++) {
+        var message = messages[index];
+        var payload = message.get_payload();
+        var batch;
+
+        // Events are sent to all of the tabs...
+        if (message.request_id === -1) {
+            this._handle_event(message);
+            this._hold(null, payload);
+            for (var port_index=0; port_index < batches.length; port_index++) {
+                batch = batches[port_index];
+                batch.messages.push(message);
+                batch.request_ids.push(-1);
+            }
+        }
+        // ... and responses to the tabs waiting for them.
+        else {
+            var waiters = this._handle_response(message);
+            for (var waiter_index=0; waiter_index < waiters.length; waiter_index++) {
+                var waiter = waiters[waiter_index];
+                port_index = this.ports.indexOf(waiter.port);
+                if (port_index !== -1) {
+                    this._hold(waiter.port, payload);
+                    batch = batches[port_index];
+                    batch.messages.push(message);
+                    batch.request_ids.push(waiter.request_id);
+                }
+            }
+        }
+    }
+
+    // The same messages are posted to each tab, so their typed arrays are
+    // copied rather than transferred (a transferred buffer can only be posted
+    // once).
+    for (index=0; index < this.ports.length; index++) {
+        batch = batches[index];
+        if (batch.messages.length > 0) {
+            this.ports[index].postMessage({
+                type: 'batch',
+                messages: jigna.pack_batch(
+                    batch.messages, batch.request_ids
+                ).messages
+            });
+        }
+    }
+
+    this._flush_releases();
+};
+
+jigna.SharedConnection.prototype._flush_releases = function() {
+    /* Release the objects that no tab holds (unless there are requests in
+    flight, as their responses may contain the objects).
+    */
+
+    if (this._releasing.size === 0 || Object.keys(this._requests).length > 0) {
+        return;
+    }
+
+    var ids = Array.from(this._releasing);
+    this._releasing.clear();
+
+    // The cached responses may contain the objects.
+    this._invalidate_all();
+
+    var request_id = this._next_request_id++;
+    this._requests[request_id] = {
+        waiters: [], kind: 'release', id: null, key: null
+    };
+    this.connection.send(JSON.stringify(
+        [request_id, JSON.stringify({kind: 'release', ids: ids})]
+    ));
+};
+
+jigna.SharedConnection.prototype._handle_event = function(message) {
+    /* Update the shared state for an event from the server. */
+
+    var event = message.get_payload();
+    if (event.obj === 'jigna' && event.name === 'new_type') {
+        this._types[event.data.type_name] = message;
+    }
+
+    // A method called in a thread may have changed any object.
+    if (this._futures.has(event.obj)) {
+        this._futures.delete(event.obj);
+        this._invalidate_all();
+    }
+
+    this._invalidate(event.obj);
+    if (event.items_event) {
+        this._invalidate(event.data.value);
+    }
+};
+
+jigna.SharedConnection.prototype._handle_response = function(message) {
+    /* Update the cache for a response and return the tabs waiting for it. */
+
+    var request = this._requests[message.request_id];
+    delete this._requests[message.request_id];
+    if (request === undefined) {
+        return [];
+    }
+
+    var response = message.get_payload();
+
+    if (request.kind === 'call_instance_method_thread' && !response.exception) {
+        this._futures.add(String(response.result.value));
+    }
+
+    if (request.key !== null) {
+        delete this._in_flight[request.id + ' ' + request.key];
+
+        // Only cache the response if the object has not changed since the
+        // request was sent.
+        var unchanged = (
+            this._generations[request.id] === request.generation &&
+            this._epoch === request.epoch
+        );
+        if (unchanged && !response.exception) {
+            this._store(request.id, request.key, message);
+        }
+    }
+
+    return request.waiters;
+};
+
+jigna.SharedConnection.prototype._hold = function(port, payload) {
+    /* Note that the objects in a payload are being sent to a tab (or to all
+    of them if the port is null).
+    */
+
+    var ids = jigna.object_ids(payload);
+    for (var index=0; index < ids.length; index++) {
+        var id = ids[index];
+        this._releasing.delete(id);
+
+        if (port === null) {
+            this._holders.set(id, this._all_ports);
+        }
+        else {
+            var holders = this._holders.get(id);
+            if (holders === undefined) {
+                this._holders.set(id, new Set([port]));
+            }
+            else if (!holders.has(port)) {
+                holders = new Set(holders);
+                holders.add(port);
+                this._holders.set(id, holders);
+            }
+        }
+    }
+};
+
+jigna.SharedConnection.prototype._invalidate = function(id) {
+    /* Drop the cached responses for an object. */
+
+    this._generations[id] = (this._generations[id] || 0) + 1;
+
+    var cached = this._cache[id];
+    if (cached !== undefined) {
+        this._cache_size -= Object.keys(cached).length;
+        delete this._cache[id];
+    }
+};
+
+jigna.SharedConnection.prototype._invalidate_all = function() {
+    /* Drop all of the cached responses. */
+
+    this._epoch += 1;
+    this._cache = {};
+    this._cache_size = 0;
+};
+
+jigna.SharedConnection.prototype._post_all = function(message) {
+    for (var index=0; index < this.ports.length; index++) {
+        this.ports[index].postMessage(message);
+    }
+};
+
+jigna.SharedConnection.prototype._release = function(id, holders, port) {
+    /* Release an object held by a tab. */
+
+    if (!holders.has(port)) {
+        return;
+    }
+
+    holders = new Set(holders);
+    holders.delete(port);
+    if (holders.size > 0) {
+        this._holders.set(id, holders);
+    }
+    else {
+        this._holders.delete(id);
+        this._releasing.add(id);
+    }
+};
+
+jigna.SharedConnection.prototype._store = function(id, key, message) {
+    /* Cache a response. */
+
+    if (this._cache_size >= jigna.SharedConnection.MAX_CACHE_SIZE) {
+        this._cache = {};
+        this._cache_size = 0;
+    }
+
+    var cached = this._cache[id];
+    if (cached === undefined) {
+        cached = this._cache[id] = {};
+    }
+    if (cached[key] === undefined) {
+        this._cache_size += 1;
+    }
+    cached[key] = message;
+};
+
+jigna.object_ids = function(value, ids) {
+    /* Return the ids of the objects in a (marshalled) value. */
+
+    ids = ids || [];
+    if (value === null || typeof value !== 'object') {
+        return ids;
+    }
+
+    var index;
+    if (Array.isArray(value)) {
+        for (index=0; index < value.length; index++) {
+            jigna.object_ids(value[index], ids);
+        }
+        return ids;
+    }
+
+    var type = value.type;
+    if (type === 'primitive') {
+        return ids;
+    }
+    if (type === 'instance' || type === 'list' || type === 'dict') {
+        ids.push(String(value.value));
+    }
+
+    // Lists of instances sent in columns.
+    if (value.type_name !== undefined && Array.isArray(value.ids)) {
+        for (index=0; index < value.ids.length; index++) {
+            ids.push(value.ids[index]);
+        }
+    }
+
+    for (var key in value) {
+        if (key !== 'ids') {
+            jigna.object_ids(value[key], ids);
+        }
+    }
+
+    return ids;
+};
+
+// The shared connections (by websocket URL and wire encoding).
+jigna.connections = {};
+
+self.onconnect = function(event) {
+    var port = event.ports[0];
+    var shared = null;
+
+    port.onmessage = function(event) {
+        var message = event.data;
+
+        if (message.type === 'connect') {
+            var key = message.url + ' ' + message.wire;
+            shared = jigna.connections[key];
+            if (shared === undefined) {
+                shared = new jigna.SharedConnection(message.url, message.wire);
+                shared.onclose = function() {
+                    if (jigna.connections[key] === this) {
+                        delete jigna.connections[key];
+                    }
+                };
+                jigna.connections[key] = shared;
+            }
+            shared.add_port(port);
+        }
+        else if (message.type === 'send') {
+            shared.send(port, message.message);
+        }
+        else if (message.type === 'disconnect') {
+            shared.remove_port(port);
+        }
+    };
+};
+
+
+
+})();
@@ -0,0 +1,24 @@
+(function (){
+
+// A Horrible hack to update objects.  This was gleaned from the vuejs
+// code.  The problem we have is that vuejs cannot listen to changes to
+// model changes because we use getters/setters.  Internally vue uses an
+// observer to notify dependent elements.  We use the __ob__ attribute
+// to get the observer and call its `dep.notify()`, this makes
+// everything work really well.
+//
+// The changes are batched by the scheduler, so the dependents of each object
+// that changed are notified (once) per animation frame.
+jigna.add_listener('jigna', 'objects_changed', function (event) {
+    var objects = event.objects;
+    for (var index=0; index < objects.length; index++) {
+        var obj = objects[index];
+        if (obj && obj.__ob__) {
+            obj.__ob__.dep.notify();
+        }
+    }
+});
+
+
+
+})();
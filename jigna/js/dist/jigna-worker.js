@@ -0,0 +1,543 @@
+(function (){
+
+///////////////////////////////////////////////////////////////////////////////
+// WorkerConnection
+///////////////////////////////////////////////////////////////////////////////
+
+// The websocket to the server used by the jigna workers (see 'dedicated.js'
+// and 'shared.js'). The messages received in a burst are handed over as a
+// single batch of `WorkerMessage`s, which are packed for the tabs by
+// 'jigna.pack_batch'.
+//
+// Whatever is posted to a tab is copied (with the structured clone
+// algorithm), and copying objects costs the tab about as much as parsing
+// their JSON. So the worker does what the tab would otherwise do with the
+// bulk of the data: the numbers in the columns of big lists (see
+// 'AsyncWebServer._get_columns') are put in typed arrays whose buffers are
+// transferred rather than copied (the tab indexes them like arrays). Other
+// payloads are posted as JSON text, which is cheaper for the tab to parse
+// than to copy as objects (see 'benchmarks/worker_messages.py').
+
+// Namespace for the jigna objects in the worker.
+var jigna = {};
+
+jigna.WorkerConnection = function(url, wire) {
+    this.url = url;
+    this.wire = wire;
+
+    // Called when the websocket is open, with each batch of (decoded)
+    // messages and when the websocket is closed.
+    this.onopen = null;
+    this.onbatch = null;
+    this.onclose = null;
+
+    // Private protocol.
+    this._socket = null;
+    this._decoder = null;
+    this._outbox = [];
+    this._batch = [];
+};
+
+jigna.WorkerConnection.prototype.connect = function() {
+    /* Open the websocket to the server. */
+
+    var connection = this;
+
+    if (this.wire === 'compact') {
+        this._decoder = new jigna.WireDecoder();
+    }
+
+    this._socket = new WebSocket(this.url);
+    this._socket.onopen = function() {
+        var outbox = connection._outbox;
+        connection._outbox = [];
+        for (var index=0; index < outbox.length; index++) {
+            connection._socket.send(outbox[index]);
+        }
+        connection.onopen();
+    };
+    this._socket.onmessage = function(event) {
+        connection._receive(event.data);
+    };
+    this._socket.onclose = function() {
+        connection.onclose();
+    };
+};
+
+jigna.WorkerConnection.prototype.close = function() {
+    this._socket.close();
+};
+
+jigna.WorkerConnection.prototype.is_open = function() {
+    return this._socket !== null && this._socket.readyState === 1;
+};
+
+jigna.WorkerConnection.prototype.send = function(message) {
+    /* Send a (jsonized) message to the server once the websocket is open. */
+
+    if (this.is_open()) {
+        this._socket.send(message);
+    }
+    else {
+        this._outbox.push(message);
+    }
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WorkerConnection.prototype._decode = function(data) {
+    /* Return the WorkerMessage for a message from the server. */
+
+    var message = JSON.parse(data);
+    if (this._decoder !== null) {
+        // The payload is already decoded (it is not a JSON string).
+        message = this._decoder.decode(message);
+        return new jigna.WorkerMessage(message[0], message[1], undefined);
+    }
+
+    return new jigna.WorkerMessage(message[0], undefined, message[1]);
+};
+
+jigna.WorkerConnection.prototype._flush = function() {
+    var batch = this._batch;
+    this._batch = [];
+    this.onbatch(batch);
+};
+
+jigna.WorkerConnection.prototype._receive = function(data) {
+    /* Decode a message from the server and add it to the batch. */
+
+    var message = this._decode(data);
+
+    if (this._batch.length === 0) {
+        // Hand the batch over once the messages that have already arrived
+        // have been decoded.
+        var connection = this;
+        setTimeout(function() { connection._flush(); }, 0);
+    }
+    this._batch.push(message);
+};
+
+///////////////////////////////////////////////////////////////////////////////
+// WorkerMessage
+///////////////////////////////////////////////////////////////////////////////
+
+// An event (request_id -1) or response from the server, with its payload
+// parsed and/or as JSON text (each is only computed when it is needed).
+
+jigna.WorkerMessage = function(request_id, payload, text) {
+    this.request_id = request_id;
+
+    // The buffers of the typed arrays in the packed payload (see 'pack').
+    this.buffers = undefined;
+
+    // Private protocol.
+    this._payload = payload;
+    this._text = text;
+    this._packed = undefined;
+};
+
+jigna.WorkerMessage.prototype.get_payload = function() {
+    /* Return the (parsed) payload. */
+
+    if (this._payload === undefined) {
+        this._payload = JSON.parse(this._text);
+    }
+
+    return this._payload;
+};
+
+jigna.WorkerMessage.prototype.get_text = function() {
+    /* Return the payload as JSON text. */
+
+    if (this._text === undefined) {
+        this._text = JSON.stringify(this._payload);
+    }
+
+    return this._text;
+};
+
+jigna.WorkerMessage.prototype.pack = function() {
+    /* Return the payload as it is posted to the tabs.
+
+    That is the payload with its numeric columns in typed arrays (whose
+    buffers are then in 'buffers') if it has any, or its JSON text.
+    */
+
+    if (this._packed !== undefined) {
+        return this._packed;
+    }
+
+    // Payloads that are too short to have a column worth packing are not
+    // parsed.
+    var text = this._text;
+    if (text !== undefined && text.length < 2 * jigna.MIN_PACKED_COLUMN) {
+        this._packed = text;
+        return text;
+    }
+
+    var payload = this.get_payload();
+    this.buffers = jigna.pack_columns(payload, []);
+    this._packed = (this.buffers.length > 0) ? payload : this.get_text();
+
+    return this._packed;
+};
+
+// The minimum length of the numeric columns that are put in typed arrays.
+jigna.MIN_PACKED_COLUMN = 64;
+
+jigna.pack_batch = function(messages, request_ids) {
+    /* Pack a batch of messages for a tab.
+
+    Return an object with the `[request_id, payload]` pairs ('messages'),
+    where each payload is packed (see 'WorkerMessage.pack'), and the buffers
+    of their typed arrays ('buffers'). If none of the payloads has typed
+    arrays, the pairs are given as JSON text (one string is cheaper to post
+    and parse than many). The request ids are those of the messages unless
+    they are given.
+    */
+
+    var pairs = [];
+    var buffers = [];
+    for (var index=0; index < messages.length; index++) {
+        var message = messages[index];
+        var request_id = message.request_id;
+        if (request_ids !== undefined) {
+            request_id = request_ids[index];
+        }
+
+        pairs.push([request_id, message.pack()]);
+        if (message.buffers !== undefined) {
+            buffers.push.apply(buffers, message.buffers);
+        }
+    }
+
+    if (buffers.length === 0) {
+        for (index=0; index < pairs.length; index++) {
+            pairs[index] = '[' + pairs[index][0] + ',' + pairs[index][1] + ']';
+        }
+        pairs = '[' + pairs.join(',') + ']';
+    }
+
+    return {messages: pairs, buffers: buffers};
+};
+
+jigna.pack_columns = function(value, buffers) {
+    /* Put the numeric columns of the lists in a (marshalled) value in typed
+    arrays, and return their buffers.
+    */
+
+    if (value === null || typeof value !== 'object') {
+        return buffers;
+    }
+
+    var key;
+    if (value.type_name !== undefined && Array.isArray(value.ids)) {
+        var values = value.values;
+        for (key in values) {
+            var column = jigna._pack_column(values[key]);
+            if (column !== null) {
+                values[key] = column;
+                buffers.push(column.buffer);
+            }
+        }
+
+        return buffers;
+    }
+
+    for (key in value) {
+        jigna.pack_columns(value[key], buffers);
+    }
+
+    return buffers;
+};
+
+jigna._pack_column = function(column) {
+    /* Return a column as a typed array (null if it is not worth it or it has
+    values that are not numbers).
+    */
+
+    if (!Array.isArray(column) || column.length < jigna.MIN_PACKED_COLUMN) {
+        return null;
+    }
+
+    for (var index=0; index < column.length; index++) {
+        if (typeof column[index] !== 'number') {
+            return null;
+        }
+    }
+
+    return new Float64Array(column);
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// WireDecoder
+///////////////////////////////////////////////////////////////////////////////
+
+// Decodes the messages sent by the server in the compact wire encoding (see
+// 'jigna/core/wire.py' for the format). The decoded events and responses are
+// exactly as sent in the default (JSON) encoding.
+
+jigna.WireDecoder = function() {
+    // The strings defined so far (indexed by their code).
+    this._strings = [];
+};
+
+// Value codes.
+jigna.WireDecoder.PRIMITIVE   = 0;
+jigna.WireDecoder.INSTANCE    = 1;
+jigna.WireDecoder.LIST        = 2;
+jigna.WireDecoder.DICT        = 3;
+jigna.WireDecoder.LIST_SPLICE = 4;
+jigna.WireDecoder.DICT_UPDATE = 5;
+jigna.WireDecoder.RAW         = 6;
+
+// Event codes.
+jigna.WireDecoder.EVENT_RAW     = 0;
+jigna.WireDecoder.EVENT_VALUE   = 1;
+jigna.WireDecoder.EVENT_ITEMS   = 2;
+jigna.WireDecoder.EVENT_CONTEXT = 3;
+jigna.WireDecoder.EVENT_TYPE    = 4;
+
+jigna.WireDecoder.prototype.decode = function(message) {
+    /* Decode a (parsed) message.
+
+    Return an array [request_id, payload] where the payload is the decoded
+    event (if the request id is -1) or response.
+    */
+
+    // The server has started a new table of codes.
+    if (message.length > 3 && message[3]) {
+        this._strings = [];
+    }
+
+    if (message.length > 2) {
+        Array.prototype.push.apply(this._strings, message[2]);
+    }
+
+    var request_id = message[0];
+    var payload = message[1];
+    if (request_id === -1) {
+        return [request_id, this._decode_event(payload)];
+    }
+
+    // The server failed to handle the request and sent a plain reply.
+    if (!Array.isArray(payload)) {
+        return [request_id, JSON.parse(payload)];
+    }
+
+    return [request_id, {
+        exception : payload.length > 1 ? payload[1] : null,
+        result    : this._decode_any(payload[0])
+    }];
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WireDecoder.prototype._decode_any = function(value) {
+    if (value === null) {
+        return null;
+    }
+
+    if (value[0] === jigna.WireDecoder.RAW) {
+        return value[1];
+    }
+
+    return this._decode_value(value);
+};
+
+jigna.WireDecoder.prototype._decode_event = function(event) {
+    if (!Array.isArray(event)) {
+        return event;
+    }
+
+    var codes = jigna.WireDecoder;
+    var code = event[2];
+    var data = event[3];
+    var decoded = {obj: this._strings[event[0]], name: this._strings[event[1]]};
+    if (code === codes.EVENT_RAW) {
+        decoded.data = data;
+    }
+    else if (code === codes.EVENT_CONTEXT) {
+        decoded.data = {};
+        for (var key in data) {
+            decoded.data[key] = this._decode_value(data[key]);
+        }
+    }
+    else if (code === codes.EVENT_TYPE) {
+        decoded.data = this._decode_type_info(data);
+    }
+    else {
+        decoded.data = this._decode_value(data);
+        decoded.items_event = code === codes.EVENT_ITEMS;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_dict_info = function(info) {
+    var decoded = {keys: info[0]};
+    if (info.length > 1) {
+        decoded.values = this._decode_list_info(info[1]);
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_columns = function(columns) {
+    var strings = this._strings;
+
+    var ids = new Array(columns[1].length);
+    for (var index=0; index < ids.length; index++) {
+        ids[index] = strings[columns[1][index]];
+    }
+
+    var values = {};
+    for (index=0; index < columns[2].length; index++) {
+        values[strings[columns[2][index][0]]] = columns[2][index][1];
+    }
+
+    return {type_name: strings[columns[0]], ids: ids, values: values};
+};
+
+jigna.WireDecoder.prototype._decode_list_info = function(info) {
+    var decoded = {length: info[0]};
+    if (info.length > 2) {
+        decoded.columns = this._decode_columns(info[2]);
+    }
+    else if (info.length > 1) {
+        var items = info[1];
+        var data = new Array(items.length);
+        for (var index=0; index < items.length; index++) {
+            data[index] = this._decode_value(items[index]);
+        }
+        decoded.data = data;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_names = function(codes) {
+    var names = new Array(codes.length);
+    for (var index=0; index < codes.length; index++) {
+        names[index] = this._strings[codes[index]];
+    }
+
+    return names;
+};
+
+jigna.WireDecoder.prototype._decode_type_info = function(info) {
+    if (!Array.isArray(info)) {
+        return {type_name: this._strings[info]};
+    }
+
+    var decoded = {
+        type_name       : this._strings[info[0]],
+        attribute_names : this._decode_names(info[1]),
+        event_names     : this._decode_names(info[2]),
+        method_names    : this._decode_names(info[3])
+    };
+    if (info.length > 4) {
+        decoded.attribute_values = this._decode_list_info([0, info[4]]).data;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_value = function(value) {
+    var codes = jigna.WireDecoder;
+    var code = value[0];
+    if (code === codes.RAW) {
+        return value[1];
+    }
+
+    if (code === codes.PRIMITIVE) {
+        return {type: 'primitive', value: value[1], info: null};
+    }
+
+    var id = this._strings[value[1]];
+    var info = value[2];
+    if (code === codes.INSTANCE) {
+        return {type: 'instance', value: id, info: this._decode_type_info(info)};
+    }
+    else if (code === codes.LIST) {
+        return {type: 'list', value: id, info: this._decode_list_info(info)};
+    }
+    else if (code === codes.DICT) {
+        return {type: 'dict', value: id, info: this._decode_dict_info(info)};
+    }
+    else if (code === codes.LIST_SPLICE) {
+        var splice;
+        if (info.length === 3) {
+            splice = {index: info[0], removed: info[1]};
+        }
+        else {
+            splice = {
+                start: info[0], stop: info[1], step: info[2], removed: info[3]
+            };
+        }
+        splice.added = this._decode_list_info(info[info.length - 1]);
+
+        return {type: 'list', value: id, info: splice};
+    }
+    else if (code === codes.DICT_UPDATE) {
+        return {type: 'dict', value: id, info: {
+            removed : info[0],
+            added   : this._decode_dict_info(info[1])
+        }};
+    }
+
+    throw new Error('Unknown value code ' + code);
+};
+
+
+///////////////////////////////////////////////////////////////////////////////
+// Dedicated worker
+///////////////////////////////////////////////////////////////////////////////
+
+// The worker used by the WorkerBridge (see 'app/worker_bridge.js').
+//
+// Messages from the main thread:
+//
+//   {type: 'connect', url: <url>, wire: <'json' or 'compact'>}
+//   {type: 'send', message: <jsonized message>}
+//
+// Messages to the main thread:
+//
+//   {type: 'open'}
+//   {type: 'batch', messages: <[[request_id, packed payload], ...] or its
+//                              JSON text (see 'jigna.pack_batch')>}
+//   {type: 'close'}
+
+jigna.connection = null;
+
+self.onmessage = function(event) {
+    var message = event.data;
+
+    if (message.type === 'connect') {
+        var connection = new jigna.WorkerConnection(message.url, message.wire);
+        connection.onopen = function() {
+            self.postMessage({type: 'open'});
+        };
+        connection.onbatch = function(messages) {
+            var batch = jigna.pack_batch(messages);
+            self.postMessage(
+                {type: 'batch', messages: batch.messages}, batch.buffers
+            );
+        };
+        connection.onclose = function() {
+            self.postMessage({type: 'close'});
+        };
+        connection.connect();
+
+        jigna.connection = connection;
+    }
+    else if (message.type === 'send') {
+        jigna.connection.send(message.message);
+    }
+};
+
+
+
+})();
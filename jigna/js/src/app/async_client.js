@@ -11,11 +11,22 @@ jigna.AsyncClient.prototype.constructor = jigna.AsyncClient;
 jigna.AsyncClient.prototype.send_request = function(request) {
     /* Send a request to the server and wait for (and return) the response. */
 
+    var deferred = new $.Deferred();
+
+    // Bridges in native mode pass the request and response as objects.
+    if (this.bridge.native) {
+        deferred.resolve(this.bridge.send_request_native(request).result);
+        return deferred.promise();
+    }
+
     var jsonized_request  = JSON.stringify(request);
 
-    var deferred = new $.Deferred();
-    this.bridge.send_request_async(jsonized_request).done(function(jsonized_response){
-        deferred.resolve(JSON.parse(jsonized_response).result);
+    this.bridge.send_request_async(jsonized_request).done(function(response){
+        // Responses in the compact wire encoding are decoded by the bridge.
+        if (typeof response === 'string') {
+            response = JSON.parse(response);
+        }
+        deferred.resolve(response.result);
     });
 
     return deferred.promise();
@@ -152,11 +163,22 @@ jigna.AsyncClient.prototype.on_object_changed = function(event){
             // update the id_to_proxy map and update the proxy with the
             // dict/list event info.
             collection_proxy = proxy.__cache__[event.name];
-            this._id_to_proxy_map[event.data.value] = collection_proxy;
+            if (collection_proxy !== undefined &&
+                collection_proxy.__id__ !== undefined) {
+                this._id_to_proxy_map[event.data.value] = collection_proxy;
+            }
+            // Otherwise the list/dict has not been fetched yet (or its proxy
+            // was evicted, see 'MemoryManager'), so it is fetched when used.
+            else {
+                collection_proxy = undefined;
+                proxy.__cache__[event.name] = undefined;
+            }
+        }
+        if (collection_proxy !== undefined) {
+            this._proxy_factory.update_proxy(
+                collection_proxy, event.data.type, event.data.info
+            );
         }
-        this._proxy_factory.update_proxy(
-            collection_proxy, event.data.type, event.data.info
-        );
 
     } else {
         proxy.__cache__[event.name] = this._unmarshal(event.data);
@@ -169,6 +191,36 @@ jigna.AsyncClient.prototype.on_object_changed = function(event){
 
 // Private protocol //////////////////////////////////////////////////////////
 
+jigna.AsyncClient.prototype._dispatch_event = function(event) {
+    /* Dispatch an event from the server. */
+
+    // The items of lists sent in columns only get proxies when they are used,
+    // so create the proxy first if it is for one of them (otherwise the
+    // change would be lost).
+    if (this._id_to_proxy_map[event.obj] === undefined) {
+        this._proxy_factory.unmarshal_row(event.obj);
+    }
+
+    jigna.Client.prototype._dispatch_event.call(this, event);
+};
+
+jigna.AsyncClient.prototype._unmarshal_items = function(info) {
+    /* Unmarshal the items in a list info (which may be in columns). */
+
+    var factory = this._proxy_factory;
+    var items = factory._saved_items(info);
+    for (var index=0; index < items.length; index++) {
+        var item = items[index];
+        if (item instanceof jigna._SavedRow) {
+            items[index] = factory.unmarshal_row(item.data.value);
+        } else if (item instanceof jigna._SavedData) {
+            items[index] = this._unmarshal(item.data);
+        }
+    }
+
+    return items;
+};
+
 jigna.AsyncClient.prototype._create_proxy_factory = function() {
     return new jigna.AsyncProxyFactory(this);
 };
@@ -7,8 +7,29 @@ jigna._SavedData = function(data) {
     this.data = data;
 };
 
+jigna._SavedRow = function(columns, index) {
+    // Used internally to save an item of a list sent in columns (see
+    // 'AsyncWebServer._get_columns') to unmarshal later.
+    jigna._SavedData.call(this, {
+        type  : 'instance',
+        value : columns.ids[index],
+        info  : {type_name: columns.type_name}
+    });
+    this.columns = columns;
+    this.index = index;
+};
+
+jigna._SavedRow.prototype = Object.create(jigna._SavedData.prototype);
+jigna._SavedRow.prototype.constructor = jigna._SavedRow;
+
 jigna.AsyncProxyFactory = function(client) {
     jigna.ProxyFactory.call(this, client);
+
+    // The (most recent) saved row of each object sent in columns that does
+    // not have a proxy yet. A row is dropped from here when it is dropped
+    // from the cache of its list (see '_drop_rows'), as it holds on to all of
+    // the columns.
+    this._id_to_row_map = {};
 };
 
 jigna.AsyncProxyFactory.prototype = Object.create(
@@ -17,6 +38,34 @@ jigna.AsyncProxyFactory.prototype = Object.create(
 
 jigna.AsyncProxyFactory.prototype.constructor = jigna.AsyncProxyFactory
 
+jigna.AsyncProxyFactory.prototype.clear_cache = function(proxy) {
+    /* Drop all of the cached values of a proxy. */
+
+    this._drop_rows(proxy.__cache__);
+    jigna.ProxyFactory.prototype.clear_cache.call(this, proxy);
+};
+
+jigna.AsyncProxyFactory.prototype.unmarshal_row = function(id) {
+    /* Create the proxy for an object that was sent in columns (if it does not
+    have one already) and return it.
+    */
+
+    var client = this._client;
+    var proxy = client._id_to_proxy_map[id];
+    var row = this._id_to_row_map[id];
+    if (row === undefined) {
+        return proxy;
+    }
+
+    delete this._id_to_row_map[id];
+    if (proxy === undefined) {
+        proxy = client._unmarshal(row.data);
+        this._set_row_values(proxy, row.columns, row.index);
+    }
+
+    return proxy;
+};
+
 jigna.AsyncProxyFactory.prototype._add_instance_attribute = function(proxy, attribute_name){
     var descriptor, get, set;
 
@@ -61,12 +110,13 @@ jigna.AsyncProxyFactory.prototype._add_instance_attribute = function(proxy, attr
 
 jigna.AsyncProxyFactory.prototype._populate_dict_proxy = function(proxy, info) {
     var index, key;
-    var values = info.values;
+    var values = this._saved_items(info.values);
 
     for (index=0; index < info.keys.length; index++) {
         key = info.keys[index];
         this._add_item_attribute(proxy, key);
-        proxy.__cache__[key] = new jigna._SavedData(values.data[index]);
+        this._drop_row(proxy.__cache__[key]);
+        proxy.__cache__[key] = values[index];
     }
 };
 
@@ -80,6 +130,7 @@ jigna.AsyncProxyFactory.prototype._update_dict_proxy = function(proxy, info) {
 
     for (var index=0; index < removed.length; index++) {
         key = removed[index];
+        this._drop_row(cache[key]);
         delete cache[key];
         delete proxy[key];
     }
@@ -88,11 +139,12 @@ jigna.AsyncProxyFactory.prototype._update_dict_proxy = function(proxy, info) {
 jigna.AsyncProxyFactory.prototype._populate_list_proxy = function(proxy, info) {
     /* Populate the items in a list proxy. */
 
-    var data = info.data;
+    var items = this._saved_items(info);
+    var cache = proxy.__cache__;
     for (var index=0; index < info.length; index++) {
-        this._add_item_attribute(proxy, index);
-        proxy.__cache__[index] = new jigna._SavedData(data[index]);
+        cache[index] = items[index];
     }
+    jigna.ListProxy.resize(proxy, info.length);
 
     return proxy;
 };
@@ -100,83 +152,123 @@ jigna.AsyncProxyFactory.prototype._populate_list_proxy = function(proxy, info) {
 jigna.AsyncProxyFactory.prototype._update_list_proxy = function(proxy, info) {
     /* Update the given proxy. */
 
+    var index;
+    var cache = proxy.__cache__;
     if (info.index === undefined) {
         // This is an extended slice.  Note that one cannot increase the size
         // of the list with an extended slice.  So one is either deleting
         // elements or changing them.
-        var index;
         var added = info.added;
-        var removed = info.removed - added.length;
-        var cache = proxy.__cache__;
-        var end = cache.length;
-        if (removed > 0) {
-            // Delete the proxy indices at the end.
-            for (index=end; index > (end-removed) ; index--) {
-                delete proxy[index-1];
-            }
+        if (info.removed - added.length > 0) {
             var to_remove = [];
             for (index=info.start; index<info.stop; index+=info.step) {
                 to_remove.push(index);
             }
             // Delete the cached entries in sequence from the back.
             for (index=to_remove.length; index > 0; index--) {
-                cache.splice(to_remove[index-1], 1);
+                this._drop_rows(cache.splice(to_remove[index-1], 1));
             }
         } else {
             // When nothing is removed, just update the cache entries.
+            var items = this._saved_items(added);
             for (var i=0; i < added.length; i++) {
                 index = info.start + i*info.step;
-                cache[index] = new jigna._SavedData(added.data[i]);
+                this._drop_row(cache[index]);
+                cache[index] = items[i];
             }
         }
     } else {
         // This is not an extended slice.
         var splice_args = [info.index, info.removed].concat(
-            info.added.data.map(function(x) {return new jigna._SavedData(x);})
+            this._saved_items(info.added)
         );
+        this._drop_rows(cache.splice.apply(cache, splice_args));
+    }
 
-        var extra = splice_args.length - 2 - splice_args[1];
-        var cache = proxy.__cache__;
-        var end = cache.length;
-        if (extra < 0) {
-            for (var index=end; index > (end+extra) ; index--) {
-                delete proxy[index-1];
-            }
-        } else {
-            for (var index=0; index < extra; index++){
-                this._add_item_attribute(proxy, end+index);
-            }
+    jigna.ListProxy.resize(proxy, cache.length);
+};
+
+
+// Common for list and dict proxies ////////////////////////////////////////////
+
+jigna.AsyncProxyFactory.prototype._get_item = function(proxy, index){
+    /* Get the value of an item of a list/dict proxy. */
+
+    var value = proxy.__cache__[index];
+    if (value === undefined) {
+        value = proxy.__client__.get_attribute(proxy, index);
+        proxy.__cache__[index] = value;
+    } else if (value instanceof jigna._SavedRow) {
+        value = this.unmarshal_row(value.data.value);
+        proxy.__cache__[index] = value;
+    } else if (value instanceof jigna._SavedData) {
+        value = proxy.__client__._unmarshal(value.data);
+        proxy.__cache__[index] = value;
+    }
+
+    return value;
+};
+
+jigna.AsyncProxyFactory.prototype._drop_row = function(value) {
+    /* Forget a saved row that is no longer in the cache of a list/dict. */
+
+    if (value instanceof jigna._SavedRow) {
+        var id = value.data.value;
+        if (this._id_to_row_map[id] === value) {
+            delete this._id_to_row_map[id];
         }
-        cache.splice.apply(cache, splice_args);
     }
 };
 
+jigna.AsyncProxyFactory.prototype._drop_rows = function(values) {
+    /* Forget the saved rows in an array (or object) of cached values. */
 
-// Common for list and dict proxies ////////////////////////////////////////////
+    for (var key in values) {
+        this._drop_row(values[key]);
+    }
+};
 
-jigna.AsyncProxyFactory.prototype._add_item_attribute = function(proxy, index){
-    var descriptor, get, set;
+jigna.AsyncProxyFactory.prototype._saved_items = function(info) {
+    /* Return the items in a list info, saved to be unmarshalled later. */
 
-    get = function() {
-        // In here, 'this' refers to the proxy!
-        var value = this.__cache__[index];
-        if (value === undefined) {
-            value = this.__client__.get_attribute(this, index);
-            this.__cache__[index] = value;
-        } else if (value instanceof jigna._SavedData) {
-            value = this.__client__._unmarshal(value.data);
-            this.__cache__[index] = value;
+    var items = new Array(info.length);
+    var index;
+
+    if (info.columns === undefined) {
+        for (index=0; index < info.length; index++) {
+            items[index] = new jigna._SavedData(info.data[index]);
         }
 
-        return value;
-    };
+        return items;
+    }
 
-    set = function(value) {
-        // In here, 'this' refers to the proxy!
-        this.__cache__[index] = value;
-        this.__client__.set_item(this.__id__, index, value);
-    };
+    // The values in the columns are the most recent ones, so the proxies
+    // that already exist are updated now, while the others are only created
+    // when they are used (see 'unmarshal_row').
+    var columns = info.columns;
+    var id_to_proxy_map = this._client._id_to_proxy_map;
+    for (index=0; index < info.length; index++) {
+        var id = columns.ids[index];
+        var proxy = id_to_proxy_map[id];
+        if (proxy === undefined) {
+            items[index] = this._id_to_row_map[id] = new jigna._SavedRow(
+                columns, index
+            );
+        }
+        else {
+            this._set_row_values(proxy, columns, index);
+            items[index] = proxy;
+        }
+    }
 
-    descriptor = {enumerable:true, get:get, set:set, configurable:true};
-    Object.defineProperty(proxy, index, descriptor);
+    return items;
+};
+
+jigna.AsyncProxyFactory.prototype._set_row_values = function(proxy, columns, index) {
+    /* Set the cached values of a proxy from a row of columns. */
+
+    var values = columns.values;
+    for (var name in values) {
+        proxy.__cache__[name] = values[name][index];
+    }
 };
@@ -11,6 +11,12 @@ jigna.Client.prototype.initialize = function() {
     // Private protocol.
     this._id_to_proxy_map = {};
     this._proxy_factory   = this._create_proxy_factory();
+    this._memory_manager  = new jigna.MemoryManager(this);
+
+    // The list queries that have started (see 'jigna.ListQuery'), by id.
+    this._queries         = {};
+
+    jigna.stats = this._memory_manager.stats;
 
     // Add all of the models being edited
     jigna.add_listener(
@@ -30,8 +36,14 @@ jigna.Client.prototype.initialize = function() {
 
 jigna.Client.prototype.handle_event = function(jsonized_event) {
     /* Handle an event from the server. */
-    var event = JSON.parse(jsonized_event);
-    jigna.fire_event(event.obj, event);
+    this._dispatch_event(JSON.parse(jsonized_event));
+};
+
+jigna.Client.prototype.handle_events = function(events) {
+    /* Handle a batch of (already parsed) events from the server. */
+    for (var index=0; index < events.length; index++) {
+        this._dispatch_event(events[index]);
+    }
 };
 
 jigna.Client.prototype.on_object_changed = function(event){
@@ -92,6 +104,11 @@ jigna.Client.prototype.on_object_changed = function(event){
 jigna.Client.prototype.send_request = function(request) {
     /* Send a request to the server and wait for (and return) the response. */
 
+    // Bridges in native mode pass the request and response as objects.
+    if (this.bridge.native) {
+        return this.bridge.send_request_native(request).result;
+    }
+
     var jsonized_request  = JSON.stringify(request);
     var jsonized_response = this.bridge.send_request(jsonized_request);
 
@@ -146,6 +163,23 @@ jigna.Client.prototype.call_instance_method_thread = function(id, method_name, a
     return deferred.promise();
 };
 
+jigna.Client.prototype.close_query = function(query_id) {
+    /* Tell the server to stop a list query. */
+
+    var request = {
+        kind  : 'close_query',
+        query : query_id
+    };
+
+    // We do not need to wait for the response.
+    if (this.bridge.native) {
+        this.bridge.send_request_native(request);
+    }
+    else {
+        this.bridge.send_request_async(JSON.stringify(request));
+    }
+};
+
 jigna.Client.prototype.get_attribute = function(proxy, attribute) {
     /* Get the specified attribute of the proxy from the server. */
 
@@ -166,6 +200,23 @@ jigna.Client.prototype.print_JS_message = function(message) {
     this.send_request(request);
 };
 
+jigna.Client.prototype.release = function(ids) {
+    /* Tell the server that we no longer have proxies for some objects. */
+
+    var request = {
+        kind : 'release',
+        ids  : ids
+    };
+
+    // We do not need to wait for the response.
+    if (this.bridge.native) {
+        this.bridge.send_request_native(request);
+    }
+    else {
+        this.bridge.send_request_async(JSON.stringify(request));
+    }
+};
+
 jigna.Client.prototype.set_instance_attribute = function(id, attribute_name, value) {
     var request = {
         kind           : 'set_instance_attribute',
@@ -191,11 +242,35 @@ jigna.Client.prototype.set_item = function(id, index, value) {
 jigna.Client.prototype.update_context = function() {
     var request  = {kind : 'update_context'};
 
+    // Tell the server which types we already know about.
+    if (jigna.type_manifest !== null) {
+        request.type_manifest = jigna.type_manifest.hash;
+    }
+
     this.send_request(request);
 };
 
 // Private protocol //////////////////////////////////////////////////////////
 
+jigna.Client.prototype._dispatch_event = function(event) {
+    /* Dispatch an event from the server.
+
+    Changes to the attributes (and events) of an instance are routed straight
+    to 'on_object_changed' via the dispatch table of the proxy's type. Any
+    listeners added with 'jigna.add_listener' are then called as usual.
+    */
+
+    var proxy = this._id_to_proxy_map[event.obj];
+    if (proxy !== undefined) {
+        var dispatch = proxy.__dispatch__;
+        if (dispatch !== undefined && dispatch[event.name] === true) {
+            this.on_object_changed(event);
+        }
+    }
+
+    jigna.fire_event(event.obj, event);
+};
+
 jigna.Client.prototype._add_model = function(model_name, id, info) {
     // Create a proxy for the object identified by the Id...
     var proxy = this._create_proxy('instance', id, info);
@@ -239,8 +314,17 @@ jigna.Client.prototype._create_proxy = function(type, obj, info) {
         return obj;
     }
     else {
-        var proxy = this._proxy_factory.create_proxy(type, obj, info);
+        // The proxy may have been evicted while the UI still refers to it.
+        var proxy = this._memory_manager.revive(obj);
+        if (proxy !== undefined && proxy.__type__ === type) {
+            this._proxy_factory.reset_proxy(proxy, type, info);
+        }
+        else {
+            proxy = this._proxy_factory.create_proxy(type, obj, info);
+        }
+
         this._id_to_proxy_map[obj] = proxy;
+        this._memory_manager.add(proxy);
         return proxy;
     }
 };
@@ -248,6 +332,9 @@ jigna.Client.prototype._create_proxy = function(type, obj, info) {
 jigna.Client.prototype._create_request = function(proxy, attribute) {
     /* Create the request object for getting the given attribute of the proxy. */
 
+    // The proxy may have been evicted while the UI still refers to it.
+    this._memory_manager.use(proxy);
+
     var request;
     if (proxy.__type__ === 'instance') {
         request = {
@@ -273,7 +360,12 @@ jigna.Client.prototype._get_bridge = function() {
     qt_bridge = window['qt_bridge'];
     if (qt_bridge !== undefined) {
         bridge = new jigna.QtBridge(this, qt_bridge);
-    // ... or the inter-process web bridge?
+    // ... or the inter-process web bridge (with its websocket in a worker
+    // shared by all tabs, in a worker or in the page)?
+    } else if (jigna.worker === 'shared' && typeof SharedWorker !== 'undefined') {
+        bridge = new jigna.SharedWorkerBridge(this);
+    } else if (jigna.worker && typeof Worker !== 'undefined') {
+        bridge = new jigna.WorkerBridge(this);
     } else {
         bridge = new jigna.WebBridge(this);
     }
@@ -307,13 +399,28 @@ jigna.Client.prototype._marshal_all = function(objs) {
     return objs;
 };
 
+jigna.Client.prototype._unmarshal_items = function(info) {
+    /* Unmarshal the items in a list info (see 'Server._get_items_info'). */
+
+    var items = new Array(info.length);
+    for (var index=0; index < info.length; index++) {
+        items[index] = this._unmarshal(info.data[index]);
+    }
+
+    return items;
+};
+
 jigna.Client.prototype._unmarshal = function(obj) {
 
-    if (obj === null) {
+    // Native bridges pass Python's None as undefined.
+    if (obj === null || obj === undefined) {
         return null;
     }
 
     if (obj.type === 'primitive') {
+        if (obj.value && obj.value.__ndarray__) {
+            return jigna.QtBridge.decode_array(obj.value);
+        }
         return obj.value;
 
     } else {
@@ -322,6 +429,7 @@ jigna.Client.prototype._unmarshal = function(obj) {
             return this._create_proxy(obj.type, obj.value, obj.info);
         }
         else {
+            this._memory_manager.touch(value);
             return value;
         }
     }
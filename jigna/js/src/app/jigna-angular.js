@@ -27,8 +27,9 @@ jigna.angular.app.run(['$rootScope', '$compile', function($rootScope, $compile){
     // Since the $digest cycle essentially involves dirty checking of
     // all the watchers, this operation means that it will trigger off
     // new GET requests for each model attribute that is being used in
-    // the registered watchers.
-    jigna.add_listener('jigna', 'object_changed', function() {
+    // the registered watchers. The changes are batched by the scheduler so
+    // that there is at most one digest per animation frame.
+    jigna.add_listener('jigna', 'objects_changed', function() {
         add_to_scope(jigna.models);
 
         if ($rootScope.$$phase === null){
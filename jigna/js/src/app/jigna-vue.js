@@ -4,9 +4,15 @@
 // observer to notify dependent elements.  We use the __ob__ attribute
 // to get the observer and call its `dep.notify()`, this makes
 // everything work really well.
-jigna.add_listener('jigna', 'object_changed', function (event) {
-    var obj = event.object;
-    if (obj && obj.__ob__) {
-        obj.__ob__.dep.notify();
+//
+// The changes are batched by the scheduler, so the dependents of each object
+// that changed are notified (once) per animation frame.
+jigna.add_listener('jigna', 'objects_changed', function (event) {
+    var objects = event.objects;
+    for (var index=0; index < objects.length; index++) {
+        var obj = objects[index];
+        if (obj && obj.__ob__) {
+            obj.__ob__.dep.notify();
+        }
     }
 });
@@ -10,6 +10,13 @@ jigna.initialize = function(options) {
     this.ready  = $.Deferred();
     this.debug  = options.debug;
     this.async  = options.async;
+    this.wire   = options.wire;
+    this.worker = options.worker;
+    this.worker_url = options.worker_url;
+    this.memory_budget = options.memory_budget;
+    if (options.max_frequency !== undefined) {
+        this.scheduler.max_frequency = options.max_frequency;
+    }
     this.client = options.async ? new jigna.AsyncClient() : new jigna.Client();
     this.client.initialize();
     return this.ready;
@@ -17,6 +24,20 @@ jigna.initialize = function(options) {
 
 jigna.models = {};
 
+// The type manifest registered by a generated types module (see
+// 'jigna/core/type_manifest.py'), if any.
+jigna.type_manifest = null;
+
+jigna.register_types = function(hash, types) {
+    /* Register the descriptions of the types in a type manifest.
+
+    This must be called before jigna is initialized. The proxy constructors
+    for the types are created when the client starts, and the server does not
+    send the types again if it has the same manifest.
+    */
+    this.type_manifest = {hash: hash, types: types};
+};
+
 jigna.add_listener('jigna', 'model_added', function(event){
     var models = event.data;
     for (var model_name in models) {
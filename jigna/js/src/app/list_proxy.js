@@ -2,14 +2,19 @@
 // ListProxy
 ///////////////////////////////////////////////////////////////////////////////
 
-// ListProxy is handled separately because it has to do special handling
-// to behave as regular Javascript `Array` objects
-// See "Wrappers. Prototype chain injection" section in this article:
-// http://perfectionkills.com/how-ecmascript-5-still-does-not-allow-to-subclass-an-array/
+// A ListProxy is a real Javascript `Array` (so that `Array.isArray`, the
+// array methods, `ng-repeat` and `v-for` all work) whose length is the length
+// of the list on the server. Its items are fetched/unmarshalled on demand by
+// the proxy factory (see `ProxyFactory._get_item`).
+//
+// Where ES6 proxies are available the array is wrapped in one that intercepts
+// reading/writing the items, so resizing a list is O(1) and no property is
+// defined per item. Otherwise an accessor property is defined for each item
+// (the length is still the native one, so reading it is O(1)).
 
 jigna.ListProxy = function(type, id, client) {
 
-    var arr = new jigna.SubArray();
+    var arr = [];
 
     // fixme: repetition of property definition
     Object.defineProperty(arr, '__type__',   {value : type});
@@ -21,5 +26,123 @@ jigna.ListProxy = function(type, id, client) {
     // implies that the server is waiting to receive the value.
     Object.defineProperty(arr, '__state__',  {value : {}});
 
+    if (jigna.ListProxy.native) {
+        var proxy = new Proxy(arr, jigna.ListProxy._handler);
+        Object.defineProperty(arr, '__proxy__', {value : proxy});
+        return proxy;
+    }
+
     return arr;
 };
+
+// Are ES6 proxies available?
+jigna.ListProxy.native = (typeof Proxy === 'function');
+
+jigna.ListProxy.resize = function(proxy, length) {
+    /* Set the length of a list proxy. */
+
+    if (!jigna.ListProxy.native) {
+        var factory = proxy.__client__._proxy_factory;
+        for (var index=proxy.length; index < length; index++) {
+            factory._add_item_attribute(proxy, index);
+        }
+    }
+
+    // This deletes any items past the new length.
+    proxy.length = length;
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.ListProxy._index = function(key) {
+    /* Return the array index named by a property key (-1 if it is not one). */
+
+    if (typeof key !== 'string') {
+        return -1;
+    }
+
+    var code = key.charCodeAt(0);
+    if (!(code >= 48 && code <= 57)) {
+        return -1;
+    }
+
+    var index = +key;
+    if ((index >>> 0) !== index || String(index) !== key) {
+        return -1;
+    }
+
+    return index;
+};
+
+jigna.ListProxy._handler = {
+    // The items (ie. the indices less than the length) are handled by the
+    // proxy factory, everything else is left to the array.
+
+    get: function(target, key, receiver) {
+        var index = jigna.ListProxy._index(key);
+        if (index !== -1 && index < target.length) {
+            return target.__client__._proxy_factory._get_item(receiver, index);
+        }
+
+        return target[key];
+    },
+
+    set: function(target, key, value, receiver) {
+        var index = jigna.ListProxy._index(key);
+        if (index !== -1 && index < target.length) {
+            target.__client__._proxy_factory._set_item(receiver, index, value);
+        }
+        else {
+            target[key] = value;
+        }
+
+        return true;
+    },
+
+    has: function(target, key) {
+        var index = jigna.ListProxy._index(key);
+        if (index !== -1 && index < target.length) {
+            return true;
+        }
+
+        return key in target;
+    },
+
+    getOwnPropertyDescriptor: function(target, key) {
+        // The items are described as accessors (as they are when there are no
+        // ES6 proxies) so that describing an item does not fetch it.
+        var index = jigna.ListProxy._index(key);
+        if (index !== -1 && index < target.length) {
+            var proxy = target.__proxy__;
+            var factory = target.__client__._proxy_factory;
+            return {
+                get          : function() {
+                    return factory._get_item(proxy, index);
+                },
+                set          : function(value) {
+                    factory._set_item(proxy, index, value);
+                },
+                enumerable   : true,
+                configurable : true
+            };
+        }
+
+        return Object.getOwnPropertyDescriptor(target, key);
+    },
+
+    ownKeys: function(target) {
+        var keys = [];
+        for (var index=0; index < target.length; index++) {
+            keys.push(String(index));
+        }
+
+        var own = Reflect.ownKeys(target);
+        for (index=0; index < own.length; index++) {
+            if (jigna.ListProxy._index(own[index]) === -1) {
+                keys.push(own[index]);
+            }
+        }
+
+        return keys;
+    }
+};
@@ -0,0 +1,134 @@
+///////////////////////////////////////////////////////////////////////////////
+// ListQuery
+///////////////////////////////////////////////////////////////////////////////
+
+// A sorted, filtered window onto a list attribute of a proxy, maintained by
+// the server (see 'jigna/core/list_query.py'), so that a table over a large
+// list only has the items that are on screen, e.g.
+//
+//     var query = jigna.query(addressbook, 'people', {
+//         sort    : ['-age', 'name'],
+//         filters : [['age', '>=', 18]],
+//         limit   : 20
+//     });
+//
+//     <tr ng-repeat="person in query.items">...</tr>
+//
+//     query.update({offset: 20});
+//
+// 'items' and 'total' are kept up to date as the list changes on the server.
+
+jigna.ListQuery = function(client, proxy, attribute_name, options) {
+    options = options || {};
+
+    // The sort keys (attribute names, prefixed with '-' for descending
+    // order) and the filters ([attribute name, operator, value] triples).
+    this.sort    = options.sort || [];
+    this.filters = options.filters || [];
+
+    // The window.
+    this.offset  = options.offset || 0;
+    this.limit   = options.limit === undefined ? 50 : options.limit;
+
+    // The items in the window and the total number of items that match the
+    // filters.
+    this.items   = [];
+    this.total   = 0;
+
+    // The id of the query on the server (once it has started).
+    this.id      = null;
+
+    // A promise that is resolved with the query once it has started.
+    var deferred = new $.Deferred();
+    this.ready   = deferred.promise();
+
+    // Private protocol.
+    this._client = client;
+    this._closed = false;
+
+    var request = {
+        kind           : 'query_list',
+        id             : proxy.__id__,
+        attribute_name : attribute_name,
+        sort           : this.sort,
+        filters        : this.filters,
+        offset         : this.offset,
+        limit          : this.limit
+    };
+
+    var query = this;
+    $.when(client.send_request(request)).done(function(window) {
+        query.id = window.query;
+        client._queries[query.id] = query;
+        jigna.add_listener(query.id, 'window', query._on_window, query);
+
+        query._set_window(window);
+
+        // The query may have been closed before it started.
+        if (query._closed) {
+            query.close();
+        }
+
+        deferred.resolve(query);
+    });
+};
+
+jigna.ListQuery.prototype.update = function(options) {
+    /* Change the sort keys, filters and/or window ('sort', 'filters',
+    'offset' and 'limit' in the options). Return a promise that is resolved
+    with the query once the new window has arrived.
+    */
+
+    var query = this;
+
+    return this.ready.then(function() {
+        var request = {kind: 'update_query', query: query.id};
+        var names = ['sort', 'filters', 'offset', 'limit'];
+        for (var index=0; index < names.length; index++) {
+            var name = names[index];
+            if (options[name] !== undefined) {
+                query[name] = request[name] = options[name];
+            }
+        }
+
+        return $.when(query._client.send_request(request)).then(
+            function(window) {
+                query._set_window(window);
+                return query;
+            }
+        );
+    });
+};
+
+jigna.ListQuery.prototype.close = function() {
+    /* Stop the query (its items are no longer kept up to date). */
+
+    this._closed = true;
+    if (this.id === null) {
+        return;
+    }
+
+    delete this._client._queries[this.id];
+    delete jigna._listeners[this.id];
+    this._client.close_query(this.id);
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.ListQuery.prototype._on_window = function(event) {
+    this._set_window(event.data);
+};
+
+jigna.ListQuery.prototype._set_window = function(window) {
+    this.offset = window.offset;
+    this.total  = window.total;
+    this.items  = this._client._unmarshal_items(window.items);
+
+    jigna.fire_event('jigna', {name: 'object_changed', object: this});
+};
+
+jigna.query = function(proxy, attribute_name, options) {
+    /* Start a query on a list attribute of a proxy (see 'jigna.ListQuery'). */
+
+    return new jigna.ListQuery(this.client, proxy, attribute_name, options);
+};
@@ -0,0 +1,322 @@
+///////////////////////////////////////////////////////////////////////////////
+// MemoryManager
+///////////////////////////////////////////////////////////////////////////////
+
+// The client keeps a proxy for every object that it has seen (and each proxy
+// caches every value fetched from the server). The memory manager keeps the
+// number of proxies within a budget: when there are more, the least recently
+// used proxies that cannot be reached from 'jigna.models' (or an object that
+// has listeners, or the window of a list query) are evicted. An evicted
+// proxy's cached values are dropped and the server is told to release the
+// object (see 'Server.release').
+//
+// The UI may still refer to an evicted proxy (eg. from a local variable or a
+// component's props), so it is only forgotten once it is garbage collected:
+// until then it is revived when it is used again (its values are fetched
+// again, and the server holds the object again) or when the same object is
+// received again (so that its identity is kept). The UI is told about the
+// evicted proxies, so the ones that it still shows are fetched again at once.
+//
+// The statistics are available as 'jigna.stats'.
+
+jigna.MemoryManager = function(client) {
+    // The maximum number of proxies (zero for no limit, see the
+    // 'memory_budget' option of 'jigna.initialize').
+    this.budget = jigna.memory_budget || 0;
+
+    // After a collection there are at most this fraction of the budget
+    // proxies (so that we do not collect every time a proxy is created).
+    this.low_water_mark = 0.75;
+
+    // Statistics.
+    this.stats = {
+        // The number of proxies.
+        proxies        : 0,
+
+        // The number of cached values (as of the last collection).
+        cached_values  : 0,
+
+        // The number of items of lists sent in columns that have no proxy
+        // yet (as of the last collection, see 'AsyncProxyFactory').
+        saved_rows     : 0,
+
+        // The number of collections and of the proxies evicted by them.
+        collections    : 0,
+        evicted        : 0,
+
+        // How long the last collection took (in milliseconds).
+        last_collection_time : 0
+    };
+
+    // Private protocol.
+    this._client = client;
+
+    // The proxies (by id), their number and when each was last used (the
+    // value of a counter incremented every time a proxy is used). Plain
+    // objects are used rather than Maps, which older browsers (eg. QtWebKit)
+    // do not have.
+    this._proxies = {};
+    this._size = 0;
+    this._last_used = {};
+    this._clock = 0;
+
+    // Weak references to the evicted proxies (by id), or the proxies
+    // themselves where there are no weak references (see '_evict').
+    this._evicted = {};
+
+    this._pending = false;
+};
+
+jigna.MemoryManager.prototype.add = function(proxy) {
+    /* Add a proxy that has just been created. */
+
+    this.stats.proxies += 1;
+    if (this.budget > 0) {
+        var id = proxy.__id__;
+        if (this._proxies[id] === undefined) {
+            this._size += 1;
+        }
+        this._proxies[id] = proxy;
+        this._last_used[id] = this._clock++;
+        if (this._size > this.budget) {
+            this._schedule();
+        }
+    }
+};
+
+jigna.MemoryManager.prototype.touch = function(proxy) {
+    /* Mark a proxy as (the most recently) used. */
+
+    if (this.budget > 0 && this._proxies[proxy.__id__] !== undefined) {
+        this._last_used[proxy.__id__] = this._clock++;
+    }
+};
+
+jigna.MemoryManager.prototype.revive = function(id) {
+    /* Return the evicted proxy for an object that is received again (or
+    undefined if there is none, or it has been garbage collected). The client
+    then adds it again (see 'Client._create_proxy').
+    */
+
+    var ref = this._evicted[id];
+    if (ref === undefined) {
+        return undefined;
+    }
+
+    delete this._evicted[id];
+
+    return (typeof WeakRef === 'function') ? ref.deref() : ref;
+};
+
+jigna.MemoryManager.prototype.use = function(proxy) {
+    /* Mark a proxy whose values are being fetched as used (reviving it if it
+    was evicted).
+    */
+
+    var id = proxy.__id__;
+    if (this._client._id_to_proxy_map[id] === undefined) {
+        delete this._evicted[id];
+        this._client._id_to_proxy_map[id] = proxy;
+        this.add(proxy);
+    }
+    else {
+        this.touch(proxy);
+    }
+};
+
+jigna.MemoryManager.prototype.collect = function() {
+    /* Evict the least recently used unreachable proxies (if there are more
+    proxies than the budget allows).
+    */
+
+    this._pending = false;
+    if (this.budget <= 0 || this._size <= this.budget) {
+        return;
+    }
+
+    var start = Date.now();
+    var reachable = this._find_reachable();
+    this._prune();
+
+    // Evict the unreachable proxies, least recently used first.
+    var last_used = this._last_used;
+    var unreachable = [];
+    for (var id in this._proxies) {
+        if (reachable[id] !== true) {
+            unreachable.push(id);
+        }
+    }
+    unreachable.sort(function(a, b) { return last_used[a] - last_used[b]; });
+
+    var target = Math.floor(this.budget * this.low_water_mark);
+    var evicted = {};
+    var ids = [];
+    var survivors = [];
+    for (var index=0; index < unreachable.length; index++) {
+        id = unreachable[index];
+        if (this._size - ids.length > target) {
+            evicted[id] = true;
+            ids.push(id);
+        }
+        else {
+            survivors.push(this._proxies[id]);
+        }
+    }
+
+    var evicted_proxies = [];
+    for (index=0; index < ids.length; index++) {
+        evicted_proxies.push(this._proxies[ids[index]]);
+        this._evict(evicted_proxies[index]);
+    }
+
+    // Unreachable proxies that were not evicted may still refer to evicted
+    // ones, so those values must be fetched again too.
+    for (index=0; index < survivors.length; index++) {
+        this._forget(survivors[index], evicted);
+    }
+
+    if (ids.length > 0) {
+        this._client.release(ids);
+    }
+
+    // Any of the evicted proxies that the UI still shows are fetched again.
+    for (index=0; index < evicted_proxies.length; index++) {
+        jigna.fire_event(
+            'jigna', {name: 'object_changed', object: evicted_proxies[index]}
+        );
+    }
+
+    this.stats.proxies -= ids.length;
+    this.stats.collections += 1;
+    this.stats.evicted += ids.length;
+    this.stats.last_collection_time = Date.now() - start;
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.MemoryManager.prototype._evict = function(proxy) {
+    /* Evict a proxy. */
+
+    var id = proxy.__id__;
+    delete this._proxies[id];
+    delete this._last_used[id];
+    this._size -= 1;
+    delete this._client._id_to_proxy_map[id];
+    this._client._proxy_factory.clear_cache(proxy);
+
+    // Without weak references the evicted proxies are kept (but their cached
+    // values are not).
+    this._evicted[id] = (
+        (typeof WeakRef === 'function') ? new WeakRef(proxy) : proxy
+    );
+};
+
+jigna.MemoryManager.prototype._find_reachable = function() {
+    /* Return the ids of the proxies that can be reached from the models (or
+    from the objects that have listeners and the windows of list queries).
+    */
+
+    var id_to_proxy_map = this._client._id_to_proxy_map;
+    var reachable = {};
+    var queue = [];
+    var cached_values = 0;
+
+    var visit = function(id) {
+        if (reachable[id] !== true) {
+            reachable[id] = true;
+            var proxy = id_to_proxy_map[id];
+            if (proxy !== undefined) {
+                queue.push(proxy);
+            }
+        }
+    };
+
+    for (var name in jigna.models) {
+        visit(jigna.models[name].__id__);
+    }
+    for (var id in jigna._listeners) {
+        visit(id);
+    }
+    var queries = this._client._queries;
+    for (id in queries) {
+        var items = queries[id].items;
+        for (var index=0; index < items.length; index++) {
+            if (items[index] !== null && items[index].__id__ !== undefined) {
+                visit(items[index].__id__);
+            }
+        }
+    }
+
+    while (queue.length > 0) {
+        var cache = queue.pop().__cache__;
+        for (var key in cache) {
+            var value = cache[key];
+            cached_values += 1;
+            if (value === null || typeof value !== 'object') {
+                continue;
+            }
+
+            // A proxy...
+            if (value.__id__ !== undefined) {
+                visit(value.__id__);
+            }
+            // ... or a value that has not been unmarshalled yet.
+            else if (value instanceof jigna._SavedData) {
+                if (value.data.type !== 'primitive') {
+                    visit(value.data.value);
+                }
+            }
+        }
+    }
+
+    this.stats.cached_values = cached_values;
+
+    var rows = this._client._proxy_factory._id_to_row_map;
+    this.stats.saved_rows = (rows === undefined) ? 0 : Object.keys(rows).length;
+
+    return reachable;
+};
+
+jigna.MemoryManager.prototype._forget = function(proxy, evicted) {
+    /* Drop the cached values of a proxy that are evicted proxies. */
+
+    var cache = proxy.__cache__;
+    for (var key in cache) {
+        var value = cache[key];
+        if (value !== null && typeof value === 'object' &&
+            evicted[value.__id__] === true) {
+            cache[key] = undefined;
+        }
+    }
+};
+
+jigna.MemoryManager.prototype._prune = function() {
+    /* Forget the evicted proxies that have been garbage collected. */
+
+    if (typeof WeakRef !== 'function') {
+        return;
+    }
+
+    for (var id in this._evicted) {
+        if (this._evicted[id].deref() === undefined) {
+            delete this._evicted[id];
+        }
+    }
+};
+
+jigna.MemoryManager.prototype._schedule = function() {
+    /* Collect once the current changes have been handled (so that the new
+    proxies are already cached by the proxies they were fetched from).
+    */
+
+    if (this._pending) {
+        return;
+    }
+    this._pending = true;
+
+    var manager = this;
+    setTimeout(function() { manager.collect(); }, 0);
+};
+
+// The statistics of the client's memory manager (see 'Client.initialize').
+jigna.stats = null;
@@ -18,6 +18,13 @@ jigna.ProxyFactory = function(client) {
         this
     );
 
+    // Create the constructors for the types in the type manifest up front.
+    if (jigna.type_manifest !== null) {
+        var types = jigna.type_manifest.types;
+        for (var index=0; index < types.length; index++) {
+            this._create_instance_constructor(types[index]);
+        }
+    }
 };
 
 jigna.ProxyFactory.prototype.create_proxy = function(type, id, info) {
@@ -31,6 +38,30 @@ jigna.ProxyFactory.prototype.create_proxy = function(type, id, info) {
     return factory_method.apply(this, [id, info]);
 };
 
+jigna.ProxyFactory.prototype.clear_cache = function(proxy) {
+    /* Drop all of the cached values of a proxy. */
+
+    proxy.__cache__ = Array.isArray(proxy.__cache__) ? [] : {};
+};
+
+jigna.ProxyFactory.prototype.reset_proxy = function(proxy, type, info) {
+    /* Reset a proxy whose cached values were dropped (see 'MemoryManager')
+    from the info that its object has been received with again.
+    */
+
+    if (type === 'list') {
+        this.clear_cache(proxy);
+        this._populate_list_proxy(proxy, info);
+    }
+    else if (type === 'dict') {
+        this.clear_cache(proxy);
+        this._delete_dict_keys(proxy);
+        this._populate_dict_proxy(proxy, info);
+    }
+
+    return proxy;
+};
+
 jigna.ProxyFactory.prototype.update_proxy = function(proxy, type, info) {
     /* Update the given proxy.
      *
@@ -113,30 +144,11 @@ jigna.ProxyFactory.prototype._create_instance_constructor = function(info) {
         return constructor;
     }
 
+    // Note that the constructor does not listen for changes to the object
+    // that the proxy is a proxy for, the client dispatches them to the proxy
+    // using the '__dispatch__' table of its type (see below).
     constructor = function(type, id, client) {
         jigna.Proxy.call(this, type, id, client);
-
-        /* Listen for changes to the object that the proxy is a proxy for! */
-        var index;
-        var info = this.__info__;
-
-        for (index in info.attribute_names) {
-            jigna.add_listener(
-                this,
-                info.attribute_names[index],
-                client.on_object_changed,
-                client
-            );
-        }
-
-        for (index in info.event_names) {
-            jigna.add_listener(
-                this,
-                info.event_names[index],
-                client.on_object_changed,
-                client
-            );
-        }
     };
 
     // This is the standard way to set up protoype inheritance in JS.
@@ -165,6 +177,19 @@ jigna.ProxyFactory.prototype._create_instance_constructor = function(info) {
         );
     }
 
+    // The names of the attributes and events whose changes are dispatched to
+    // 'Client.on_object_changed' (shared by all of the proxies of the type).
+    var dispatch = Object.create(null);
+    for (index in info.attribute_names) {
+        dispatch[info.attribute_names[index]] = true;
+    }
+    for (index in info.event_names) {
+        dispatch[info.event_names[index]] = true;
+    }
+    Object.defineProperty(
+        constructor.prototype, '__dispatch__', {value : dispatch}
+    );
+
     // The info is only sent to us once per type, and so we store it in the
     // prototype so that we can use it in the constructor to get the names
     // of any atttributes and events.
@@ -239,20 +264,10 @@ jigna.ProxyFactory.prototype._create_list_proxy = function(id, info) {
     return proxy;
 };
 
-jigna.ProxyFactory.prototype._delete_list_items = function(proxy) {
-    /* Delete all items of a previously used list proxy. */
-
-    for (var index=proxy.length-1; index >= 0; index--) {
-        delete proxy[index];
-    }
-};
-
 jigna.ProxyFactory.prototype._populate_list_proxy = function(proxy, info) {
     /* Populate the items in a list proxy. */
 
-    for (var index=0; index < info.length; index++) {
-        this._add_item_attribute(proxy, index);
-    }
+    jigna.ListProxy.resize(proxy, info.length);
 
     return proxy;
 };
@@ -260,39 +275,48 @@ jigna.ProxyFactory.prototype._populate_list_proxy = function(proxy, info) {
 jigna.ProxyFactory.prototype._update_list_proxy = function(proxy, info) {
     /* Update the given proxy.
      *
-     * This removes all previous items and then repopulates the proxy with
-     * items that reflect the (possibly) new length.
+     * This gets rid of any cached items (items we have already requested from
+     * the server-side) and sets the (possibly) new length.
      */
-    this._delete_list_items(proxy);
+    proxy.__cache__ = [];
     this._populate_list_proxy(proxy, info);
-
-    // Get rid of any cached items (items we have already requested from the
-    // server-side.
-    proxy.__cache__ = []
 };
 
 // Common for list and dict proxies ////////////////////////////////////////////
 
 jigna.ProxyFactory.prototype._add_item_attribute = function(proxy, index){
     var descriptor, get, set;
+    var factory = this;
 
     get = function() {
         // In here, 'this' refers to the proxy!
-        var value = this.__cache__[index];
-        if (value === undefined) {
-            value = this.__client__.get_attribute(this, index);
-            this.__cache__[index] = value;
-        }
-
-        return value;
+        return factory._get_item(this, index);
     };
 
     set = function(value) {
         // In here, 'this' refers to the proxy!
-        this.__cache__[index] = value;
-        this.__client__.set_item(this.__id__, index, value);
+        factory._set_item(this, index, value);
     };
 
     descriptor = {enumerable:true, get:get, set:set, configurable:true};
     Object.defineProperty(proxy, index, descriptor);
 };
+
+jigna.ProxyFactory.prototype._get_item = function(proxy, index){
+    /* Get the value of an item of a list/dict proxy. */
+
+    var value = proxy.__cache__[index];
+    if (value === undefined) {
+        value = proxy.__client__.get_attribute(proxy, index);
+        proxy.__cache__[index] = value;
+    }
+
+    return value;
+};
+
+jigna.ProxyFactory.prototype._set_item = function(proxy, index, value){
+    /* Set the value of an item of a list/dict proxy. */
+
+    proxy.__cache__[index] = value;
+    proxy.__client__.set_item(proxy.__id__, index, value);
+};
@@ -5,18 +5,63 @@
 jigna.QtBridge = function(client, qt_bridge) {
     this.ready = new $.Deferred();
 
+    // In native mode (see QtServer.bridge_mode), requests, responses and
+    // events are passed as objects rather than as JSON text.
+    this.native = (qt_bridge.handle_request_native !== undefined);
+
     // Private protocol
     this._client    = client;
     this._qt_bridge = qt_bridge;
 
+    if (this.native) {
+        var bridge = this;
+        qt_bridge.events_sent.connect(function(events) {
+            bridge.handle_events(events);
+        });
+    }
+
     this.ready.resolve();
 };
 
+// The typed array for each numpy dtype (as given by 'dtype.str').
+jigna.QtBridge.ARRAY_TYPES = {
+    '|b1': Uint8Array,   '|i1': Int8Array,    '|u1': Uint8Array,
+    '<i2': Int16Array,   '<u2': Uint16Array,  '<i4': Int32Array,
+    '<u4': Uint32Array,  '<f4': Float32Array, '<f8': Float64Array
+};
+
+jigna.QtBridge.decode_array = function(value) {
+    /* Decode a numpy array sent by a native bridge.
+
+    The array is returned as a typed array (sharing the data sent) with an
+    extra 'shape' attribute. Arrays with a dtype that has no typed array
+    equivalent are returned as sent (with the raw bytes in 'data').
+    */
+
+    var array_type = jigna.QtBridge.ARRAY_TYPES[value.dtype];
+    if (array_type === undefined) {
+        return value;
+    }
+
+    var data  = value.data;
+    var array = new array_type(
+        data.buffer, data.byteOffset, data.byteLength / array_type.BYTES_PER_ELEMENT
+    );
+    array.shape = value.shape;
+
+    return array;
+};
+
 jigna.QtBridge.prototype.handle_event = function(jsonized_event) {
     /* Handle an event from the server. */
     this._client.handle_event(jsonized_event);
 };
 
+jigna.QtBridge.prototype.handle_events = function(events) {
+    /* Handle a batch of (already parsed) events from the server. */
+    this._client.handle_events(events);
+};
+
 jigna.QtBridge.prototype.send_request = function(jsonized_request) {
     /* Send a request to the server and wait for the reply. */
 
@@ -25,6 +70,13 @@ jigna.QtBridge.prototype.send_request = function(jsonized_request) {
     return result;
 };
 
+jigna.QtBridge.prototype.send_request_native = function(request) {
+    /* Send a request (an object) to the server and return the response (an
+    object). Only available in native mode. */
+
+    return this._qt_bridge.handle_request_native(request);
+};
+
 jigna.QtBridge.prototype.send_request_async = function(jsonized_request) {
     /* A dummy async version of the send_request method. Since QtBridge is
     single process, this method indeed waits for the reply but presents
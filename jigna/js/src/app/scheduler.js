@@ -0,0 +1,149 @@
+///////////////////////////////////////////////////////////////////////////////
+// Scheduler
+///////////////////////////////////////////////////////////////////////////////
+
+// The scheduler batches the 'object_changed' events fired by the client (one
+// for every change to a proxy and every value fetched from the server) and
+// fires a single 'objects_changed' event per animation frame, with the
+// (distinct) proxies that changed. The Angular and Vue apps listen to that
+// event so that a burst of changes costs one digest/re-render.
+//
+// Browsers do not run animation frames for hidden documents (background tabs,
+// minimized windows), so the scheduler uses a timer instead while the document
+// is hidden.
+
+jigna.Scheduler = function() {
+    // The maximum number of 'objects_changed' events fired per second (at
+    // most one per animation frame). If it is zero (or less) the event is
+    // fired synchronously for every change.
+    this.max_frequency = 60;
+
+    // Private protocol.
+    this._changed = false;
+    this._objects = [];
+    this._object_ids = {};
+    this._pending = false;
+    this._last_flush = 0;
+
+    // Incremented to cancel the scheduled flush.
+    this._generation = 0;
+};
+
+jigna.Scheduler.prototype.mark_changed = function(proxy) {
+    /* Mark a proxy as changed (or just that something changed if the proxy
+    is undefined).
+    */
+
+    if (proxy !== undefined && proxy !== null) {
+        var id = proxy.__id__;
+        if (id === undefined || this._object_ids[id] !== true) {
+            if (id !== undefined) {
+                this._object_ids[id] = true;
+            }
+            this._objects.push(proxy);
+        }
+    }
+    this._changed = true;
+
+    if (this.max_frequency > 0) {
+        this._schedule();
+    }
+    else {
+        this.flush();
+    }
+};
+
+jigna.Scheduler.prototype.flush = function() {
+    /* Fire the 'objects_changed' event now (if anything changed). */
+
+    if (!this._changed) {
+        return;
+    }
+
+    var objects = this._objects;
+    this._changed = false;
+    this._objects = [];
+    this._object_ids = {};
+    this._last_flush = Date.now();
+
+    jigna.fire_event('jigna', {name: 'objects_changed', objects: objects});
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.Scheduler.prototype._schedule = function() {
+    /* Schedule a flush on the next animation frame (no sooner than the
+    maximum frequency allows).
+    */
+
+    if (this._pending) {
+        return;
+    }
+    this._pending = true;
+
+    var scheduler = this;
+    var generation = this._generation;
+    var flush = function() {
+        if (scheduler._generation !== generation) {
+            return;
+        }
+        scheduler._pending = false;
+        scheduler.flush();
+    };
+    var request_frame = function() {
+        if (scheduler._has_animation_frames()) {
+            window.requestAnimationFrame(flush);
+        }
+        else {
+            setTimeout(flush, 16);
+        }
+    };
+
+    var delay = 1000 / this.max_frequency - (Date.now() - this._last_flush);
+    if (delay > 0) {
+        setTimeout(request_frame, delay);
+    }
+    else {
+        request_frame();
+    }
+};
+
+jigna.Scheduler.prototype._has_animation_frames = function() {
+    /* Return true if animation frames run (the document is visible). */
+
+    if (typeof window === 'undefined' || !window.requestAnimationFrame) {
+        return false;
+    }
+
+    return typeof document === 'undefined' || !document.hidden;
+};
+
+jigna.Scheduler.prototype._on_visibility_changed = function() {
+    /* Flush now if the document is hidden while a frame is awaited (it would
+    not run until the document is shown again).
+    */
+
+    if (this._pending && !this._has_animation_frames()) {
+        this._generation += 1;
+        this._pending = false;
+        this.flush();
+    }
+};
+
+// The scheduler used by jigna.
+jigna.scheduler = new jigna.Scheduler();
+
+jigna.add_listener('jigna', 'object_changed', function(event) {
+    jigna.scheduler.mark_changed(event.object);
+});
+
+if (typeof document !== 'undefined' && document.addEventListener) {
+    document.addEventListener('visibilitychange', function() {
+        jigna.scheduler._on_visibility_changed();
+    });
+}
+
+jigna.flush = function() {
+    /* Propagate any pending changes to the UI now. */
+    this.scheduler.flush();
+};
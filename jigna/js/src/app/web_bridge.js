@@ -15,26 +15,40 @@ jigna.WebBridge = function(client) {
 
     var url = 'ws://' + jigna_server + '/_jigna_ws';
 
+    // With the compact wire encoding the server's messages must be decoded
+    // (see wire.js).
+    this._decoder = null;
+    if (jigna.wire === 'compact') {
+        url += '?wire=compact';
+        this._decoder = new jigna.WireDecoder();
+    }
+
     this._deferred_requests = {};
     this._request_ids = [];
     for (var index=0; index < 1024; index++) {
         this._request_ids.push(index);
     }
 
-    this._web_socket = new WebSocket(url);
+    // The id that identifies the websocket in the synchronous GET requests
+    // (see '_connect').
+    this._connection_id = null;
+
     this.ready = new $.Deferred();
-    var bridge = this;
-    this._web_socket.onopen = function() {
-        bridge.ready.resolve();
-    };
-    this._web_socket.onmessage = function(event) {
-        bridge.handle_event(event.data);
-    };
+    this._connect(url);
 };
 
 jigna.WebBridge.prototype.handle_event = function(jsonized_event) {
     /* Handle an event from the server. */
     var response = JSON.parse(jsonized_event);
+    if (this._decoder !== null) {
+        // The payload is already decoded (it is not a JSON string).
+        response = this._decoder.decode(response);
+        if (response[0] === -1) {
+            this._client.handle_events([response[1]]);
+            return;
+        }
+    }
+
     var request_id = response[0];
     var jsonized_response = response[1];
     if (request_id === -1) {
@@ -51,11 +65,17 @@ jigna.WebBridge.prototype.send_request = function(jsonized_request) {
 
     var jsonized_response;
 
+    // The server notes which client holds the objects in the response.
+    var data = {'data': jsonized_request};
+    if (this._connection_id !== null) {
+        data['connection'] = this._connection_id;
+    }
+
     $.ajax(
         {
             url     : '/_jigna',
             type    : 'GET',
-            data    : {'data': jsonized_request},
+            data    : data,
             success : function(result) {jsonized_response = result;},
             error   : function(status, error) {
                           console.warning("Error: " + error);
@@ -76,13 +96,38 @@ jigna.WebBridge.prototype.send_request_async = function(jsonized_request) {
     var request_id = this._push_deferred_request(deferred);
     var bridge = this;
     this.ready.done(function() {
-        bridge._web_socket.send(JSON.stringify([request_id, jsonized_request]));
+        bridge._send(JSON.stringify([request_id, jsonized_request]));
     });
     return deferred.promise();
 };
 
 //// Private protocol /////////////////////////////////////////////////////
 
+jigna.WebBridge.prototype._connect = function(url) {
+    /* Open the websocket to the server. */
+
+    // Tell the server which websocket the synchronous GET requests come from.
+    this._connection_id = (
+        Math.random().toString(36).slice(2) + Date.now().toString(36)
+    );
+    url += (url.indexOf('?') === -1 ? '?' : '&');
+    url += 'connection=' + this._connection_id;
+
+    var bridge = this;
+    this._web_socket = new WebSocket(url);
+    this._web_socket.onopen = function() {
+        bridge.ready.resolve();
+    };
+    this._web_socket.onmessage = function(event) {
+        bridge.handle_event(event.data);
+    };
+};
+
+jigna.WebBridge.prototype._send = function(message) {
+    /* Send a message to the server. */
+    this._web_socket.send(message);
+};
+
 jigna.WebBridge.prototype._pop_deferred_request = function(request_id) {
     var deferred = this._deferred_requests[request_id];
     delete this._deferred_requests[request_id];
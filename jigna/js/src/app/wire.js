@@ -0,0 +1,219 @@
+///////////////////////////////////////////////////////////////////////////////
+// WireDecoder
+///////////////////////////////////////////////////////////////////////////////
+
+// Decodes the messages sent by the server in the compact wire encoding (see
+// 'jigna/core/wire.py' for the format). The decoded events and responses are
+// exactly as sent in the default (JSON) encoding.
+
+jigna.WireDecoder = function() {
+    // The strings defined so far (indexed by their code).
+    this._strings = [];
+};
+
+// Value codes.
+jigna.WireDecoder.PRIMITIVE   = 0;
+jigna.WireDecoder.INSTANCE    = 1;
+jigna.WireDecoder.LIST        = 2;
+jigna.WireDecoder.DICT        = 3;
+jigna.WireDecoder.LIST_SPLICE = 4;
+jigna.WireDecoder.DICT_UPDATE = 5;
+jigna.WireDecoder.RAW         = 6;
+
+// Event codes.
+jigna.WireDecoder.EVENT_RAW     = 0;
+jigna.WireDecoder.EVENT_VALUE   = 1;
+jigna.WireDecoder.EVENT_ITEMS   = 2;
+jigna.WireDecoder.EVENT_CONTEXT = 3;
+jigna.WireDecoder.EVENT_TYPE    = 4;
+
+jigna.WireDecoder.prototype.decode = function(message) {
+    /* Decode a (parsed) message.
+
+    Return an array [request_id, payload] where the payload is the decoded
+    event (if the request id is -1) or response.
+    */
+
+    // The server has started a new table of codes.
+    if (message.length > 3 && message[3]) {
+        this._strings = [];
+    }
+
+    if (message.length > 2) {
+        Array.prototype.push.apply(this._strings, message[2]);
+    }
+
+    var request_id = message[0];
+    var payload = message[1];
+    if (request_id === -1) {
+        return [request_id, this._decode_event(payload)];
+    }
+
+    // The server failed to handle the request and sent a plain reply.
+    if (!Array.isArray(payload)) {
+        return [request_id, JSON.parse(payload)];
+    }
+
+    return [request_id, {
+        exception : payload.length > 1 ? payload[1] : null,
+        result    : this._decode_any(payload[0])
+    }];
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WireDecoder.prototype._decode_any = function(value) {
+    if (value === null) {
+        return null;
+    }
+
+    if (value[0] === jigna.WireDecoder.RAW) {
+        return value[1];
+    }
+
+    return this._decode_value(value);
+};
+
+jigna.WireDecoder.prototype._decode_event = function(event) {
+    if (!Array.isArray(event)) {
+        return event;
+    }
+
+    var codes = jigna.WireDecoder;
+    var code = event[2];
+    var data = event[3];
+    var decoded = {obj: this._strings[event[0]], name: this._strings[event[1]]};
+    if (code === codes.EVENT_RAW) {
+        decoded.data = data;
+    }
+    else if (code === codes.EVENT_CONTEXT) {
+        decoded.data = {};
+        for (var key in data) {
+            decoded.data[key] = this._decode_value(data[key]);
+        }
+    }
+    else if (code === codes.EVENT_TYPE) {
+        decoded.data = this._decode_type_info(data);
+    }
+    else {
+        decoded.data = this._decode_value(data);
+        decoded.items_event = code === codes.EVENT_ITEMS;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_dict_info = function(info) {
+    var decoded = {keys: info[0]};
+    if (info.length > 1) {
+        decoded.values = this._decode_list_info(info[1]);
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_columns = function(columns) {
+    var strings = this._strings;
+
+    var ids = new Array(columns[1].length);
+    for (var index=0; index < ids.length; index++) {
+        ids[index] = strings[columns[1][index]];
+    }
+
+    var values = {};
+    for (index=0; index < columns[2].length; index++) {
+        values[strings[columns[2][index][0]]] = columns[2][index][1];
+    }
+
+    return {type_name: strings[columns[0]], ids: ids, values: values};
+};
+
+jigna.WireDecoder.prototype._decode_list_info = function(info) {
+    var decoded = {length: info[0]};
+    if (info.length > 2) {
+        decoded.columns = this._decode_columns(info[2]);
+    }
+    else if (info.length > 1) {
+        var items = info[1];
+        var data = new Array(items.length);
+        for (var index=0; index < items.length; index++) {
+            data[index] = this._decode_value(items[index]);
+        }
+        decoded.data = data;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_names = function(codes) {
+    var names = new Array(codes.length);
+    for (var index=0; index < codes.length; index++) {
+        names[index] = this._strings[codes[index]];
+    }
+
+    return names;
+};
+
+jigna.WireDecoder.prototype._decode_type_info = function(info) {
+    if (!Array.isArray(info)) {
+        return {type_name: this._strings[info]};
+    }
+
+    var decoded = {
+        type_name       : this._strings[info[0]],
+        attribute_names : this._decode_names(info[1]),
+        event_names     : this._decode_names(info[2]),
+        method_names    : this._decode_names(info[3])
+    };
+    if (info.length > 4) {
+        decoded.attribute_values = this._decode_list_info([0, info[4]]).data;
+    }
+
+    return decoded;
+};
+
+jigna.WireDecoder.prototype._decode_value = function(value) {
+    var codes = jigna.WireDecoder;
+    var code = value[0];
+    if (code === codes.RAW) {
+        return value[1];
+    }
+
+    if (code === codes.PRIMITIVE) {
+        return {type: 'primitive', value: value[1], info: null};
+    }
+
+    var id = this._strings[value[1]];
+    var info = value[2];
+    if (code === codes.INSTANCE) {
+        return {type: 'instance', value: id, info: this._decode_type_info(info)};
+    }
+    else if (code === codes.LIST) {
+        return {type: 'list', value: id, info: this._decode_list_info(info)};
+    }
+    else if (code === codes.DICT) {
+        return {type: 'dict', value: id, info: this._decode_dict_info(info)};
+    }
+    else if (code === codes.LIST_SPLICE) {
+        var splice;
+        if (info.length === 3) {
+            splice = {index: info[0], removed: info[1]};
+        }
+        else {
+            splice = {
+                start: info[0], stop: info[1], step: info[2], removed: info[3]
+            };
+        }
+        splice.added = this._decode_list_info(info[info.length - 1]);
+
+        return {type: 'list', value: id, info: splice};
+    }
+    else if (code === codes.DICT_UPDATE) {
+        return {type: 'dict', value: id, info: {
+            removed : info[0],
+            added   : this._decode_dict_info(info[1])
+        }};
+    }
+
+    throw new Error('Unknown value code ' + code);
+};
@@ -0,0 +1,144 @@
+///////////////////////////////////////////////////////////////////////////////
+// WorkerBridge
+///////////////////////////////////////////////////////////////////////////////
+
+// A WebBridge whose websocket lives in a Web Worker (see
+// 'worker/dedicated.js'). The worker receives (and, with the compact wire
+// encoding, decodes) the server's messages and posts them in batches, with
+// each payload either as JSON text or with the columns of big lists in typed
+// arrays (see 'jigna.pack_batch' in 'worker/connection.js'). Used when jigna
+// is initialized with the 'worker' option.
+
+jigna.WorkerBridge = function(client) {
+    jigna.WebBridge.call(this, client);
+};
+
+jigna.WorkerBridge.prototype = Object.create(jigna.WebBridge.prototype);
+jigna.WorkerBridge.prototype.constructor = jigna.WorkerBridge;
+
+// The URL of the worker script (unless it is given by the 'worker' option).
+jigna.WorkerBridge.url = '/jigna/jigna-worker.js';
+
+jigna.WorkerBridge.prototype.handle_batch = function(messages) {
+    /* Handle a batch of (decoded) messages from the worker. */
+
+    var events = [];
+    for (var index=0; index < messages.length; index++) {
+        var request_id = messages[index][0];
+        var payload = messages[index][1];
+        if (typeof payload === 'string') {
+            payload = JSON.parse(payload);
+        }
+        if (request_id === -1) {
+            events.push(payload);
+        }
+        else {
+            // Handle the events that arrived before the response first.
+            if (events.length > 0) {
+                this._client.handle_events(events);
+                events = [];
+            }
+            this._pop_deferred_request(request_id).resolve(payload);
+        }
+    }
+
+    if (events.length > 0) {
+        this._client.handle_events(events);
+    }
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WorkerBridge.prototype._connect = function(url) {
+    /* Start the worker and have it open the websocket to the server. */
+
+    // The messages are decoded by the worker.
+    this._decoder = null;
+
+    var bridge = this;
+    this._port = this._create_port(url);
+    this._port.onmessage = function(event) {
+        var message = event.data;
+        if (message.type === 'batch') {
+            var messages = message.messages;
+            if (typeof messages === 'string') {
+                messages = JSON.parse(messages);
+            }
+            bridge.handle_batch(messages);
+        }
+        else if (message.type === 'open') {
+            bridge.ready.resolve();
+        }
+    };
+    this._port.postMessage({type: 'connect', url: url, wire: jigna.wire});
+};
+
+jigna.WorkerBridge.prototype._create_port = function(url) {
+    /* Create the worker and return the port to post messages to it. */
+
+    // The 'worker' option is true, 'shared' (if shared workers are not
+    // supported) or the URL of the worker script. Templates give the URL of
+    // the (content hashed) worker script in the 'worker_url' option, which is
+    // that of the shared worker script if the option is 'shared'.
+    var worker_url = jigna.worker;
+    if (worker_url === true) {
+        worker_url = jigna.worker_url || jigna.WorkerBridge.url;
+    }
+    else if (worker_url === 'shared') {
+        worker_url = jigna.WorkerBridge.url;
+    }
+
+    return new Worker(worker_url);
+};
+
+jigna.WorkerBridge.prototype._send = function(message) {
+    /* Send a message to the server (via the worker). */
+    this._port.postMessage({type: 'send', message: message});
+};
+
+///////////////////////////////////////////////////////////////////////////////
+// SharedWorkerBridge
+///////////////////////////////////////////////////////////////////////////////
+
+// A WorkerBridge whose worker is shared by all of the tabs that connect to the
+// same server (see 'worker/shared.js'), so that there is one websocket (and
+// every event is sent and decoded once) no matter how many tabs are open.
+// Used when jigna is initialized with the 'worker' option set to 'shared'.
+
+jigna.SharedWorkerBridge = function(client) {
+    jigna.WorkerBridge.call(this, client);
+};
+
+jigna.SharedWorkerBridge.prototype = Object.create(jigna.WorkerBridge.prototype);
+jigna.SharedWorkerBridge.prototype.constructor = jigna.SharedWorkerBridge;
+
+// The URL of the shared worker script.
+jigna.SharedWorkerBridge.url = '/jigna/jigna-shared-worker.js';
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.SharedWorkerBridge.prototype._create_port = function(url) {
+    /* Connect to the shared worker and return the port to it. */
+
+    var worker = new SharedWorker(
+        jigna.worker_url || jigna.SharedWorkerBridge.url, 'jigna'
+    );
+    var port = worker.port;
+
+    // Shared workers cannot tell when a tab goes away.
+    window.addEventListener('pagehide', function() {
+        port.postMessage({type: 'disconnect'});
+    });
+
+    // The tab also goes away when it is put in the back/forward cache. When
+    // it is shown again it has missed the events sent meanwhile (and the
+    // objects it held may have been released), so it is reloaded to connect
+    // again.
+    window.addEventListener('pageshow', function(event) {
+        if (event.persisted) {
+            window.location.reload();
+        }
+    });
+
+    return port;
+};
@@ -0,0 +1,269 @@
+///////////////////////////////////////////////////////////////////////////////
+// WorkerConnection
+///////////////////////////////////////////////////////////////////////////////
+
+// The websocket to the server used by the jigna workers (see 'dedicated.js'
+// and 'shared.js'). The messages received in a burst are handed over as a
+// single batch of `WorkerMessage`s, which are packed for the tabs by
+// 'jigna.pack_batch'.
+//
+// Whatever is posted to a tab is copied (with the structured clone
+// algorithm), and copying objects costs the tab about as much as parsing
+// their JSON. So the worker does what the tab would otherwise do with the
+// bulk of the data: the numbers in the columns of big lists (see
+// 'AsyncWebServer._get_columns') are put in typed arrays whose buffers are
+// transferred rather than copied (the tab indexes them like arrays). Other
+// payloads are posted as JSON text, which is cheaper for the tab to parse
+// than to copy as objects (see 'benchmarks/worker_messages.py').
+
+// Namespace for the jigna objects in the worker.
+var jigna = {};
+
+jigna.WorkerConnection = function(url, wire) {
+    this.url = url;
+    this.wire = wire;
+
+    // Called when the websocket is open, with each batch of (decoded)
+    // messages and when the websocket is closed.
+    this.onopen = null;
+    this.onbatch = null;
+    this.onclose = null;
+
+    // Private protocol.
+    this._socket = null;
+    this._decoder = null;
+    this._outbox = [];
+    this._batch = [];
+};
+
+jigna.WorkerConnection.prototype.connect = function() {
+    /* Open the websocket to the server. */
+
+    var connection = this;
+
+    if (this.wire === 'compact') {
+        this._decoder = new jigna.WireDecoder();
+    }
+
+    this._socket = new WebSocket(this.url);
+    this._socket.onopen = function() {
+        var outbox = connection._outbox;
+        connection._outbox = [];
+        for (var index=0; index < outbox.length; index++) {
+            connection._socket.send(outbox[index]);
+        }
+        connection.onopen();
+    };
+    this._socket.onmessage = function(event) {
+        connection._receive(event.data);
+    };
+    this._socket.onclose = function() {
+        connection.onclose();
+    };
+};
+
+jigna.WorkerConnection.prototype.close = function() {
+    this._socket.close();
+};
+
+jigna.WorkerConnection.prototype.is_open = function() {
+    return this._socket !== null && this._socket.readyState === 1;
+};
+
+jigna.WorkerConnection.prototype.send = function(message) {
+    /* Send a (jsonized) message to the server once the websocket is open. */
+
+    if (this.is_open()) {
+        this._socket.send(message);
+    }
+    else {
+        this._outbox.push(message);
+    }
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.WorkerConnection.prototype._decode = function(data) {
+    /* Return the WorkerMessage for a message from the server. */
+
+    var message = JSON.parse(data);
+    if (this._decoder !== null) {
+        // The payload is already decoded (it is not a JSON string).
+        message = this._decoder.decode(message);
+        return new jigna.WorkerMessage(message[0], message[1], undefined);
+    }
+
+    return new jigna.WorkerMessage(message[0], undefined, message[1]);
+};
+
+jigna.WorkerConnection.prototype._flush = function() {
+    var batch = this._batch;
+    this._batch = [];
+    this.onbatch(batch);
+};
+
+jigna.WorkerConnection.prototype._receive = function(data) {
+    /* Decode a message from the server and add it to the batch. */
+
+    var message = this._decode(data);
+
+    if (this._batch.length === 0) {
+        // Hand the batch over once the messages that have already arrived
+        // have been decoded.
+        var connection = this;
+        setTimeout(function() { connection._flush(); }, 0);
+    }
+    this._batch.push(message);
+};
+
+///////////////////////////////////////////////////////////////////////////////
+// WorkerMessage
+///////////////////////////////////////////////////////////////////////////////
+
+// An event (request_id -1) or response from the server, with its payload
+// parsed and/or as JSON text (each is only computed when it is needed).
+
+jigna.WorkerMessage = function(request_id, payload, text) {
+    this.request_id = request_id;
+
+    // The buffers of the typed arrays in the packed payload (see 'pack').
+    this.buffers = undefined;
+
+    // Private protocol.
+    this._payload = payload;
+    this._text = text;
+    this._packed = undefined;
+};
+
+jigna.WorkerMessage.prototype.get_payload = function() {
+    /* Return the (parsed) payload. */
+
+    if (this._payload === undefined) {
+        this._payload = JSON.parse(this._text);
+    }
+
+    return this._payload;
+};
+
+jigna.WorkerMessage.prototype.get_text = function() {
+    /* Return the payload as JSON text. */
+
+    if (this._text === undefined) {
+        this._text = JSON.stringify(this._payload);
+    }
+
+    return this._text;
+};
+
+jigna.WorkerMessage.prototype.pack = function() {
+    /* Return the payload as it is posted to the tabs.
+
+    That is the payload with its numeric columns in typed arrays (whose
+    buffers are then in 'buffers') if it has any, or its JSON text.
+    */
+
+    if (this._packed !== undefined) {
+        return this._packed;
+    }
+
+    // Payloads that are too short to have a column worth packing are not
+    // parsed.
+    var text = this._text;
+    if (text !== undefined && text.length < 2 * jigna.MIN_PACKED_COLUMN) {
+        this._packed = text;
+        return text;
+    }
+
+    var payload = this.get_payload();
+    this.buffers = jigna.pack_columns(payload, []);
+    this._packed = (this.buffers.length > 0) ? payload : this.get_text();
+
+    return this._packed;
+};
+
+// The minimum length of the numeric columns that are put in typed arrays.
+jigna.MIN_PACKED_COLUMN = 64;
+
+jigna.pack_batch = function(messages, request_ids) {
+    /* Pack a batch of messages for a tab.
+
+    Return an object with the `[request_id, payload]` pairs ('messages'),
+    where each payload is packed (see 'WorkerMessage.pack'), and the buffers
+    of their typed arrays ('buffers'). If none of the payloads has typed
+    arrays, the pairs are given as JSON text (one string is cheaper to post
+    and parse than many). The request ids are those of the messages unless
+    they are given.
+    */
+
+    var pairs = [];
+    var buffers = [];
+    for (var index=0; index < messages.length; index++) {
+        var message = messages[index];
+        var request_id = message.request_id;
+        if (request_ids !== undefined) {
+            request_id = request_ids[index];
+        }
+
+        pairs.push([request_id, message.pack()]);
+        if (message.buffers !== undefined) {
+            buffers.push.apply(buffers, message.buffers);
+        }
+    }
+
+    if (buffers.length === 0) {
+        for (index=0; index < pairs.length; index++) {
+            pairs[index] = '[' + pairs[index][0] + ',' + pairs[index][1] + ']';
+        }
+        pairs = '[' + pairs.join(',') + ']';
+    }
+
+    return {messages: pairs, buffers: buffers};
+};
+
+jigna.pack_columns = function(value, buffers) {
+    /* Put the numeric columns of the lists in a (marshalled) value in typed
+    arrays, and return their buffers.
+    */
+
+    if (value === null || typeof value !== 'object') {
+        return buffers;
+    }
+
+    var key;
+    if (value.type_name !== undefined && Array.isArray(value.ids)) {
+        var values = value.values;
+        for (key in values) {
+            var column = jigna._pack_column(values[key]);
+            if (column !== null) {
+                values[key] = column;
+                buffers.push(column.buffer);
+            }
+        }
+
+        return buffers;
+    }
+
+    for (key in value) {
+        jigna.pack_columns(value[key], buffers);
+    }
+
+    return buffers;
+};
+
+jigna._pack_column = function(column) {
+    /* Return a column as a typed array (null if it is not worth it or it has
+    values that are not numbers).
+    */
+
+    if (!Array.isArray(column) || column.length < jigna.MIN_PACKED_COLUMN) {
+        return null;
+    }
+
+    for (var index=0; index < column.length; index++) {
+        if (typeof column[index] !== 'number') {
+            return null;
+        }
+    }
+
+    return new Float64Array(column);
+};
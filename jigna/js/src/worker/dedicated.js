@@ -0,0 +1,45 @@
+///////////////////////////////////////////////////////////////////////////////
+// Dedicated worker
+///////////////////////////////////////////////////////////////////////////////
+
+// The worker used by the WorkerBridge (see 'app/worker_bridge.js').
+//
+// Messages from the main thread:
+//
+//   {type: 'connect', url: <url>, wire: <'json' or 'compact'>}
+//   {type: 'send', message: <jsonized message>}
+//
+// Messages to the main thread:
+//
+//   {type: 'open'}
+//   {type: 'batch', messages: <[[request_id, packed payload], ...] or its
+//                              JSON text (see 'jigna.pack_batch')>}
+//   {type: 'close'}
+
+jigna.connection = null;
+
+self.onmessage = function(event) {
+    var message = event.data;
+
+    if (message.type === 'connect') {
+        var connection = new jigna.WorkerConnection(message.url, message.wire);
+        connection.onopen = function() {
+            self.postMessage({type: 'open'});
+        };
+        connection.onbatch = function(messages) {
+            var batch = jigna.pack_batch(messages);
+            self.postMessage(
+                {type: 'batch', messages: batch.messages}, batch.buffers
+            );
+        };
+        connection.onclose = function() {
+            self.postMessage({type: 'close'});
+        };
+        connection.connect();
+
+        jigna.connection = connection;
+    }
+    else if (message.type === 'send') {
+        jigna.connection.send(message.message);
+    }
+};
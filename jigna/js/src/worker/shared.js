@@ -0,0 +1,533 @@
+///////////////////////////////////////////////////////////////////////////////
+// Shared worker
+///////////////////////////////////////////////////////////////////////////////
+
+// The worker used by the SharedWorkerBridge (see 'app/worker_bridge.js'). All
+// of the tabs (of an origin) that connect to the same server share one
+// websocket: their requests are multiplexed over it, and every event is
+// received (and decoded) once and then posted to all of the tabs.
+//
+// The worker also keeps the state that the tabs can share:
+//
+//  - the types sent by the server, which are replayed to tabs that connect
+//    later (the server sends the description of a type only once);
+//
+//  - the responses to requests for the attributes/items of objects, so that
+//    tabs asking for the same value (eg. when a dashboard is opened in a new
+//    tab) are answered without asking the server. A cached value is dropped
+//    whenever the server sends an event for its object or a tab sets one of
+//    its attributes/items, and all of them are dropped when a tab calls a
+//    method (objects that do not notify of their changes, eg. plain Python
+//    objects, can only be changed by that);
+//
+//  - which tabs hold which objects. To the server the worker is a single
+//    connection, so the tabs' 'release' requests (see 'Server.release') are
+//    only passed on for the objects that no tab holds anymore.
+//
+// The messages from/to the tabs are the same as for the dedicated worker
+// (see 'dedicated.js'), and tabs also send {type: 'disconnect'} when they are
+// closed.
+
+jigna.SharedConnection = function(url, wire) {
+    this.connection = new jigna.WorkerConnection(url, wire);
+
+    // The ports to the connected tabs.
+    this.ports = [];
+
+    // Called when the websocket is closed (or the last tab is removed).
+    this.onclose = null;
+
+    // Private protocol.
+
+    // The pending requests (by request id) with the ports and the ids that
+    // the tabs are waiting for their responses with, and (for requests whose
+    // response can be cached) their cache key.
+    this._requests = {};
+    this._next_request_id = 0;
+
+    // The new_type events (WorkerMessages, by type name).
+    this._types = {};
+
+    // The cached responses (WorkerMessages, by object id and cache key), their
+    // number, and the ids of the pending requests by object id and cache key.
+    this._cache = {};
+    this._cache_size = 0;
+    this._in_flight = {};
+
+    // The number of times the cached responses of each object (and all of
+    // them) were dropped (so that responses to requests sent before that are
+    // not cached).
+    this._generations = {};
+    this._epoch = 0;
+
+    // The ids of the futures of the methods called in threads (see
+    // 'Server.call_instance_method_thread') that have not finished yet.
+    this._futures = new Set();
+
+    // The tabs (ports) that hold each object (by id) that has been sent to
+    // them. Objects that are not in here are held by all of the tabs (those
+    // sent in events share the set of all the tabs).
+    this._holders = new Map();
+    this._all_ports = new Set();
+
+    // The ids of the objects that no tab holds, to be released (once there
+    // are no requests in flight whose responses might contain them).
+    this._releasing = new Set();
+
+    var shared = this;
+    this.connection.onopen = function() {
+        shared._post_all({type: 'open'});
+    };
+    this.connection.onbatch = function(messages) {
+        shared._handle_batch(messages);
+    };
+    this.connection.onclose = function() {
+        shared._post_all({type: 'close'});
+        shared.onclose();
+    };
+    this.connection.connect();
+};
+
+// The maximum number of cached responses (the cache is emptied if there are
+// more).
+jigna.SharedConnection.MAX_CACHE_SIZE = 10000;
+
+jigna.SharedConnection.prototype.add_port = function(port) {
+    /* Add a tab. */
+
+    this.ports.push(port);
+    this._all_ports = new Set(this.ports);
+
+    // Tell the tab about the types that were sent before it connected.
+    var events = [];
+    for (var type_name in this._types) {
+        events.push(this._types[type_name]);
+    }
+    if (events.length > 0) {
+        port.postMessage(
+            {type: 'batch', messages: jigna.pack_batch(events).messages}
+        );
+    }
+
+    if (this.connection.is_open()) {
+        port.postMessage({type: 'open'});
+    }
+};
+
+jigna.SharedConnection.prototype.remove_port = function(port) {
+    /* Remove a tab (the websocket is closed when the last tab is removed). */
+
+    var index = this.ports.indexOf(port);
+    if (index === -1) {
+        return;
+    }
+    this.ports.splice(index, 1);
+
+    // Nobody is waiting for the responses to the tab's requests anymore.
+    for (var request_id in this._requests) {
+        var waiters = this._requests[request_id].waiters;
+        for (index=waiters.length-1; index >= 0; index--) {
+            if (waiters[index].port === port) {
+                waiters.splice(index, 1);
+            }
+        }
+    }
+
+    if (this.ports.length === 0) {
+        this.connection.close();
+        this.onclose();
+        return;
+    }
+
+    // The tab no longer holds any objects.
+    this._all_ports = new Set(this.ports);
+    var shared = this;
+    this._holders.forEach(function(holders, id) {
+        if (holders.has(port)) {
+            shared._release(id, holders, port);
+        }
+    });
+    this._flush_releases();
+};
+
+jigna.SharedConnection.prototype.send = function(port, message) {
+    /* Send a (jsonized) message from a tab to the server. */
+
+    var data = JSON.parse(message);
+    var waiter = {port: port, request_id: data[0]};
+    var request = JSON.parse(data[1]);
+
+    // The objects are only released once no tab holds them.
+    if (request.kind === 'release') {
+        for (var index=0; index < request.ids.length; index++) {
+            var id = request.ids[index];
+            var holders = this._holders.get(id) || this._all_ports;
+            this._release(id, holders, port);
+        }
+        this._flush_releases();
+
+        var response = new jigna.WorkerMessage(
+            waiter.request_id, {exception: null, result: null}, undefined
+        );
+        port.postMessage(
+            {type: 'batch', messages: jigna.pack_batch([response]).messages}
+        );
+        return;
+    }
+
+    // Setting an attribute/item changes the object, and calling a method may
+    // change any object.
+    if (request.kind === 'set_instance_attribute' || request.kind === 'set_item') {
+        this._invalidate(request.id);
+    }
+    else if (request.kind.indexOf('call_instance_method') === 0) {
+        this._invalidate_all();
+    }
+
+    var key = this._cache_key(request);
+    if (key !== null) {
+        var cached = this._cache[request.id];
+        if (cached !== undefined && cached[key] !== undefined) {
+            this._hold(port, cached[key].get_payload());
+            var batch = jigna.pack_batch([cached[key]], [waiter.request_id]);
+            port.postMessage({type: 'batch', messages: batch.messages});
+            return;
+        }
+
+        var in_flight = this._in_flight[request.id + ' ' + key];
+        if (in_flight !== undefined) {
+            this._requests[in_flight].waiters.push(waiter);
+            return;
+        }
+    }
+
+    var request_id = this._next_request_id++;
+    this._requests[request_id] = {
+        waiters    : [waiter],
+        kind       : request.kind,
+        id         : request.id,
+        key        : key,
+        generation : this._generations[request.id],
+        epoch      : this._epoch
+    };
+    if (key !== null) {
+        this._in_flight[request.id + ' ' + key] = request_id;
+    }
+
+    this.connection.send(JSON.stringify([request_id, data[1]]));
+};
+
+//// Private protocol /////////////////////////////////////////////////////
+
+jigna.SharedConnection.prototype._cache_key = function(request) {
+    /* Return the cache key of a request (null if its response cannot be
+    cached).
+    */
+
+    if (request.kind === 'get_instance_attribute') {
+        return 'attribute ' + request.attribute_name;
+    }
+    else if (request.kind === 'get_item') {
+        return 'item ' + JSON.stringify(request.index);
+    }
+
+    return null;
+};
+
+jigna.SharedConnection.prototype._handle_batch = function(messages) {
+    /* Route a batch of messages (WorkerMessages) from the server to the
+    tabs.
+    */
+
+    // The messages for each tab and the request ids they are sent with.
+    var batches = [];
+    for (var index=0; index < this.ports.length; index++) {
+        batches.push({messages: [], request_ids: []});
+    }
+
+    for (index=0; index < messages.length; index++) {
+        var message = messages[index];
+        var payload = message.get_payload();
+        var batch;
+
+        // Events are sent to all of the tabs...
+        if (message.request_id === -1) {
+            this._handle_event(message);
+            this._hold(null, payload);
+            for (var port_index=0; port_index < batches.length; port_index++) {
+                batch = batches[port_index];
+                batch.messages.push(message);
+                batch.request_ids.push(-1);
+            }
+        }
+        // ... and responses to the tabs waiting for them.
+        else {
+            var waiters = this._handle_response(message);
+            for (var waiter_index=0; waiter_index < waiters.length; waiter_index++) {
+                var waiter = waiters[waiter_index];
+                port_index = this.ports.indexOf(waiter.port);
+                if (port_index !== -1) {
+                    this._hold(waiter.port, payload);
+                    batch = batches[port_index];
+                    batch.messages.push(message);
+                    batch.request_ids.push(waiter.request_id);
+                }
+            }
+        }
+    }
+
+    // The same messages are posted to each tab, so their typed arrays are
+    // copied rather than transferred (a transferred buffer can only be posted
+    // once).
+    for (index=0; index < this.ports.length; index++) {
+        batch = batches[index];
+        if (batch.messages.length > 0) {
+            this.ports[index].postMessage({
+                type: 'batch',
+                messages: jigna.pack_batch(
+                    batch.messages, batch.request_ids
+                ).messages
+            });
+        }
+    }
+
+    this._flush_releases();
+};
+
+jigna.SharedConnection.prototype._flush_releases = function() {
+    /* Release the objects that no tab holds (unless there are requests in
+    flight, as their responses may contain the objects).
+    */
+
+    if (this._releasing.size === 0 || Object.keys(this._requests).length > 0) {
+        return;
+    }
+
+    var ids = Array.from(this._releasing);
+    this._releasing.clear();
+
+    // The cached responses may contain the objects.
+    this._invalidate_all();
+
+    var request_id = this._next_request_id++;
+    this._requests[request_id] = {
+        waiters: [], kind: 'release', id: null, key: null
+    };
+    this.connection.send(JSON.stringify(
+        [request_id, JSON.stringify({kind: 'release', ids: ids})]
+    ));
+};
+
+jigna.SharedConnection.prototype._handle_event = function(message) {
+    /* Update the shared state for an event from the server. */
+
+    var event = message.get_payload();
+    if (event.obj === 'jigna' && event.name === 'new_type') {
+        this._types[event.data.type_name] = message;
+    }
+
+    // A method called in a thread may have changed any object.
+    if (this._futures.has(event.obj)) {
+        this._futures.delete(event.obj);
+        this._invalidate_all();
+    }
+
+    this._invalidate(event.obj);
+    if (event.items_event) {
+        this._invalidate(event.data.value);
+    }
+};
+
+jigna.SharedConnection.prototype._handle_response = function(message) {
+    /* Update the cache for a response and return the tabs waiting for it. */
+
+    var request = this._requests[message.request_id];
+    delete this._requests[message.request_id];
+    if (request === undefined) {
+        return [];
+    }
+
+    var response = message.get_payload();
+
+    if (request.kind === 'call_instance_method_thread' && !response.exception) {
+        this._futures.add(String(response.result.value));
+    }
+
+    if (request.key !== null) {
+        delete this._in_flight[request.id + ' ' + request.key];
+
+        // Only cache the response if the object has not changed since the
+        // request was sent.
+        var unchanged = (
+            this._generations[request.id] === request.generation &&
+            this._epoch === request.epoch
+        );
+        if (unchanged && !response.exception) {
+            this._store(request.id, request.key, message);
+        }
+    }
+
+    return request.waiters;
+};
+
+jigna.SharedConnection.prototype._hold = function(port, payload) {
+    /* Note that the objects in a payload are being sent to a tab (or to all
+    of them if the port is null).
+    */
+
+    var ids = jigna.object_ids(payload);
+    for (var index=0; index < ids.length; index++) {
+        var id = ids[index];
+        this._releasing.delete(id);
+
+        if (port === null) {
+            this._holders.set(id, this._all_ports);
+        }
+        else {
+            var holders = this._holders.get(id);
+            if (holders === undefined) {
+                this._holders.set(id, new Set([port]));
+            }
+            else if (!holders.has(port)) {
+                holders = new Set(holders);
+                holders.add(port);
+                this._holders.set(id, holders);
+            }
+        }
+    }
+};
+
+jigna.SharedConnection.prototype._invalidate = function(id) {
+    /* Drop the cached responses for an object. */
+
+    this._generations[id] = (this._generations[id] || 0) + 1;
+
+    var cached = this._cache[id];
+    if (cached !== undefined) {
+        this._cache_size -= Object.keys(cached).length;
+        delete this._cache[id];
+    }
+};
+
+jigna.SharedConnection.prototype._invalidate_all = function() {
+    /* Drop all of the cached responses. */
+
+    this._epoch += 1;
+    this._cache = {};
+    this._cache_size = 0;
+};
+
+jigna.SharedConnection.prototype._post_all = function(message) {
+    for (var index=0; index < this.ports.length; index++) {
+        this.ports[index].postMessage(message);
+    }
+};
+
+jigna.SharedConnection.prototype._release = function(id, holders, port) {
+    /* Release an object held by a tab. */
+
+    if (!holders.has(port)) {
+        return;
+    }
+
+    holders = new Set(holders);
+    holders.delete(port);
+    if (holders.size > 0) {
+        this._holders.set(id, holders);
+    }
+    else {
+        this._holders.delete(id);
+        this._releasing.add(id);
+    }
+};
+
+jigna.SharedConnection.prototype._store = function(id, key, message) {
+    /* Cache a response. */
+
+    if (this._cache_size >= jigna.SharedConnection.MAX_CACHE_SIZE) {
+        this._cache = {};
+        this._cache_size = 0;
+    }
+
+    var cached = this._cache[id];
+    if (cached === undefined) {
+        cached = this._cache[id] = {};
+    }
+    if (cached[key] === undefined) {
+        this._cache_size += 1;
+    }
+    cached[key] = message;
+};
+
+jigna.object_ids = function(value, ids) {
+    /* Return the ids of the objects in a (marshalled) value. */
+
+    ids = ids || [];
+    if (value === null || typeof value !== 'object') {
+        return ids;
+    }
+
+    var index;
+    if (Array.isArray(value)) {
+        for (index=0; index < value.length; index++) {
+            jigna.object_ids(value[index], ids);
+        }
+        return ids;
+    }
+
+    var type = value.type;
+    if (type === 'primitive') {
+        return ids;
+    }
+    if (type === 'instance' || type === 'list' || type === 'dict') {
+        ids.push(String(value.value));
+    }
+
+    // Lists of instances sent in columns.
+    if (value.type_name !== undefined && Array.isArray(value.ids)) {
+        for (index=0; index < value.ids.length; index++) {
+            ids.push(value.ids[index]);
+        }
+    }
+
+    for (var key in value) {
+        if (key !== 'ids') {
+            jigna.object_ids(value[key], ids);
+        }
+    }
+
+    return ids;
+};
+
+// The shared connections (by websocket URL and wire encoding).
+jigna.connections = {};
+
+self.onconnect = function(event) {
+    var port = event.ports[0];
+    var shared = null;
+
+    port.onmessage = function(event) {
+        var message = event.data;
+
+        if (message.type === 'connect') {
+            var key = message.url + ' ' + message.wire;
+            shared = jigna.connections[key];
+            if (shared === undefined) {
+                shared = new jigna.SharedConnection(message.url, message.wire);
+                shared.onclose = function() {
+                    if (jigna.connections[key] === this) {
+                        delete jigna.connections[key];
+                    }
+                };
+                jigna.connections[key] = shared;
+            }
+            shared.add_port(port);
+        }
+        else if (message.type === 'send') {
+            shared.send(port, message.message);
+        }
+        else if (message.type === 'disconnect') {
+            shared.remove_port(port);
+        }
+    };
+};
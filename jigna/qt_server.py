@@ -12,17 +12,19 @@
 import json
 import os
 from os.path import abspath, dirname, join
+import threading
 
 # Enthought library.
-from traits.api import Any, Bool, Str, Instance
+from traits.api import Any, Bool, Enum, Str, Instance
 from traits.trait_notifiers import set_ui_handler
 
 # Jigna library.
+from jigna.core.interoperation import from_qvariant, to_qvariant
 from jigna.core.proxy_qwebview import ProxyQWebView
 from jigna.core.wsgi import FileLoader
 from jigna.server import Bridge, Server
 from jigna.qt import QtWebKit
-from jigna.utils.gui import ui_handler
+from jigna.utils.gui import invoke_later, ui_handler
 
 #: Path to jigna.js file
 JIGNA_JS_FILE = join(abspath(dirname(__file__)), 'js', 'dist', 'jigna.js')
@@ -39,6 +41,10 @@ class QtBridge(Bridge):
     def send_event(self, event):
         """ Send an event. """
 
+        if self.native:
+            self._send_native_events([to_qvariant(event)])
+            return
+
         try:
             jsonized_event = json.dumps(event)
         except TypeError:
@@ -51,7 +57,9 @@ class QtBridge(Bridge):
             # This looks weird but this is how we fake an event being
             # 'received' on the client side when using the Qt bridge!
             self.webview.execute_js(
-                'jigna.client.bridge.handle_event(%r);' % jsonized_event
+                'jigna.client.bridge.handle_event(%s);' % json.dumps(
+                    jsonized_event
+                )
             )
 
         return
@@ -61,6 +69,106 @@ class QtBridge(Bridge):
     #: The 'WebViewContainer' that contains the QtWebKit malarky.
     webview = Any
 
+    #: Whether to send events as structured Qt values (via the 'events_sent'
+    #: signal of the object exposed to JS) rather than as JSON text.
+    native = Bool(False)
+
+    #### Private protocol #####################################################
+
+    def _send_native_events(self, events):
+        """ Send a list of events converted with 'to_qvariant'. """
+
+        if self.webview is None:
+            raise RuntimeError("WebView does not exist")
+
+        self.webview.js_wrapper.events_sent.emit(events)
+
+        return
+
+
+class QueuedQtBridge(QtBridge):
+    """ A Qt bridge that sends events in batches.
+
+    Executing JavaScript is synchronous and expensive, so rather than doing
+    it for every event, the events are queued and sent to the client once per
+    event loop iteration as a single JavaScript call carrying all of them.
+
+    """
+
+    #### 'Bridge' protocol ####################################################
+
+    def send_event(self, event):
+        """ Send an event. """
+
+        if self.native:
+            # Convert the event now as it may refer to mutable values.
+            pending_event = to_qvariant(event)
+
+        else:
+            try:
+                pending_event = json.dumps(event)
+            except TypeError:
+                return
+
+        with self._lock:
+            self._pending_events.append(pending_event)
+            if self._flush_pending:
+                return
+
+            self._flush_pending = True
+
+        invoke_later(self.flush)
+
+        return
+
+    #### 'QueuedQtBridge' protocol ############################################
+
+    def flush(self):
+        """ Send all queued events to the client (in the GUI thread). """
+
+        with self._lock:
+            pending_events = self._pending_events
+            self._pending_events = []
+            self._flush_pending = False
+
+        if len(pending_events) == 0:
+            return
+
+        if self.native:
+            self._send_native_events(pending_events)
+            return
+
+        if self.webview is None:
+            raise RuntimeError("WebView does not exist")
+
+        # The events are already JSON (with any non-ASCII characters escaped,
+        # so it is also a JavaScript literal), so we send them as an array of
+        # objects rather than an array of strings that the client would need
+        # to parse.
+        self.webview.execute_js(
+            'jigna.client.bridge.handle_events([%s]);' % ','.join(
+                pending_events
+            )
+        )
+
+        return
+
+    #### Private protocol #####################################################
+
+    #: Whether a flush has been requested but not done yet.
+    _flush_pending = Bool(False)
+
+    #: Guards the queue of events (which may be sent from any thread).
+    _lock = Any
+    def __lock_default(self):
+        return threading.Lock()
+
+    #: The events waiting to be sent (jsonized, or converted with
+    #: 'to_qvariant' in native mode).
+    _pending_events = Any
+    def __pending_events_default(self):
+        return []
+
 
 class QtServer(Server):
     """ Qt (via QWebkit) server implementation. """
@@ -92,6 +200,25 @@ class QtServer(Server):
     #: The trait change dispatch mechanism to use when traits change.
     trait_change_dispatch = Str('ui')
 
+    #: Whether to send events to the client in batches (once per event loop
+    #: iteration) rather than one at a time.
+    batch_events = Bool(True)
+
+    #: How requests, responses and events are passed between JS and Python.
+    #:
+    #: 'json': as JSON text (parsed and serialized on both sides).
+    #: 'native': as structured Qt values (QVariantMap/QVariantList) which
+    #: QtWebKit converts to and from JS objects directly. Bytes and numpy
+    #: arrays are passed as byte arrays (see 'to_qvariant').
+    bridge_mode = Enum('json', 'native')
+
+    def handle_request_native(self, request):
+        """ Handle a request passed from JS as a structured Qt value. """
+
+        response = self._handle_request(from_qvariant(request))
+
+        return to_qvariant(response)
+
     def shutdown(self):
         """ Shutdown the server.
 
@@ -111,19 +238,27 @@ class QtServer(Server):
     def _webview_default(self):
         user_root, index_file = self.home_url.split('/')[-2:]
 
+        callbacks = [('handle_request', self.handle_request)]
+        signals = []
+        if self.bridge_mode == 'native':
+            # The JS bridge uses the native mode if this callback exists.
+            callbacks.append(
+                ('handle_request_native', self.handle_request_native)
+            )
+            signals.append('events_sent')
+
         return ProxyQWebView(
             python_namespace = 'qt_bridge',
-            callbacks        = [('handle_request', self.handle_request)],
+            callbacks        = callbacks,
+            signals          = signals,
             debug            = self.debug,
             hosts            = {
                 user_root: FileLoader(
                     root      = abspath(self.base_url),
-                    overrides = {
-                        index_file: self.html,
-                        join('jigna', 'jigna.js'): open(JIGNA_JS_FILE).read(),
-                        join('jigna', 'jigna-vue.js'):
-                        open(JIGNA_VUE_JS_FILE).read()
-                    }
+                    overrides = {index_file: self.html},
+                    # The JS bundles (including the split bundles listed in
+                    # their manifest) are served from the package.
+                    mounts    = {'jigna': dirname(JIGNA_JS_FILE)}
                 ),
                 'root.filesystem': FileLoader(root=abspath(os.sep))
             }
@@ -133,7 +268,11 @@ class QtServer(Server):
 
     _bridge = Instance(QtBridge)
     def __bridge_default(self):
-        return QtBridge(webview=self.webview)
+        bridge_class = QueuedQtBridge if self.batch_events else QtBridge
+
+        return bridge_class(
+            webview=self.webview, native=self.bridge_mode == 'native'
+        )
 
     _plugin_factory = Instance('QtWebPluginFactory')
 
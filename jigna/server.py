@@ -6,15 +6,18 @@
 
 
 # Standard library.
+from contextlib import contextmanager
 import inspect
 import json
 import logging
+import threading
 import traceback
+from weakref import WeakValueDictionary
 
 # Enthought library.
 from traits.api import (
-    Any, Dict, Event, HasTraits, Instance, Property, Str, TraitDictEvent,
-    TraitListEvent
+    Any, Dict, Event, HasTraits, Instance, Int, Property, Str,
+    TraitDictEvent, TraitListEvent
 )
 
 # Logging.
@@ -59,6 +62,18 @@ class Server(HasTraits):
     #: The trait change dispatch mechanism to use when traits change.
     trait_change_dispatch = Str('ui')
 
+    #: An optional 'jigna.core.watchdog.LoopWatchdog' that is told about each
+    #: request as it is being handled.
+    watchdog = Any
+
+    #: An optional 'jigna.core.profiler.CallProfiler' that records statistics
+    #: for each request and for each method called in a thread.
+    profiler = Any
+
+    #: An optional 'jigna.core.type_manifest.TypeManifest' describing types
+    #: that clients may already know about (so they are not sent to them).
+    type_manifest = Any
+
     #: Context mapping from object name to obj.
     context = Dict
     def _context_changed(self):
@@ -81,25 +96,60 @@ class Server(HasTraits):
 
         return
 
-    def handle_request(self, jsonized_request):
-        """ Handle a jsonized request from a client. """
+    def add_connection(self, connection):
+        """ Add a client connection (e.g. a websocket).
 
-        request = json.loads(jsonized_request)
+        Servers with more than one client tell the server about each of their
+        connections (and pass the connection to 'handle_request'), so that an
+        object released by one client is kept for as long as the others may
+        still use it (see 'release').
 
-        # To dispatch the request we have a method named after each one!
-        method    = getattr(self, request['kind'])
-        exception = None
-        try:
-            result = method(request)
+        """
 
-        except:
-            exception = traceback.format_exc()
-            logger.exception(exception)
-            result = None
+        self._connections.add(connection)
+        self._all_connections = frozenset(self._connections)
 
-        response = dict(exception=exception, result=result)
+        return
+
+    def remove_connection(self, connection):
+        """ Remove a client connection that has been closed.
+
+        The objects that no other connection holds are released.
+
+        """
+
+        self._connections.discard(connection)
+        self._all_connections = frozenset(self._connections)
+        self._visited_type_names.pop(connection, None)
+
+        for obj_id, holders in list(self._holders.items()):
+            if connection in holders:
+                self._release(obj_id, holders, connection)
 
-        return json.dumps(response, default=lambda obj: repr(type(obj)));
+        # Nobody is left to see the connection's queries.
+        for query_id, owner in list(self._query_connections.items()):
+            if owner is connection:
+                self._close_query(query_id)
+
+        return
+
+    def handle_request(self, jsonized_request, connection=None):
+        """ Handle a jsonized request from a client.
+
+        'connection' is the connection that the request came from (see
+        'add_connection').
+
+        """
+
+        request = json.loads(jsonized_request)
+        response = self._handle_request(request, connection)
+
+        jsonized_response = json.dumps(
+            response, default=lambda obj: repr(type(obj))
+        )
+        self._record_sizes(request, jsonized_request, jsonized_response)
+
+        return jsonized_response
 
     def shutdown(self):
         """ Shutdown the server.
@@ -109,20 +159,30 @@ class Server(HasTraits):
 
         """
 
-        for obj in self._id_to_object_map.values():
+        for query_id in list(self._queries):
+            self._close_query(query_id)
+
+        objs = list(self._id_to_object_map.values())
+        objs.extend(self._released_objects.values())
+        for obj in objs:
             if isinstance(obj, HasTraits):
-                obj.on_trait_change(
-                    self._send_object_changed_event, remove=True
-                )
+                obj.on_trait_change(self._on_object_changed, remove=True)
 
     #### Handlers for each kind of request ####################################
 
     def update_context(self, request):
         """ Update the context on the JS side """
         # This method is called on a page reload or if a new client is used.
-        # In these cases, the visited_type_names is no longer relevant as the
-        # new client does not have the required data, so clear it.
-        self._visited_type_names = set()
+        # In these cases, the connection's visited type names are no longer
+        # relevant as the new client does not have the required data, so
+        # clear them (unless the client already has the types in our
+        # manifest).
+        visited = set()
+        manifest = self.type_manifest
+        if manifest is not None and request.get('type_manifest') == manifest.hash:
+            visited.update(manifest.type_names)
+        self._visited_type_names[self._connection] = visited
+
         return self._send_context_updated_event(self.context)
 
     def print_JS_message(self, request):
@@ -137,7 +197,7 @@ class Server(HasTraits):
     def call_instance_method(self, request):
         """ Call a method on an instance. """
 
-        obj         = self._id_to_object_map[request['id']]
+        obj         = self._get_object(request['id'])
         method_name = request['method_name']
         args        = self._unmarshal_all(request['args'])
         method      = getattr(obj, method_name)
@@ -152,11 +212,15 @@ class Server(HasTraits):
 
         """
 
-        obj         = self._id_to_object_map[request['id']]
+        obj         = self._get_object(request['id'])
         method_name = request['method_name']
         args        = self._unmarshal_all(request['args'])
         method      = getattr(obj, method_name)
 
+        if self.profiler is not None:
+            key = ('thread', self._get_type_name(obj), method_name)
+            method = self.profiler.wrap(key, method)
+
         from jigna.core.concurrent import Future
         future = Future(
             method, args=tuple(args), dispatch=self.trait_change_dispatch
@@ -190,7 +254,7 @@ class Server(HasTraits):
     def get_instance_attribute(self, request):
         """ Get the value of an instance attribute. """
 
-        obj            = self._id_to_object_map[request['id']]
+        obj            = self._get_object(request['id'])
         attribute_name = request['attribute_name']
 
         return self._marshal(getattr(obj, attribute_name))
@@ -198,7 +262,7 @@ class Server(HasTraits):
     def set_instance_attribute(self, request):
         """ Set an attribute on an instance. """
 
-        obj            = self._id_to_object_map[request['id']]
+        obj            = self._get_object(request['id'])
         attribute_name = request['attribute_name']
         value          = self._unmarshal(request['value']);
 
@@ -206,12 +270,32 @@ class Server(HasTraits):
 
         return
 
+    def release(self, request):
+        """ Release the objects that a client no longer has proxies for.
+
+        Each object is held by the connections that it has been sent to (see
+        '_hold'). Once no connection holds an object (each one has released
+        it or has been closed) it is only weakly referenced, so that it can
+        be garbage collected once nothing else refers to it, and its changes
+        are no longer sent. Plain lists and dicts cannot be weakly referenced
+        and are kept.
+
+        """
+
+        connection = self._connection
+        for obj_id in request['ids']:
+            if obj_id in self._id_to_object_map:
+                holders = self._holders.get(obj_id, self._all_connections)
+                self._release(obj_id, holders, connection)
+
+        return
+
     #### Lists/Dicts ####
 
     def get_item(self, request):
         """ Get the value of an item in a list or dict. """
 
-        obj   = self._id_to_object_map[request['id']]
+        obj   = self._get_object(request['id'])
         index = request['index']
 
         return self._marshal(obj[index])
@@ -219,7 +303,7 @@ class Server(HasTraits):
     def set_item(self, request):
         """ Set the value of a an item in a list or dict. """
 
-        obj   = self._id_to_object_map[request['id']]
+        obj   = self._get_object(request['id'])
         index = request['index']
         value = self._unmarshal(request['value'])
 
@@ -227,6 +311,68 @@ class Server(HasTraits):
 
         return
 
+    #### Queries ####
+
+    def query_list(self, request):
+        """ Start a query on a list attribute of an instance.
+
+        Besides the 'id' of the instance and the 'attribute_name' of the list,
+        the request can have the 'sort' keys, the 'filters', the 'offset' and
+        the 'limit' of the window (see 'jigna.core.list_query'). The window is
+        kept up to date as the list changes: whenever its items change a
+        'window' event is sent, with the id of the query as the object.
+
+        Return the window (see '_get_window').
+
+        """
+
+        from jigna.core.list_query import ListQuery
+
+        obj   = self._get_object(request['id'])
+        query = ListQuery(
+            obj        = obj,
+            trait_name = request['attribute_name'],
+            dispatch   = self.trait_change_dispatch,
+            **self._get_query_options(request)
+        )
+        query.open()
+
+        # Query ids are never reused (unlike the ids of Python objects), so
+        # that events for a closed query cannot reach a later one.
+        self._query_count += 1
+        query_id = 'query-%d' % self._query_count
+        self._queries[query_id] = query
+        self._query_connections[query_id] = self._connection
+
+        def _on_window_changed():
+            with self._broadcasting():
+                data = self._get_window(query_id)
+
+            self.send_event(dict(obj=query_id, name='window', data=data))
+
+        query.on_trait_change(_on_window_changed, 'window_changed')
+
+        return self._get_window(query_id)
+
+    def update_query(self, request):
+        """ Change the sort keys, filters and/or window of a query.
+
+        Return the window (see '_get_window').
+
+        """
+
+        query_id = request['query']
+        self._queries[query_id].update(**self._get_query_options(request))
+
+        return self._get_window(query_id)
+
+    def close_query(self, request):
+        """ Stop a query. """
+
+        self._close_query(request['query'])
+
+        return
+
     #### Private protocol #####################################################
 
     #: Shadow trait for `base_url`
@@ -242,13 +388,146 @@ class Server(HasTraits):
     def __id_to_object_map_default(self):
         return {}
 
-    #: The typenames of the Python types that we have already visited.
+    #: The objects that have been released by every client (see 'release'),
+    #: for as long as they are alive.
+    #:
+    #: { str id : instance obj }
+    _released_objects = Any
+    def __released_objects_default(self):
+        return WeakValueDictionary()
+
+    #: The connections that hold each object (see '_hold'). Objects that are
+    #: not in here are held by all of the connections.
+    #:
+    #: { str id : frozenset(connection) }
+    _holders = Dict
+
+    #: The open client connections (see 'add_connection').
+    _connections = Any
+    def __connections_default(self):
+        return set()
+
+    #: The open client connections (shared by the objects that were sent to
+    #: all of them).
+    _all_connections = Any(frozenset())
+
+    #: The connection that the request being handled (in the current thread)
+    #: came from (None if there is none, e.g. when sending an event).
+    _connection = Property
+    def _get__connection(self):
+        return getattr(self._local, 'connection', None)
+
+    def _set__connection(self, connection):
+        self._local.connection = connection
+
+    #: Where the connection of the request being handled in each thread is.
+    _local = Any
+    def __local_default(self):
+        return threading.local()
+
+    #: The queries on lists that clients have started (see 'query_list').
+    #:
+    #: { str id : ListQuery query }
+    _queries = Dict
+
+    #: The connection that started each query (see 'add_connection').
+    #:
+    #: { str id : connection }
+    _query_connections = Dict
+
+    #: The number of queries that have been started (used for their ids).
+    _query_count = Int
+
+    #: The typenames of the Python types that we have already visited, for
+    #: each connection (None without connections, i.e. with a single client).
     #:
     #: And by 'visited' we mean, those types that we have already sent the
     #: the full info for over to the client side.
-    _visited_type_names = Any
-    def __visited_type_names_default(self):
-        return set()
+    #:
+    #: { connection : set(str type_name) }
+    _visited_type_names = Dict
+
+    def _call_instrumented(self, method, request, activity):
+        """ Call a request handler, telling the watchdog and the profiler.
+
+        'activity' is the description of the request as returned by
+        '_describe_request'.
+
+        """
+
+        if self.profiler is not None:
+            call = lambda: self.profiler.call(activity, method, request)
+
+        else:
+            call = lambda: method(request)
+
+        if self.watchdog is not None:
+            with self.watchdog.activity(*activity):
+                return call()
+
+        return call()
+
+    def _broadcasting(self):
+        """ Return a context manager to marshal the values of an event.
+
+        Events are sent to every connection, so the values marshalled within
+        it are held by all of them (see 'release').
+
+        """
+
+        return self._handling(None)
+
+    @contextmanager
+    def _handling(self, connection):
+        """ Handle a request from a connection within a context. """
+
+        previous, self._connection = self._connection, connection
+        try:
+            yield
+
+        finally:
+            self._connection = previous
+
+    def _handle_request(self, request, connection=None):
+        """ Handle a (decoded) request from a client.
+
+        Return the response as a dict with the keys 'exception' and 'result'.
+
+        """
+
+        with self._handling(connection):
+            return self._handle_decoded_request(request)
+
+    def _handle_decoded_request(self, request):
+        """ Handle a (decoded) request in the context of its connection. """
+
+        # To dispatch the request we have a method named after each one!
+        method    = getattr(self, request['kind'])
+        exception = None
+        try:
+            if self.watchdog is None and self.profiler is None:
+                result = method(request)
+
+            else:
+                activity = self._describe_request(request)
+                result = self._call_instrumented(method, request, activity)
+
+        except:
+            exception = traceback.format_exc()
+            logger.exception(exception)
+            result = None
+
+        return dict(exception=exception, result=result)
+
+    def _close_query(self, query_id):
+        """ Stop a query (if it has not been stopped already). """
+
+        self._query_connections.pop(query_id, None)
+        query = self._queries.pop(query_id, None)
+        if query is not None:
+            query.close()
+
+        return
 
     def _context_ids(self, context):
         """ Return a dictionary keyed with object ids of the objects in
@@ -260,6 +539,41 @@ class Server(HasTraits):
 
         return context_ids
 
+    def _describe_request(self, request):
+        """ Describe a request for instrumentation purposes.
+
+        Return a tuple (kind, type_name, name) where 'type_name' is the type
+        of the object the request is for and 'name' is the method, attribute
+        or item being accessed (either may be None).
+
+        """
+
+        # Looking the object up must not hold a released object again (see
+        # '_get_object').
+        obj_id = request.get('id')
+        obj = self._id_to_object_map.get(obj_id)
+        if obj is None:
+            obj = self._released_objects.get(obj_id)
+
+        type_name = self._get_type_name(obj) if obj is not None else None
+
+        name = request.get('method_name', request.get('attribute_name'))
+        if name is None:
+            name = request.get('index')
+
+        return request['kind'], type_name, name
+
+    def _record_sizes(self, request, jsonized_request, jsonized_response):
+        """ Record the size of a request and its response (if profiling). """
+
+        if self.profiler is not None:
+            self.profiler.record_sizes(
+                self._describe_request(request), len(jsonized_request),
+                len(jsonized_response)
+            )
+
+        return
+
     def _get_attribute_names(self, obj):
         """ Get the names of all 'public' attributes on an object.
 
@@ -312,17 +626,19 @@ class Server(HasTraits):
 
         type_name = self._get_type_name(obj)
 
-        # The first time we send the details of a type over to the client we
+        # The first time we send the details of a type over to a client we
         # need to include the full info for it (its attributes, events and
         # methods etc)...
-        if type_name not in self._visited_type_names:
+        visited = self._get_visited_type_names()
+        if any(type_name not in names for names in visited):
             info = dict(
                 type_name       = type_name,
                 attribute_names = self._get_attribute_names(obj),
                 event_names     = self._get_event_names(obj),
                 method_names    = self._get_public_method_names(obj)
             )
-            self._visited_type_names.add(type_name)
+            for names in visited:
+                names.add(type_name)
 
         # ... for subsequent calls, we only need to send the type name as the
         # the client will have already built a prototype based on the previous
@@ -332,11 +648,41 @@ class Server(HasTraits):
 
         return info
 
+    def _get_items_info(self, items):
+        """ Get a description of a list including all of its items. """
+
+        return dict(length=len(items), data=self._marshal_all(items))
+
     def _get_list_info(self, obj):
         """ Get a description of a list. """
 
         return dict(length=len(obj))
 
+    def _get_object(self, obj_id):
+        """ Return the object with the given id.
+
+        Raise a KeyError if there is no such object.
+
+        """
+
+        obj = self._id_to_object_map.get(obj_id)
+        if obj is None:
+            obj = self._released_objects[obj_id]
+
+            # A client asking for a released object that is still alive wants
+            # it again (e.g. a proxy that it evicted is still in use), so hold
+            # it and send its changes again.
+            del self._released_objects[obj_id]
+            self._id_to_object_map[obj_id] = obj
+            if isinstance(obj, HasTraits):
+                obj.on_trait_change(
+                    self._on_object_changed,
+                    dispatch=self.trait_change_dispatch
+                )
+            self._hold(obj_id)
+
+        return obj
+
     def _get_public_method_names(self, obj):
         """ Get the names of all public methods on a class.
 
@@ -357,10 +703,78 @@ class Server(HasTraits):
 
         return public_method_names
 
+    def _get_query_options(self, request):
+        """ Get the options of a query from a request. """
+
+        names = ['sort', 'filters', 'offset', 'limit']
+
+        return dict(
+            (name, request[name]) for name in names if name in request
+        )
+
     def _get_type_name(self, obj):
         t = type(obj)
         return t.__module__ + '.' + t.__name__
 
+    def _get_visited_type_names(self):
+        """ Return the visited type names of the connections that the values
+        being marshalled are sent to (see '_hold').
+        """
+
+        connection = self._connection
+        if connection is None and len(self._all_connections) > 0:
+            connections = self._all_connections
+
+        else:
+            connections = [connection]
+
+        return [
+            self._visited_type_names.setdefault(each, set())
+            for each in connections
+        ]
+
+    def _get_window(self, query_id):
+        """ Get the window of a query.
+
+        Return a dict with the id of the 'query', the 'total' number of items
+        that match its filters, the 'offset' of the window and its 'items' (as
+        described by '_get_items_info').
+
+        """
+
+        query = self._queries[query_id]
+
+        return dict(
+            query  = query_id,
+            total  = query.total,
+            offset = query.offset,
+            items  = self._get_items_info(query.window())
+        )
+
+    def _hold(self, obj_id):
+        """ Note that an object is being sent to the connection whose request
+        is being handled (or to every connection if there is none).
+        """
+
+        # Without connections (i.e. with a single client) there is nothing to
+        # keep track of.
+        if len(self._all_connections) == 0:
+            return
+
+        connection = self._connection
+        if connection is None:
+            self._holders[obj_id] = self._all_connections
+
+        else:
+            holders = self._holders.get(obj_id)
+            if holders is None:
+                self._holders[obj_id] = frozenset([connection])
+
+            elif connection not in holders:
+                self._holders[obj_id] = holders.union([connection])
+
+        return
+
     def _marshal(self, obj):
         """ Marshal a value. """
 
@@ -393,7 +807,7 @@ class Server(HasTraits):
 
             if isinstance(obj, HasTraits):
                 obj.on_trait_change(
-                    self._send_object_changed_event,
+                    self._on_object_changed,
                     dispatch=self.trait_change_dispatch
                 )
         else:
@@ -401,6 +815,9 @@ class Server(HasTraits):
             value = obj
             info  = None
 
+        if type != 'primitive':
+            self._hold(value)
+
         return dict(type=type, value=value, info=info)
 
     def _marshal_all(self, iter):
@@ -415,7 +832,7 @@ class Server(HasTraits):
             value = obj['value']
 
         else:
-            value = self._id_to_object_map[obj['value']]
+            value = self._get_object(obj['value'])
 
         return value
 
@@ -424,6 +841,36 @@ class Server(HasTraits):
 
         return [self._unmarshal(obj) for obj in iter]
 
+    def _release(self, obj_id, holders, connection):
+        """ Release an object held by a connection.
+
+        Once no connection holds the object it is only weakly referenced and
+        we stop listening to it (see 'release').
+
+        """
+
+        holders = holders.difference([connection])
+        if len(holders) > 0:
+            self._holders[obj_id] = holders
+            return
+
+        self._holders.pop(obj_id, None)
+        obj = self._id_to_object_map.pop(obj_id, None)
+        if obj is None:
+            return
+
+        try:
+            self._released_objects[obj_id] = obj
+
+        except TypeError:
+            self._id_to_object_map[obj_id] = obj
+            return
+
+        if isinstance(obj, HasTraits):
+            obj.on_trait_change(self._on_object_changed, remove=True)
+
+        return
+
     def _register_object(self, obj):
         """ Register the given object with the server. """
 
@@ -439,6 +886,14 @@ class Server(HasTraits):
 
         return
 
+    def _on_object_changed(self, obj, trait_name, old, new):
+        """ Called when any trait of an object that we know about changes. """
+
+        with self._broadcasting():
+            self._send_object_changed_event(obj, trait_name, old, new)
+
+        return
+
     def _send_object_changed_event(self, obj, trait_name, old, new):
         """ Send an object changed event. """
 
@@ -477,10 +932,13 @@ class Server(HasTraits):
     def _send_context_updated_event(self, context):
         """ Send a context_updated event. """
 
+        with self._broadcasting():
+            data = self._context_ids(context)
+
         event = dict(
             obj  = 'jigna',
             name = 'context_updated',
-            data = self._context_ids(context)
+            data = data
         )
 
         self.send_event(event)
@@ -5,10 +5,16 @@
 # All right reserved.
 #
 
+import json
 from textwrap import dedent
 
 # Enthought library.
-from traits.api import Bool, HasTraits, Str, Property, Tuple, Int
+from traits.api import (
+    Any, Bool, Enum, HasTraits, Str, Property, Tuple, Int
+)
+
+# Local imports.
+from .core.static import script_tags, worker_url
 
 
 #### HTML template ############################################################
@@ -46,9 +52,29 @@ class Template(HasTraits):
     #: `body_html` and `head_html`.
     html_file = Str
 
-    #: The HTML template used for this.
+    #: The HTML template used for this. The '{jigna_scripts}' placeholder is
+    #: replaced with the script tags that load the JS bundle.
     html_template = Str
 
+    #: The JS bundle loaded by the template.
+    js_bundle = Str('jigna.js')
+
+    #: The encoding of the messages sent by a web server to the view, either
+    #: 'json' or 'compact' (see 'jigna.core.wire'). The compact encoding is
+    #: smaller but harder to read when debugging.
+    wire = Enum('json', 'compact')
+
+    #: Should the websocket to a web server live in a Web Worker? If so the
+    #: server's messages are decoded off the main thread (see
+    #: 'worker_bridge.js'), which keeps the UI responsive during big updates.
+    #: If 'shared' the worker (and the websocket) is shared by all of the
+    #: browser's tabs that view the same server.
+    worker = Enum(False, True, 'shared')
+
+    #: An optional 'jigna.core.type_manifest.TypeManifest' whose JS module is
+    #: loaded by the template (the server must have the same manifest).
+    type_manifest = Any
+
     #: The HTML for the entire document.
     #:
     #: The order of precedence in determining its value is:
@@ -77,10 +103,22 @@ class Template(HasTraits):
         # ...otherwise, create the template out of body and head htmls
         else:
             async = 'true' if self.async else 'false'
+            jigna_scripts = script_tags(self.js_bundle)
+            worker = (
+                'jigna-shared-worker.js' if self.worker == 'shared'
+                else 'jigna-worker.js'
+            )
+            if self.type_manifest is not None:
+                jigna_scripts += '\n' + self.type_manifest.script_tag()
+
             html = self.html_template.format(
-                body_html = self.body_html,
-                head_html = self.head_html,
-                async     = async,
+                body_html     = self.body_html,
+                head_html     = self.head_html,
+                async         = async,
+                wire          = self.wire,
+                worker        = json.dumps(self.worker),
+                worker_url    = worker_url(worker),
+                jigna_scripts = jigna_scripts,
             )
 
         return html
@@ -92,9 +130,12 @@ class Template(HasTraits):
         return dedent("""
         <html ng-app='jigna'>
           <head>
-            <script type="text/javascript" src="/jigna/jigna.js"></script>
+            {jigna_scripts}
             <script type="text/javascript">
-                jigna.initialize({{async: {async}}});
+                jigna.initialize({{
+                    async: {async}, wire: '{wire}', worker: {worker},
+                    worker_url: '{worker_url}'
+                }});
             </script>
 
             {head_html}
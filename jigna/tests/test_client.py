@@ -0,0 +1,171 @@
+import unittest
+
+try:
+    from tornado.testing import AsyncHTTPTestCase, gen_test
+    from tornado.web import Application
+except ImportError:
+    raise unittest.SkipTest("Tornado not installed")
+
+from traits.api import Dict, HasTraits, Instance, Int, List, Str, Undefined
+
+from jigna.client import Client, InstanceProxy, ListProxy, RequestError
+from jigna.web_server import AsyncWebServer, WebServer
+
+
+class Person(HasTraits):
+    name = Str
+    age = Int
+    spouse = Instance('Person')
+    fruits = List(Str)
+    friends = List(Instance('Person'))
+    phonebook = Dict(Str, Int)
+
+    def greet(self, greeting):
+        return '%s %s' % (greeting, self.name)
+
+    def fail(self):
+        raise ValueError('Oops')
+
+
+class TestAsyncClient(AsyncHTTPTestCase):
+
+    server_class = AsyncWebServer
+
+    wire = 'json'
+
+    def get_app(self):
+        self.fred = Person(name='Fred', age=42, fruits=['apple'])
+        self.server = self.server_class(
+            context={'model': self.fred}, html='', base_url='.'
+        )
+        return Application(self.server.handlers)
+
+    def tearDown(self):
+        self.client.close()
+        super(TestAsyncClient, self).tearDown()
+
+    def _create_client(self):
+        url = self.get_url('/_jigna_ws').replace('http', 'ws', 1)
+        self.client = Client(url=url, wire=self.wire)
+        return self.client
+
+    @gen_test
+    def test_connect_creates_models(self):
+        # When
+        models = yield self._create_client().connect()
+
+        # Then
+        model = models['model']
+        self.assertIsInstance(model, InstanceProxy)
+        self.assertIn('name', dir(model))
+
+    @gen_test
+    def test_get_and_set_attribute(self):
+        # Given
+        client = self._create_client()
+        model = (yield client.connect())['model']
+
+        # When
+        name = yield client.get_attribute(model, 'name')
+        yield client.set_instance_attribute(model, 'name', 'Freddie')
+
+        # Then
+        self.assertEqual(name, 'Fred')
+        self.assertEqual(self.fred.name, 'Freddie')
+        self.assertEqual(model.name, 'Freddie')
+
+    @gen_test
+    def test_server_changes_are_mirrored(self):
+        # Given
+        client = self._create_client()
+        model = (yield client.connect())['model']
+        fruits = yield client.get_attribute(model, 'fruits')
+
+        # When
+        self.fred.age = 43
+        self.fred.fruits.append('pear')
+        self.fred.spouse = Person(name='Wilma')
+        yield client.get_attribute(model, 'name')
+
+        # Then
+        self.assertEqual(model.age, 43)
+        self.assertIsInstance(fruits, ListProxy)
+        self.assertEqual(len(fruits), 2)
+        fruit = yield client.get_item(fruits, 1)
+        self.assertEqual(fruit, 'pear')
+        spouse = yield client.get_attribute(model.spouse, 'name')
+        self.assertEqual(spouse, 'Wilma')
+
+    @gen_test
+    def test_call_method(self):
+        # Given
+        client = self._create_client()
+        model = (yield client.connect())['model']
+
+        # When
+        result = yield model.greet('Hello')
+
+        # Then
+        self.assertEqual(result, 'Hello Fred')
+
+    @gen_test
+    def test_call_failing_method(self):
+        # Given
+        client = self._create_client()
+        model = (yield client.connect())['model']
+
+        # When/Then
+        with self.assertRaises(RequestError):
+            yield model.fail()
+
+
+    @gen_test
+    def test_lists_of_instances_are_sent_in_columns(self):
+        # Given
+        betty = Person(name='Betty')
+        self.fred.friends = [Person(name='Barney', age=40, spouse=betty), betty]
+        client = self._create_client()
+        model = (yield client.connect())['model']
+
+        # When
+        friends = yield client.get_attribute(model, 'friends')
+
+        # Then
+        self.assertEqual([friend.name for friend in friends], ['Barney', 'Betty'])
+        self.assertEqual(friends[0].age, 40)
+        self.assertNotIn('spouse', friends[0]._cache)
+        spouse = yield client.get_attribute(friends[0], 'spouse')
+        self.assertIs(spouse, friends[1])
+
+
+class TestAsyncClientCompactWire(TestAsyncClient):
+
+    wire = 'compact'
+
+
+class TestSyncClient(TestAsyncClient):
+
+    server_class = WebServer
+
+    @unittest.skip('The sync server only sends the length of lists.')
+    def test_lists_of_instances_are_sent_in_columns(self):
+        pass
+
+    @gen_test
+    def test_items_are_fetched_on_demand(self):
+        # Given
+        client = self._create_client()
+        model = (yield client.connect())['model']
+        fruits = yield client.get_attribute(model, 'fruits')
+
+        # When
+        before = fruits[0]
+        fruit = yield client.get_item(fruits, 0)
+
+        # Then
+        self.assertIs(before, Undefined)
+        self.assertEqual(fruit, 'apple')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import threading
+import unittest
+
+try:
+    from jigna.qt import QtWidgets
+except ImportError:
+    raise unittest.SkipTest("Qt not installed")
+
+from jigna.utils.gui import dispatcher_stats, invoke_later, process_events
+
+
+class TestInvokeLater(unittest.TestCase):
+
+    def setUp(self):
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def test_calls_from_threads_are_made_in_order_in_the_gui_thread(self):
+        # Given
+        calls = []
+        gui_thread = threading.current_thread()
+
+        def record(value):
+            calls.append((value, threading.current_thread() is gui_thread))
+
+        def worker():
+            for i in range(100):
+                invoke_later(record, i)
+
+        # When
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        before = dispatcher_stats()
+        process_events()
+
+        # Then
+        self.assertEqual(calls, [(i, True) for i in range(100)])
+        after = dispatcher_stats()
+        self.assertEqual(after['depth'], 0)
+        self.assertEqual(after['calls'] - before['calls'], 100)
+        self.assertGreaterEqual(after['max_depth'], 1)
+
+    def test_calls_made_by_calls_are_made_on_the_next_wakeup(self):
+        # Given
+        calls = []
+
+        def outer():
+            calls.append('outer')
+            invoke_later(calls.append, 'inner')
+
+        # When
+        invoke_later(outer)
+        invoke_later(calls.append, 'second')
+        process_events()
+        process_events()
+
+        # Then
+        self.assertEqual(calls, ['outer', 'second', 'inner'])
+
+    def test_errors_do_not_stop_the_batch(self):
+        # Given
+        calls = []
+
+        # When
+        invoke_later(lambda: 1 / 0)
+        invoke_later(calls.append, 'after')
+        process_events()
+
+        # Then
+        self.assertEqual(calls, ['after'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -119,7 +119,7 @@ body_html = """
 class TestJignaQt(unittest.TestCase):
 
     @classmethod
-    def setUpClass(cls):
+    def setUpClass(cls, bridge_mode='json'):
         from jigna.qt import QtWidgets
         from jigna.html_widget import HTMLWidget
         from jigna.utils import gui
@@ -129,7 +129,8 @@ class TestJignaQt(unittest.TestCase):
         addressbook = AddressBook()
         widget = HTMLWidget(
             template=template,
-            context={'model':fred, 'addressbook': addressbook}
+            context={'model':fred, 'addressbook': addressbook},
+            bridge_mode=bridge_mode
         )
         widget.show()
         gui.process_events()
@@ -162,6 +163,70 @@ class TestJignaQt(unittest.TestCase):
         from jigna.utils import gui
         gui.process_events()
 
+    def _hold_evicted_spouse(self, spouse):
+        """ Make 'window.held' refer to the proxy for the spouse once it has
+        been evicted (see 'jigna.MemoryManager').
+        """
+        self.execute_js(
+            "jigna.client._memory_manager.budget = 1;"
+            "jigna.client._memory_manager.low_water_mark = 0;"
+        )
+        self.addCleanup(
+            self.execute_js,
+            "jigna.client._memory_manager.budget = 0;"
+            "jigna.client._memory_manager.low_water_mark = 0.75;"
+            "jigna.client._memory_manager._proxies = {};"
+            "jigna.client._memory_manager._last_used = {};"
+            "jigna.client._memory_manager._size = 0;"
+        )
+
+        fred = self.fred
+        fred.spouse = spouse
+        fred.friends = [Person(name='Dino')]
+        self.assertJSEqual("jigna.models.model.spouse.name", spouse.name)
+        self.assertJSEqual("jigna.models.model.friends[0].name", 'Dino')
+        self.execute_js("window.held = jigna.models.model.spouse;")
+
+        fred.spouse = None
+        self.assertJSEqual("jigna.models.model.spouse === null", True)
+        self.execute_js("jigna.client._memory_manager.collect();")
+        self.assertJSEqual(
+            "jigna.client._id_to_proxy_map[window.held.__id__] === undefined",
+            True
+        )
+
+    def wait_for_js(self, js, value, timeout=1.0):
+        """ Wait until a JS expression has the given value. """
+        self.assertTrue(
+            sleep_while(lambda: self.assertJSEqual(js, value), timeout)
+        )
+
+    def _listen_to_batches(self):
+        """ Record the number of objects in every 'objects_changed' event
+        fired by the scheduler in 'window.batches' (and when it was fired in
+        'window.batch_times').
+        """
+        # Let any changes that are already scheduled go first.
+        self.wait_for_js("jigna.scheduler._pending", False)
+        self.execute_js("""
+            window.batches = [];
+            window.batch_times = [];
+            window.on_batch = function(event) {
+                window.batches.push(event.objects.length);
+                window.batch_times.push(Date.now());
+            };
+            jigna.add_listener('jigna', 'objects_changed', window.on_batch);
+        """)
+        self.addCleanup(self.execute_js, """
+            var listeners = jigna._listeners['jigna']['objects_changed'];
+            for (var index=0; index < listeners.length; index++) {
+                if (listeners[index].listener === window.on_batch) {
+                    listeners.splice(index, 1);
+                    break;
+                }
+            }
+        """)
+
     def assertJSEqual(self, js, value):
         result = self.execute_js(js)
         if isinstance(value, (list, tuple)):
@@ -247,6 +312,47 @@ class TestJignaQt(unittest.TestCase):
         del fred.fruits[::3]
         self.assertJSEqual("jigna.models.model.fruits", fred.fruits)
 
+    def test_list_proxy_is_an_array(self):
+        fred = self.fred
+        fred.fruits = ["peach", "pear", "mango"]
+        fruits = "jigna.models.model.fruits"
+
+        # Length and index access.
+        self.assertJSEqual("Array.isArray(%s)" % fruits, True)
+        self.assertJSEqual("%s.length" % fruits, 3)
+        self.assertJSEqual("%s[2]" % fruits, "mango")
+        self.assertJSEqual("%s[3] === undefined" % fruits, True)
+
+        # Describing an item does not fetch it.
+        self.assertJSEqual(
+            "typeof Object.getOwnPropertyDescriptor(%s, '1').get" % fruits,
+            "function"
+        )
+
+        # Iteration.
+        self.assertJSEqual("Object.keys(%s).join()" % fruits, "0,1,2")
+        self.assertJSEqual(
+            "%s.map(function(fruit) {return fruit;}).join()" % fruits,
+            "peach,pear,mango"
+        )
+        self.assertJSEqual(
+            "(function() {"
+            "    var fruits = [];"
+            "    for (var index in %s) {fruits.push(%s[index]);}"
+            "    return fruits.join();"
+            "})()" % (fruits, fruits),
+            "peach,pear,mango"
+        )
+
+        # Splicing.
+        fred.fruits[1:2] = ["kiwi", "lime"]
+        self.assertJSEqual("%s.length" % fruits, 4)
+        self.assertJSEqual("%s.join()" % fruits, "peach,kiwi,lime,mango")
+        del fred.fruits[0:3]
+        self.assertJSEqual("%s.length" % fruits, 1)
+        self.assertJSEqual("%s.slice(0).join()" % fruits, "mango")
+        self.assertJSEqual("%s[1] === undefined" % fruits, True)
+
     def test_dict_of_primitives(self):
         self.assertJSEqual("jigna.models.model.phonebook", {})
         fred = self.fred
@@ -296,6 +402,33 @@ class TestJignaQt(unittest.TestCase):
         self.assertEqual(wilma.name, "Wilmaji")
         self.assertEqual(wilma.age, 41)
 
+    def test_evicted_proxy_is_reused_when_received_again(self):
+        # Given
+        fred = self.fred
+        wilma = Person(name='Wilma', age=40)
+        self._hold_evicted_spouse(wilma)
+
+        # When
+        fred.spouse = wilma
+
+        # Then
+        self.assertJSEqual("jigna.models.model.spouse === window.held", True)
+        wilma.name = 'Wilmaji'
+        self.assertJSEqual("window.held.name", 'Wilmaji')
+
+    def test_evicted_proxy_is_fetched_again_when_used(self):
+        # Given
+        wilma = Person(name='Wilma', age=40)
+        self._hold_evicted_spouse(wilma)
+
+        # When
+        wilma.name = 'Wilmaji'
+
+        # Then
+        self.assertJSEqual("window.held.name", 'Wilmaji')
+        wilma.age = 41
+        self.assertJSEqual("window.held.age", 41)
+
     def test_list_of_instances(self):
         self.assertJSEqual("jigna.models.model.friends", [])
         dino = Person(name="Dino", age=10)
@@ -373,6 +506,126 @@ class TestJignaQt(unittest.TestCase):
         # Then
         self.assertJSEqual("jigna.models.model.new_name", "Freddie")
 
+    def test_changes_are_dispatched_to_their_proxies(self):
+        # Given
+        wilma = Person(name='Wilma')
+        self.fred.friends = [wilma, Person(name='Barney')]
+        self.assertJSEqual("jigna.models.model.friends[0].name", 'Wilma')
+        self.assertJSEqual("jigna.models.model.friends[1].name", 'Barney')
+        self.execute_js("""
+            window.heard = [];
+            jigna.add_listener(
+                jigna.models.model.friends[0], 'name', function(event) {
+                    window.heard.push(event.data.value);
+                }
+            );
+        """)
+
+        # When
+        wilma.name = 'Wilmaji'
+
+        # Then
+        self.assertJSEqual("jigna.models.model.friends[0].name", 'Wilmaji')
+        self.assertJSEqual("jigna.models.model.friends[1].name", 'Barney')
+        self.assertJSEqual("window.heard.join()", 'Wilmaji')
+
+    def test_events_without_a_proxy_reach_listeners(self):
+        # When
+        self.execute_js("""
+            window.heard = [];
+            jigna.add_listener('no-such-id', 'name', function(event) {
+                window.heard.push(event.data.value);
+            });
+            jigna.client._dispatch_event({
+                obj         : 'no-such-id',
+                name        : 'name',
+                items_event : false,
+                data        : {type: 'primitive', value: 'Dino', info: null}
+            });
+        """)
+        self.addCleanup(
+            self.execute_js, "delete jigna._listeners['no-such-id'];"
+        )
+
+        # Then
+        self.assertJSEqual("window.heard.join()", 'Dino')
+        self.assertJSEqual(
+            "jigna.client._id_to_proxy_map['no-such-id'] === undefined", True
+        )
+
+    def test_flush_fires_the_changes_at_once(self):
+        # Given
+        self._listen_to_batches()
+
+        # When
+        self.execute_js("""
+            var model = jigna.models.model;
+            jigna.scheduler.mark_changed(model);
+            jigna.scheduler.mark_changed(model);
+            jigna.scheduler.mark_changed({__id__: 'other'});
+            jigna.flush();
+            window.flushed = window.batches.join();
+        """)
+
+        # Then
+        self.assertJSEqual("window.flushed", '2')
+
+    def test_changes_are_coalesced_into_one_batch(self):
+        # Given
+        self._listen_to_batches()
+
+        # When
+        self.execute_js("""
+            var model = jigna.models.model;
+            jigna.scheduler.mark_changed(model);
+            jigna.scheduler.mark_changed({__id__: 'other'});
+            jigna.scheduler.mark_changed(model);
+            window.flushed = window.batches.join();
+        """)
+
+        # Then
+        self.assertJSEqual("window.flushed", '')
+        self.wait_for_js("window.batches.join()", '2')
+
+    def test_batches_are_limited_to_the_max_frequency(self):
+        # Given
+        self._listen_to_batches()
+        self.execute_js("jigna.scheduler.max_frequency = 4;")
+        self.addCleanup(
+            self.execute_js, "jigna.scheduler.max_frequency = 60;"
+        )
+
+        # When
+        self.execute_js("""
+            jigna.scheduler.mark_changed(jigna.models.model);
+            jigna.flush();
+            jigna.scheduler.mark_changed(jigna.models.model);
+        """)
+
+        # Then
+        self.wait_for_js("window.batches.join()", '1,1')
+        self.assertJSEqual(
+            "window.batch_times[1] - window.batch_times[0] >= 240", True
+        )
+
+    def test_zero_max_frequency_fires_every_change(self):
+        # Given
+        self._listen_to_batches()
+        self.execute_js("jigna.scheduler.max_frequency = 0;")
+        self.addCleanup(
+            self.execute_js, "jigna.scheduler.max_frequency = 60;"
+        )
+
+        # When
+        self.execute_js("""
+            jigna.scheduler.mark_changed(jigna.models.model);
+            jigna.scheduler.mark_changed(jigna.models.model);
+            window.flushed = window.batches.join();
+        """)
+
+        # Then
+        self.assertJSEqual("window.flushed", '1,1')
+
     def test_threaded_call(self):
         # When
         self.execute_js("""
@@ -425,6 +678,137 @@ class TestJignaQt(unittest.TestCase):
         self.assertJSEqual('jigna.models.addressbook.contacts[10].address', '10')
 
 
+class TestJignaQtEventBatching(unittest.TestCase):
+    """ Tests for the events sent in batches by the Qt server (see
+    'QueuedQtBridge').
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        from jigna.qt import QtWidgets
+        from jigna.html_widget import HTMLWidget
+        from jigna.utils import gui
+        qapp = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        template = Template(body_html=body_html)
+        fred = Person(name='Fred', age=42)
+        widget = HTMLWidget(template=template, context={'model': fred})
+        widget.show()
+        gui.process_events()
+        cls.widget = widget
+        cls.fred = fred
+
+    def setUp(self):
+        cls = self.__class__
+        self.widget = cls.widget
+        self.server = cls.widget._server
+        self.fred = cls.fred
+        self.fred.fruits = []
+        self.process_events()
+
+        # Record the names of the events in each call made to the client.
+        self.widget.execute_js(
+            "window.batches = [];"
+            "var bridge = jigna.client.bridge;"
+            "bridge.handle_events = function(events) {"
+            "    window.batches.push(events.map(function(e) {"
+            "        return e.name;"
+            "    }));"
+            "    jigna.QtBridge.prototype.handle_events.call(this, events);"
+            "};"
+            "bridge.handle_event = function(jsonized_event) {"
+            "    window.batches.push([JSON.parse(jsonized_event).name]);"
+            "    jigna.QtBridge.prototype.handle_event.call("
+            "        this, jsonized_event"
+            "    );"
+            "};"
+        )
+        self.addCleanup(
+            self.widget.execute_js,
+            "delete jigna.client.bridge.handle_events;"
+            "delete jigna.client.bridge.handle_event;"
+        )
+
+    def process_events(self):
+        from jigna.utils import gui
+        gui.process_events()
+
+    def test_events_are_sent_in_one_batch_in_order(self):
+        # When
+        self.fred.name = 'Wilma'
+        self.fred.age = 40
+        self.fred.name = 'Pebbles'
+
+        # Then
+        self.assertEqual(self.widget.execute_js("window.batches"), [])
+        self.process_events()
+        self.assertEqual(
+            self.widget.execute_js("window.batches"),
+            [['name', 'age', 'name']]
+        )
+        self.assertEqual(
+            self.widget.execute_js("jigna.models.model.name"), 'Pebbles'
+        )
+        self.assertEqual(self.widget.execute_js("jigna.models.model.age"), 40)
+
+    def test_events_queued_before_a_response_are_applied_after_it(self):
+        # Given
+        self.fred.fruits = ['peach']
+        self.process_events()
+        self.widget.execute_js("window.batches = [];")
+
+        # When
+        fruit = self.widget.execute_js(
+            "jigna.models.model.fruits[0] = 'pear';"
+            "jigna.models.model.fruits[0];"
+        )
+        self.fred.fruits.append('mango')
+        self.process_events()
+
+        # Then
+        self.assertEqual(fruit, 'pear')
+        self.assertEqual(self.fred.fruits, ['pear', 'mango'])
+        self.assertEqual(
+            self.widget.execute_js("window.batches"),
+            [['fruits', 'fruits']]
+        )
+        self.assertEqual(
+            self.widget.execute_js("jigna.models.model.fruits.length"), 2
+        )
+        self.assertEqual(
+            self.widget.execute_js("jigna.models.model.fruits[1]"), 'mango'
+        )
+
+    def test_events_are_sent_one_at_a_time_without_batching(self):
+        # Given
+        from jigna.qt_server import QtBridge
+        batched = self.server._bridge
+        self.server._bridge = QtBridge(webview=self.server.webview)
+        self.addCleanup(setattr, self.server, '_bridge', batched)
+
+        # When
+        self.fred.name = 'Wilma'
+        self.fred.age = 40
+
+        # Then
+        self.assertEqual(
+            self.widget.execute_js("window.batches"), [['name'], ['age']]
+        )
+        self.assertEqual(
+            self.widget.execute_js("jigna.models.model.name"), 'Wilma'
+        )
+
+    def test_line_separators_are_sent_escaped(self):
+        # When
+        self.fred.name = u'Fred\u2028Flintstone\u2029'
+        self.process_events()
+
+        # Then
+        self.assertEqual(
+            self.widget.execute_js("jigna.models.model.name"),
+            u'Fred\u2028Flintstone\u2029'
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,17 @@
+from __future__ import absolute_import
+import unittest
+
+from .test_jigna_qt import TestJignaQt
+
+
+class TestJignaQtNative(TestJignaQt):
+    @classmethod
+    def setUpClass(cls):
+        super(TestJignaQtNative, cls).setUpClass(bridge_mode='native')
+
+
+# Delete this so running just this file does not run all the tests.
+del TestJignaQt
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+import unittest
+
+from traits.api import HasTraits, Int, List, Str
+
+from jigna.core.list_query import ListQuery
+
+
+class Person(HasTraits):
+    name = Str
+    age = Int
+
+
+class AddressBook(HasTraits):
+    people = List(Person)
+
+
+def names(items):
+    return [item.name for item in items]
+
+
+class TestListQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.addressbook = AddressBook(
+            people=[
+                Person(name='Fred', age=42),
+                Person(name='Wilma', age=38),
+                Person(name='Pebbles', age=2),
+                Person(name='Barney', age=40),
+                Person(name='Betty', age=38),
+            ]
+        )
+        self.changes = []
+
+    def _open(self, **options):
+        query = ListQuery(
+            obj=self.addressbook, trait_name='people', **options
+        )
+        query.open()
+        query.on_trait_change(
+            lambda: self.changes.append(names(query.window())),
+            'window_changed'
+        )
+        self.addCleanup(query.close)
+
+        return query
+
+    def test_sort_and_filter(self):
+        # When
+        query = self._open(
+            sort=['-age', 'name'], filters=[['age', '>=', 18]], limit=3
+        )
+
+        # Then
+        self.assertEqual(query.total, 4)
+        self.assertEqual(names(query.window()), ['Fred', 'Barney', 'Betty'])
+
+    def test_window(self):
+        # Given
+        query = self._open(sort=['name'], limit=2)
+
+        # When
+        query.update(offset=2)
+
+        # Then
+        self.assertEqual(names(query.window()), ['Fred', 'Pebbles'])
+        self.assertEqual(self.changes, [])
+
+    def test_added_items_are_inserted_in_order(self):
+        # Given
+        query = self._open(sort=['age'], limit=2)
+
+        # When
+        self.addressbook.people.append(Person(name='Bamm-Bamm', age=1))
+
+        # Then
+        self.assertEqual(query.total, 6)
+        self.assertEqual(self.changes, [['Bamm-Bamm', 'Pebbles']])
+
+    def test_changes_outside_the_window_are_not_sent(self):
+        # Given
+        query = self._open(sort=['age'], limit=2)
+
+        # When
+        self.addressbook.people[0].age = 43
+        self.addressbook.people[3].age = 41
+
+        # Then
+        self.assertEqual(names(query.window()), ['Pebbles', 'Wilma'])
+        self.assertEqual(self.changes, [])
+
+    def test_total_is_sent_when_it_changes(self):
+        # Given
+        query = self._open(sort=['age'], limit=2)
+
+        # When
+        del self.addressbook.people[3]
+
+        # Then
+        self.assertEqual(query.total, 4)
+        self.assertEqual(self.changes, [['Pebbles', 'Wilma']])
+
+    def test_items_move_when_their_sort_key_changes(self):
+        # Given
+        query = self._open(sort=['age', 'name'], limit=3)
+
+        # When
+        self.addressbook.people[0].age = 30
+
+        # Then
+        self.assertEqual(
+            names(query.window()), ['Pebbles', 'Fred', 'Betty']
+        )
+        self.assertEqual(len(self.changes), 1)
+
+    def test_items_are_filtered_when_they_change(self):
+        # Given
+        query = self._open(filters=[['name', 'icontains', 'b']])
+
+        # When
+        self.addressbook.people[0].name = 'Bob'
+
+        # Then
+        self.assertEqual(
+            names(query.window()), ['Bob', 'Pebbles', 'Barney', 'Betty']
+        )
+
+    def test_unsorted_items_stay_in_the_order_of_the_list(self):
+        # Given
+        query = self._open(filters=[['age', '>=', 18]])
+        people = self.addressbook.people
+
+        # When
+        people.insert(1, Person(name='Dino', age=20))
+        people[3:5] = [Person(name='Bamm-Bamm', age=1), Person(name='Joe')]
+        people.append(people[0])
+
+        # Then
+        self.assertEqual(
+            names(query.window()), ['Fred', 'Dino', 'Wilma', 'Betty', 'Fred']
+        )
+
+    def test_unsorted_items_inserted_at_the_same_place(self):
+        # Given
+        query = self._open(filters=[['age', '>=', 18]])
+        people = self.addressbook.people
+
+        # When
+        for age in range(100):
+            people.insert(1, Person(name=str(age), age=age))
+        people[-1].age = 1
+        people[0].age = 1
+
+        # Then
+        expected = [str(age) for age in range(99, 17, -1)]
+        expected += ['Wilma', 'Barney']
+        self.assertEqual(names(query.window()), expected[:50])
+        self.assertEqual(query.total, len(expected))
+
+    def test_list_is_replaced(self):
+        # Given
+        query = self._open(sort=['name'])
+
+        # When
+        self.addressbook.people = [Person(name='Dino')]
+
+        # Then
+        self.assertEqual(names(query.window()), ['Dino'])
+        self.assertEqual(self.changes, [['Dino']])
+
+    def test_closed_query_stops_listening(self):
+        # Given
+        query = self._open(sort=['age'])
+        fred = self.addressbook.people[0]
+
+        # When
+        query.close()
+        fred.age = 1
+        self.addressbook.people.append(Person())
+
+        # Then
+        self.assertEqual(self.changes, [])
+
+    def test_invalid_queries_are_rejected(self):
+        invalid = [
+            dict(sort=['__class__']),
+            dict(filters=[['name', 'matches', 'F.*']]),
+            dict(filters=[['name', '==', {'a': 1}]]),
+            dict(filters=[['_secret', '==', 1]]),
+        ]
+        for options in invalid:
+            query = ListQuery(
+                obj=self.addressbook, trait_name='people', **options
+            )
+            with self.assertRaises(ValueError):
+                query.open()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+import threading
+import time
+import unittest
+
+import mock
+
+try:
+    from jigna.core.network_access import (
+        ProxyAccessManager, ProxyReplyWorker, ReplyBuffer
+    )
+    from jigna.qt import QtCore, QtNetwork, QtWidgets
+except ImportError:
+    raise unittest.SkipTest("Qt not installed")
+
+
+class TestReplyBuffer(unittest.TestCase):
+
+    def test_reads_span_chunks(self):
+        # Given
+        buffer = ReplyBuffer()
+        for chunk in (b'abc', b'defg', b'', b'hi'):
+            buffer.write(chunk)
+
+        # When
+        reads = [buffer.read(2), buffer.read(4), buffer.read(10)]
+
+        # Then
+        self.assertEqual(reads, [b'ab', b'cdef', b'ghi'])
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.read(10), b'')
+
+    def test_writer_waits_for_reader(self):
+        # Given
+        buffer = ReplyBuffer()
+        buffer.high_watermark = 8
+        buffer.low_watermark = 4
+        buffer.write(b'x' * 8)
+        self.assertTrue(buffer.is_full())
+        done = threading.Event()
+
+        def writer():
+            buffer.wait_for_reader()
+            done.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+
+        # When
+        self.assertFalse(done.wait(0.1))
+        buffer.read(5)
+        thread.join(5)
+
+        # Then
+        self.assertTrue(done.is_set())
+
+    def test_close_wakes_writer_and_discards_data(self):
+        # Given
+        buffer = ReplyBuffer()
+        buffer.low_watermark = 1
+        buffer.write(b'data')
+        thread = threading.Thread(target=buffer.wait_for_reader)
+        thread.start()
+
+        # When
+        buffer.close()
+        thread.join(5)
+        buffer.write(b'more')
+
+        # Then
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(buffer), 0)
+
+    def test_writer_stops_waiting_after_timeout(self):
+        # Given
+        buffer = ReplyBuffer()
+        buffer.low_watermark = 1
+        buffer.write(b'data')
+
+        # When
+        drained = buffer.wait_for_reader(timeout=0.1)
+
+        # Then
+        self.assertFalse(drained)
+        self.assertEqual(len(buffer), 4)
+
+
+class StreamingApp(object):
+    """ A WSGI app whose response is 'count' chunks of 'size' bytes. """
+
+    def __init__(self, count, size):
+        self.count = count
+        self.size = size
+        self.written = 0
+        self.closed = threading.Event()
+
+    def __call__(self, environ, start_response):
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        return self._response()
+
+    def _response(self):
+        try:
+            for index in range(self.count):
+                self.written += 1
+                yield b'x' * self.size
+        finally:
+            self.closed.set()
+
+
+class TestProxyReplyPool(unittest.TestCase):
+
+    def setUp(self):
+        self.qapp = (
+            QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        )
+
+        # Small watermarks so that the workers wait for the replies to be
+        # read.
+        for name, value in (('high_watermark', 8), ('low_watermark', 4)):
+            patcher = mock.patch.object(ReplyBuffer, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.app = StreamingApp(count=100, size=4)
+        self.manager = ProxyAccessManager(hosts={'jigna': self.app})
+        self.addCleanup(self.manager.thread_pool.waitForDone, 5000)
+
+    def _get(self):
+        request = QtNetwork.QNetworkRequest(QtCore.QUrl('http://jigna/data'))
+        return self.manager.get(request)
+
+    def _wait_for(self, condition, timeout=5.0):
+        start = time.time()
+        while not condition() and time.time() - start < timeout:
+            self.qapp.processEvents(QtCore.QEventLoop.AllEvents, 50)
+            time.sleep(0.01)
+
+        return condition()
+
+    def test_response_is_streamed_as_it_is_read(self):
+        # Given
+        reply = self._get()
+        data = []
+        reply.readyRead.connect(lambda: data.append(bytes(reply.readAll())))
+        finished = []
+        reply.finished.connect(lambda: finished.append(True))
+
+        # When
+        self._wait_for(lambda: len(finished) > 0)
+        data.append(bytes(reply.readAll()))
+
+        # Then
+        self.assertEqual(finished, [True])
+        self.assertEqual(b''.join(data), b'x' * 400)
+        self.assertTrue(self.app.closed.wait(5))
+
+    def test_closed_reply_releases_its_worker(self):
+        # Given
+        reply = self._get()
+        self._wait_for(lambda: self.app.written > 0)
+
+        # When
+        reply.close()
+
+        # Then
+        self.assertTrue(self.manager.thread_pool.waitForDone(5000))
+        self.assertTrue(self.app.closed.is_set())
+        self.assertLess(self.app.written, 100)
+
+    def test_destroyed_reply_releases_its_worker(self):
+        # Given
+        reply = self._get()
+        self._wait_for(lambda: self.app.written > 0)
+
+        # When
+        reply.deleteLater()
+        self.qapp.processEvents()
+        QtCore.QCoreApplication.sendPostedEvents(
+            None, QtCore.QEvent.DeferredDelete
+        )
+
+        # Then
+        self.assertTrue(self.manager.thread_pool.waitForDone(5000))
+        self.assertTrue(self.app.closed.is_set())
+
+    def test_reply_that_is_never_read_times_out(self):
+        # Given
+        patcher = mock.patch.object(ProxyReplyWorker, 'read_timeout', 0.1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # When
+        reply = self._get()
+
+        # Then
+        self.assertTrue(self.manager.thread_pool.waitForDone(5000))
+        self.assertTrue(self.app.closed.is_set())
+        self.assertLess(self.app.written, 100)
+        reply.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+
+from traits.api import HasTraits, Int
+
+from jigna.core.profiler import CallProfiler
+from jigna.server import Bridge, Server
+
+
+class Counter(HasTraits):
+    value = Int
+
+    def add(self, amount):
+        self.value += self._square(amount)
+        return self.value
+
+    def _square(self, amount):
+        return amount * amount
+
+
+class TestCallProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.counter = Counter()
+        self.profiler = CallProfiler()
+        self.server = Server(
+            context={'counter': self.counter}, profiler=self.profiler,
+            trait_change_dispatch='same'
+        )
+        self.server._bridge = DummyBridge()
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _call_add(self, amount):
+        request = dict(
+            kind='call_instance_method', id=str(id(self.counter)),
+            method_name='add', args=[dict(type='primitive', value=amount)]
+        )
+        return json.loads(self.server.handle_request(json.dumps(request)))
+
+    def test_calls_are_recorded(self):
+        # When
+        for amount in range(5):
+            self._call_add(amount)
+
+        # Then
+        rows = self.profiler.report()
+        self.assertEqual(len(rows), 1)
+        row = rows[0]
+        self.assertEqual(row['kind'], 'call_instance_method')
+        self.assertEqual(row['type_name'], 'jigna.tests.test_profiler.Counter')
+        self.assertEqual(row['name'], 'add')
+        self.assertEqual(row['count'], 5)
+        self.assertEqual(row['errors'], 0)
+        self.assertEqual(row['request_size']['count'], 5)
+        self.assertGreater(row['response_size']['total'], 0)
+
+    def test_errors_are_recorded(self):
+        # When
+        response = self._call_add('a')
+
+        # Then
+        self.assertIsNotNone(response['exception'])
+        self.assertEqual(self.profiler.report()[0]['errors'], 1)
+
+    def test_sampled_calls_are_saved(self):
+        # Given
+        self.profiler.sample(
+            'jigna.tests.test_profiler.Counter', 'add', calls=2
+        )
+        stats_file = os.path.join(self.tmpdir, 'jigna.pstats')
+        collapsed_file = os.path.join(self.tmpdir, 'jigna.collapsed')
+
+        # When
+        for amount in range(5):
+            self._call_add(amount)
+        self.profiler.dump_stats(stats_file)
+        self.profiler.dump_collapsed(collapsed_file)
+
+        # Then
+        stats = pstats.Stats(stats_file)
+        calls = [
+            entry[1] for func, entry in stats.stats.items()
+            if func[2] == '_square'
+        ]
+        self.assertEqual(calls, [2])
+        with open(collapsed_file) as f:
+            lines = f.read().splitlines()
+        self.assertTrue(any('add (' in line for line in lines))
+
+    def test_no_samples(self):
+        # When/Then
+        with self.assertRaises(ValueError):
+            self.profiler.dump_stats(os.path.join(self.tmpdir, 'x.pstats'))
+
+
+class DummyBridge(Bridge):
+    def send_event(self, event):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
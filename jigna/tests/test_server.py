@@ -0,0 +1,356 @@
+import gc
+import json
+import unittest
+
+from traits.api import Any, HasTraits, Instance, Int, List, Str
+
+from jigna.server import Bridge, Server
+
+
+class Address(HasTraits):
+    street = Str
+
+
+class Person(HasTraits):
+    name = Str
+    address = Instance(Address)
+    tags = Any
+
+
+class Contact(HasTraits):
+    name = Str
+    age = Int
+
+
+class AddressBook(HasTraits):
+    contacts = List(Contact)
+
+
+class EventRecorder(Bridge):
+    events = List
+
+    def send_event(self, event):
+        self.events.append(event)
+
+
+class TestRelease(unittest.TestCase):
+
+    def setUp(self):
+        self.person = Person(address=Address(street='Main St.'), tags=['a'])
+        self.server = Server(context={'person': self.person})
+
+    def _request(self, **request):
+        response = json.loads(self.server.handle_request(json.dumps(request)))
+        self.assertIsNone(response['exception'])
+        return response['result']
+
+    def _get_address_id(self):
+        return self._request(
+            kind='get_instance_attribute', id=str(id(self.person)),
+            attribute_name='address'
+        )['value']
+
+    def test_released_objects_are_used_while_alive(self):
+        # Given
+        address_id = self._get_address_id()
+
+        # When
+        self._request(kind='release', ids=[address_id])
+
+        # Then
+        self.assertNotIn(address_id, self.server._id_to_object_map)
+        street = self._request(
+            kind='get_instance_attribute', id=address_id,
+            attribute_name='street'
+        )
+        self.assertEqual(street['value'], 'Main St.')
+
+    def test_released_objects_are_held_again_when_used(self):
+        # Given
+        address_id = self._get_address_id()
+        self._request(kind='release', ids=[address_id])
+
+        # When
+        self._request(
+            kind='get_instance_attribute', id=address_id,
+            attribute_name='street'
+        )
+        address = self.person.address
+        self.person.address = Address()
+        gc.collect()
+
+        # Then
+        self.assertIs(self.server._get_object(address_id), address)
+        self.assertIn(address_id, self.server._id_to_object_map)
+
+    def test_describing_requests_does_not_hold_released_objects(self):
+        # Given
+        address_id = self._get_address_id()
+        self._request(kind='release', ids=[address_id])
+
+        # When
+        activity = self.server._describe_request(
+            dict(kind='get_instance_attribute', id=address_id)
+        )
+
+        # Then
+        self.assertEqual(activity[1], 'jigna.tests.test_server.Address')
+        self.assertNotIn(address_id, self.server._id_to_object_map)
+
+    def test_released_objects_can_be_garbage_collected(self):
+        # Given
+        address_id = self._get_address_id()
+
+        # When
+        self._request(kind='release', ids=[address_id])
+        self.person.address = Address()
+        gc.collect()
+
+        # Then
+        with self.assertRaises(KeyError):
+            self.server._get_object(address_id)
+
+    def test_plain_lists_are_kept(self):
+        # Given
+        tags_id = self._request(
+            kind='get_instance_attribute', id=str(id(self.person)),
+            attribute_name='tags'
+        )['value']
+
+        # When
+        self._request(kind='release', ids=[tags_id, 'unknown'])
+
+        # Then
+        self.assertIs(self.server._id_to_object_map[tags_id], self.person.tags)
+
+
+class TestReleaseWithConnections(unittest.TestCase):
+
+    def setUp(self):
+        self.person = Person(address=Address(street='Main St.'))
+        self.bridge = EventRecorder()
+        self.server = Server(
+            context={'person': self.person}, trait_change_dispatch='same'
+        )
+        self.server._bridge = self.bridge
+        self.first = object()
+        self.second = object()
+        self.server.add_connection(self.first)
+        self.server.add_connection(self.second)
+        self._request(self.first, kind='update_context')
+
+    def _request(self, connection, **request):
+        response = json.loads(
+            self.server.handle_request(json.dumps(request), connection)
+        )
+        self.assertIsNone(response['exception'])
+        return response['result']
+
+    def _get_address_id(self, connection):
+        return self._request(
+            connection, kind='get_instance_attribute',
+            id=str(id(self.person)), attribute_name='address'
+        )['value']
+
+    def _get_street(self, connection, address_id):
+        return self._request(
+            connection, kind='get_instance_attribute', id=address_id,
+            attribute_name='street'
+        )['value']
+
+    def test_objects_are_kept_while_another_connection_holds_them(self):
+        # Given
+        address_id = self._get_address_id(self.first)
+        self._get_address_id(self.second)
+
+        # When
+        self._request(self.first, kind='release', ids=[address_id])
+        self.person.address = Address()
+        gc.collect()
+
+        # Then
+        self.assertIn(address_id, self.server._id_to_object_map)
+        self.assertEqual(self._get_street(self.second, address_id), 'Main St.')
+
+    def test_objects_are_freed_once_every_connection_releases_them(self):
+        # Given
+        address_id = self._get_address_id(self.first)
+        self._get_address_id(self.second)
+        address = self.person.address
+
+        # When
+        self._request(self.first, kind='release', ids=[address_id])
+        self._request(self.second, kind='release', ids=[address_id])
+        del self.bridge.events[:]
+        address.street = 'Elm St.'
+
+        # Then
+        self.assertNotIn(address_id, self.server._id_to_object_map)
+        self.assertIs(self.server._get_object(address_id), address)
+        self.assertEqual(self.bridge.events, [])
+
+    def test_objects_are_only_held_by_the_connections_they_were_sent_to(self):
+        # Given
+        address_id = self._get_address_id(self.first)
+
+        # When
+        self._request(self.first, kind='release', ids=[address_id])
+
+        # Then
+        self.assertNotIn(address_id, self.server._id_to_object_map)
+
+    def test_closed_connections_hold_nothing(self):
+        # Given
+        address_id = self._get_address_id(self.first)
+        self._get_address_id(self.second)
+        self._request(self.first, kind='release', ids=[address_id])
+
+        # When
+        self.server.remove_connection(self.second)
+
+        # Then
+        self.assertNotIn(address_id, self.server._id_to_object_map)
+
+    def test_objects_sent_again_are_held_again(self):
+        # Given
+        address_id = self._get_address_id(self.first)
+        self._get_address_id(self.second)
+        self._request(self.first, kind='release', ids=[address_id])
+
+        # When
+        self._get_address_id(self.first)
+        self._request(self.second, kind='release', ids=[address_id])
+
+        # Then
+        self.assertIn(address_id, self.server._id_to_object_map)
+
+    def test_objects_in_events_are_held_by_every_connection(self):
+        # Given
+        address_id = self._get_address_id(self.first)
+
+        # When
+        address = self.person.address
+        self.person.trait_property_changed('address', None, address)
+        self._request(self.first, kind='release', ids=[address_id])
+
+        # Then
+        self.assertIn(address_id, self.server._id_to_object_map)
+
+
+class TestQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.addressbook = AddressBook(
+            contacts=[Contact(name=name, age=age) for name, age in
+                      [('Fred', 42), ('Wilma', 38), ('Pebbles', 2)]]
+        )
+        self.bridge = EventRecorder()
+        self.server = Server(
+            context={'addressbook': self.addressbook},
+            trait_change_dispatch='same'
+        )
+        self.server._bridge = self.bridge
+
+    def _request(self, **request):
+        response = json.loads(self.server.handle_request(json.dumps(request)))
+        self.assertIsNone(response['exception'])
+        return response['result']
+
+    def _names(self, window):
+        return [
+            self.server._get_object(item['value']).name
+            for item in window['items']['data']
+        ]
+
+    def _query(self):
+        return self._request(
+            kind='query_list', id=str(id(self.addressbook)),
+            attribute_name='contacts', sort=['age'],
+            filters=[['age', '>', 10]], limit=1
+        )
+
+    def test_query_list(self):
+        # When
+        window = self._query()
+
+        # Then
+        self.assertEqual(window['total'], 2)
+        self.assertEqual(window['offset'], 0)
+        self.assertEqual(self._names(window), ['Wilma'])
+
+    def test_window_events_are_sent_when_the_window_changes(self):
+        # Given
+        window = self._query()
+
+        # When
+        self.addressbook.contacts.append(Contact(name='Barney', age=20))
+
+        # Then
+        events = [
+            event for event in self.bridge.events if event['name'] == 'window'
+        ]
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['obj'], window['query'])
+        self.assertEqual(events[0]['data']['total'], 3)
+        self.assertEqual(self._names(events[0]['data']), ['Barney'])
+
+    def test_update_and_close_query(self):
+        # Given
+        query_id = self._query()['query']
+
+        # When
+        window = self._request(
+            kind='update_query', query=query_id, sort=['-age']
+        )
+        self._request(kind='close_query', query=query_id)
+        self.addressbook.contacts.append(Contact(name='Barney', age=20))
+
+        # Then
+        self.assertEqual(self._names(window), ['Fred'])
+        self.assertNotIn(query_id, self.server._queries)
+        self.assertEqual(self.bridge.events, [])
+
+    def test_query_ids_are_not_reused(self):
+        # Given
+        first = self._query()['query']
+        self._request(kind='close_query', query=first)
+
+        # When
+        second = self._query()['query']
+
+        # Then
+        self.assertNotEqual(first, second)
+
+    def test_queries_are_closed_with_their_connection(self):
+        # Given
+        self.server.add_connection('first')
+        self.server.add_connection('second')
+        first = json.loads(self.server.handle_request(json.dumps(dict(
+            kind='query_list', id=str(id(self.addressbook)),
+            attribute_name='contacts'
+        )), 'first'))['result']['query']
+        second = json.loads(self.server.handle_request(json.dumps(dict(
+            kind='query_list', id=str(id(self.addressbook)),
+            attribute_name='contacts'
+        )), 'second'))['result']['query']
+
+        # When
+        self.server.remove_connection('first')
+
+        # Then
+        self.assertNotIn(first, self.server._queries)
+        self.assertIn(second, self.server._queries)
+
+    def test_invalid_query_is_an_exception(self):
+        # When
+        response = json.loads(self.server.handle_request(json.dumps(dict(
+            kind='query_list', id=str(id(self.addressbook)),
+            attribute_name='contacts', filters=[['age', 'lambda', 1]]
+        ))))
+
+        # Then
+        self.assertIn('ValueError', response['exception'])
+
+
+if __name__ == '__main__':
+    unittest.main()
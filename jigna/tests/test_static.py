@@ -0,0 +1,255 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from jigna.core.static import (
+    HASHED_FILE, JS_DIST_DIR, UNSATISFIABLE, StaticFiles, bundle_files,
+    parse_range, script_tags, worker_url
+)
+from jigna.core.wsgi import FileLoader
+
+
+class TestParseRange(unittest.TestCase):
+
+    def test_parse_range(self):
+        # Given
+        cases = [
+            (None, None),
+            ('bytes=0-9', (0, 10)),
+            ('bytes=5-', (5, 100)),
+            ('bytes=-10', (90, 100)),
+            ('bytes=90-200', (90, 100)),
+            ('bytes=100-', UNSATISFIABLE),
+            ('bytes=-0', UNSATISFIABLE),
+            ('bytes=0-1,5-6', None),
+            ('bytes=9-5', None),
+            ('lines=1-2', None),
+        ]
+
+        for value, expected in cases:
+            # When
+            result = parse_range(value, 100)
+
+            # Then
+            self.assertEqual(result, expected, value)
+
+
+class TestStaticFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.static_files = StaticFiles(max_size=10, max_file_size=6)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, name, data, mtime=None):
+        path = os.path.join(self.root, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def _read(self, static_file, start=0, stop=None):
+        if stop is None:
+            stop = static_file.size
+        return b''.join(
+            self.static_files.iter_content(static_file, start, stop)
+        )
+
+    def test_changed_files_are_reloaded(self):
+        # Given
+        path = self._write('a.txt', b'hello', mtime=1000)
+        first = self.static_files.get(path)
+
+        # When
+        self._write('a.txt', b'hullo', mtime=2000)
+        second = self.static_files.get(path)
+
+        # Then
+        self.assertIs(self.static_files.get(path), second)
+        self.assertEqual(self._read(first), b'hello')
+        self.assertEqual(self._read(second), b'hullo')
+        self.assertNotEqual(first.etag, second.etag)
+
+    def test_least_recently_used_files_are_evicted(self):
+        # Given
+        a = self._write('a.txt', b'aaaa')
+        b = self._write('b.txt', b'bbbb')
+        c = self._write('c.txt', b'cccc')
+        cached_a = self.static_files.get(a)
+        self.static_files.get(b)
+
+        # When
+        self.assertIs(self.static_files.get(a), cached_a)
+        self.static_files.get(c)
+
+        # Then
+        self.assertIs(self.static_files.get(a), cached_a)
+        self.assertEqual(
+            list(self.static_files._files), [c, a]
+        )
+
+    def test_large_files_are_streamed(self):
+        # Given
+        self.static_files.chunk_size = 4
+        path = self._write('large.bin', b'0123456789')
+
+        # When
+        static_file = self.static_files.get(path)
+
+        # Then
+        self.assertIsNone(static_file.data)
+        self.assertEqual(
+            list(self.static_files.iter_content(static_file, 1, 9)),
+            [b'1234', b'5678']
+        )
+
+    def test_missing_files_and_directories(self):
+        self.assertIsNone(self.static_files.get(os.path.join(self.root, 'x')))
+        self.assertIsNone(self.static_files.get(self.root))
+
+    def test_conditional_requests(self):
+        # Given
+        path = self._write('a.txt', b'hello', mtime=1000)
+        static_file = self.static_files.get(path)
+        last_modified = static_file.last_modified
+
+        cases = [
+            ({}, 200),
+            ({'If-None-Match': static_file.etag}, 304),
+            ({'If-None-Match': 'W/' + static_file.etag}, 304),
+            ({'If-None-Match': '"other"'}, 200),
+            ({'If-Modified-Since': last_modified}, 304),
+            ({'If-Modified-Since': 'Thu, 01 Jan 1970 00:00:00 GMT'}, 200),
+            ({'Range': 'bytes=1-2'}, 206),
+            ({'Range': 'bytes=10-'}, 416),
+        ]
+
+        for headers, status in cases:
+            # When
+            response = self.static_files.prepare(static_file, headers.get)
+
+            # Then
+            self.assertEqual(response.status, status, headers)
+
+
+class TestBundles(unittest.TestCase):
+
+    def test_bundles_are_split_into_hashed_files(self):
+        for bundle in ('jigna.js', 'jigna-vue.js'):
+            # When
+            names = bundle_files(bundle)
+
+            # Then
+            self.assertEqual(len(names), 3)
+            for name in names:
+                self.assertTrue(HASHED_FILE.search(name), name)
+                for extension in ('', '.gz', '.br'):
+                    path = os.path.join(JS_DIST_DIR, name + extension)
+                    self.assertTrue(os.path.isfile(path), path)
+
+        self.assertEqual(bundle_files('other.js'), ['other.js'])
+
+    def test_workers_are_hashed(self):
+        for worker in ('jigna-worker.js', 'jigna-shared-worker.js'):
+            # When
+            url = worker_url(worker)
+
+            # Then
+            name = url[len('/jigna/'):]
+            self.assertTrue(url.startswith('/jigna/'), url)
+            self.assertTrue(HASHED_FILE.search(name), name)
+            self.assertTrue(name.startswith(worker[:-len('.js')]), name)
+            for extension in ('', '.gz', '.br'):
+                path = os.path.join(JS_DIST_DIR, name + extension)
+                self.assertTrue(os.path.isfile(path), path)
+
+    def test_script_tags(self):
+        # When
+        tags = script_tags('jigna.js', prefix='/static/')
+
+        # Then
+        self.assertEqual(
+            tags.splitlines(),
+            [
+                '<script type="text/javascript" src="/static/%s"></script>'
+                % name for name in bundle_files('jigna.js')
+            ]
+        )
+
+
+class TestFileLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        with open(os.path.join(self.root, 'index.html'), 'wb') as f:
+            f.write(b'<html></html>')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _call(self, path, mounts={}, **environ):
+        result = {}
+
+        def start_response(status, headers):
+            result['status'] = status
+            result['headers'] = dict(headers)
+
+        environ['PATH_INFO'] = path
+        loader = FileLoader(root=self.root, mounts=mounts)
+        result['body'] = b''.join(loader(environ, start_response))
+
+        return result
+
+    def test_get_file(self):
+        # When
+        result = self._call('/index.html')
+
+        # Then
+        self.assertEqual(result['status'], '200 OK')
+        self.assertEqual(result['body'], b'<html></html>')
+        self.assertEqual(result['headers']['Content-Type'], 'text/html')
+        self.assertEqual(result['headers']['Content-Length'], '13')
+
+    def test_get_unmodified_file(self):
+        # Given
+        etag = self._call('/index.html')['headers']['ETag']
+
+        # When
+        result = self._call('/index.html', HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        self.assertEqual(result['status'], '304 Not Modified')
+        self.assertEqual(result['body'], b'')
+
+    def test_get_mounted_file(self):
+        # Given
+        name = bundle_files('jigna.js')[-1]
+        mounts = {'jigna': JS_DIST_DIR}
+        os.mkdir(os.path.join(self.root, 'jigna'))
+        with open(os.path.join(self.root, 'jigna', 'app.js'), 'wb') as f:
+            f.write(b'app')
+
+        # When
+        mounted = self._call('/jigna/' + name, mounts=mounts)
+        not_mounted = self._call('/jigna/app.js', mounts=mounts)
+
+        # Then
+        with open(os.path.join(JS_DIST_DIR, name), 'rb') as f:
+            self.assertEqual(mounted['body'], f.read())
+        self.assertIn('immutable', mounted['headers']['Cache-Control'])
+        self.assertEqual(not_mounted['body'], b'app')
+
+    def test_get_missing_file(self):
+        # When
+        result = self._call('/missing.html')
+
+        # Then
+        self.assertEqual(result['status'], '404 File not found')
+
+
+if __name__ == '__main__':
+    unittest.main()
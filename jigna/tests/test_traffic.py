@@ -0,0 +1,138 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from tornado.testing import AsyncHTTPTestCase, bind_unused_port, gen_test
+    from tornado.httpserver import HTTPServer
+    from tornado.web import Application
+except ImportError:
+    raise unittest.SkipTest("Tornado not installed")
+
+from traits.api import HasTraits, Instance, Int, List, Str
+
+from jigna.client import Client
+from jigna.client.replay import Replayer
+from jigna.core.traffic import TrafficRecorder, read_traffic
+from jigna.web_server import AsyncWebServer
+
+
+class Person(HasTraits):
+    name = Str
+    age = Int
+    friends = List(Instance('Person'))
+
+    def greet(self, greeting):
+        return '%s %s' % (greeting, self.name)
+
+
+def create_person():
+    return Person(
+        name='Fred', age=42, friends=[Person(name='Barney', age=40)]
+    )
+
+
+class TestTrafficRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_records_are_read_back(self):
+        for filename in ('traffic.jsonl', 'traffic.jsonl.gz'):
+            # Given
+            path = os.path.join(self.root, filename)
+            recorder = TrafficRecorder(filename=path)
+
+            # When
+            recorder.record('request', 1, 0, '{}')
+            recorder.start()
+            recorder.record('request', 1, 0, '{"kind": "update_context"}')
+            recorder.record('event', None, -1, '{}')
+            recorder.stop()
+            recorder.record('response', 1, 0, '{}')
+
+            # Then
+            header, records = read_traffic(path)
+            records = list(records)
+            self.assertEqual(header['version'], 1)
+            self.assertEqual(recorder.count, 2)
+            self.assertEqual(
+                [(r.direction, r.socket, r.request_id) for r in records],
+                [('request', 1, 0), ('event', None, -1)]
+            )
+            self.assertEqual(records[0].payload, '{"kind": "update_context"}')
+
+    def test_unsupported_versions_are_rejected(self):
+        # Given
+        path = os.path.join(self.root, 'traffic.jsonl')
+        with open(path, 'w') as f:
+            f.write('{"version": 0}\n[0.0, "open", 1, null, null]\n')
+
+        # When/Then
+        with self.assertRaises(ValueError):
+            read_traffic(path)
+
+
+class TestRecordAndReplay(AsyncHTTPTestCase):
+
+    def get_app(self):
+        self.root = tempfile.mkdtemp()
+        self.filename = os.path.join(self.root, 'traffic.jsonl.gz')
+        self.recorder = TrafficRecorder(filename=self.filename)
+        self.recorder.start()
+
+        self.fred = create_person()
+        self.server = AsyncWebServer(
+            context={'model': self.fred}, html='', base_url='.',
+            recorder=self.recorder
+        )
+        return Application(self.server.handlers)
+
+    def tearDown(self):
+        self.recorder.stop()
+        shutil.rmtree(self.root)
+        super(TestRecordAndReplay, self).tearDown()
+
+    @gen_test
+    def test_replay_against_another_server(self):
+        # Given
+        url = self.get_url('/_jigna_ws').replace('http', 'ws', 1)
+        client = Client(url=url)
+        model = (yield client.connect())['model']
+        friends = yield client.get_attribute(model, 'friends')
+        barney = yield client.get_item(friends, 0)
+        yield client.get_attribute(barney, 'name')
+        yield client.set_instance_attribute(barney, 'age', 41)
+        yield model.greet('Hello')
+        client.close()
+        self.recorder.stop()
+
+        other = AsyncWebServer(
+            context={'model': create_person()}, html='', base_url='.'
+        )
+        sock, port = bind_unused_port()
+        http_server = HTTPServer(Application(other.handlers))
+        http_server.add_sockets([sock])
+
+        # When
+        header, records = read_traffic(self.filename)
+        replayer = Replayer(
+            url='ws://127.0.0.1:%d/_jigna_ws' % port, records=records,
+            speed=0
+        )
+        report = yield replayer.replay()
+        http_server.stop()
+
+        # Then
+        self.assertEqual(report['requests'], 6)
+        self.assertEqual(replayer.mismatches, [])
+        self.assertEqual(other.context['model'].friends[0].age, 41)
+        self.assertIn('get_item', report['kinds'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from traits.api import Event, HasTraits, Int, Str
+
+from jigna.core.type_manifest import TypeManifest, import_class, main
+from jigna.server import Server
+from jigna.web_server import AsyncWebServer
+
+
+class Person(HasTraits):
+    name = Str
+    age = Int
+    birthday = Event
+
+    def greet(self):
+        return 'Hello ' + self.name
+
+    def move(self, street):
+        return Address(street=street)
+
+
+class Address(HasTraits):
+    street = Str
+
+
+class EventCollector(object):
+    """ A fake websocket that collects the events sent by the server. """
+
+    def __init__(self):
+        self.events = []
+
+    def write_message(self, message, binary=False):
+        self.events.append(json.loads(json.loads(message)[1]))
+
+
+class TestTypeManifest(unittest.TestCase):
+
+    def test_types_are_described_as_the_server_would(self):
+        # When
+        manifest = TypeManifest.from_classes([Person, Address])
+
+        # Then
+        person = Person()
+        self.assertEqual(
+            manifest.type_names, [
+                Server()._get_type_name(Address()),
+                Server()._get_type_name(person)
+            ]
+        )
+        self.assertEqual(manifest.types[1], Server()._get_instance_info(person))
+
+    def test_hash_depends_only_on_the_types(self):
+        # When
+        manifest = TypeManifest.from_classes([Person, Address])
+        same = TypeManifest.from_classes([Address, Person])
+        other = TypeManifest.from_classes([Person])
+
+        # Then
+        self.assertEqual(manifest.hash, same.hash)
+        self.assertNotEqual(manifest.hash, other.hash)
+        self.assertEqual(manifest.filename, 'jigna-types.%s.js' % manifest.hash)
+        self.assertIn('jigna.register_types("%s", ' % manifest.hash, manifest.to_js())
+
+    def test_command_line(self):
+        # Given
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        name = __name__ + ':Person'
+
+        # When
+        main([name, '-o', directory])
+
+        # Then
+        manifest = TypeManifest.load(os.path.join(directory, 'jigna-types.json'))
+        self.assertEqual(
+            sorted(os.listdir(directory)),
+            [manifest.filename, 'jigna-types.json']
+        )
+        self.assertIs(import_class(name), Person)
+        self.assertEqual(manifest.types, TypeManifest.from_classes([Person]).types)
+
+    def test_server_does_not_send_types_in_the_clients_manifest(self):
+        # Given
+        manifest = TypeManifest.from_classes([Person])
+        server = AsyncWebServer(
+            context={'model': Person(name='Fred')}, html='', base_url='.',
+            type_manifest=manifest
+        )
+        collector = EventCollector()
+        server._bridge.add_socket(collector)
+
+        # When
+        for hash in ['0123456789', manifest.hash]:
+            server.handle_request(
+                json.dumps(dict(kind='update_context', type_manifest=hash))
+            )
+
+        # Then
+        names = [event['name'] for event in collector.events]
+        self.assertEqual(names, ['new_type', 'context_updated', 'context_updated'])
+
+    def test_types_in_a_clients_manifest_are_sent_to_other_clients(self):
+        # Given
+        manifest = TypeManifest.from_classes([Person, Address])
+        server = AsyncWebServer(
+            context={'model': Person(name='Fred')}, html='', base_url='.',
+            type_manifest=manifest
+        )
+        collector = EventCollector()
+        server._bridge.add_socket(collector)
+        without_manifest, with_manifest = object(), object()
+        server.add_connection(without_manifest)
+        server.add_connection(with_manifest)
+        server.handle_request(
+            json.dumps(dict(kind='update_context')), without_manifest
+        )
+        server.handle_request(
+            json.dumps(dict(kind='update_context', type_manifest=manifest.hash)),
+            with_manifest
+        )
+        del collector.events[:]
+
+        # When
+        model = server.context['model']
+        server.handle_request(
+            json.dumps(dict(
+                kind='call_instance_method', id=str(id(model)),
+                method_name='move', args=[server._marshal('Main Street')]
+            )),
+            without_manifest
+        )
+
+        # Then
+        types = [
+            event['data']['type_name'] for event in collector.events
+            if event['name'] == 'new_type'
+        ]
+        self.assertEqual(types, [server._get_type_name(Address())])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import threading
+import time
+import unittest
+
+try:
+    from tornado.ioloop import IOLoop
+except ImportError:
+    raise unittest.SkipTest("Tornado not installed")
+
+from traits.api import HasTraits, Str
+
+from jigna.core.stats import Histogram
+from jigna.core.watchdog import LoopWatchdog
+from jigna.server import Server
+
+
+class Model(HasTraits):
+    name = Str
+
+    def block(self, watchdog):
+        with watchdog.activity('call_instance_method', 'Model', 'block'):
+            time.sleep(0.5)
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_add_values(self):
+        # Given
+        histogram = Histogram(bounds=(1, 10))
+
+        # When
+        for value in (0.5, 5, 5, 50):
+            histogram.add(value)
+
+        # Then
+        self.assertEqual(histogram.counts, [1, 2, 1])
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.maximum, 50)
+        self.assertEqual(histogram.percentile(50), 10)
+        self.assertEqual(histogram.percentile(100), 50)
+
+    def test_empty_histogram(self):
+        # Given
+        histogram = Histogram()
+
+        # When
+        summary = histogram.as_dict()
+
+        # Then
+        self.assertEqual(summary['count'], 0)
+        self.assertIsNone(summary['p99'])
+
+
+class TestLoopWatchdog(unittest.TestCase):
+
+    def setUp(self):
+        self.io_loop = IOLoop()
+        self.thread = threading.Thread(target=self.io_loop.start)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def tearDown(self):
+        self.io_loop.add_callback(self.io_loop.stop)
+        self.thread.join(2)
+        self.io_loop.close()
+
+    def test_lag_is_measured(self):
+        # Given
+        watchdog = LoopWatchdog(io_loop=self.io_loop, interval=0.01)
+
+        # When
+        watchdog.start()
+        time.sleep(0.2)
+        watchdog.stop()
+
+        # Then
+        self.assertGreater(watchdog.histogram.count, 0)
+        self.assertEqual(watchdog.reports, [])
+
+    def test_stall_captures_stack_and_activity(self):
+        # Given
+        model = Model()
+        watchdog = LoopWatchdog(
+            io_loop=self.io_loop, interval=0.01, threshold=0.1
+        )
+        watchdog.start()
+        time.sleep(0.1)
+
+        # When
+        self.io_loop.add_callback(model.block, watchdog)
+        time.sleep(0.8)
+        watchdog.stop()
+
+        # Then
+        self.assertEqual(len(watchdog.reports), 1)
+        report = watchdog.reports[0]
+        self.assertIn('in block', report['stack'])
+        self.assertEqual(report['kind'], 'call_instance_method')
+        self.assertEqual(report['type_name'], 'Model')
+        self.assertEqual(report['name'], 'block')
+        self.assertGreaterEqual(report['lag'], 0.4)
+
+
+class TestServerActivity(unittest.TestCase):
+
+    def test_describe_request(self):
+        # Given
+        model = Model()
+        server = Server(context={'model': model})
+        request = dict(
+            kind='get_instance_attribute', id=str(id(model)),
+            attribute_name='name'
+        )
+
+        # When
+        activity = server._describe_request(request)
+
+        # Then
+        self.assertEqual(
+            activity, (
+                'get_instance_attribute', 'jigna.tests.test_watchdog.Model',
+                'name'
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,33 @@
+import base64
+import json
 import os
+import shutil
+import struct
 import sys
 import tempfile
 import unittest
 
 import mock
 
+from tornado.testing import AsyncHTTPTestCase, gen_test
 from tornado.web import Application
-from tornado.httputil import HTTPServerRequest
+from tornado.httputil import HTTPHeaders, HTTPServerRequest
+from tornado.tcpclient import TCPClient
+from tornado.websocket import websocket_connect
 
-from jigna.web_server import MainHandler, normalize_slice
+from traits.api import HasTraits, Instance, Str
+
+from jigna.core.static import JS_DIST_DIR, bundle_files, static_files
+from jigna.core.type_manifest import TypeManifest
+from jigna.web_server import (
+    AsyncWebServer, JSBundleHandler, MainHandler, WebServer, normalize_slice
+)
+
+try:
+    from urllib import urlencode
+except ImportError:
+    # The above import will not work on Python-3.x.
+    from urllib.parse import urlencode
 
 # A dummy image to write and test with.
 DATA = b"""\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x05\x00\x00\x00\x05\x08\x06\x00\x00\x00\x8do&\xe5\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\tpHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x01YiTXtXML:com.adobe.xmp\x00\x00\x00\x00\x00<x:xmpmeta xmlns:x="adobe:ns:meta/" x:xmptk="XMP Core 5.4.0">\n   <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">\n      <rdf:Description rdf:about=""\n            xmlns:tiff="http://ns.adobe.com/tiff/1.0/">\n         <tiff:Orientation>1</tiff:Orientation>\n      </rdf:Description>\n   </rdf:RDF>\n</x:xmpmeta>\nL\xc2\'Y\x00\x00\x00tIDAT\x08\x1d\x01i\x00\x96\xff\x01\x00\x1cj\xff}e0\x00;8*\x00\xcb\xcd\xd9\x00\xa2\xad\xd3\x00\x04gP!\x00<9)\x00\x03\x03\x03\x00YVC\x00\xd7\xd9\xe5\x00\x04\x08\x08\x01\x00\xb0\xb4\xc3\x00\n\x08\r\x00\x0f\x0e\x08\x00\xf7\xf8\xfd\x00\x04\xe1\xe3\xf1\x0030\x18\x00\xfc\xfb\x03\x00>>0\x00\x04\x05\x03\x00\x03\xef\xff0\x80\xef\xed\xf3\x00>:$\x00\xdc\xdc\xe5\x00y\x88\xc9\x00\x9a\xa5"\x98\x19\x929\xa9\x00\x00\x00\x00IEND\xaeB`\x82"""
@@ -46,8 +65,9 @@ class TestMainHandler(unittest.TestCase):
         with open(self.tmpfile, 'wb') as fp:
             fp.write(DATA)
 
-    def _make_request(self, path):
+    def _make_request(self, path, **headers):
         request = mock.MagicMock(spec=HTTPServerRequest)()
+        request.headers = HTTPHeaders(headers)
         if sys.platform.startswith('win'):
             request.path = '/' + path
         else:
@@ -95,6 +115,296 @@ class TestMainHandler(unittest.TestCase):
         # Then
         self.assertEqual(h.test_data, DATA)
 
+    def test_get_unmodified_data(self):
+        # Given
+        self._make_binary_data()
+        app = Application()
+        server = DummyServer()
+        h = TestableMainHandler(
+            app, self._make_request(self.tmpfile), server=server
+        )
+        h.get()
+        etag = h._headers['ETag']
+
+        # When
+        request = self._make_request(self.tmpfile, **{'If-None-Match': etag})
+        h = TestableMainHandler(app, request, server=server)
+        h.test_data = None
+        h.get()
+
+        # Then
+        self.assertEqual(h.get_status(), 304)
+        self.assertIsNone(h.test_data)
+
+    def test_get_range_of_data(self):
+        # Given
+        self._make_binary_data()
+        request = self._make_request(self.tmpfile, Range='bytes=1-3')
+        app = Application()
+        server = DummyServer()
+
+        # When
+        h = TestableMainHandler(app, request, server=server)
+        h.get()
+
+        # Then
+        self.assertEqual(h.get_status(), 206)
+        self.assertEqual(h.test_data, DATA[1:4])
+        self.assertEqual(
+            h._headers['Content-Range'], 'bytes 1-3/%d' % len(DATA)
+        )
+
+
+class TestMainHandlerWithLargeFiles(AsyncHTTPTestCase):
+
+    def get_app(self):
+        self.root = tempfile.mkdtemp()
+        with open(os.path.join(self.root, 'image.png'), 'wb') as f:
+            f.write(DATA)
+
+        server = AsyncWebServer(context={}, html='', base_url=self.root)
+        return Application(server.handlers)
+
+    def tearDown(self):
+        super(TestMainHandlerWithLargeFiles, self).tearDown()
+        shutil.rmtree(self.root)
+
+    def test_files_that_are_not_cached_are_read_in_chunks(self):
+        # Given
+        patcher = mock.patch.object(static_files, 'max_file_size', 10)
+
+        # When
+        with patcher:
+            response = self.fetch('/image.png')
+            partial = self.fetch('/image.png', headers={'Range': 'bytes=1-3'})
+
+        # Then
+        self.assertEqual(response.body, DATA)
+        self.assertEqual(partial.code, 206)
+        self.assertEqual(partial.body, DATA[1:4])
+
+
+class TestJSBundleHandler(AsyncHTTPTestCase):
+
+    def get_app(self):
+        return Application(
+            [(r"/jigna/(.*)", JSBundleHandler, dict(path=JS_DIST_DIR))]
+        )
+
+    def _read(self, name):
+        with open(os.path.join(JS_DIST_DIR, name), 'rb') as f:
+            return f.read()
+
+    def test_precompressed_files_are_negotiated(self):
+        # Given
+        name = bundle_files('jigna.js')[-1]
+        url = '/jigna/' + name
+        cases = [
+            ('', None, name),
+            ('gzip, deflate', 'gzip', name + '.gz'),
+            ('gzip, br', 'br', name + '.br'),
+            ('br;q=0, gzip', 'gzip', name + '.gz'),
+        ]
+
+        for accept_encoding, encoding, served in cases:
+            # When
+            response = self.fetch(
+                url, headers={'Accept-Encoding': accept_encoding},
+                decompress_response=False
+            )
+
+            # Then
+            self.assertEqual(response.code, 200)
+            self.assertEqual(response.body, self._read(served))
+            self.assertEqual(
+                response.headers.get('Content-Encoding'), encoding
+            )
+            self.assertIn('javascript', response.headers['Content-Type'])
+            self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+            self.assertIn('immutable', response.headers['Cache-Control'])
+
+    def test_unhashed_files_are_not_immutable(self):
+        # When
+        response = self.fetch('/jigna/jigna.js')
+
+        # Then
+        self.assertEqual(response.code, 200)
+        self.assertNotIn('Cache-Control', response.headers)
+
+    def test_worker_scripts_are_served(self):
+        for name in ['jigna-worker.js', 'jigna-shared-worker.js']:
+            # When
+            response = self.fetch('/jigna/' + name)
+
+            # Then
+            self.assertEqual(response.code, 200)
+            self.assertIn('javascript', response.headers['Content-Type'])
+            self.assertEqual(response.body, self._read(name))
+
+
+class Model(HasTraits):
+    name = Str
+
+
+class TestTypeManifestHandler(AsyncHTTPTestCase):
+
+    def get_app(self):
+        self.manifest = TypeManifest.from_classes([Model])
+        self.server = AsyncWebServer(
+            html='', base_url='.', type_manifest=self.manifest
+        )
+        return Application(self.server.handlers)
+
+    def test_manifest_module_is_served_immutable(self):
+        # When
+        response = self.fetch('/jigna/' + self.manifest.filename)
+
+        # Then
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.body.decode('utf-8'), self.manifest.to_js())
+        self.assertIn('immutable', response.headers['Cache-Control'])
+
+    def test_other_manifests_are_not_found(self):
+        # When
+        response = self.fetch('/jigna/jigna-types.0123456789.js')
+
+        # Then
+        self.assertEqual(response.code, 404)
+
+
+class Owner(HasTraits):
+    pet = Instance(Model)
+
+
+class TestSyncGETHandler(AsyncHTTPTestCase):
+
+    def get_app(self):
+        self.owner = Owner(pet=Model(name='Dino'))
+        self.server = WebServer(
+            context={'owner': self.owner}, html='', base_url='.'
+        )
+        return Application(self.server.handlers)
+
+    @gen_test
+    def test_objects_are_held_by_the_connection_that_asked(self):
+        # Given
+        url = self.get_url('/_jigna_ws').replace('http', 'ws', 1)
+        first = yield websocket_connect(url + '?connection=first')
+        second = yield websocket_connect(url)
+        request = json.dumps(dict(
+            kind='get_instance_attribute', id=str(id(self.owner)),
+            attribute_name='pet'
+        ))
+
+        # When
+        response = yield self.http_client.fetch(self.get_url(
+            '/_jigna?' + urlencode(dict(data=request, connection='first'))
+        ))
+
+        # Then
+        pet_id = json.loads(response.body.decode('utf-8'))['result']['value']
+        connection = self.server._connections_by_id['first']
+        self.assertEqual(
+            self.server._holders[pet_id], frozenset([connection])
+        )
+
+        first.close()
+        second.close()
+
+
+class TestWebSocketCompression(AsyncHTTPTestCase):
+
+    def get_app(self):
+        self.model = Model(name='x' * 1000)
+        self.server = AsyncWebServer(
+            context={'model': self.model}, html='', base_url='.'
+        )
+        return Application(self.server.handlers)
+
+    @gen_test
+    def _get_name(self, extensions):
+        """ Request the model's name over a websocket whose client offers the
+        given extensions, and return the frame of the response as sent on the
+        wire: whether it is compressed and the size of its payload.
+        """
+        stream = yield TCPClient().connect('127.0.0.1', self.get_http_port())
+        headers = [
+            'GET /_jigna_ws HTTP/1.1',
+            'Host: 127.0.0.1:%d' % self.get_http_port(),
+            'Upgrade: websocket',
+            'Connection: Upgrade',
+            'Sec-WebSocket-Key: %s' % base64.b64encode(os.urandom(16)).decode(),
+            'Sec-WebSocket-Version: 13',
+        ]
+        if extensions is not None:
+            headers.append('Sec-WebSocket-Extensions: ' + extensions)
+        yield stream.write(('\r\n'.join(headers) + '\r\n\r\n').encode())
+        response = yield stream.read_until(b'\r\n\r\n')
+        self.assertIn(b' 101 ', response.split(b'\r\n')[0])
+
+        request = json.dumps(dict(
+            kind='get_instance_attribute', id=str(id(self.model)),
+            attribute_name='name'
+        ))
+        yield stream.write(_frame(json.dumps([0, request]).encode()))
+
+        first, length = bytearray((yield stream.read_bytes(2)))
+        length &= 0x7f
+        if length == 126:
+            length, = struct.unpack('!H', (yield stream.read_bytes(2)))
+
+        elif length == 127:
+            length, = struct.unpack('!Q', (yield stream.read_bytes(8)))
+
+        yield stream.read_bytes(length)
+        stream.close()
+
+        # The RSV1 bit marks compressed messages.
+        return bool(first & 0x40), length
+
+    def test_messages_are_compressed(self):
+        # When
+        compressed, length = self._get_name('permessage-deflate')
+
+        # Then
+        self.assertTrue(compressed)
+        self.assertLess(length, 1000)
+
+    def test_compression_can_be_disabled(self):
+        # Given
+        self.server.compression = False
+
+        # When
+        compressed, length = self._get_name('permessage-deflate')
+
+        # Then
+        self.assertFalse(compressed)
+        self.assertGreater(length, 1000)
+
+    def test_client_without_compression(self):
+        # When
+        compressed, length = self._get_name(None)
+
+        # Then
+        self.assertFalse(compressed)
+        self.assertGreater(length, 1000)
+
+
+def _frame(payload):
+    """ Return a (masked) websocket text frame as sent by a client. """
+
+    mask = bytearray(os.urandom(4))
+    masked = bytearray(
+        byte ^ mask[index % 4] for index, byte in enumerate(bytearray(payload))
+    )
+    if len(masked) < 126:
+        header = struct.pack('!BB', 0x81, 0x80 | len(masked))
+
+    else:
+        header = struct.pack('!BBH', 0x81, 0x80 | 126, len(masked))
+
+    return header + bytes(mask) + bytes(masked)
+
 
 class TestNormalizeSlice(unittest.TestCase):
     def test_simple_slice(self):
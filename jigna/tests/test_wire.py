@@ -0,0 +1,180 @@
+import json
+import unittest
+
+from traits.api import HasTraits, Int, List, Str
+
+from jigna.core.wire import CompactDecoder, CompactEncoder, LIST, RAW
+from jigna.web_server import AsyncWebServer
+
+
+class Person(HasTraits):
+    name = Str
+    age = Int
+    friends = List(Str)
+
+
+class MessageCollector(object):
+    """ A fake websocket that collects the events sent by the server. """
+
+    def __init__(self):
+        self.messages = []
+
+    def write_message(self, message, binary=False):
+        self.messages.append(message)
+
+
+class TestCompactWire(unittest.TestCase):
+
+    def setUp(self):
+        self.fred = Person(name='Fred', age=42, friends=['Wilma', 'Barney'])
+        self.server = AsyncWebServer(
+            context={'model': self.fred}, html='', base_url='.'
+        )
+        self.collector = MessageCollector()
+        self.server._bridge.add_socket(self.collector)
+        self.encoder = CompactEncoder()
+        self.decoder = CompactDecoder()
+
+    def _round_trip(self, message):
+        # Go through JSON as the messages do.
+        return self.decoder.decode(json.loads(json.dumps(message)))
+
+    def _events(self):
+        events = [json.loads(json.loads(m)[1]) for m in self.collector.messages]
+        self.collector.messages = []
+        return events
+
+    def test_events_round_trip(self):
+        # Given
+        self.server.handle_request(json.dumps(dict(kind='update_context')))
+        self.server._marshal(self.fred.friends)
+        self.fred.age = 43
+        self.fred.friends.append('Betty')
+        self.fred.friends[0:2] = ['Dino']
+
+        # When
+        events = self._events()
+        decoded = [
+            self._round_trip(self.encoder.encode_event(event))[1]
+            for event in events
+        ]
+
+        # Then
+        expected = json.loads(json.dumps(events))
+        for event in expected:
+            # Object ids are always decoded as strings.
+            if event.get('items_event'):
+                event['data']['value'] = str(event['data']['value'])
+
+        self.assertEqual(len(events), 5)
+        self.assertEqual(decoded, expected)
+
+    def test_responses_round_trip(self):
+        # Given
+        self.server.handle_request(json.dumps(dict(kind='update_context')))
+        requests = [
+            dict(kind='get_instance_attribute', id=str(id(self.fred)),
+                 attribute_name='friends'),
+            dict(kind='get_instance_attribute', id=str(id(self.fred)),
+                 attribute_name='name'),
+            dict(kind='set_instance_attribute', id=str(id(self.fred)),
+                 attribute_name='name', value=dict(type='primitive', value='F')),
+            dict(kind='get_instance_attribute', id='missing',
+                 attribute_name='name'),
+        ]
+
+        for request in requests:
+            # When
+            response = json.loads(self.server.handle_request(json.dumps(request)))
+            request_id, decoded = self._round_trip(
+                self.encoder.encode_response(7, response)
+            )
+
+            # Then
+            self.assertEqual(request_id, 7)
+            self.assertEqual(decoded, response)
+
+    def test_columns_round_trip(self):
+        # Given
+        people = [Person(name='Wilma'), Person(name='Barney', age=40)]
+        response = dict(exception=None, result=self.server._marshal(people))
+
+        # When
+        message = self.encoder.encode_response(7, response)
+
+        # Then
+        self.assertIn('columns', response['result']['info'])
+        self.assertEqual(message[1][0][0], LIST)
+        self.assertEqual(
+            self._round_trip(message)[1], json.loads(json.dumps(response))
+        )
+
+    def test_strings_are_sent_once(self):
+        # Given
+        event = dict(
+            obj=str(id(self.fred)), name='age', items_event=False,
+            data=dict(type='primitive', value=1, info=None)
+        )
+
+        # When
+        first = self.encoder.encode_event(event)
+        second = self.encoder.encode_event(event)
+
+        # Then
+        self.assertEqual(first[2], [str(id(self.fred)), 'age'])
+        self.assertEqual(len(second), 2)
+        self.assertEqual(second[1], [0, 1, 1, [0, 1]])
+
+    def test_new_table_is_started_when_it_is_full(self):
+        # Given
+        self.encoder.max_strings = 3
+        events = [
+            dict(
+                obj=obj, name='age', items_event=False,
+                data=dict(type='primitive', value=1, info=None)
+            )
+            for obj in ('1', '2', '1')
+        ]
+
+        # When
+        messages = [self.encoder.encode_event(event) for event in events]
+        decoded = [self._round_trip(message)[1] for message in messages]
+
+        # Then
+        self.assertEqual(messages[1][2:], [['2']])
+        self.assertEqual(messages[2][2:], [['1', 'age'], True])
+        self.assertEqual(decoded, events)
+        self.assertEqual(self.decoder._strings, ['1', 'age'])
+
+    def test_unknown_values_are_sent_raw(self):
+        # Given
+        value = dict(type='list', value='1', info=dict(columns=[]))
+
+        # When
+        message = self.encoder.encode_response(0, dict(result=value, exception=None))
+
+        # Then
+        self.assertEqual(message[1], [[RAW, value]])
+        self.assertEqual(self._round_trip(message)[1]['result'], value)
+
+    def test_compact_events_are_less_than_half_the_size(self):
+        # Given
+        self.server.handle_request(json.dumps(dict(kind='update_context')))
+        self._events()
+
+        # When
+        for age in range(100):
+            self.fred.age = age
+        messages = self.collector.messages
+        compact = [
+            json.dumps(self.encoder.encode_event(json.loads(json.loads(m)[1])))
+            for m in messages
+        ]
+
+        # Then
+        size = sum(len(message) for message in messages)
+        self.assertLess(sum(len(message) for message in compact), size / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
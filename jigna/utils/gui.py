@@ -1,9 +1,15 @@
 # Standard library imports
+from collections import deque
+import logging
 import sys
+import threading
 
 # Local imports
 from ..qt import QtWidgets, QtCore
 
+# Logger.
+logger = logging.getLogger(__name__)
+
 
 def ui_handler(handler, *args, **kw):
     """ Handles UI notification handler requests that occur on a thread other
@@ -20,8 +26,11 @@ def set_trait_later(obj, trait_name, value):
 
 def invoke_later(callable, *args, **kw):
     """ Invoke the callable in the GUI thread.
+
+    Calls are made in the order in which they were requested (from any
+    thread).
     """
-    _FutureCall(0, callable, *args, **kw)
+    _get_dispatcher().post(callable, args, kw)
 
 
 def do_after(ms, callable, *args, **kw):
@@ -37,69 +46,132 @@ def process_events():
     QtCore.QCoreApplication.processEvents(QtCore.QEventLoop.AllEvents)
 
 
-#### Private protocol #########################################################
+def dispatcher_stats():
+    """ Return statistics about the calls made via 'invoke_later'.
+
+    Return a dict with the keys:
 
-class _FutureCall(QtCore.QObject):
-    """ This is a helper class to facilitate execution of a function in the
-    future (after all events are finished processing) in the GUI thread.
+    - 'depth': the number of calls currently waiting to be made.
+    - 'max_depth': the largest number of calls that were ever waiting.
+    - 'calls': the number of calls made so far.
+    - 'batches': the number of event loop wakeups that made calls.
     """
+    return _get_dispatcher().stats()
 
-    # Keep a list of references so that they don't get garbage collected.
-    _calls = []
 
-    # Manage access to the list of instances.
-    _calls_mutex = QtCore.QMutex()
+#### Private protocol #########################################################
+
+class _Dispatcher(QtCore.QObject):
+    """ Makes calls requested from any thread in the GUI thread.
+
+    There is a single dispatcher which lives in the GUI thread. Calls are
+    appended to a (thread safe) queue and an event is posted to wake the
+    dispatcher up only if one is not already pending, so a burst of calls
+    costs a single event. On each wakeup the dispatcher makes all the calls
+    that were queued when it woke up (calls queued by those calls are made on
+    the next wakeup so that the GUI gets a chance to process its other
+    events).
+    """
 
-    # A new Qt event type for _FutureCalls
+    # A new Qt event type for the dispatcher's wakeups.
     _gui_event = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
 
-    def __init__(self, ms, callable, *args, **kw):
-        super(_FutureCall, self).__init__()
+    def __init__(self):
+        super(_Dispatcher, self).__init__()
 
-        # Save the arguments.
-        self._ms = ms
-        self._callable = callable
-        self._args = args
-        self._kw = kw
+        # The pending calls as (callable, args, kw) tuples. Appending to and
+        # popping from a deque are atomic.
+        self._queue = deque()
 
-        # Save the instance.
-        self._calls_mutex.lock()
-        self._calls.append(self)
-        self._calls_mutex.unlock()
+        # Guards the wakeup flag and the statistics.
+        self._lock = threading.Lock()
+        self._wakeup_pending = False
+
+        self._max_depth = 0
+        self._calls = 0
+        self._batches = 0
 
         # Move to the main GUI thread.
         self.moveToThread(QtWidgets.QApplication.instance().thread())
 
-        # Post an event to be dispatched on the main GUI thread. Note that
-        # we do not call QTimer.singleShot here, which would be simpler, because
-        # that only works on QThreads. We want regular Python threads to work.
-        event = QtCore.QEvent(self._gui_event)
-        QtWidgets.QApplication.postEvent(self, event)
-        QtWidgets.QApplication.sendPostedEvents()
-
     def event(self, event):
         """ QObject event handler.
         """
         if event.type() == self._gui_event:
-            # Invoke the callable (puts it at the end of the event queue)
-            QtCore.QTimer.singleShot(self._ms, self._dispatch)
+            self._dispatch()
             return True
 
-        return super(_FutureCall, self).event(event)
+        return super(_Dispatcher, self).event(event)
 
-    def _dispatch(self):
-        """ Invoke the callable.
+    def post(self, callable, args, kw):
+        """ Queue a call to be made in the GUI thread.
         """
-        try:
-            self._callable(*self._args, **self._kw)
-        finally:
-            self._finished()
+        self._queue.append((callable, args, kw))
+
+        with self._lock:
+            depth = len(self._queue)
+            if depth > self._max_depth:
+                self._max_depth = depth
+
+            if self._wakeup_pending:
+                return
+
+            self._wakeup_pending = True
+
+        # Note that we do not use QTimer.singleShot here, which would be
+        # simpler, because that only works on QThreads. We want regular Python
+        # threads to work.
+        QtWidgets.QApplication.postEvent(self, QtCore.QEvent(self._gui_event))
 
-    def _finished(self):
-        """ Remove the call from the list, so it can be garbage collected.
+    def stats(self):
+        """ Return statistics about the calls made so far.
         """
-        self._calls_mutex.lock()
-        try:
-            self._calls.remove(self)
-        finally:
-            self._calls_mutex.unlock()
+        with self._lock:
+            return dict(
+                depth     = len(self._queue),
+                max_depth = self._max_depth,
+                calls     = self._calls,
+                batches   = self._batches,
+            )
+
+    def _dispatch(self):
+        """ Make all the calls that are queued.
+        """
+        # Clear the flag first so that calls queued from now on post another
+        # wakeup (at worst that wakeup finds an empty queue).
+        with self._lock:
+            self._wakeup_pending = False
+
+        queue = self._queue
+        count = len(queue)
+        for i in range(count):
+            callable, args, kw = queue.popleft()
+            try:
+                callable(*args, **kw)
+
+            except Exception:
+                logger.exception('Error in call made by invoke_later')
+
+        with self._lock:
+            self._calls += count
+            self._batches += 1
+
+
+# The dispatcher (created on first use).
+_dispatcher = None
+
+# Guards the creation of the dispatcher.
+_dispatcher_lock = threading.Lock()
+
+
+def _get_dispatcher():
+    """ Return the dispatcher, creating it if necessary.
+    """
+    global _dispatcher
+
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = _Dispatcher()
+
+    return _dispatcher
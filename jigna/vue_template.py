@@ -15,11 +15,15 @@ class VueTemplate(Template):
     """A template for vue.js templates.  Note that this assumes that the
     ViewModel is attached to the body and all the jigna models are exposed.
     """
+
+    #: The JS bundle loaded by the template.
+    js_bundle = 'jigna-vue.js'
+
     def _html_template_default(self):
         return dedent("""
         <html>
           <head>
-            <script type="text/javascript" src="/jigna/jigna-vue.js"></script>
+            {jigna_scripts}
             {head_html}
           </head>
 
@@ -30,7 +34,10 @@ class VueTemplate(Template):
               var vm = undefined;
               // jigna.models are ready only when the deferred returned by initialize
               // is resolved. One could also use jigna.ready.done.
-              jigna.initialize({{async: {async}}}).done(function() {{
+              jigna.initialize({{
+                  async: {async}, wire: '{wire}', worker: {worker},
+                  worker_url: '{worker_url}'
+              }}).done(function() {{
                   vm = new Vue({{
                       el: 'body',
                       data: jigna.models,
@@ -51,7 +51,12 @@ class WebApp(web.Application):
             base_url              = join(os.getcwd(), self.template.base_url),
             html                  = self.template.html,
             context               = self.context,
-            trait_change_dispatch = self.trait_change_dispatch
+            trait_change_dispatch = self.trait_change_dispatch,
+            type_manifest         = self.template.type_manifest
         )
 
+        # Keep a reference to the server so that it can be instrumented (eg.
+        # by giving it a watchdog).
+        self.server = server
+
         return server.handlers
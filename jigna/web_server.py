@@ -9,7 +9,7 @@
 # Standard library.
 import json
 import mimetypes
-from os.path import abspath, dirname, join
+from os.path import abspath, dirname, isfile, join
 import threading
 import traceback
 try:
@@ -19,18 +19,22 @@ except ImportError:
     from urllib.parse import unquote
 
 # 3rd party library.
+from tornado import gen
 from tornado.websocket import WebSocketHandler
-from tornado.web import Application, RequestHandler, StaticFileHandler
+from tornado.web import (
+    Application, HTTPError, RequestHandler, StaticFileHandler
+)
 from tornado.ioloop import IOLoop
 
 # Enthought library.
 from traits.api import (
-    Bool, List, Str, Instance, TraitDictEvent, TraitListEvent
+    Any, Bool, Dict, Int, List, Str, Instance, TraitDictEvent, TraitListEvent
 )
 
 # Jigna library.
 from jigna.server import Bridge, Server
-from jigna.core.wsgi import guess_type
+from jigna.core.static import HASHED_FILE, static_files
+from jigna.core.wire import CompactEncoder
 
 #: Path to jigna.js file
 JIGNA_JS_FILE = join(abspath(dirname(__file__)), 'js', 'dist', 'jigna.js')
@@ -63,6 +67,14 @@ def normalize_slice(s, size):
     return slice(start, stop, step)
 
 
+def _is_proxied(value):
+    """ Is a value sent as a proxy (an instance, list or dict) rather than
+    as a primitive?
+    """
+
+    return isinstance(value, (list, dict)) or hasattr(value, '__dict__')
+
+
 class WebBridge(Bridge):
     """ Bridge that handles the client-server communication. """
 
@@ -87,16 +99,32 @@ class WebBridge(Bridge):
 
         message_id = -1
         data = json.dumps([message_id, jsonized_event])
+        if self.recorder is not None:
+            self.recorder.record('event', None, message_id, jsonized_event)
+
         for socket in self._active_sockets:
+            # Sockets using the compact wire encoding encode the event when
+            # it is written, so that the strings it defines reach the client
+            # in the same order as the messages that use them.
+            codec = getattr(socket, 'codec', None)
+            if codec is None:
+                call = (socket.write_message, data)
+            else:
+                call = (self._write_compact_event, socket, codec, event)
+
             if main_thread:
-                socket.write_message(data)
+                call[0](*call[1:])
             else:
-                IOLoop.instance().add_callback(socket.write_message, data)
+                IOLoop.instance().add_callback(*call)
 
         return
 
     #### 'WebBridge' protocol #################################################
 
+    #: The recorder (a 'jigna.core.traffic.TrafficRecorder') that all
+    #: requests, responses and events are written to (None to not record).
+    recorder = Any
+
     def add_socket(self, socket):
         """ Add a client socket. """
 
@@ -116,6 +144,13 @@ class WebBridge(Bridge):
     #: All active client sockets.
     _active_sockets = List
 
+    def _write_compact_event(self, socket, codec, event):
+        """ Write an event to a socket using the compact wire encoding. """
+
+        socket.write_message(json.dumps(codec.encode_event(event)))
+
+        return
+
 
 class WebServer(Server):
     """ Web-based server implementation.
@@ -130,9 +165,15 @@ class WebServer(Server):
     handlers = List
     def _handlers_default(self):
         return [
+            # To serve the JS module of the type manifest (if any).
+            (
+                r"/jigna/(jigna-types\.[0-9a-f]{10}\.js)", TypeManifestHandler,
+                dict(server=self)
+            ),
+
             # To serve jigna.js from package source
             (
-                r"/jigna/(.*)", StaticFileHandler,
+                r"/jigna/(.*)", JSBundleHandler,
                 dict(path=dirname(JIGNA_JS_FILE))
             ),
 
@@ -156,11 +197,36 @@ class WebServer(Server):
     #: The trait change dispatch mechanism to use when traits change.
     trait_change_dispatch = Str('same')
 
+    #: Should the websocket messages be compressed (if the client supports
+    #: the 'permessage-deflate' extension)? Marshalled JSON is repetitive and
+    #: typically compresses 5-10x.
+    compression = Bool(True)
+
+    #: The zlib compression level (1-9) of the websocket messages.
+    compression_level = Int(6)
+
+    #: The zlib memory level (1-9) used to compress the websocket messages.
+    #: Each connection uses about 2**(mem_level + 9) bytes for compression.
+    compression_mem_level = Int(8)
+
+    #: The recorder (a 'jigna.core.traffic.TrafficRecorder') that all
+    #: requests, responses and events are written to (None to not record).
+    recorder = Any
+    def _recorder_changed(self, recorder):
+        self._bridge.recorder = recorder
+
     #### Private protocol #####################################################
 
     _bridge = Instance(WebBridge)
     def __bridge_default(self):
-        return WebBridge()
+        return WebBridge(recorder=self.recorder)
+
+    #: The websocket connections by the id that their clients identify them
+    #: with (clients send the id with their synchronous GET requests, so that
+    #: the objects sent in the responses are held by the right connection).
+    #:
+    #: { str id : AsyncWebSocketHandler connection }
+    _connections_by_id = Dict
 
 
 class AsyncWebServer(WebServer):
@@ -172,6 +238,16 @@ class AsyncWebServer(WebServer):
 
     """
 
+    #### 'AsyncWebServer' protocol ############################################
+
+    #: Lists of at least this many items that are all instances of the same
+    #: type are sent in columns: the ids of the items and the values of each
+    #: attribute (see '_get_columns'). This saves both the size of the message
+    #: and a request per attribute of each item. Zero to never use columns.
+    columnar_min_length = Int(2)
+
+    #### Private protocol #####################################################
+
     def _get_attribute_values(self, obj, attribute_names):
         """ Get the values of all 'public' attributes on an object.
 
@@ -204,13 +280,17 @@ class AsyncWebServer(WebServer):
     def _get_instance_info(self, obj):
         """ Get a description of an instance. """
 
-        info = super(WebServer, self)._get_instance_info(obj)
+        # The info of a new type is sent to all of the connections (in a
+        # new_type event).
+        with self._broadcasting():
+            info = super(WebServer, self)._get_instance_info(obj)
 
         # If this is a new type, also send the attribute_values.
         if 'attribute_names' in info:
-            attribute_values = self._get_attribute_values(
-                obj, info['attribute_names']
-            )
+            with self._broadcasting():
+                attribute_values = self._get_attribute_values(
+                    obj, info['attribute_names']
+                )
             info['attribute_values'] = attribute_values
             self._send_new_type_event(info)
             # Now that the type info is sent we do not need to send all that
@@ -219,8 +299,51 @@ class AsyncWebServer(WebServer):
 
         return info
 
+    def _get_columns(self, obj):
+        """ Get the columnar description of a list of instances.
+
+        Return None unless the list is long enough and its items are all
+        instances of the same type. Otherwise return a dict with the type
+        name, the ids of the items and, for each attribute whose values are
+        all primitives, the list of its values. The other attributes are
+        fetched when they are used.
+
+        """
+
+        min_length = self.columnar_min_length
+        if min_length <= 0 or len(obj) < min_length:
+            return None
+
+        klass = type(obj[0])
+        if isinstance(obj[0], (list, dict)) or not _is_proxied(obj[0]):
+            return None
+
+        for item in obj:
+            if type(item) is not klass:
+                return None
+
+        # Marshal the items so that they are registered (and their type is
+        # sent to the client).
+        ids = [self._marshal(item)['value'] for item in obj]
+
+        values = {}
+        for name in self._get_attribute_names(obj[0]):
+            column = [getattr(item, name, None) for item in obj]
+            if not any(_is_proxied(value) for value in column):
+                values[name] = column
+
+        return dict(type_name=self._get_type_name(obj[0]), ids=ids, values=values)
+
+    def _get_items_info(self, items):
+        """ Get a description of a list including all of its items. """
+        return self._get_list_info(items)
+
     def _get_list_info(self, obj):
         """ Get a description of a list. """
+        columns = self._get_columns(obj)
+        if columns is not None:
+            return dict(length=len(obj), columns=columns)
+
         data = self._marshal_all(obj)
         return dict(length=len(obj), data=data)
 
@@ -320,17 +443,150 @@ class MainHandler(RequestHandler):
 
         return
 
-    def get(self):
+    def head(self):
+        return self.get(include_body=False)
+
+    def get(self, include_body=True):
         path = unquote(self.request.path[1:])
         if not len(path):
             self.write(self.server.html)
-        else:
-            mime_type, _ = guess_type(path)
-            self.set_header('Content-Type', mime_type)
-            self.write(open(join(self.server.base_url, path), 'rb').read())
+            return
+
+        static_file = static_files.get(join(self.server.base_url, path))
+        if static_file is None:
+            raise HTTPError(404)
+
+        response = static_files.prepare(static_file, self.request.headers.get)
+        self.set_status(response.status)
+        for name, value in response.headers:
+            self.set_header(name, value)
+
+        if not include_body or response.start == response.stop:
+            return
+
+        # Cached files are written straight away, large ones are read (in
+        # chunks) on a thread so that we never block the IOLoop (tornado
+        # waits for the returned future).
+        if static_file.data is not None:
+            self.write(static_file.data[response.start:response.stop])
+            return
+
+        return self._write_chunks(static_file, response.start, response.stop)
+
+    #### Private protocol #####################################################
+
+    @gen.coroutine
+    def _write_chunks(self, static_file, start, stop):
+        """ Write part of a (large) file, reading it on a thread. """
+
+        chunks = static_files.iter_content(static_file, start, stop)
+        io_loop = IOLoop.current()
+        try:
+            while True:
+                chunk = yield io_loop.run_in_executor(None, next, chunks, None)
+                if chunk is None:
+                    break
+
+                self.write(chunk)
+                yield self.flush()
+
+        finally:
+            chunks.close()
+
 
+class JSBundleHandler(StaticFileHandler):
+    """ Serves the JS bundles.
+
+    The precompressed ('.br' and '.gz') sibling of a file is sent to clients
+    that accept its encoding, and content hashed files are cached by clients
+    forever.
+    """
+
+    #: The encodings of the precompressed files (in order of preference) and
+    #: their file extensions.
+    ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+    def get(self, path, include_body=True):
+        self.encoding = None
+        accepted = self._accepted_encodings()
+        for encoding, extension in self.ENCODINGS:
+            if encoding in accepted and isfile(join(self.root, path + extension)):
+                self.encoding = encoding
+                path += extension
+                break
+
+        return super(JSBundleHandler, self).get(path, include_body)
+
+    def get_cache_time(self, path, modified, mime_type):
+        if HASHED_FILE.search(self._uncompressed(path)):
+            return self.CACHE_MAX_AGE
+
+        return super(JSBundleHandler, self).get_cache_time(
+            path, modified, mime_type
+        )
+
+    def get_content_type(self):
+        mime_type, _ = mimetypes.guess_type(
+            self._uncompressed(self.absolute_path)
+        )
+
+        return mime_type or 'application/octet-stream'
+
+    def set_extra_headers(self, path):
+        self.set_header('Vary', 'Accept-Encoding')
+        if self.encoding is not None:
+            self.set_header('Content-Encoding', self.encoding)
+
+        if HASHED_FILE.search(self._uncompressed(path)):
+            self.set_header(
+                'Cache-Control', 'public, max-age=%d, immutable' %
+                self.CACHE_MAX_AGE
+            )
+
+    #### Private protocol #####################################################
+
+    def _accepted_encodings(self):
+        """ Return the encodings accepted by the client. """
+
+        accepted = set()
+        for value in self.request.headers.get('Accept-Encoding', '').split(','):
+            parts = value.split(';')
+            params = [part.strip().replace(' ', '') for part in parts[1:]]
+            if 'q=0' not in params and 'q=0.0' not in params:
+                accepted.add(parts[0].strip().lower())
+
+        return accepted
+
+    def _uncompressed(self, path):
+        """ Return the path of the uncompressed file for a path. """
+
+        for encoding, extension in self.ENCODINGS:
+            if path.endswith(extension) and self.encoding == encoding:
+                return path[:-len(extension)]
+
+        return path
+
+
+class TypeManifestHandler(RequestHandler):
+    """ Serves the JS module of the server's type manifest.
+
+    The name of the module includes the hash of its contents, so it can be
+    cached by clients forever.
+    """
+
+    def initialize(self, server):
+        self.server = server
         return
 
+    def get(self, filename):
+        manifest = self.server.type_manifest
+        if manifest is None or filename != manifest.filename:
+            raise HTTPError(404)
+
+        self.set_header('Content-Type', 'application/javascript')
+        self.set_header('Cache-Control', static_files.hashed_cache_control)
+        self.write(manifest.to_js())
+
 
 class SyncGETHandler(RequestHandler):
 
@@ -344,37 +600,122 @@ class SyncGETHandler(RequestHandler):
     def get(self):
         jsonized_request = self.get_argument("data")
 
-        jsonized_response = self.server.handle_request(jsonized_request)
+        # The websocket of the client that sent the request (if it says).
+        connection = self.server._connections_by_id.get(
+            self.get_argument('connection', None)
+        )
+
+        recorder = self.server.recorder
+        if recorder is not None:
+            recorder.record('request', 'get', None, jsonized_request)
+
+        jsonized_response = self.server.handle_request(
+            jsonized_request, connection
+        )
+
+        if recorder is not None:
+            recorder.record('response', 'get', None, jsonized_response)
+
         self.write(jsonized_response)
         return
 
 
 class AsyncWebSocketHandler(WebSocketHandler):
 
+    #: The encoder used for the messages sent to the client (None if they are
+    #: sent as plain JSON). Clients ask for the compact wire encoding (see
+    #: 'jigna.core.wire') by connecting with '?wire=compact'.
+    codec = None
+
+    #: The id that the client identifies the connection with in its
+    #: synchronous GET requests (None if it does not).
+    connection_id = None
+
     def initialize(self, bridge, server):
         self.bridge = bridge
         self.server = server
         return
 
     def open(self):
+        if self.get_argument('wire', 'json') == 'compact':
+            self.codec = CompactEncoder()
+
+        self.connection_id = self.get_argument('connection', None)
+        if self.connection_id is not None:
+            self.server._connections_by_id[self.connection_id] = self
+
         self.bridge.add_socket(self)
+        self.server.add_connection(self)
+        self._record('open')
         return
 
     def on_message(self, message):
         try:
             request_id, jsonized_request = json.loads(message)
-            jsonized_response = self.server.handle_request(jsonized_request)
-            self.write_message(json.dumps([request_id, jsonized_response]))
+            self._record('request', request_id, jsonized_request)
+            if self.codec is None:
+                jsonized_response = self.server.handle_request(
+                    jsonized_request, self
+                )
+                self._record('response', request_id, jsonized_response)
+                self.write_message(json.dumps([request_id, jsonized_response]))
+
+            else:
+                self._handle_compact_request(request_id, jsonized_request)
+
         except Exception:
             traceback.print_exc()
             self.write_message(json.dumps([request_id, '{}']))
         return
 
     def on_close(self):
+        connections = self.server._connections_by_id
+        if connections.get(self.connection_id) is self:
+            del connections[self.connection_id]
+
         self.bridge.remove_socket(self)
+        self.server.remove_connection(self)
+        self._record('close')
+        return
+
+    def get_compression_options(self):
+        server = self.server
+        if not server.compression:
+            return None
+
+        return dict(
+            compression_level = server.compression_level,
+            mem_level         = server.compression_mem_level,
+        )
+
+    def _handle_compact_request(self, request_id, jsonized_request):
+        """ Handle a request and send the response in the compact wire
+        encoding.
+        """
+        server = self.server
+        request = json.loads(jsonized_request)
+        response = server._handle_request(request, self)
+        if self.bridge.recorder is not None:
+            self._record('response', request_id, json.dumps(
+                response, default=lambda obj: repr(type(obj))
+            ))
+
+        message = json.dumps(
+            self.codec.encode_response(request_id, response),
+            default=lambda obj: repr(type(obj))
+        )
+        server._record_sizes(request, jsonized_request, message)
+        self.write_message(message)
+
         return
 
-    def write_message(self, msg, binary=False):
-        return super(AsyncWebSocketHandler, self).write_message(msg, binary)
+    def _record(self, direction, request_id=None, payload=None):
+        """ Record a message if the bridge has a traffic recorder. """
+
+        recorder = self.bridge.recorder
+        if recorder is not None:
+            recorder.record(direction, id(self), request_id, payload)
+
+        return
 
 #### EOF ######################################################################
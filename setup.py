@@ -30,7 +30,12 @@ setup(
     packages=find_packages(),
     package_dir={'jigna': 'jigna'},
     include_package_data=True,
-    package_data={'jigna': ['js/dist/*.js']},
+    package_data={
+        'jigna': [
+            'js/dist/*.js', 'js/dist/*.js.gz', 'js/dist/*.js.br',
+            'js/dist/manifest.json'
+        ]
+    },
     install_requires=requires,
     extras_require={
         'pyside': pyside,